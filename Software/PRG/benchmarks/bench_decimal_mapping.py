@@ -0,0 +1,69 @@
+"""Benchmark: DECIMAL-Prüfwerte als float vs. exakt (decimals='exact')
+
+Misst (ohne Datenbank) mit Zeilen, wie sie die C-Extension liefert (Decimal):
+    1. Generierter Row-Mapper mit und ohne float-Umwandlung
+    2. MySQLDeviceRepository._map_to_device (float- vs. exact-Repository)
+    3. Serialisierung (Detail-Serializer + dumps)
+    4. Device.all_dguv3_tests_passed (Grenzwertvergleich)
+
+Aufruf (aus Software/PRG):
+    python -m benchmarks.bench_decimal_mapping [anzahl_zeilen]
+"""
+import sys
+import time
+from datetime import date, datetime
+from decimal import Decimal
+
+from src.adapters.persistence.converters import DECIMAL_EXACT, DECIMAL_FLOAT
+from src.adapters.persistence.mysql_device_repository import MySQLDeviceRepository
+from src.adapters.persistence.row_mapper import build_row_mapper
+from src.adapters.web.presenters import dumps, get_serializer
+from benchmarks.bench_row_mapper import COLUMN_NAMES
+
+
+def _sample_row(index: int) -> tuple:
+    return (
+        index, 'Parloa', f'Parloa-{index:05d}', 'Elektroschrauber', 'Elektrowerkzeug',
+        f'SN-{index}', 'Bosch', 'GSR 12V', 'Berlin - Buero - MB1', date(2023, 1, 15),
+        datetime(2024, 1, 15, 10, 30), date(2025, 1, 15), 'active', None, None,
+        datetime(2024, 1, 1), datetime(2024, 1, 1),
+        Decimal('0.150'), Decimal('250.00'), Decimal('0.210'), Decimal('0.030'),
+        None, None, Decimal('1.20'), None, None,
+    )
+
+
+def _timed(label: str, func, rows: int) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<38} {elapsed * 1000:9.1f} ms  ({rows / elapsed:12,.0f} rows/s)")
+    return elapsed
+
+
+def run(rows: int = 100_000) -> None:
+    tuples = [_sample_row(i) for i in range(1, rows + 1)]
+    dicts = [dict(zip(COLUMN_NAMES, row)) for row in tuples]
+    serializer = get_serializer('detail')
+
+    print(f"\n{rows:,} Zeilen")
+    for decimals in (DECIMAL_FLOAT, DECIMAL_EXACT):
+        print(f"\ndecimals='{decimals}'")
+        repository = MySQLDeviceRepository('localhost', 3306, 'bench', 'bench', 'bench', decimals=decimals)
+        map_row = build_row_mapper(COLUMN_NAMES, decimals)
+        _timed("Generierter Mapper", lambda: [map_row(row) for row in tuples], rows)
+        _timed("_map_to_device", lambda: [repository._map_to_device(row) for row in dicts], rows)
+        devices = [map_row(row) for row in tuples]
+        _timed(
+            "Serialisierung (detail + dumps)",
+            lambda: dumps(serializer.many(devices)),
+            rows
+        )
+        _timed(
+            "all_dguv3_tests_passed",
+            lambda: [device.all_dguv3_tests_passed() for device in devices],
+            rows
+        )
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
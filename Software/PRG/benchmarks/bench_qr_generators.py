@@ -0,0 +1,38 @@
+"""Benchmark: QR-Adapter (SVG-Pfad, SVG-Rechtecklauf, PNG) je Fehlerkorrektur
+
+Misst Kodierzeit pro QR-Code sowie mittlere Ausgabegröße roh und gzip-
+komprimiert (so wie der Bild-Endpunkt SVGs ausliefert). Inhalte wie im
+Betrieb: "Kunde|customer_device_id".
+
+Aufruf (aus Software/PRG):
+    python -m benchmarks.bench_qr_generators [anzahl_codes]
+"""
+import gzip
+import sys
+import time
+
+from src.adapters.services.qr_generators import QR_GENERATORS, ERROR_CORRECTION_LEVELS
+
+
+def _timed(label: str, func, codes: int) -> list:
+    start = time.perf_counter()
+    outputs = func()
+    elapsed = time.perf_counter() - start
+    raw = sum(len(output) for output in outputs) / codes
+    packed = sum(len(gzip.compress(output, mtime=0)) for output in outputs) / codes
+    print(f"  {label:<28} {elapsed * 1000 / codes:7.2f} ms/Code  {raw:9,.0f} B  {packed:7,.0f} B gzip")
+    return outputs
+
+
+def run(codes: int = 500) -> None:
+    payloads = [f"Parloa|Parloa-{index:05d}" for index in range(1, codes + 1)]
+
+    for error_correction in ERROR_CORRECTION_LEVELS:
+        print(f"\n{codes:,} Codes, Fehlerkorrektur {error_correction}")
+        for name, generator_class in QR_GENERATORS.items():
+            generator = generator_class(error_correction=error_correction)
+            _timed(f"{name} ({generator.mimetype})", lambda: [generator.encode(p) for p in payloads], codes)
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,65 @@
+"""Benchmark: Dict-Cursor + _map_to_device vs. Tupel-Cursor + generierter Mapper
+
+Simuliert `SELECT * FROM devices` mit bereits dekodierten Werten. Der Dict-Pfad
+enthält die Dict-Erzeugung pro Zeile, die `cursor(dictionary=True)` durchführt.
+
+Aufruf (aus Software/PRG):
+    python -m benchmarks.bench_row_mapper [anzahl_zeilen]
+"""
+import sys
+import time
+from datetime import date, datetime
+
+from src.adapters.persistence.mysql_device_repository import MySQLDeviceRepository
+from src.adapters.persistence.row_mapper import build_row_mapper
+
+# Spaltenreihenfolge wie SELECT * auf der devices-Tabelle
+COLUMN_NAMES = (
+    'id', 'customer', 'customer_device_id', 'name', 'type', 'serial_number',
+    'manufacturer', 'model', 'location', 'purchase_date', 'last_inspection',
+    'next_inspection', 'status', 'qr_code', 'notes', 'created_at', 'updated_at',
+    'r_pe', 'r_iso', 'i_pe', 'i_b', 'cable_type', 'test_result',
+    'internal_resistance', 'emarker_active', 'inspection_notes',
+)
+
+
+def _sample_row(index: int) -> tuple:
+    return (
+        index, 'Parloa', f'Parloa-{index:05d}', 'Elektroschrauber', 'Elektrowerkzeug',
+        f'SN-{index}', 'Bosch', 'GSR 12V', 'Berlin - Buero - MB1', date(2023, 1, 15),
+        datetime(2024, 1, 15, 10, 30), date(2025, 1, 15), 'active', None, None,
+        datetime(2024, 1, 1), datetime(2024, 1, 1),
+        0.15, 250.0, 0.21, 0.03, None, None, None, None, None,
+    )
+
+
+def _timed(label: str, func, rows: int) -> float:
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<38} {elapsed * 1000:9.1f} ms  ({rows / elapsed:12,.0f} rows/s)")
+    return elapsed
+
+
+def run(rows: int = 100_000) -> None:
+    repository = MySQLDeviceRepository('localhost', 3306, 'bench', 'bench', 'bench')
+    tuples = [_sample_row(i) for i in range(1, rows + 1)]
+    names = list(COLUMN_NAMES)
+
+    print(f"\n{rows:,} Zeilen")
+    dict_time = _timed(
+        "Dict-Cursor + _map_to_device",
+        lambda: [repository._map_to_device(dict(zip(names, row))) for row in tuples],
+        rows
+    )
+    map_row = build_row_mapper(COLUMN_NAMES)
+    tuple_time = _timed(
+        "Tupel-Cursor + generierter Mapper",
+        lambda: [map_row(row) for row in tuples],
+        rows
+    )
+    print(f"  Speedup: {dict_time / tuple_time:.2f}x")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
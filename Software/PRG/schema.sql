@@ -41,7 +41,26 @@ CREATE TABLE IF NOT EXISTS devices (
     INDEX idx_name (name),
     INDEX idx_serial (serial_number),
     INDEX idx_status (status),
-    INDEX idx_created (created_at)
+    INDEX idx_created (created_at),
+    -- Prüfplanung: "fällig in N Tagen für Kunde X" (Keyset über next_inspection, id)
+    INDEX idx_customer_next_inspection_status (customer, next_inspection, status),
+    INDEX idx_next_inspection (next_inspection),
+    -- Kalender-Feed: Änderungsprüfung und Delta pro Kunde
+    INDEX idx_customer_updated (customer, updated_at),
+    -- DeviceQuery-Filter (Typ, Standort-Präfix)
+    INDEX idx_type (type),
+    INDEX idx_location (location)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- ============================================================================
+-- ANCHOR: Customer Device Counters (Nummernvergabe customer_device_id)
+-- ============================================================================
+-- Letzte vergebene laufende Nummer pro Kunde; wird beim Reservieren mit
+-- SELECT ... FOR UPDATE gesperrt, damit gleichzeitige Anlagen verschiedene
+-- ID-Blöcke erhalten.
+CREATE TABLE IF NOT EXISTS customer_device_counters (
+    customer VARCHAR(255) NOT NULL PRIMARY KEY,
+    last_number INT UNSIGNED NOT NULL DEFAULT 0
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- ============================================================================
@@ -50,18 +69,57 @@ CREATE TABLE IF NOT EXISTS devices (
 CREATE TABLE IF NOT EXISTS inspections (
     id INT PRIMARY KEY AUTO_INCREMENT,
     device_id INT NOT NULL,
-    inspection_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    inspection_date DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     result ENUM('pass', 'fail', 'pending') DEFAULT 'pending',
     notes TEXT DEFAULT NULL,
     inspector VARCHAR(255) DEFAULT NULL,
+    
+    -- DGUV3 Prüfwerte dieser Prüfung
+    r_pe DECIMAL(6,3) DEFAULT NULL COMMENT 'Schutzleiterwiderstand in Ohm',
+    r_iso DECIMAL(8,3) DEFAULT NULL COMMENT 'Isolationswiderstand in MegaOhm',
+    i_pe DECIMAL(6,3) DEFAULT NULL COMMENT 'Schutzleiterstrom in mA',
+    i_b DECIMAL(6,3) DEFAULT NULL COMMENT 'Berührungsstrom in mA',
+    
+    -- USB-Kabel Prüfung
+    cable_type VARCHAR(100) DEFAULT NULL COMMENT 'USB-Kabeltyp (USB-C, Lightning, etc.)',
+    test_result VARCHAR(50) DEFAULT NULL COMMENT 'Testergebnis (bestanden, nicht_bestanden, etc.)',
+    internal_resistance DECIMAL(10,3) DEFAULT NULL COMMENT 'Innenwiderstand in Ohm',
+    emarker_active BOOLEAN DEFAULT NULL COMMENT 'eMarker Status (nur USB-C)',
+    
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     FOREIGN KEY (device_id) REFERENCES devices(id) ON DELETE CASCADE,
-    INDEX idx_device (device_id),
+    -- Letzte Prüfung pro Gerät / Historie: ein Range-Scan über (device_id, inspection_date, id)
+    INDEX idx_device_date (device_id, inspection_date, id),
     INDEX idx_date (inspection_date),
     INDEX idx_result (result)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+-- ============================================================================
+-- ANCHOR: Measurements Table (Messwert-Zeitreihe)
+-- ============================================================================
+-- Eine Zeile pro Messwert (ca. 14 Byte Nutzdaten): Drift-/Trendanalyse über
+-- Jahre. metric: 1=r_pe, 2=r_iso, 3=i_pe, 4=i_b, 5=internal_resistance.
+-- Partitioniert nach Jahr; deshalb ohne Fremdschlüssel (wird beim Löschen
+-- eines Geräts vom Repository mit entfernt) und measured_at im Primärschlüssel.
+CREATE TABLE IF NOT EXISTS measurements (
+    device_id INT NOT NULL,
+    measured_at DATETIME NOT NULL,
+    metric TINYINT UNSIGNED NOT NULL,
+    value FLOAT NOT NULL,
+    PRIMARY KEY (device_id, metric, measured_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+PARTITION BY RANGE (YEAR(measured_at)) (
+    PARTITION p2020 VALUES LESS THAN (2021),
+    PARTITION p2021 VALUES LESS THAN (2022),
+    PARTITION p2022 VALUES LESS THAN (2023),
+    PARTITION p2023 VALUES LESS THAN (2024),
+    PARTITION p2024 VALUES LESS THAN (2025),
+    PARTITION p2025 VALUES LESS THAN (2026),
+    PARTITION p2026 VALUES LESS THAN (2027),
+    PARTITION pmax VALUES LESS THAN MAXVALUE
+);
+
 -- ============================================================================
 -- ANCHOR: Users Table
 -- ============================================================================
@@ -0,0 +1,4 @@
+"""Kommandozeilen-Befehle (flask <befehl>)"""
+from src.adapters.cli.commands import register_commands
+
+__all__ = ['register_commands']
@@ -0,0 +1,145 @@
+"""CLI Commands - Wartungs- und Exportbefehle über die Flask-CLI
+
+Aufruf z.B.:
+    flask --app src.main:create_app export-zpl --due-within 30 -o faellig.zpl
+    flask --app src.main:create_app backfill-qr --stale --state-file /var/cache/benning/qr/backfill.json
+    flask --app src.main:create_app pdf-worker --processes 2
+"""
+import json
+import os
+import tempfile
+import click
+from flask import Flask
+from src.config.dependencies import container
+from src.core.domain.bulk_result import BackfillProgress
+from src.core.usecases.device_usecases import BackfillQRCodesUseCase, ListLabelDevicesUseCase
+from src.adapters.services.pdf_export_worker import PDFExportWorker
+from src.adapters.web.presenters import get_zpl_layout, iter_zpl
+from src.adapters.web.presenters.zpl_export import DEFAULT_ZPL_LAYOUT
+
+
+def register_commands(app: Flask) -> None:
+    """Alle CLI-Befehle an der App registrieren"""
+    app.cli.add_command(export_zpl)
+    app.cli.add_command(backfill_qr)
+    app.cli.add_command(pdf_worker)
+
+
+@click.command('export-zpl')
+@click.option('--customer', default=None, help='Kundenname')
+@click.option('--ids', default='', help='Kommagetrennte customer_device_ids')
+@click.option('--due-within', type=int, default=None, help='Fällige Geräte der nächsten N Tage')
+@click.option('--layout', default=DEFAULT_ZPL_LAYOUT, show_default=True, help='Etikettenformat')
+@click.option('--copies', type=int, default=1, show_default=True, help='Etiketten pro Gerät')
+@click.option('-o', '--output', type=click.File('wb'), default='-', help='Zieldatei (Standard: stdout)')
+def export_zpl(customer, ids, due_within, layout, copies, output):
+    """Geräte-Etiketten als ZPL-Datei für Thermodrucker schreiben"""
+    try:
+        zpl_layout = get_zpl_layout(layout)
+        if not 1 <= copies <= ListLabelDevicesUseCase.MAX_COPIES:
+            raise ValueError(f"copies must be between 1 and {ListLabelDevicesUseCase.MAX_COPIES}")
+        devices = container.list_label_devices_usecase.execute(
+            customer=customer,
+            customer_device_ids=[i.strip() for i in ids.split(',') if i.strip()],
+            due_within_days=due_within
+        )
+    except ValueError as e:
+        raise click.BadParameter(str(e))
+
+    labels = 0
+    for chunk in iter_zpl(devices, zpl_layout, copies):
+        output.write(chunk)
+        labels += chunk.count(b'^XZ')
+    click.echo(f"{labels * copies} Etiketten ({zpl_layout.name}, {zpl_layout.dpi} dpi) geschrieben", err=True)
+
+
+def _read_checkpoint(path: str, refresh_stale: bool) -> int:
+    """Wiederaufsetzpunkt (letzte gespeicherte id) aus der Zustandsdatei, sonst 0"""
+    try:
+        with open(path) as state_file:
+            state = json.load(state_file)
+    except FileNotFoundError:
+        return 0
+    except (OSError, ValueError) as e:
+        raise click.BadParameter(f"cannot read state file {path}: {e}")
+    if state.get('refresh_stale') != refresh_stale:
+        click.echo("Zustandsdatei stammt aus einem Lauf mit anderem --stale, starte von vorn", err=True)
+        return 0
+    return int(state.get('after_id', 0))
+
+
+def _write_checkpoint(path: str, refresh_stale: bool, progress: BackfillProgress) -> None:
+    """Zustandsdatei atomar schreiben (temporäre Datei + os.replace)"""
+    folder = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=folder, prefix='.tmp-', suffix='.json')
+    with os.fdopen(fd, 'w') as temp_file:
+        json.dump({'after_id': progress.last_id, 'refresh_stale': refresh_stale}, temp_file)
+    os.replace(temp_path, path)
+
+
+@click.command('backfill-qr')
+@click.option('--stale', is_flag=True, help='Auch veraltete QR-Codes (Kunde/Encoder geändert) erneuern')
+@click.option('--batch-size', type=click.IntRange(1, 10000), default=500, show_default=True,
+              help='Geräte pro Transaktion')
+@click.option('--limit', type=click.IntRange(1), default=None, help='Höchstens N Geräte prüfen')
+@click.option('--workers', type=click.IntRange(1), default=None, help='Prozesse (Standard: QR_WORKERS)')
+@click.option('--state-file', type=click.Path(dir_okay=False), default=None,
+              help='Fortschritt speichern und beim nächsten Aufruf dort fortsetzen')
+@click.option('--restart', is_flag=True, help='Zustandsdatei ignorieren und von vorn beginnen')
+def backfill_qr(stale, batch_size, limit, workers, state_file, restart):
+    """QR-Codes bestehender Geräte batchweise erzeugen (abbrechbar, fortsetzbar)"""
+    after_id = 0
+    if state_file and not restart:
+        after_id = _read_checkpoint(state_file, stale)
+        if after_id:
+            click.echo(f"Setze nach Geräte-id {after_id} fort", err=True)
+
+    def report(progress: BackfillProgress) -> None:
+        # Erst nach dem Commit eines Batches aufgerufen: der Stand ist dauerhaft
+        if state_file:
+            _write_checkpoint(state_file, stale, progress)
+        click.echo(
+            f"  {progress.scanned:>7} geprüft, {progress.updated:>7} gespeichert ({progress.stale} veraltet), "
+            f"{progress.failed} Fehler - {progress.rate:,.0f} Geräte/s, bis id {progress.last_id}",
+            err=True
+        )
+
+    usecase = BackfillQRCodesUseCase(container.device_repository, batch_size=batch_size,
+                                     qr_generator=container.qr_generator)
+    try:
+        updated = usecase.execute(max_devices=limit, refresh_stale=stale, after_id=after_id,
+                                  workers=workers, on_batch=report)
+    except KeyboardInterrupt:
+        hint = " - erneut aufrufen, um fortzusetzen" if state_file else ""
+        click.echo(f"Abgebrochen; gespeicherte Batches bleiben erhalten{hint}", err=True)
+        raise click.Abort()
+
+    if state_file and limit is None and os.path.exists(state_file):
+        # Vollständig durchgelaufen: nächster Aufruf beginnt von vorn
+        os.unlink(state_file)
+    click.echo(f"{updated} QR-Codes gespeichert", err=True)
+
+
+@click.command('pdf-worker')
+@click.option('--processes', type=click.IntRange(1), default=lambda: int(os.getenv('PDF_WORKERS', '2')),
+              show_default='PDF_WORKERS oder 2', help='Gleichzeitig gerenderte PDFs (je ein Prozess)')
+@click.option('--poll', type=float, default=1.0, show_default=True, help='Abfrageintervall in Sekunden')
+@click.option('--timeout', type=click.FloatRange(min=1), default=lambda: float(os.getenv('PDF_JOB_TIMEOUT', '1800')),
+              show_default='PDF_JOB_TIMEOUT oder 1800', help='Maximale Renderzeit eines Jobs in Sekunden')
+@click.option('--once', is_flag=True, help='Beenden, sobald die Warteschlange leer ist')
+def pdf_worker(processes, poll, timeout, once):
+    """PDF-Export-Jobs aus /pdf/jobs im Hintergrund rendern"""
+    worker = PDFExportWorker(
+        container.export_job_repository,
+        directory=container.pdf_job_directory,
+        processes=processes,
+        poll_interval=poll,
+        job_timeout=timeout
+    )
+    try:
+        processed = worker.run(stop_when_idle=once)
+    except KeyboardInterrupt:
+        # Laufende Jobs werden nach Ablauf des Heartbeats neu eingereiht
+        click.echo("PDF-Worker beendet", err=True)
+        return
+    click.echo(f"{processed} PDF-Jobs abgeschlossen", err=True)
@@ -0,0 +1,4 @@
+"""Importer für Prüfprotokolle externer Prüfgeräte"""
+from src.adapters.importers.st725_reader import ProtocolRecord, ST725ProtocolReader
+
+__all__ = ['ProtocolRecord', 'ST725ProtocolReader']
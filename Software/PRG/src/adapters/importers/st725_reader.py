@@ -0,0 +1,250 @@
+"""BENNING ST 725 Prüfprotokoll-Reader - zeilenweises Streaming von CSV/XLS
+
+Das ST 725 exportiert Messungen als *.csv (Semikolon, Dezimalkomma, cp1252);
+das Excel-Prüfprotokoll (archiv/ST 725_Pruefprotokoll_*.xls) hat denselben
+Spaltenaufbau mit einem Kopfbereich (Auftraggeber, Prüfer) darüber.
+
+Die Spalten werden über die Kopfzeile erkannt (nicht über feste Positionen),
+der Kopfbereich liefert Kunde und Prüfer. Datensätze werden als Generator
+geliefert, die Datei wird nie vollständig in Domain-Objekte umgewandelt.
+"""
+import csv
+import re
+from dataclasses import dataclass
+from datetime import date, datetime
+from io import TextIOWrapper
+from typing import IO, Dict, Iterable, Iterator, Optional, Sequence
+
+try:
+    import xlrd
+except ImportError:  # pragma: no cover - .xls nur mit xlrd
+    xlrd = None
+
+
+# ANCHOR: Spaltenerkennung
+# (Schlüsselwort im normalisierten Spaltenkopf, Feld) - erster Treffer gewinnt
+HEADER_KEYWORDS = (
+    ('nächsterprüftermin', 'next_inspection'),
+    ('gesamt', 'passed'),
+    ('elektrischeprüfung', 'electrical_ok'),
+    ('funktions', 'function_ok'),
+    ('rcd', 'rcd'),
+    ('kabel', 'cable_ok'),
+    ('iber', 'i_b'),
+    ('ipe', 'i_pe'),
+    ('riso', 'r_iso'),
+    ('rpe', 'r_pe'),
+    ('sicht', 'visual_ok'),
+    ('prüfdatum', 'inspection_date'),
+    ('prüfablauf', 'test_sequence'),
+    ('idnr', 'id_number'),
+    ('prüfobjekt', 'name'),
+)
+
+TRUE_VALUES = {'ja', 'j', 'yes', 'x', 'b', 'bestanden', 'ok', 'io', 'i.o.'}
+FALSE_VALUES = {'nein', 'n', 'no', 'nb', 'nichtbestanden', 'nio', 'n.i.o.'}
+
+_NUMBER = re.compile(r'[-+]?\d+(?:[.,]\d+)?')
+_GERMAN_DATE = re.compile(r'(\d{1,2})\.(\d{1,2})\.(\d{2,4})(?:\s+(\d{1,2}):(\d{2})(?::(\d{2}))?)?')
+
+
+def _normalize_header(value) -> str:
+    return re.sub(r'[\s\-_.]', '', str(value)).lower()
+
+
+def _text(value) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    text = str(value).strip()
+    return text or None
+
+
+def parse_bool(value) -> Optional[bool]:
+    """Ja/Nein, b/nb, bestanden/nicht bestanden -> bool (None wenn leer/unbekannt)"""
+    text = _text(value)
+    if text is None:
+        return None
+    key = text.lower().replace(' ', '')
+    if key in TRUE_VALUES:
+        return True
+    if key in FALSE_VALUES:
+        return False
+    return None
+
+
+def parse_number(value) -> Optional[float]:
+    """Messwert mit Dezimalkomma, Einheit oder Vergleichszeichen (z.B. ">299 MΩ") -> float"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    text = _text(value)
+    if text is None:
+        return None
+    match = _NUMBER.search(text)
+    return float(match.group().replace(',', '.')) if match else None
+
+
+def parse_datetime(value, datemode: Optional[int] = None) -> Optional[datetime]:
+    """Prüfdatum "01.12.2021 10:15", ISO-String oder Excel-Seriennummer -> datetime"""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, float) and datemode is not None and xlrd is not None:
+        return xlrd.xldate_as_datetime(value, datemode) if value > 0 else None
+    text = _text(value)
+    if text is None:
+        return None
+    match = _GERMAN_DATE.fullmatch(text)
+    if match:
+        day, month, year, hour, minute, second = match.groups()
+        year = int(year) + 2000 if len(year) == 2 else int(year)
+        return datetime(year, int(month), int(day), int(hour or 0), int(minute or 0), int(second or 0))
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+# ANCHOR: Datensatz
+@dataclass
+class ProtocolRecord:
+    """Eine Messzeile des Prüfprotokolls"""
+    row_number: int
+    name: Optional[str] = None
+    id_number: Optional[str] = None
+    test_sequence: Optional[str] = None
+    inspection_date: Optional[datetime] = None
+    visual_ok: Optional[bool] = None
+    r_pe: Optional[float] = None
+    r_iso: Optional[float] = None
+    i_pe: Optional[float] = None
+    i_b: Optional[float] = None
+    cable_ok: Optional[bool] = None
+    rcd: Optional[str] = None
+    function_ok: Optional[bool] = None
+    electrical_ok: Optional[bool] = None
+    passed: Optional[bool] = None
+    next_inspection: Optional[date] = None
+
+    @property
+    def is_empty(self) -> bool:
+        """Leere Vorlagenzeile (nur laufende Nummer)"""
+        return not (self.name or self.id_number or self.inspection_date
+                    or any(v is not None for v in (self.r_pe, self.r_iso, self.i_pe, self.i_b)))
+
+    @property
+    def result(self) -> str:
+        """Prüfergebnis: Gesamtprüfung, sonst elektrische Prüfung, sonst pending"""
+        verdict = self.passed if self.passed is not None else self.electrical_ok
+        if verdict is None:
+            return 'pending'
+        return 'pass' if verdict else 'fail'
+
+
+class ST725ProtocolReader:
+    """Streaming-Reader für ST 725 Prüfprotokolle
+
+    Nach dem Lesen der Kopfzeile enthält `metadata` die Angaben aus dem
+    Kopfbereich (customer, inspector), soweit vorhanden.
+    """
+
+    def __init__(self, delimiter: str = ';', encoding: str = 'cp1252'):
+        self.delimiter = delimiter
+        self.encoding = encoding
+        self.metadata: Dict[str, str] = {}
+
+    def read(self, filename: str, stream: IO[bytes]) -> Iterator[ProtocolRecord]:
+        """Lese Datei abhängig von der Endung (.csv oder .xls)"""
+        if filename.lower().endswith('.xls'):
+            return self.read_xls(stream.read())
+        return self.read_csv(TextIOWrapper(stream, encoding=self.encoding, newline=''))
+
+    def read_csv(self, text_stream: IO[str]) -> Iterator[ProtocolRecord]:
+        """CSV-Export des Geräts zeilenweise lesen"""
+        return self._iter_records(csv.reader(text_stream, delimiter=self.delimiter))
+
+    def read_xls(self, content: bytes) -> Iterator[ProtocolRecord]:
+        """Excel-Prüfprotokoll (erstes Tabellenblatt) zeilenweise lesen
+
+        Raises:
+            ValueError: Wenn xlrd nicht installiert ist
+        """
+        if xlrd is None:
+            raise ValueError("Reading .xls protocols requires the 'xlrd' package")
+        book = xlrd.open_workbook(file_contents=content, on_demand=True)
+        sheet = book.sheet_by_index(0)
+        rows = (sheet.row_values(index) for index in range(sheet.nrows))
+        return self._iter_records(rows, datemode=book.datemode)
+
+    # ANCHOR: Zeilenverarbeitung
+    def _iter_records(self, rows: Iterable[Sequence], datemode: Optional[int] = None) -> Iterator[ProtocolRecord]:
+        columns: Optional[Dict[int, str]] = None
+        labels: Dict[int, str] = {}
+        for row_number, row in enumerate(rows, start=1):
+            if columns is None:
+                columns = self._match_header(row)
+                if columns is None:
+                    self._collect_metadata(row, labels)
+                continue
+            record = self._to_record(row_number, row, columns, datemode)
+            if not record.is_empty:
+                yield record
+
+    def _match_header(self, row: Sequence) -> Optional[Dict[int, str]]:
+        """Spaltenindex -> Feld, wenn die Zeile eine Protokoll-Kopfzeile ist"""
+        columns: Dict[int, str] = {}
+        assigned = set()
+        for index, cell in enumerate(row):
+            header = _normalize_header(cell)
+            if not header:
+                continue
+            for keyword, field_name in HEADER_KEYWORDS:
+                if keyword in header and field_name not in assigned:
+                    columns[index] = field_name
+                    assigned.add(field_name)
+                    # Kombinierte Spalte "Ableitstrom IPE [mA] IBer [mA]" (zwei Zellen)
+                    if field_name == 'i_b' and 'ipe' in header and 'i_pe' not in assigned:
+                        columns[index] = 'i_pe'
+                        columns[index + 1] = 'i_b'
+                        assigned.add('i_pe')
+                    break
+        if 'inspection_date' in assigned and assigned & {'r_pe', 'r_iso', 'id_number'}:
+            return columns
+        return None
+
+    def _collect_metadata(self, row: Sequence, labels: Dict[int, str]) -> None:
+        """Kopfbereich: Werte unter "Auftraggeber" / "Prüfer" übernehmen"""
+        for index, cell in enumerate(row):
+            text = _text(cell)
+            # Beschriftungen enden mit ":" (z.B. "Auftragnehmer/Prüfer:")
+            header = _normalize_header(cell) if text and text.endswith(':') else ''
+            if 'auftraggeber' in header:
+                labels[index] = 'customer'
+            elif 'prüfer' in header:
+                labels[index] = 'inspector'
+            elif text and index in labels:
+                key = labels[index]
+                # Kunde = erste Zeile (Firmenname), Prüfer = letzte Zeile (Person)
+                if key == 'inspector' or key not in self.metadata:
+                    self.metadata[key] = text
+
+    def _to_record(self, row_number: int, row: Sequence, columns: Dict[int, str],
+                   datemode: Optional[int]) -> ProtocolRecord:
+        record = ProtocolRecord(row_number=row_number)
+        for index, field_name in columns.items():
+            if index >= len(row):
+                continue
+            value = row[index]
+            if field_name in ('r_pe', 'r_iso', 'i_pe', 'i_b'):
+                setattr(record, field_name, parse_number(value))
+            elif field_name in ('visual_ok', 'cable_ok', 'function_ok', 'electrical_ok', 'passed'):
+                setattr(record, field_name, parse_bool(value))
+            elif field_name == 'inspection_date':
+                record.inspection_date = parse_datetime(value, datemode)
+            elif field_name == 'next_inspection':
+                next_date = parse_datetime(value, datemode)
+                record.next_inspection = next_date.date() if next_date else None
+            else:
+                setattr(record, field_name, _text(value))
+        return record
+
@@ -0,0 +1,44 @@
+"""DECIMAL-Prüfwerte - Umwandlung zu float beim Mapping
+
+Die DGUV3-Prüfwerte (r_pe, r_iso, i_pe, i_b) und der Innenwiderstand
+(internal_resistance) sind DECIMAL-Spalten, für die mysql.connector
+`decimal.Decimal` liefert. Die Verbindung behält bewusst den Standard-Konverter:
+jede `converter_class` schaltet die C-Extension in den Raw-Modus und dekodiert
+dann jede Spalte jeder Zeile in Python. Stattdessen werden nur diese fünf
+Spalten im Row-Mapper zu float umgewandelt.
+
+Für gedruckte Protokolle (PDF, Tabellenexport) gibt es den Modus 'exact': die
+Werte bleiben `Decimal` mit der Skala der Spalte (z.B. 0.150 statt 0.15).
+"""
+from decimal import Decimal
+from typing import Callable, Optional, Tuple
+
+
+# DECIMAL-Spalten der Tabellen devices und inspections
+DECIMAL_COLUMNS: Tuple[str, ...] = ('r_pe', 'r_iso', 'i_pe', 'i_b', 'internal_resistance')
+
+# Mapping der DECIMAL-Spalten: 'float' (Standard) oder 'exact' (Decimal)
+DECIMAL_FLOAT = 'float'
+DECIMAL_EXACT = 'exact'
+DECIMAL_MODES: Tuple[str, ...] = (DECIMAL_FLOAT, DECIMAL_EXACT)
+
+
+def to_float(value) -> Optional[float]:
+    """DECIMAL-Wert (Decimal, None) als float"""
+    return float(value) if value is not None else None
+
+
+def to_decimal(value) -> Optional[Decimal]:
+    """DECIMAL-Wert unverändert (Decimal vom Connector, None)"""
+    return value
+
+
+def decimal_converter(decimals: str) -> Callable:
+    """Umwandlung der DECIMAL-Werte für einen Modus (siehe DECIMAL_MODES)
+
+    Raises:
+        ValueError: Bei unbekanntem Modus
+    """
+    if decimals not in DECIMAL_MODES:
+        raise ValueError(f"decimals must be one of {list(DECIMAL_MODES)}, got '{decimals}'")
+    return to_float if decimals == DECIMAL_FLOAT else to_decimal
@@ -1,21 +1,67 @@
 """MySQL Device Repository - Hexagonal Architecture Pattern mit customer_device_id und USB-Kabel Feldern"""
 import time
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional, Sequence
 from src.core.domain.device import Device
+from src.core.domain.device_query import (
+    DUE_STATUSES, ChangeMarker, DevicePage, DeviceQuery, decode_cursor, encode_cursor
+)
 from src.adapters.services.logger_service import LoggerService
+from src.adapters.persistence.converters import DECIMAL_FLOAT, decimal_converter
+from src.adapters.persistence.row_mapper import MAPPED_COLUMNS, RowMapperCache
 import mysql.connector
 from mysql.connector import Error
 
 
+# Explizite Spaltenliste für Listenabfragen (ohne qr_code LONGBLOB)
+DEVICE_COLUMNS = ", ".join(MAPPED_COLUMNS)
+
+
+INSERT_DEVICE_SQL = """
+    INSERT INTO devices 
+    (customer, customer_device_id, name, type, location, manufacturer, serial_number, 
+     purchase_date, last_inspection, next_inspection, status, notes, 
+     r_pe, r_iso, i_pe, i_b,
+     cable_type, test_result, internal_resistance, emarker_active, inspection_notes,
+     qr_code)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+
+# ANCHOR: Nummernvergabe customer_device_id (Zähler pro Kunde)
+RESERVE_COUNTER_SEED_SQL = "INSERT IGNORE INTO customer_device_counters (customer, last_number) VALUES (%s, 0)"
+RESERVE_COUNTER_LOCK_SQL = "SELECT last_number FROM customer_device_counters WHERE customer = %s FOR UPDATE"
+RESERVE_COUNTER_UPDATE_SQL = "UPDATE customer_device_counters SET last_number = %s WHERE customer = %s"
+MAX_CUSTOMER_DEVICE_NUMBER_SQL = """
+    SELECT MAX(CAST(SUBSTRING_INDEX(customer_device_id, '-', -1) AS UNSIGNED)) as max_num 
+    FROM devices 
+    WHERE customer = %s AND customer_device_id LIKE %s
+"""
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE-Wildcards für Präfixsuche"""
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
 class MySQLDeviceRepository:
-    """MySQL implementation of Device Repository"""
+    """MySQL implementation of Device Repository
+    
+    decimals='exact' liefert die DECIMAL-Prüfwerte als Decimal statt float
+    (für Prüfprotokolle, siehe converters.py).
+    """
     
-    def __init__(self, host: str, port: int, user: str, password: str, database: str):
+    def __init__(self, host: str, port: int, user: str, password: str, database: str,
+                 decimals: str = DECIMAL_FLOAT):
         self.host = host
         self.port = port
         self.user = user
         self.password = password
         self.database = database
+        self.decimals = decimals
+        self._decimal = decimal_converter(decimals)
+        # Generierte Tupel -> Device Mapper pro Spaltenliste
+        self._row_mappers = RowMapperCache(decimals)
         self.logger = LoggerService()
         self.logger.info("MySQLDeviceRepository initialized", host=host)
     
@@ -45,50 +91,7 @@ class MySQLDeviceRepository:
             if not device.customer_device_id and device.customer:
                 device.customer_device_id = self._generate_customer_device_id(device.customer)
             
-            # FIX: Konvertiere leere Strings zu NULL für serial_number
-            # Dies verhindert Duplicate-Fehler bei leeren Seriennummern
-            if device.serial_number == "" or device.serial_number is None:
-                device.serial_number = None
-            
-            # FIX: Konvertiere leere Strings zu NULL für purchase_date
-            if device.purchase_date == "":
-                device.purchase_date = None
-            
-            query = """
-                INSERT INTO devices 
-                (customer, customer_device_id, name, type, location, manufacturer, serial_number, 
-                 purchase_date, last_inspection, next_inspection, status, notes, 
-                 r_pe, r_iso, i_pe, i_b,
-                 cable_type, test_result, internal_resistance, emarker_active, inspection_notes)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-            """
-            
-            values = (
-                device.customer,
-                device.customer_device_id,
-                device.name,
-                device.type,
-                device.location,
-                device.manufacturer,
-                device.serial_number,  # Jetzt NULL statt leerer String
-                device.purchase_date,  # Jetzt NULL statt leerer String
-                device.last_inspection,  # Prüfdatum
-                device.next_inspection,  # Nächste Prüfung
-                device.status or 'active',
-                device.notes,
-                device.r_pe,
-                device.r_iso,
-                device.i_pe,
-                device.i_b,
-                # USB-Kabel Felder (NEU)
-                device.cable_type,
-                device.test_result,
-                device.internal_resistance,
-                device.emarker_active,
-                device.inspection_notes
-            )
-            
-            cursor.execute(query, values)
+            cursor.execute(INSERT_DEVICE_SQL, self._insert_values(device))
             conn.commit()
             
             # Get the inserted ID
@@ -112,16 +115,116 @@ class MySQLDeviceRepository:
             self.logger.error(f"Failed to create device: {e}", exception=e)
             raise
     
+    def _insert_values(self, device: Device) -> tuple:
+        """Parameter-Tupel für INSERT_DEVICE_SQL"""
+        # FIX: Konvertiere leere Strings zu NULL für serial_number
+        # Dies verhindert Duplicate-Fehler bei leeren Seriennummern
+        if device.serial_number == "" or device.serial_number is None:
+            device.serial_number = None
+        
+        return (
+            device.customer,
+            device.customer_device_id,
+            device.name,
+            device.type,
+            device.location,
+            device.manufacturer,
+            device.serial_number,  # Jetzt NULL statt leerer String
+            device.purchase_date,
+            device.last_inspection,  # Prüfdatum
+            device.next_inspection,  # Nächste Prüfung
+            device.status or 'active',
+            device.notes,
+            device.r_pe,
+            device.r_iso,
+            device.i_pe,
+            device.i_b,
+            # USB-Kabel Felder (NEU)
+            device.cable_type,
+            device.test_result,
+            device.internal_resistance,
+            device.emarker_active,
+            device.inspection_notes,
+            # QR-Code wird einmalig beim Anlegen erzeugt und gespeichert
+            device.qr_code
+        )
+    
+    def create_many(self, devices: List[Device], batch_size: int = 200) -> Dict[int, str]:
+        """Create many devices in batched transactions
+        
+        Jeder Batch wird als ein mehrzeiliges INSERT in einer Transaktion
+        geschrieben. Schlägt ein Batch fehl (z.B. doppelte Seriennummer), wird
+        er zurückgerollt und zeilenweise wiederholt, damit nur die fehlerhaften
+        Geräte ausfallen. Erfolgreich angelegte Geräte erhalten ihre ID.
+        
+        Args:
+            devices: Geräte mit gesetzter customer_device_id
+            batch_size: Geräte pro Transaktion
+            
+        Returns:
+            Fehler pro Geräte-Index ({index: fehlermeldung}), leer wenn alles ok
+        """
+        errors: Dict[int, str] = {}
+        start_time = time.time()
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            for offset in range(0, len(devices), batch_size):
+                batch = list(enumerate(devices[offset:offset + batch_size], start=offset))
+                try:
+                    cursor.executemany(INSERT_DEVICE_SQL, [self._insert_values(d) for _, d in batch])
+                    conn.commit()
+                except Error as e:
+                    conn.rollback()
+                    self.logger.warning(f"Batch insert failed, retrying row by row: {e}",
+                                        offset=offset, size=len(batch))
+                    for index, device in batch:
+                        try:
+                            cursor.execute(INSERT_DEVICE_SQL, self._insert_values(device))
+                            conn.commit()
+                        except Error as row_error:
+                            conn.rollback()
+                            errors[index] = str(row_error)
+                self._assign_ids(cursor, [d for i, d in batch if i not in errors])
+            cursor.close()
+        finally:
+            conn.close()
+        
+        duration_ms = (time.time() - start_time) * 1000
+        self.logger.log_db_operation(
+            operation="INSERT",
+            table="devices",
+            result="success" if not errors else "partial",
+            duration_ms=duration_ms,
+            rows=len(devices) - len(errors),
+            failed=len(errors)
+        )
+        return errors
+    
+    def _assign_ids(self, cursor, devices: List[Device]) -> None:
+        """Lade die vergebenen Auto-Increment-IDs über customer_device_id nach"""
+        if not devices:
+            return
+        by_customer_id = {d.customer_device_id: d for d in devices}
+        placeholders = ', '.join(['%s'] * len(by_customer_id))
+        cursor.execute(
+            f"SELECT id, customer_device_id FROM devices WHERE customer_device_id IN ({placeholders})",
+            tuple(by_customer_id)
+        )
+        for device_id, customer_device_id in cursor.fetchall():
+            by_customer_id[customer_device_id].id = device_id
+    
     def get_by_id(self, device_id: int) -> Optional[Device]:
         """Get device by ID"""
         try:
             start_time = time.time()
             conn = self._get_connection()
-            cursor = conn.cursor(dictionary=True)
+            cursor = conn.cursor()
             
             query = "SELECT * FROM devices WHERE id = %s"
             cursor.execute(query, (device_id,))
             result = cursor.fetchone()
+            map_row = self._row_mappers.get(cursor.column_names)
             
             duration_ms = (time.time() - start_time) * 1000
             self.logger.log_db_operation(
@@ -135,7 +238,7 @@ class MySQLDeviceRepository:
             conn.close()
             
             if result:
-                return self._map_to_device(result)
+                return map_row(result)
             return None
         except Exception as e:
             self.logger.error(f"Failed to get device by id: {e}", exception=e)
@@ -146,11 +249,12 @@ class MySQLDeviceRepository:
         try:
             start_time = time.time()
             conn = self._get_connection()
-            cursor = conn.cursor(dictionary=True)
+            cursor = conn.cursor()
             
             query = "SELECT * FROM devices WHERE customer_device_id = %s"
             cursor.execute(query, (customer_device_id,))
             result = cursor.fetchone()
+            map_row = self._row_mappers.get(cursor.column_names)
             
             duration_ms = (time.time() - start_time) * 1000
             self.logger.log_db_operation(
@@ -164,22 +268,101 @@ class MySQLDeviceRepository:
             conn.close()
             
             if result:
-                return self._map_to_device(result)
+                return map_row(result)
             return None
         except Exception as e:
             self.logger.error(f"Failed to get device by customer_device_id: {e}", exception=e)
             raise
     
+    def get_customer_of(self, customer_device_id: str) -> Optional[str]:
+        """Get the customer of a device (QR-Bilder: nur customer, über den UNIQUE-Index)"""
+        try:
+            start_time = time.time()
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            cursor.execute("SELECT customer FROM devices WHERE customer_device_id = %s", (customer_device_id,))
+            result = cursor.fetchone()
+            
+            duration_ms = (time.time() - start_time) * 1000
+            self.logger.log_db_operation(
+                operation="SELECT",
+                table="devices",
+                result="success",
+                duration_ms=duration_ms,
+                query="customer_of"
+            )
+            
+            cursor.close()
+            conn.close()
+            
+            if result:
+                return result[0] or ""
+            return None
+        except Exception as e:
+            self.logger.error(f"Failed to get customer of device: {e}", exception=e)
+            raise
+    
+    def get_by_identifiers(self, customer_device_ids: Sequence[str] = (),
+                           serial_numbers: Sequence[str] = (),
+                           customer: Optional[str] = None) -> List[Device]:
+        """Get devices matching any of the customer device IDs or serial numbers (Import-Abgleich)
+        
+        Eine Abfrage über den UNIQUE-Index customer_device_id und den Index
+        idx_serial (Seriennummern sind nicht eindeutig). Mit `customer` werden
+        nur Geräte dieses Kunden gefunden.
+        """
+        conditions = []
+        params: list = []
+        for column, values in (('customer_device_id', customer_device_ids), ('serial_number', serial_numbers)):
+            values = [v for v in dict.fromkeys(values) if v]
+            if values:
+                conditions.append(f"{column} IN ({', '.join(['%s'] * len(values))})")
+                params.extend(values)
+        if not conditions:
+            return []
+        try:
+            start_time = time.time()
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            query = f"SELECT {DEVICE_COLUMNS} FROM devices WHERE ({' OR '.join(conditions)})"
+            if customer is not None:
+                query += " AND customer = %s"
+                params.append(customer)
+            cursor.execute(query, tuple(params))
+            results = cursor.fetchall()
+            map_row = self._row_mappers.get(cursor.column_names)
+            
+            duration_ms = (time.time() - start_time) * 1000
+            self.logger.log_db_operation(
+                operation="SELECT",
+                table="devices",
+                result="success",
+                duration_ms=duration_ms,
+                query="by_identifiers",
+                rows=len(results)
+            )
+            
+            cursor.close()
+            conn.close()
+            
+            return [map_row(row) for row in results]
+        except Exception as e:
+            self.logger.error(f"Failed to get devices by identifiers: {e}", exception=e)
+            raise
+    
     def get_all(self) -> List[Device]:
         """Get all devices"""
         try:
             start_time = time.time()
             conn = self._get_connection()
-            cursor = conn.cursor(dictionary=True)
+            cursor = conn.cursor()
             
             query = "SELECT * FROM devices ORDER BY id DESC"
             cursor.execute(query)
             results = cursor.fetchall()
+            map_row = self._row_mappers.get(cursor.column_names)
             
             duration_ms = (time.time() - start_time) * 1000
             self.logger.log_db_operation(
@@ -192,11 +375,212 @@ class MySQLDeviceRepository:
             cursor.close()
             conn.close()
             
-            return [self._map_to_device(row) for row in results]
+            return [map_row(row) for row in results]
         except Exception as e:
             self.logger.error(f"Failed to get all devices: {e}", exception=e)
             raise
     
+    def find(self, query: DeviceQuery) -> List[Device]:
+        """Find devices matching a DeviceQuery (Filter/Sortierung/Limit in SQL)"""
+        try:
+            start_time = time.time()
+            sql, params = self._build_select(query)
+            
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            results = cursor.fetchall()
+            map_row = self._row_mappers.get(cursor.column_names)
+            
+            duration_ms = (time.time() - start_time) * 1000
+            self.logger.log_db_operation(
+                operation="SELECT",
+                table="devices",
+                result="success",
+                duration_ms=duration_ms,
+                query="find",
+                rows=len(results)
+            )
+            
+            cursor.close()
+            conn.close()
+            
+            return [map_row(row) for row in results]
+        except Exception as e:
+            self.logger.error(f"Failed to find devices: {e}", exception=e)
+            raise
+    
+    def iter_find(self, query: DeviceQuery, fetch_size: int = 1000) -> Iterator[Device]:
+        """Stream devices matching a DeviceQuery (Server-Side-Cursor)
+        
+        Der ungepufferte Cursor holt die Zeilen blockweise (fetchmany) vom
+        Server, es liegen nie mehr als `fetch_size` Geräte im Speicher. Die
+        Verbindung bleibt geöffnet, bis der Generator erschöpft oder
+        geschlossen ist.
+        """
+        start_time = time.time()
+        sql, params = self._build_select(query)
+        conn = self._get_connection()
+        cursor = conn.cursor(buffered=False)
+        rows = 0
+        try:
+            cursor.execute(sql, params)
+            map_row = self._row_mappers.get(cursor.column_names)
+            while True:
+                batch = cursor.fetchmany(fetch_size)
+                if not batch:
+                    break
+                rows += len(batch)
+                for row in batch:
+                    yield map_row(row)
+            
+            duration_ms = (time.time() - start_time) * 1000
+            self.logger.log_db_operation(
+                operation="SELECT",
+                table="devices",
+                result="success",
+                duration_ms=duration_ms,
+                query="iter_find",
+                rows=rows
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to stream devices: {e}", exception=e)
+            raise
+        finally:
+            # Abgebrochener Download: ungelesene Zeilen nicht nachladen ("Unread result"),
+            # das Schließen der Verbindung verwirft sie serverseitig
+            try:
+                cursor.close()
+            except Error:
+                pass
+            conn.close()
+    
+    def _build_select(self, query: DeviceQuery, columns: str = DEVICE_COLUMNS) -> tuple:
+        """Übersetze DeviceQuery in (SQL, Parameter)
+        
+        Feldnamen stammen ausschließlich aus den validierten Whitelists in
+        DeviceQuery; Werte werden immer als Parameter übergeben.
+        """
+        conditions = []
+        params: list = []
+        
+        if query.customer:
+            conditions.append("customer = %s")
+            params.append(query.customer)
+        if query.statuses:
+            conditions.append(f"status IN ({', '.join(['%s'] * len(query.statuses))})")
+            params.extend(query.statuses)
+        if query.types:
+            conditions.append(f"type IN ({', '.join(['%s'] * len(query.types))})")
+            params.extend(query.types)
+        if query.location_prefix:
+            conditions.append("location LIKE %s")
+            params.append(f"{_escape_like(query.location_prefix)}%")
+        for column, lower, upper in (
+            ('next_inspection', query.next_inspection_from, query.next_inspection_to),
+            ('last_inspection', query.last_inspection_from, query.last_inspection_to),
+        ):
+            if lower is not None:
+                conditions.append(f"{column} >= %s")
+                params.append(lower)
+            if upper is not None:
+                conditions.append(f"{column} <= %s")
+                params.append(upper)
+        for metric, value in query.min_values.items():
+            conditions.append(f"{metric} >= %s")
+            params.append(value)
+        for metric, value in query.max_values.items():
+            conditions.append(f"{metric} <= %s")
+            params.append(value)
+        
+        sql = f"SELECT {columns} FROM devices"
+        if conditions:
+            sql += f" WHERE {' AND '.join(conditions)}"
+        
+        order = [f"{key[1:]} DESC" if key.startswith('-') else f"{key} ASC" for key in query.sort]
+        if not any(key.lstrip('-') == 'id' for key in query.sort):
+            order.append("id DESC")  # stabile Reihenfolge
+        sql += f" ORDER BY {', '.join(order)}"
+        
+        if query.limit is not None:
+            sql += " LIMIT %s"
+            params.append(query.limit)
+        return sql, tuple(params)
+    
+    def get_due_for_inspection(self, until: date, customer: Optional[str] = None,
+                               location: Optional[str] = None, limit: int = 100,
+                               cursor: Optional[str] = None) -> DevicePage:
+        """Get devices due for inspection up to `until` (inkl. überfällige)
+        
+        Nutzt den Index idx_customer_next_inspection_status (customer,
+        next_inspection, status) bzw. idx_next_inspection ohne Kundenfilter.
+        Sortierung und Pagination über den Keyset (next_inspection, id).
+        
+        Args:
+            until: Letztes Fälligkeitsdatum (inklusive)
+            customer: Optionaler Kundenfilter (exakt)
+            location: Optionaler Standortfilter (Präfix, z.B. "Berlin - Büro")
+            limit: Maximale Anzahl Geräte pro Seite
+            cursor: Cursor der vorherigen Seite (DevicePage.next_cursor)
+            
+        Returns:
+            DevicePage mit Geräten und Cursor auf die Folgeseite
+        """
+        try:
+            start_time = time.time()
+            
+            conditions = ["next_inspection IS NOT NULL", "next_inspection <= %s"]
+            params: list = [until]
+            if customer:
+                conditions.insert(0, "customer = %s")
+                params.insert(0, customer)
+            conditions.append(f"status IN ({', '.join(['%s'] * len(DUE_STATUSES))})")
+            params.extend(DUE_STATUSES)
+            if location:
+                conditions.append("location LIKE %s")
+                params.append(f"{_escape_like(location)}%")
+            if cursor:
+                after_date, after_id = decode_cursor(cursor)
+                conditions.append("(next_inspection > %s OR (next_inspection = %s AND id > %s))")
+                params.extend([after_date, after_date, after_id])
+            
+            # Eine Zeile mehr laden, um das Vorhandensein einer Folgeseite zu erkennen
+            query = (
+                f"SELECT {DEVICE_COLUMNS} FROM devices "
+                f"WHERE {' AND '.join(conditions)} "
+                f"ORDER BY next_inspection, id LIMIT %s"
+            )
+            params.append(limit + 1)
+            
+            conn = self._get_connection()
+            db_cursor = conn.cursor()
+            db_cursor.execute(query, tuple(params))
+            results = db_cursor.fetchall()
+            map_row = self._row_mappers.get(db_cursor.column_names)
+            
+            duration_ms = (time.time() - start_time) * 1000
+            self.logger.log_db_operation(
+                operation="SELECT",
+                table="devices",
+                result="success",
+                duration_ms=duration_ms,
+                query="due_for_inspection",
+                customer=customer
+            )
+            
+            db_cursor.close()
+            conn.close()
+            
+            devices = [map_row(row) for row in results[:limit]]
+            next_cursor = None
+            if len(results) > limit and devices:
+                last = devices[-1]
+                next_cursor = encode_cursor(last.next_inspection, last.id)
+            return DevicePage(items=devices, next_cursor=next_cursor)
+        except Exception as e:
+            self.logger.error(f"Failed to get devices due for inspection: {e}", exception=e)
+            raise
+    
     def update(self, device: Device) -> Device:
         """Update an existing device"""
         try:
@@ -216,7 +600,8 @@ class MySQLDeviceRepository:
                     manufacturer = %s, serial_number = %s, purchase_date = %s, 
                     status = %s, notes = %s,
                     cable_type = %s, test_result = %s, internal_resistance = %s,
-                    emarker_active = %s, inspection_notes = %s
+                    emarker_active = %s, inspection_notes = %s,
+                    qr_code = COALESCE(%s, qr_code)
                 WHERE customer_device_id = %s
             """
             
@@ -236,6 +621,8 @@ class MySQLDeviceRepository:
                 device.internal_resistance,
                 device.emarker_active,
                 device.inspection_notes,
+                # Neuer QR-Code nur, wenn der Use Case einen erzeugt hat
+                device.qr_code,
                 device.customer_device_id
             )
             
@@ -259,6 +646,188 @@ class MySQLDeviceRepository:
             self.logger.error(f"Failed to update device: {e}", exception=e)
             raise
     
+    def get_change_marker(self, customer: str) -> ChangeMarker:
+        """Änderungsstand eines Kunden: (Anzahl Geräte, MAX(updated_at), NOW())
+        
+        Reiner Index-Zugriff über idx_customer_updated. NOW() liefert die
+        Datenbankzeit in derselben Session-Zeitzone wie updated_at.
+        """
+        try:
+            start_time = time.time()
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT COUNT(*), MAX(updated_at), NOW() FROM devices WHERE customer = %s",
+                (customer,)
+            )
+            count, changed_at, observed_at = cursor.fetchone()
+            
+            duration_ms = (time.time() - start_time) * 1000
+            self.logger.log_db_operation(
+                operation="SELECT",
+                table="devices",
+                result="success",
+                duration_ms=duration_ms,
+                query="change_marker",
+                customer=customer
+            )
+            
+            cursor.close()
+            conn.close()
+            
+            return ChangeMarker(int(count or 0), changed_at, observed_at)
+        except Exception as e:
+            self.logger.error(f"Failed to get change marker: {e}", exception=e)
+            raise
+    
+    def get_changed_since(self, customer: str, since: Optional[datetime] = None) -> List[Device]:
+        """Geräte eines Kunden mit updated_at >= since (alle ohne since)"""
+        try:
+            start_time = time.time()
+            sql = f"SELECT {DEVICE_COLUMNS} FROM devices WHERE customer = %s"
+            params: tuple = (customer,)
+            if since is not None:
+                # >= statt >: TIMESTAMP hat Sekundenauflösung, Änderungen in
+                # derselben Sekunde dürfen nicht verloren gehen
+                sql += " AND updated_at >= %s"
+                params += (since,)
+            
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute(sql, params)
+            results = cursor.fetchall()
+            map_row = self._row_mappers.get(cursor.column_names)
+            
+            duration_ms = (time.time() - start_time) * 1000
+            self.logger.log_db_operation(
+                operation="SELECT",
+                table="devices",
+                result="success",
+                duration_ms=duration_ms,
+                query="changed_since",
+                customer=customer,
+                rows=len(results)
+            )
+            
+            cursor.close()
+            conn.close()
+            
+            return [map_row(row) for row in results]
+        except Exception as e:
+            self.logger.error(f"Failed to get changed devices: {e}", exception=e)
+            raise
+    
+    def get_without_qr_code(self, limit: int = 200, after_id: int = 0) -> List[Device]:
+        """Get devices without stored QR code (Backfill), ordered by id
+        
+        Args:
+            limit: Maximale Anzahl Geräte
+            after_id: Nur Geräte mit id > after_id (Keyset über den Primärschlüssel)
+        """
+        try:
+            start_time = time.time()
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            query = (
+                f"SELECT {DEVICE_COLUMNS} FROM devices "
+                f"WHERE qr_code IS NULL AND customer_device_id IS NOT NULL AND id > %s "
+                f"ORDER BY id LIMIT %s"
+            )
+            cursor.execute(query, (after_id, limit))
+            results = cursor.fetchall()
+            map_row = self._row_mappers.get(cursor.column_names)
+            
+            duration_ms = (time.time() - start_time) * 1000
+            self.logger.log_db_operation(
+                operation="SELECT",
+                table="devices",
+                result="success",
+                duration_ms=duration_ms,
+                query="without_qr_code",
+                rows=len(results)
+            )
+            
+            cursor.close()
+            conn.close()
+            
+            return [map_row(row) for row in results]
+        except Exception as e:
+            self.logger.error(f"Failed to get devices without QR code: {e}", exception=e)
+            raise
+    
+    def get_qr_code_batch(self, limit: int = 200, after_id: int = 0) -> List[Device]:
+        """Get devices with their stored QR code (Backfill veralteter QR-Codes), ordered by id
+        
+        Args:
+            limit: Maximale Anzahl Geräte
+            after_id: Nur Geräte mit id > after_id (Keyset über den Primärschlüssel)
+        """
+        try:
+            start_time = time.time()
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            query = (
+                "SELECT id, customer, customer_device_id, name, qr_code FROM devices "
+                "WHERE customer_device_id IS NOT NULL AND id > %s "
+                "ORDER BY id LIMIT %s"
+            )
+            cursor.execute(query, (after_id, limit))
+            results = cursor.fetchall()
+            map_row = self._row_mappers.get(cursor.column_names)
+            
+            duration_ms = (time.time() - start_time) * 1000
+            self.logger.log_db_operation(
+                operation="SELECT",
+                table="devices",
+                result="success",
+                duration_ms=duration_ms,
+                query="qr_code_batch",
+                rows=len(results)
+            )
+            
+            cursor.close()
+            conn.close()
+            
+            return [map_row(row) for row in results]
+        except Exception as e:
+            self.logger.error(f"Failed to get devices with QR code: {e}", exception=e)
+            raise
+    
+    def update_qr_codes(self, qr_codes: Dict[int, bytes]) -> int:
+        """Store QR codes for many devices in one transaction ({id: qr_code})"""
+        if not qr_codes:
+            return 0
+        try:
+            start_time = time.time()
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            cursor.executemany(
+                "UPDATE devices SET qr_code = %s WHERE id = %s",
+                [(qr_code, device_id) for device_id, qr_code in qr_codes.items()]
+            )
+            conn.commit()
+            
+            duration_ms = (time.time() - start_time) * 1000
+            self.logger.log_db_operation(
+                operation="UPDATE",
+                table="devices",
+                result="success",
+                duration_ms=duration_ms,
+                query="qr_codes",
+                rows=len(qr_codes)
+            )
+            
+            cursor.close()
+            conn.close()
+            
+            return len(qr_codes)
+        except Exception as e:
+            self.logger.error(f"Failed to store QR codes: {e}", exception=e)
+            raise
+    
     def delete(self, customer_device_id: str) -> bool:
         """Delete a device"""
         try:
@@ -266,6 +835,12 @@ class MySQLDeviceRepository:
             conn = self._get_connection()
             cursor = conn.cursor(dictionary=True)
             
+            # measurements ist partitioniert und hat daher keinen Fremdschlüssel (kein CASCADE)
+            cursor.execute(
+                "DELETE m FROM measurements m JOIN devices d ON d.id = m.device_id "
+                "WHERE d.customer_device_id = %s",
+                (customer_device_id,)
+            )
             query = "DELETE FROM devices WHERE customer_device_id = %s"
             cursor.execute(query, (customer_device_id,))
             conn.commit()
@@ -287,33 +862,78 @@ class MySQLDeviceRepository:
             self.logger.error(f"Failed to delete device: {e}", exception=e)
             raise
     
+    def reserve_customer_device_ids(self, customer: str, count: int) -> List[str]:
+        """Reserve a contiguous block of customer device IDs (e.g. Parloa-00004..00010)
+        
+        Der Zähler pro Kunde (customer_device_counters) wird mit SELECT ... FOR
+        UPDATE gesperrt und in derselben Transaktion hochgezählt; gleichzeitige
+        Anlagen erhalten dadurch disjunkte Blöcke. Manuell vergebene IDs werden
+        über MAX() der vorhandenen Geräte berücksichtigt. Nicht genutzte
+        Nummern (fehlgeschlagene Inserts) bleiben als Lücke frei.
+        
+        Raises:
+            Exception: Wenn die Datenbankabfrage fehlschlägt
+        """
+        start_time = time.time()
+        conn = self._get_connection()
+        try:
+            cursor = conn.cursor()
+            # Zählerzeile anlegen (eigene Transaktion, sonst blockieren sich
+            # gleichzeitige Erstanlagen gegenseitig beim FOR UPDATE)
+            cursor.execute(RESERVE_COUNTER_SEED_SQL, (customer,))
+            conn.commit()
+            
+            conn.start_transaction()
+            try:
+                cursor.execute(RESERVE_COUNTER_LOCK_SQL, (customer,))
+                last_number = cursor.fetchone()[0]
+                cursor.execute(MAX_CUSTOMER_DEVICE_NUMBER_SQL, (customer, f"{_escape_like(customer)}-%"))
+                result = cursor.fetchone()
+                first_num = max(last_number, (result[0] if result else 0) or 0) + 1
+                cursor.execute(RESERVE_COUNTER_UPDATE_SQL, (first_num + count - 1, customer))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            cursor.close()
+        finally:
+            conn.close()
+        
+        duration_ms = (time.time() - start_time) * 1000
+        self.logger.log_db_operation(
+            operation="UPDATE",
+            table="customer_device_counters",
+            result="success",
+            duration_ms=duration_ms,
+            customer=customer,
+            count=count
+        )
+        
+        # Format as "Customer-00001"
+        return [f"{customer}-{num:05d}" for num in range(first_num, first_num + count)]
+    
     def get_next_customer_device_id(self, customer: str) -> str:
-        """Get next customer device ID (e.g., Parloa-00001)"""
+        """Get next customer device ID (e.g., Parloa-00001)
+        
+        Nur Vorschau (Formulare): es wird nichts reserviert. Zum Anlegen
+        reserve_customer_device_ids verwenden.
+        """
         try:
             conn = self._get_connection()
-            cursor = conn.cursor(dictionary=True)
+            cursor = conn.cursor()
             
-            # Get the highest number for this customer
-            query = """
-                SELECT MAX(CAST(SUBSTRING_INDEX(customer_device_id, '-', -1) AS UNSIGNED)) as max_num 
-                FROM devices 
-                WHERE customer = %s AND customer_device_id LIKE %s
-            """
-            
-            pattern = f"{customer}-%"
-            cursor.execute(query, (customer, pattern))
+            cursor.execute("SELECT last_number FROM customer_device_counters WHERE customer = %s", (customer,))
+            counter = cursor.fetchone()
+            cursor.execute(MAX_CUSTOMER_DEVICE_NUMBER_SQL, (customer, f"{_escape_like(customer)}-%"))
             result = cursor.fetchone()
             
             cursor.close()
             conn.close()
             
-            max_num = result.get('max_num') if result else 0
-            next_num = (max_num or 0) + 1
-            
-            # Format as "Customer-00001"
+            next_num = max(counter[0] if counter else 0, (result[0] if result else 0) or 0) + 1
             next_id = f"{customer}-{next_num:05d}"
             
-            self.logger.debug(f"Generated customer_device_id: {next_id}", customer=customer)
+            self.logger.debug(f"Next customer_device_id: {next_id}", customer=customer)
             
             return next_id
         except Exception as e:
@@ -321,11 +941,18 @@ class MySQLDeviceRepository:
             return f"{customer}-00001"
     
     def _generate_customer_device_id(self, customer: str) -> str:
-        """Generate a new customer device ID"""
-        return self.get_next_customer_device_id(customer)
+        """Generate a new customer device ID (reserviert)"""
+        return self.reserve_customer_device_ids(customer, 1)[0]
     
     def _map_to_device(self, row: dict) -> Device:
-        """Map database row to Device domain object"""
+        """Map database row (dict) to Device domain object
+        
+        Lesezugriffe verwenden den generierten Tupel-Mapper (row_mapper.py);
+        diese Dict-Variante bleibt für Dict-Cursor erhalten.
+        
+        DATE/DATETIME-Spalten werden in Device.__post_init__ einmalig zu
+        date bzw. zeitzonenbewusstem datetime normalisiert.
+        """
         return Device(
             id=row.get('id'),
             customer=row.get('customer'),
@@ -340,14 +967,14 @@ class MySQLDeviceRepository:
             next_inspection=row.get('next_inspection'),
             status=row.get('status'),
             notes=row.get('notes'),
-            r_pe=row.get('r_pe'),
-            r_iso=row.get('r_iso'),
-            i_pe=row.get('i_pe'),
-            i_b=row.get('i_b'),
+            r_pe=self._decimal(row.get('r_pe')),
+            r_iso=self._decimal(row.get('r_iso')),
+            i_pe=self._decimal(row.get('i_pe')),
+            i_b=self._decimal(row.get('i_b')),
             # USB-Kabel Felder (NEU)
             cable_type=row.get('cable_type'),
             test_result=row.get('test_result'),
-            internal_resistance=row.get('internal_resistance'),
+            internal_resistance=self._decimal(row.get('internal_resistance')),
             emarker_active=row.get('emarker_active'),
             inspection_notes=row.get('inspection_notes')
         )
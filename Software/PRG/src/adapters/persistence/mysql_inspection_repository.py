@@ -0,0 +1,282 @@
+"""MySQL Inspection Repository - Prüfhistorie (inspections) mit transaktionalem Geräte-Update"""
+import time
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.core.domain.inspection import Inspection
+from src.core.domain.measurement import measurements_from_inspection
+from src.adapters.services.logger_service import LoggerService
+from src.adapters.persistence.converters import DECIMAL_COLUMNS, DECIMAL_FLOAT, decimal_converter
+from src.adapters.persistence.mysql_measurement_repository import insert_measurements
+import mysql.connector
+from mysql.connector import Error
+
+
+INSPECTION_COLUMNS = (
+    'id', 'device_id', 'inspection_date', 'result', 'inspector', 'notes',
+    'r_pe', 'r_iso', 'i_pe', 'i_b',
+    'cable_type', 'test_result', 'internal_resistance', 'emarker_active',
+    'created_at',
+)
+
+SELECT_INSPECTION_SQL = f"SELECT {', '.join(INSPECTION_COLUMNS)} FROM inspections"
+
+# Historie vieler Geräte: die letzten N Prüfungen pro Gerät über ROW_NUMBER()
+# (MySQL 8). Der Index idx_device_date liefert die Partitionen bereits sortiert.
+SELECT_HISTORY_SQL = (
+    f"SELECT {', '.join(INSPECTION_COLUMNS)} FROM ("
+    f"SELECT {', '.join(INSPECTION_COLUMNS)}, "
+    f"ROW_NUMBER() OVER (PARTITION BY device_id ORDER BY inspection_date DESC, id DESC) AS row_num "
+    f"FROM inspections WHERE device_id IN ({{placeholders}})"
+    f") ranked WHERE row_num <= %s "
+    f"ORDER BY device_id, inspection_date DESC, id DESC"
+)
+
+# Maximale Anzahl Geräte-IDs pro IN-Liste
+HISTORY_CHUNK_SIZE = 1000
+
+INSERT_INSPECTION_SQL = """
+    INSERT INTO inspections
+    (device_id, inspection_date, result, inspector, notes,
+     r_pe, r_iso, i_pe, i_b,
+     cable_type, test_result, internal_resistance, emarker_active)
+    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+# Gerät hält den aktuellen Stand: Termine, Status und die letzten Messwerte.
+# NULL-Werte (nicht gemessen / unverändert) überschreiben nichts; nachgetragene
+# ältere Prüfungen (z.B. Archiv-Import) landen nur in der Historie.
+UPDATE_DEVICE_AFTER_INSPECTION_SQL = """
+    UPDATE devices
+    SET last_inspection = %s,
+        next_inspection = COALESCE(%s, next_inspection),
+        status = COALESCE(%s, status),
+        r_pe = COALESCE(%s, r_pe), r_iso = COALESCE(%s, r_iso),
+        i_pe = COALESCE(%s, i_pe), i_b = COALESCE(%s, i_b),
+        cable_type = COALESCE(%s, cable_type), test_result = COALESCE(%s, test_result),
+        internal_resistance = COALESCE(%s, internal_resistance),
+        emarker_active = COALESCE(%s, emarker_active),
+        inspection_notes = COALESCE(%s, inspection_notes)
+    WHERE id = %s AND (last_inspection IS NULL OR last_inspection <= %s)
+"""
+
+
+class MySQLInspectionRepository:
+    """MySQL implementation of Inspection Repository
+    
+    decimals='exact' liefert die DECIMAL-Messwerte als Decimal statt float.
+    """
+    
+    def __init__(self, host: str, port: int, user: str, password: str, database: str,
+                 decimals: str = DECIMAL_FLOAT):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.database = database
+        self.decimals = decimals
+        self._decimal = decimal_converter(decimals)
+        self.logger = LoggerService()
+        self.logger.info("MySQLInspectionRepository initialized", host=host)
+    
+    def _get_connection(self):
+        """Get MySQL connection"""
+        try:
+            conn = mysql.connector.connect(
+                host=self.host,
+                port=self.port,
+                user=self.user,
+                password=self.password,
+                database=self.database
+            )
+            return conn
+        except Error as e:
+            self.logger.error(f"Database connection failed: {e}")
+            raise
+    
+    def record(self, inspection: Inspection, next_inspection: Optional[date],
+               device_status: Optional[str]) -> Inspection:
+        """Append inspection and update the device in one transaction (eine Verbindung)
+        
+        Schlägt einer der beiden Schritte fehl, wird beides zurückgerollt.
+        """
+        return self.record_many([(inspection, next_inspection, device_status)])[0]
+    
+    def record_many(self, entries: Sequence[Tuple[Inspection, Optional[date], Optional[str]]]) -> List[Inspection]:
+        """Append many inspections and update their devices in one transaction
+        
+        Die Messwerte werden zusätzlich an die Zeitreihe (measurements) angehängt.
+        
+        Bei mehreren Einträgen werden keine IDs zugewiesen (mehrzeiliges INSERT,
+        Auto-Increment-Werte sind bei innodb_autoinc_lock_mode=2 nicht lückenlos).
+        
+        Args:
+            entries: (inspection, next_inspection, device_status) pro Prüfung
+        """
+        if not entries:
+            return []
+        start_time = time.time()
+        conn = self._get_connection()
+        try:
+            conn.start_transaction()
+            cursor = conn.cursor()
+            
+            if len(entries) == 1:
+                cursor.execute(INSERT_INSPECTION_SQL, self._insert_values(entries[0][0]))
+                entries[0][0].id = cursor.lastrowid
+            else:
+                cursor.executemany(INSERT_INSPECTION_SQL, [self._insert_values(e[0]) for e in entries])
+            
+            update_values = [self._device_update_values(*entry) for entry in entries]
+            if len(update_values) == 1:
+                cursor.execute(UPDATE_DEVICE_AFTER_INSPECTION_SQL, update_values[0])
+            else:
+                cursor.executemany(UPDATE_DEVICE_AFTER_INSPECTION_SQL, update_values)
+            
+            # Messwert-Zeitreihe (measurements) in derselben Transaktion fortschreiben
+            measurements = [m for inspection, _, _ in entries for m in measurements_from_inspection(inspection)]
+            if measurements:
+                insert_measurements(cursor, measurements)
+            
+            conn.commit()
+            cursor.close()
+        except Exception as e:
+            conn.rollback()
+            self.logger.error(f"Failed to record inspections: {e}", exception=e, count=len(entries))
+            raise
+        finally:
+            conn.close()
+        
+        duration_ms = (time.time() - start_time) * 1000
+        self.logger.log_db_operation(
+            operation="INSERT",
+            table="inspections",
+            result="success",
+            duration_ms=duration_ms,
+            rows=len(entries)
+        )
+        return [inspection for inspection, _, _ in entries]
+    
+    def _insert_values(self, inspection: Inspection) -> tuple:
+        """Parameter-Tupel für INSERT_INSPECTION_SQL"""
+        return (
+            inspection.device_id,
+            inspection.inspection_date,
+            inspection.result,
+            inspection.inspector,
+            inspection.notes,
+            inspection.r_pe,
+            inspection.r_iso,
+            inspection.i_pe,
+            inspection.i_b,
+            inspection.cable_type,
+            inspection.test_result,
+            inspection.internal_resistance,
+            inspection.emarker_active
+        )
+    
+    def _device_update_values(self, inspection: Inspection, next_inspection: Optional[date],
+                              device_status: Optional[str]) -> tuple:
+        """Parameter-Tupel für UPDATE_DEVICE_AFTER_INSPECTION_SQL"""
+        return (
+            inspection.inspection_date,
+            next_inspection,
+            device_status,
+            inspection.r_pe,
+            inspection.r_iso,
+            inspection.i_pe,
+            inspection.i_b,
+            inspection.cable_type,
+            inspection.test_result,
+            inspection.internal_resistance,
+            inspection.emarker_active,
+            inspection.notes,
+            inspection.device_id,
+            inspection.inspection_date
+        )
+    
+    def get_latest(self, device_id: int) -> Optional[Inspection]:
+        """Get latest inspection (Index idx_device_date: ein Index-Lookup)"""
+        inspections = self.list_for_device(device_id, limit=1)
+        return inspections[0] if inspections else None
+    
+    def list_for_device(self, device_id: int, limit: int = 50) -> List[Inspection]:
+        """Get inspection history of a device, newest first"""
+        try:
+            start_time = time.time()
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            query = (
+                f"{SELECT_INSPECTION_SQL} WHERE device_id = %s "
+                f"ORDER BY inspection_date DESC, id DESC LIMIT %s"
+            )
+            cursor.execute(query, (device_id, limit))
+            results = cursor.fetchall()
+            
+            duration_ms = (time.time() - start_time) * 1000
+            self.logger.log_db_operation(
+                operation="SELECT",
+                table="inspections",
+                result="success",
+                duration_ms=duration_ms,
+                device_id=device_id
+            )
+            
+            cursor.close()
+            conn.close()
+            
+            return [self._map_to_inspection(row) for row in results]
+        except Exception as e:
+            self.logger.error(f"Failed to get inspections: {e}", exception=e)
+            raise
+    
+    def list_for_devices(self, device_ids: Sequence[int], per_device: int = 5) -> Dict[int, List[Inspection]]:
+        """Get the last `per_device` inspections for many devices (newest first)
+        
+        Eine Abfrage pro HISTORY_CHUNK_SIZE Geräte über eine Verbindung statt
+        einer Abfrage pro Gerät.
+        
+        Returns:
+            {device_id: [Inspection, ...]} - Geräte ohne Prüfung fehlen im Dict
+        """
+        unique_ids = list(dict.fromkeys(device_ids))
+        history: Dict[int, List[Inspection]] = {}
+        if not unique_ids:
+            return history
+        try:
+            start_time = time.time()
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            
+            for offset in range(0, len(unique_ids), HISTORY_CHUNK_SIZE):
+                chunk = unique_ids[offset:offset + HISTORY_CHUNK_SIZE]
+                query = SELECT_HISTORY_SQL.format(placeholders=', '.join(['%s'] * len(chunk)))
+                cursor.execute(query, (*chunk, per_device))
+                for row in cursor.fetchall():
+                    inspection = self._map_to_inspection(row)
+                    history.setdefault(inspection.device_id, []).append(inspection)
+            
+            duration_ms = (time.time() - start_time) * 1000
+            self.logger.log_db_operation(
+                operation="SELECT",
+                table="inspections",
+                result="success",
+                duration_ms=duration_ms,
+                query="history",
+                devices=len(unique_ids)
+            )
+            
+            cursor.close()
+            conn.close()
+            
+            return history
+        except Exception as e:
+            self.logger.error(f"Failed to get inspection history: {e}", exception=e)
+            raise
+    
+    def _map_to_inspection(self, row: tuple) -> Inspection:
+        """Map tuple row (Reihenfolge INSPECTION_COLUMNS) to Inspection, DECIMAL-Werte je Modus"""
+        values = dict(zip(INSPECTION_COLUMNS, row))
+        for column in DECIMAL_COLUMNS:
+            values[column] = self._decimal(values[column])
+        return Inspection(**values)
@@ -0,0 +1,216 @@
+"""MySQL Measurement Repository - Messwert-Zeitreihe (measurements) mit Trendberechnung in SQL"""
+import time
+from datetime import datetime
+from typing import List, Optional, Sequence
+from src.core.domain.measurement import METRIC_CODES, METRIC_NAMES, Measurement, MetricTrend
+from src.adapters.services.logger_service import LoggerService
+import mysql.connector
+from mysql.connector import Error
+
+
+# Zeilen pro INSERT (executemany fasst sie zu einem mehrzeiligen INSERT zusammen)
+MEASUREMENT_BATCH_SIZE = 1000
+
+# Idempotent: erneuter Import derselben Prüfung überschreibt nur den Wert
+INSERT_MEASUREMENT_SQL = """
+    INSERT INTO measurements (device_id, measured_at, metric, value)
+    VALUES (%s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE value = VALUES(value)
+"""
+
+# Lineare Regression value ~ x (x = Jahre seit Bezugszeitpunkt) pro Gerät und
+# Metrik: slope = (n*Sxy - Sx*Sy) / (n*Sxx - Sx^2). Erster/letzter Wert über
+# FIRST_VALUE (MySQL 8). Der Primärschlüssel (device_id, metric, measured_at)
+# liefert die Partitionen bereits sortiert.
+SELECT_TRENDS_SQL = """
+    SELECT device_id, metric, customer_device_id, COUNT(*) AS samples,
+           MIN(measured_at), MAX(measured_at), MAX(first_value), MAX(last_value),
+           (COUNT(*) * SUM(x * value) - SUM(x) * SUM(value))
+             / NULLIF(COUNT(*) * SUM(x * x) - SUM(x) * SUM(x), 0) AS slope
+    FROM (
+        SELECT m.device_id, m.metric, d.customer_device_id, m.measured_at, m.value,
+               TIMESTAMPDIFF(SECOND, '2000-01-01', m.measured_at) / 31557600e0 AS x,
+               FIRST_VALUE(m.value) OVER (PARTITION BY m.device_id, m.metric ORDER BY m.measured_at) AS first_value,
+               FIRST_VALUE(m.value) OVER (PARTITION BY m.device_id, m.metric ORDER BY m.measured_at DESC) AS last_value
+        FROM measurements m
+        JOIN devices d ON d.id = m.device_id
+        {where}
+    ) series
+    GROUP BY device_id, metric, customer_device_id
+    HAVING COUNT(*) >= %s
+"""
+
+
+def measurement_values(measurement: Measurement) -> tuple:
+    """Parameter-Tupel für INSERT_MEASUREMENT_SQL"""
+    return (measurement.device_id, measurement.measured_at, measurement.metric_code, measurement.value)
+
+
+def insert_measurements(cursor, measurements: Sequence[Measurement]) -> None:
+    """Messwerte über einen bestehenden Cursor schreiben (Teil einer Transaktion)"""
+    for start in range(0, len(measurements), MEASUREMENT_BATCH_SIZE):
+        batch = measurements[start:start + MEASUREMENT_BATCH_SIZE]
+        cursor.executemany(INSERT_MEASUREMENT_SQL, [measurement_values(m) for m in batch])
+
+
+def _value(value) -> float:
+    # FLOAT-Spalte: auf die Genauigkeit der Messgeräte (3 Nachkommastellen) runden
+    return round(float(value), 3)
+
+
+class MySQLMeasurementRepository:
+    """MySQL implementation of Measurement Repository"""
+
+    def __init__(self, host: str, port: int, user: str, password: str, database: str):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.database = database
+        self.logger = LoggerService()
+        self.logger.info("MySQLMeasurementRepository initialized", host=host)
+
+    def _get_connection(self):
+        """Get MySQL connection"""
+        try:
+            conn = mysql.connector.connect(
+                host=self.host,
+                port=self.port,
+                user=self.user,
+                password=self.password,
+                database=self.database
+            )
+            return conn
+        except Error as e:
+            self.logger.error(f"Database connection failed: {e}")
+            raise
+
+    def append_many(self, measurements: Sequence[Measurement]) -> int:
+        """Append measurements in batches within one transaction"""
+        if not measurements:
+            return 0
+        start_time = time.time()
+        conn = self._get_connection()
+        try:
+            conn.start_transaction()
+            cursor = conn.cursor()
+            insert_measurements(cursor, measurements)
+            conn.commit()
+            cursor.close()
+        except Exception as e:
+            conn.rollback()
+            self.logger.error(f"Failed to append measurements: {e}", exception=e, count=len(measurements))
+            raise
+        finally:
+            conn.close()
+
+        duration_ms = (time.time() - start_time) * 1000
+        self.logger.log_db_operation(
+            operation="INSERT",
+            table="measurements",
+            result="success",
+            duration_ms=duration_ms,
+            rows=len(measurements)
+        )
+        return len(measurements)
+
+    def get_series(self, device_id: int, metric: Optional[str] = None,
+                   since: Optional[datetime] = None) -> List[Measurement]:
+        """Get the measurement series of a device (Range-Scan über den Primärschlüssel)"""
+        try:
+            start_time = time.time()
+            sql = "SELECT metric, measured_at, value FROM measurements WHERE device_id = %s"
+            params: list = [device_id]
+            if metric is not None:
+                sql += " AND metric = %s"
+                params.append(METRIC_CODES[metric])
+            if since is not None:
+                sql += " AND measured_at >= %s"
+                params.append(since)
+            sql += " ORDER BY metric, measured_at"
+
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute(sql, tuple(params))
+            results = cursor.fetchall()
+
+            duration_ms = (time.time() - start_time) * 1000
+            self.logger.log_db_operation(
+                operation="SELECT",
+                table="measurements",
+                result="success",
+                duration_ms=duration_ms,
+                device_id=device_id,
+                rows=len(results)
+            )
+
+            cursor.close()
+            conn.close()
+
+            return [
+                Measurement(device_id, measured_at, METRIC_NAMES[code], _value(value))
+                for code, measured_at, value in results
+            ]
+        except Exception as e:
+            self.logger.error(f"Failed to get measurements: {e}", exception=e)
+            raise
+
+    def get_trends(self, customer: Optional[str] = None, device_ids: Sequence[int] = (),
+                   metric: Optional[str] = None, since: Optional[datetime] = None,
+                   min_samples: int = 2) -> List[MetricTrend]:
+        """Compute per-device trends in one aggregate query"""
+        try:
+            start_time = time.time()
+            conditions = []
+            params: list = []
+            if customer:
+                conditions.append("d.customer = %s")
+                params.append(customer)
+            if device_ids:
+                conditions.append(f"m.device_id IN ({', '.join(['%s'] * len(device_ids))})")
+                params.extend(device_ids)
+            if metric is not None:
+                conditions.append("m.metric = %s")
+                params.append(METRIC_CODES[metric])
+            if since is not None:
+                conditions.append("m.measured_at >= %s")
+                params.append(since)
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            params.append(min_samples)
+
+            conn = self._get_connection()
+            cursor = conn.cursor()
+            cursor.execute(SELECT_TRENDS_SQL.format(where=where), tuple(params))
+            results = cursor.fetchall()
+
+            duration_ms = (time.time() - start_time) * 1000
+            self.logger.log_db_operation(
+                operation="SELECT",
+                table="measurements",
+                result="success",
+                duration_ms=duration_ms,
+                query="trends",
+                rows=len(results)
+            )
+
+            cursor.close()
+            conn.close()
+
+            return [
+                MetricTrend(
+                    device_id=device_id,
+                    metric=METRIC_NAMES[code],
+                    customer_device_id=customer_device_id,
+                    samples=int(samples),
+                    first_at=first_at,
+                    last_at=last_at,
+                    first_value=_value(first_value),
+                    last_value=_value(last_value),
+                    slope_per_year=float(slope) if slope is not None else None
+                )
+                for (device_id, code, customer_device_id, samples, first_at, last_at,
+                     first_value, last_value, slope) in results
+            ]
+        except Exception as e:
+            self.logger.error(f"Failed to compute measurement trends: {e}", exception=e)
+            raise
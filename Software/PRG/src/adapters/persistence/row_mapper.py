@@ -0,0 +1,85 @@
+"""Positionaler Row-Mapper - Device-Objekte direkt aus Tupel-Zeilen
+
+`cursor(dictionary=True)` erzeugt pro Zeile ein Dict, auf das der klassische
+Mapper anschließend ~22 `row.get()`-Aufrufe macht. Dieser Mapper wird einmal
+pro Spaltenliste (cursor.column_names) erzeugt: die Spaltenindizes werden
+vorab berechnet und in eine generierte Funktion übersetzt, die den
+Device-Konstruktor direkt mit `row[i]`-Zugriffen aufruft.
+
+DECIMAL-Prüfwerte (converters.DECIMAL_COLUMNS) werden dabei zu float
+umgewandelt (decimals='exact': bleiben Decimal). Spalten, die kein Device-Feld sind (created_at, ...), werden ignoriert;
+fehlende Device-Felder bekommen ihren Default-Wert. Der gespeicherte QR-Code
+(BLOB_COLUMNS) wird nur übernommen, wenn die Abfrage ihn selektiert.
+"""
+from dataclasses import fields
+from threading import Lock
+from typing import Callable, Dict, Sequence, Tuple
+
+from src.core.domain.device import Device
+from src.adapters.persistence.converters import DECIMAL_COLUMNS, DECIMAL_FLOAT, decimal_converter
+
+
+# Device-Felder, die aus der devices-Tabelle gelesen werden
+MAPPED_COLUMNS: Tuple[str, ...] = (
+    'id', 'customer', 'customer_device_id', 'name', 'type', 'location',
+    'manufacturer', 'model', 'serial_number', 'purchase_date',
+    'last_inspection', 'next_inspection', 'status', 'notes',
+    'r_pe', 'r_iso', 'i_pe', 'i_b',
+    'cable_type', 'test_result', 'internal_resistance', 'emarker_active',
+    'inspection_notes',
+)
+
+# Große Spalten, die nur bei Bedarf selektiert werden (nicht in MAPPED_COLUMNS)
+BLOB_COLUMNS: Tuple[str, ...] = ('qr_code',)
+
+RowMapper = Callable[[Sequence], Device]
+
+
+def build_row_mapper(column_names: Sequence[str], decimals: str = DECIMAL_FLOAT) -> RowMapper:
+    """Erzeuge Mapper Tupel -> Device für eine feste Spaltenliste
+
+    Args:
+        column_names: Spaltennamen in Cursor-Reihenfolge (cursor.column_names)
+        decimals: 'float' (Standard) oder 'exact' (DECIMAL-Werte bleiben Decimal)
+
+    Returns:
+        Funktion, die eine Tupel-Zeile in ein Device übersetzt
+
+    Raises:
+        ValueError: Bei unbekanntem decimals-Modus
+    """
+    decimal_converter(decimals)
+    position = {name: index for index, name in enumerate(column_names)}
+    namespace = {'Device': Device}
+    arguments = []
+    for field in fields(Device):
+        if (field.name not in MAPPED_COLUMNS and field.name not in BLOB_COLUMNS) or field.name not in position:
+            continue
+        value = f"row[{position[field.name]}]"
+        if field.name in DECIMAL_COLUMNS and decimals == DECIMAL_FLOAT:
+            value = f"(float({value}) if {value} is not None else None)"
+        arguments.append(f"{field.name}={value}")
+    source = f"def map_row(row):\n    return Device({', '.join(arguments)})\n"
+    exec(compile(source, f"<row_mapper:{len(column_names)} columns>", 'exec'), namespace)
+    return namespace['map_row']
+
+
+class RowMapperCache:
+    """Thread-sicherer Cache: Spaltenliste -> generierter Mapper"""
+
+    def __init__(self, decimals: str = DECIMAL_FLOAT):
+        decimal_converter(decimals)
+        self.decimals = decimals
+        self._mappers: Dict[Tuple[str, ...], RowMapper] = {}
+        self._lock = Lock()
+
+    def get(self, column_names: Sequence[str]) -> RowMapper:
+        key = tuple(column_names)
+        mapper = self._mappers.get(key)
+        if mapper is None:
+            with self._lock:
+                mapper = self._mappers.get(key)
+                if mapper is None:
+                    mapper = build_row_mapper(key, self.decimals)
+                    self._mappers[key] = mapper
+        return mapper
@@ -0,0 +1,301 @@
+"""SQLite Export Job Repository - Job-Warteschlange als lokale Datei
+
+Liegt im Job-Verzeichnis neben den fertigen PDFs (gemeinsames Volume von
+Web-App und PDF-Worker) und übersteht damit Neustarts beider Seiten. WAL-Modus
+erlaubt gleichzeitiges Lesen (Status-Abfragen) während ein Worker schreibt;
+Jobs werden mit BEGIN IMMEDIATE atomar übernommen.
+"""
+import sqlite3
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, List, Optional, Sequence
+from src.core.domain import dates
+from src.core.domain.export_job import (
+    ExportJob, JOB_DONE, JOB_FAILED, JOB_QUEUED, JOB_RUNNING
+)
+from src.core.ports.export_job_repository import ExportJobRepository
+from src.adapters.services.logger_service import LoggerService
+
+
+SCHEMA = """
+    CREATE TABLE IF NOT EXISTS pdf_jobs (
+        id TEXT PRIMARY KEY,
+        kind TEXT NOT NULL,
+        customer TEXT,
+        status TEXT NOT NULL,
+        stage TEXT,
+        progress REAL NOT NULL DEFAULT 0,
+        attempts INTEGER NOT NULL DEFAULT 0,
+        error TEXT,
+        filename TEXT,
+        size_bytes INTEGER,
+        pages INTEGER,
+        created_at REAL NOT NULL,
+        started_at REAL,
+        finished_at REAL,
+        heartbeat_at REAL
+    );
+    CREATE INDEX IF NOT EXISTS idx_pdf_jobs_status_created ON pdf_jobs (status, created_at);
+"""
+
+JOB_COLUMNS = ("id, kind, customer, status, stage, progress, attempts, error, filename, "
+               "size_bytes, pages, created_at, started_at, finished_at")
+
+
+def _timestamp(value: Optional[float]) -> Optional[datetime]:
+    return datetime.fromtimestamp(value, dates.APP_TIMEZONE) if value is not None else None
+
+
+class SQLiteExportJobRepository(ExportJobRepository):
+    """SQLite implementation of ExportJobRepository (eine Datei, mehrere Prozesse)"""
+
+    def __init__(self, path: str, busy_timeout: float = 30.0):
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self.logger = LoggerService()
+        with self._connection() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+        self.logger.info("SQLiteExportJobRepository initialized", path=path)
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        # Autocommit; Transaktionen werden explizit geöffnet (BEGIN IMMEDIATE)
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def _log(self, operation: str, query: str, start_time: float, **kwargs) -> None:
+        self.logger.log_db_operation(
+            operation=operation,
+            table="pdf_jobs",
+            result="success",
+            duration_ms=(time.time() - start_time) * 1000,
+            query=query,
+            **kwargs
+        )
+
+    @staticmethod
+    def _map_row(row: Sequence) -> ExportJob:
+        return ExportJob(
+            id=row[0], kind=row[1], customer=row[2], status=row[3], stage=row[4],
+            progress=row[5], attempts=row[6], error=row[7], filename=row[8],
+            size_bytes=row[9], pages=row[10], created_at=_timestamp(row[11]),
+            started_at=_timestamp(row[12]), finished_at=_timestamp(row[13])
+        )
+
+    def create(self, job: ExportJob) -> ExportJob:
+        """Store a new queued job"""
+        try:
+            start_time = time.time()
+            created_at = time.time()
+            with self._connection() as conn:
+                conn.execute(
+                    "INSERT INTO pdf_jobs (id, kind, customer, status, progress, attempts, created_at) "
+                    "VALUES (?, ?, ?, ?, 0, 0, ?)",
+                    (job.id, job.kind, job.customer, JOB_QUEUED, created_at)
+                )
+            self._log("INSERT", "create", start_time, job_id=job.id)
+            job.status = JOB_QUEUED
+            job.created_at = _timestamp(created_at)
+            return job
+        except Exception as e:
+            self.logger.error(f"Failed to create export job: {e}", exception=e)
+            raise
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        """Get job by id"""
+        try:
+            start_time = time.time()
+            with self._connection() as conn:
+                row = conn.execute(f"SELECT {JOB_COLUMNS} FROM pdf_jobs WHERE id = ?", (job_id,)).fetchone()
+            self._log("SELECT", "get", start_time, job_id=job_id)
+            return self._map_row(row) if row else None
+        except Exception as e:
+            self.logger.error(f"Failed to get export job: {e}", exception=e)
+            raise
+
+    def find_active(self, kind: str, customer: Optional[str] = None) -> Optional[ExportJob]:
+        """Newest queued/running job for the same export (Doppelklicks erzeugen keinen zweiten Job)"""
+        try:
+            start_time = time.time()
+            with self._connection() as conn:
+                row = conn.execute(
+                    f"SELECT {JOB_COLUMNS} FROM pdf_jobs WHERE kind = ? AND customer IS ? "
+                    f"AND status IN (?, ?) ORDER BY created_at DESC LIMIT 1",
+                    (kind, customer, JOB_QUEUED, JOB_RUNNING)
+                ).fetchone()
+            self._log("SELECT", "find_active", start_time, kind=kind)
+            return self._map_row(row) if row else None
+        except Exception as e:
+            self.logger.error(f"Failed to find active export job: {e}", exception=e)
+            raise
+
+    def claim_next(self) -> Optional[ExportJob]:
+        """Oldest queued job -> running (atomar über alle Prozesse)"""
+        try:
+            start_time = time.time()
+            now = time.time()
+            with self._connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    row = conn.execute(
+                        "SELECT id FROM pdf_jobs WHERE status = ? ORDER BY created_at LIMIT 1",
+                        (JOB_QUEUED,)
+                    ).fetchone()
+                    if row is None:
+                        conn.execute("COMMIT")
+                        return None
+                    conn.execute(
+                        "UPDATE pdf_jobs SET status = ?, stage = NULL, progress = 0, error = NULL, "
+                        "attempts = attempts + 1, started_at = ?, heartbeat_at = ? WHERE id = ?",
+                        (JOB_RUNNING, now, now, row[0])
+                    )
+                    job_row = conn.execute(f"SELECT {JOB_COLUMNS} FROM pdf_jobs WHERE id = ?", (row[0],)).fetchone()
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            self._log("UPDATE", "claim_next", start_time, job_id=row[0])
+            return self._map_row(job_row)
+        except Exception as e:
+            self.logger.error(f"Failed to claim export job: {e}", exception=e)
+            raise
+
+    def update_progress(self, job_id: str, stage: str, progress: float) -> None:
+        """Store progress of a running job (zählt als Lebenszeichen)"""
+        try:
+            with self._connection() as conn:
+                conn.execute(
+                    "UPDATE pdf_jobs SET stage = ?, progress = ?, heartbeat_at = ? WHERE id = ? AND status = ?",
+                    (stage, progress, time.time(), job_id, JOB_RUNNING)
+                )
+        except Exception as e:
+            self.logger.error(f"Failed to update export job progress: {e}", exception=e)
+            raise
+
+    def heartbeat(self, job_ids: Sequence[str]) -> None:
+        """Mark running jobs as alive"""
+        if not job_ids:
+            return
+        try:
+            now = time.time()
+            with self._connection() as conn:
+                conn.executemany(
+                    "UPDATE pdf_jobs SET heartbeat_at = ? WHERE id = ? AND status = ?",
+                    [(now, job_id, JOB_RUNNING) for job_id in job_ids]
+                )
+        except Exception as e:
+            self.logger.error(f"Failed to store export job heartbeat: {e}", exception=e)
+            raise
+
+    def complete(self, job_id: str, filename: str, size_bytes: int, pages: Optional[int] = None) -> None:
+        """Mark job as done"""
+        try:
+            start_time = time.time()
+            with self._connection() as conn:
+                conn.execute(
+                    "UPDATE pdf_jobs SET status = ?, stage = ?, progress = 1, filename = ?, size_bytes = ?, "
+                    "pages = ?, finished_at = ? WHERE id = ?",
+                    (JOB_DONE, JOB_DONE, filename, size_bytes, pages, time.time(), job_id)
+                )
+            self._log("UPDATE", "complete", start_time, job_id=job_id, size_bytes=size_bytes)
+        except Exception as e:
+            self.logger.error(f"Failed to complete export job: {e}", exception=e)
+            raise
+
+    def fail(self, job_id: str, error: str) -> None:
+        """Mark job as failed"""
+        try:
+            start_time = time.time()
+            with self._connection() as conn:
+                conn.execute(
+                    "UPDATE pdf_jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                    (JOB_FAILED, error, time.time(), job_id)
+                )
+            self._log("UPDATE", "fail", start_time, job_id=job_id)
+        except Exception as e:
+            self.logger.error(f"Failed to mark export job as failed: {e}", exception=e)
+            raise
+
+    def requeue(self, job_id: str, error: str, max_attempts: int) -> bool:
+        """Running job -> queued (bzw. failed nach max_attempts)"""
+        try:
+            start_time = time.time()
+            with self._connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    requeued = conn.execute(
+                        "UPDATE pdf_jobs SET status = ?, stage = NULL, progress = 0, error = ? "
+                        "WHERE id = ? AND status = ? AND attempts < ?",
+                        (JOB_QUEUED, error, job_id, JOB_RUNNING, max_attempts)
+                    ).rowcount > 0
+                    if not requeued:
+                        conn.execute(
+                            "UPDATE pdf_jobs SET status = ?, error = ?, finished_at = ? WHERE id = ? AND status = ?",
+                            (JOB_FAILED, error, time.time(), job_id, JOB_RUNNING)
+                        )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            self._log("UPDATE", "requeue", start_time, job_id=job_id, requeued=requeued)
+            return requeued
+        except Exception as e:
+            self.logger.error(f"Failed to requeue export job: {e}", exception=e)
+            raise
+
+    def requeue_stale(self, timeout_seconds: float, max_attempts: int) -> int:
+        """Running jobs without heartbeat -> queued (bzw. failed nach max_attempts)"""
+        try:
+            start_time = time.time()
+            cutoff = time.time() - timeout_seconds
+            with self._connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    failed = conn.execute(
+                        "UPDATE pdf_jobs SET status = ?, error = ?, finished_at = ? "
+                        "WHERE status = ? AND heartbeat_at < ? AND attempts >= ?",
+                        (JOB_FAILED, "worker stopped while rendering", time.time(), JOB_RUNNING, cutoff,
+                         max_attempts)
+                    ).rowcount
+                    requeued = conn.execute(
+                        "UPDATE pdf_jobs SET status = ?, stage = NULL, progress = 0 "
+                        "WHERE status = ? AND heartbeat_at < ?",
+                        (JOB_QUEUED, JOB_RUNNING, cutoff)
+                    ).rowcount
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            self._log("UPDATE", "requeue_stale", start_time, requeued=requeued, failed=failed)
+            return requeued + failed
+        except Exception as e:
+            self.logger.error(f"Failed to requeue stale export jobs: {e}", exception=e)
+            raise
+
+    def expire(self, older_than_seconds: float) -> List[ExportJob]:
+        """Delete finished jobs older than the given age"""
+        try:
+            start_time = time.time()
+            cutoff = time.time() - older_than_seconds
+            with self._connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    rows = conn.execute(
+                        f"SELECT {JOB_COLUMNS} FROM pdf_jobs WHERE status IN (?, ?) AND finished_at < ?",
+                        (JOB_DONE, JOB_FAILED, cutoff)
+                    ).fetchall()
+                    conn.executemany("DELETE FROM pdf_jobs WHERE id = ?", [(row[0],) for row in rows])
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            self._log("DELETE", "expire", start_time, rows=len(rows))
+            return [self._map_row(row) for row in rows]
+        except Exception as e:
+            self.logger.error(f"Failed to expire export jobs: {e}", exception=e)
+            raise
@@ -1,4 +1,10 @@
 """Services Adapter Module"""
+from .byte_cache import ByteLRUCache
+from .qr_artifact_store import QRArtifactStore
 from .qr_code_generator import QRCodeGenerator
+from .qr_generators import (
+    PNGQRGenerator, SVGPathQRGenerator, SVGRectRunQRGenerator, create_qr_generator
+)
 
-__all__ = ['QRCodeGenerator']
+__all__ = ['ByteLRUCache', 'QRArtifactStore', 'QRCodeGenerator', 'PNGQRGenerator',
+           'SVGPathQRGenerator', 'SVGRectRunQRGenerator', 'create_qr_generator']
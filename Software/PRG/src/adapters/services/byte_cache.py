@@ -0,0 +1,78 @@
+"""Byte LRU Cache - prozesslokaler Cache mit Größenbegrenzung in Bytes
+
+Begrenzt sowohl die Anzahl der Einträge als auch die Summe der Wertgrößen;
+beim Überschreiten werden die am längsten nicht genutzten Einträge verdrängt.
+Thread-sicher, mit Trefferstatistik.
+"""
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Hashable, Optional
+
+
+class ByteLRUCache:
+    """LRU-Cache für bytes-Werte mit Limit in Einträgen und Bytes"""
+
+    def __init__(self, max_bytes: int, max_entries: Optional[int] = None):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: bytes) -> None:
+        size = len(value)
+        if size > self.max_bytes:
+            return  # größer als der ganze Cache - nicht speichern
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = value
+            self._size += size
+            while self._size > self.max_bytes or (
+                    self.max_entries is not None and len(self._entries) > self.max_entries):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def stats(self) -> Dict[str, float]:
+        """Trefferstatistik und Füllstand"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'size_bytes': self._size,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
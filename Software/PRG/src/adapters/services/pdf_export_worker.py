@@ -0,0 +1,165 @@
+"""PDF Export Worker - verteilt PDF-Jobs auf einen Prozess-Pool
+
+Läuft als eigener Prozess neben Gunicorn (flask pdf-worker), damit WeasyPrint
+keine Web-Worker blockiert und nicht an deren 120-s-Timeout gebunden ist:
+- übernimmt Jobs atomar aus der Warteschlange (mehrere Worker-Instanzen möglich)
+- rendert jeden Job in einem frischen Kindprozess (max_tasks_per_child=1:
+  WeasyPrint gibt Speicher großer Dokumente nicht vollständig frei)
+- meldet laufende Jobs regelmäßig als lebendig; Jobs eines abgestürzten oder
+  neu gestarteten Workers werden nach `stale_after` Sekunden neu eingereiht
+- stürzt ein Kindprozess ab oder läuft ein Job länger als `job_timeout`
+  Sekunden, wird der Pool ersetzt und die betroffenen Jobs werden neu
+  eingereiht (nach `max_attempts` Versuchen: failed)
+- löscht fertige Jobs samt Datei nach `retention` Sekunden
+"""
+import os
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Optional, Set
+
+from src.core.ports.export_job_repository import ExportJobRepository
+from src.adapters.services.logger_service import LoggerService
+
+
+# Wartungsläufe (Neueinreihen, Aufräumen) höchstens alle N Sekunden
+MAINTENANCE_INTERVAL = 60.0
+
+
+def run_pdf_export_job(job_id: str) -> bool:
+    """Einstiegspunkt im Kindprozess (eigener Container, eigene Verbindungen)"""
+    from src.config.dependencies import container
+    return container.run_pdf_export_job_usecase.execute(job_id)
+
+
+class PDFExportWorker:
+    """Dispatcher: Warteschlange -> Prozess-Pool"""
+
+    def __init__(self, repository: ExportJobRepository, directory: str, processes: int = 2,
+                 poll_interval: float = 1.0, stale_after: float = 120.0, retention: float = 24 * 3600,
+                 max_attempts: int = 3, job_timeout: float = 1800.0,
+                 run_job: Callable[[str], bool] = run_pdf_export_job,
+                 executor_factory: Optional[Callable[[int], Executor]] = None):
+        if processes < 1:
+            raise ValueError("processes must be positive")
+        self.repository = repository
+        self.directory = directory
+        self.processes = processes
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self.retention = retention
+        self.max_attempts = max_attempts
+        self.job_timeout = job_timeout
+        self.run_job = run_job
+        self.executor_factory = executor_factory or (
+            lambda workers: ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1)
+        )
+        self.logger = LoggerService()
+
+    def run(self, stop_when_idle: bool = False) -> int:
+        """Jobs abarbeiten, bis unterbrochen (bzw. bis die Warteschlange leer ist)
+
+        Returns:
+            Anzahl abgeschlossener Jobs
+        """
+        self.logger.info("PDF export worker started", processes=self.processes, directory=self.directory)
+        executor = self.executor_factory(self.processes)
+        running: Dict[str, Future] = {}
+        started: Dict[str, float] = {}
+        processed = 0
+        last_maintenance = None
+        try:
+            while True:
+                if last_maintenance is None or time.monotonic() - last_maintenance >= MAINTENANCE_INTERVAL:
+                    self._maintenance()
+                    last_maintenance = time.monotonic()
+
+                finished, broken = self._collect(running)
+                processed += finished
+                now = time.monotonic()
+                overdue = {job_id for job_id in running if now - started[job_id] >= self.job_timeout}
+                if broken or overdue:
+                    # Ein abgestürzter Kindprozess macht den ganzen Pool unbrauchbar, ein
+                    # hängender blockiert seinen Platz: Pool ersetzen, Jobs neu einreihen
+                    self._requeue_running(running, overdue)
+                    self._terminate(executor)
+                    executor = self.executor_factory(self.processes)
+                for job_id in set(started) - set(running):
+                    del started[job_id]
+                self.repository.heartbeat(list(running))
+
+                while len(running) < self.processes:
+                    job = self.repository.claim_next()
+                    if job is None:
+                        break
+                    self.logger.info(f"PDF export started: {job.id}", kind=job.kind, attempt=job.attempts)
+                    running[job.id] = executor.submit(self.run_job, job.id)
+                    started[job.id] = time.monotonic()
+
+                if stop_when_idle and not running:
+                    break
+                time.sleep(self.poll_interval)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self.logger.info("PDF export worker stopped", processed=processed)
+        return processed
+
+    def _collect(self, running: Dict[str, Future]) -> tuple:
+        """Fertige Jobs einsammeln; (Anzahl, Pool defekt)"""
+        finished = 0
+        broken = False
+        for job_id, future in list(running.items()):
+            if not future.done():
+                continue
+            del running[job_id]
+            try:
+                future.result()
+            except BrokenProcessPool as e:
+                # Betrifft alle Jobs des Pools, nicht nur den auslösenden
+                broken = True
+                self._requeue(job_id, f"PDF worker process crashed: {e}")
+                continue
+            except Exception as e:
+                self.logger.error(f"PDF export {job_id} failed: {e}", exception=e)
+                self.repository.fail(job_id, str(e))
+            finished += 1
+        return finished, broken
+
+    def _requeue_running(self, running: Dict[str, Future], overdue: Set[str]) -> None:
+        """Alle noch laufenden Jobs eines zu ersetzenden Pools neu einreihen"""
+        for job_id in list(running):
+            if job_id in overdue:
+                self._requeue(job_id, f"PDF export timed out after {self.job_timeout:.0f} s")
+            else:
+                self._requeue(job_id, "PDF worker pool restarted")
+            del running[job_id]
+
+    def _requeue(self, job_id: str, error: str) -> None:
+        if self.repository.requeue(job_id, error, self.max_attempts):
+            self.logger.warning(f"PDF export {job_id} requeued: {error}")
+        else:
+            self.logger.error(f"PDF export {job_id} failed after {self.max_attempts} attempts: {error}")
+
+    @staticmethod
+    def _terminate(executor: Executor) -> None:
+        """Pool beenden, hängende Kindprozesse abbrechen
+
+        ProcessPoolExecutor bietet dafür keine öffentliche API; andere
+        Executors (z.B. Threads in Tests) werden nur heruntergefahren.
+        """
+        processes = getattr(executor, '_processes', None) or {}
+        for process in list(processes.values()):
+            if process.is_alive():
+                process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _maintenance(self) -> None:
+        requeued = self.repository.requeue_stale(self.stale_after, self.max_attempts)
+        if requeued:
+            self.logger.warning(f"{requeued} stale PDF export jobs requeued or failed")
+        for job in self.repository.expire(self.retention):
+            if job.filename:
+                try:
+                    os.unlink(os.path.join(self.directory, os.path.basename(job.filename)))
+                except FileNotFoundError:
+                    pass
@@ -0,0 +1,184 @@
+"""QR Artifact Store - inhaltsadressierte QR-Code-Dateien auf der Platte
+
+Gemeinsam für alle Gunicorn-Worker (und Prozess-Pools): Dateiname ist der
+SHA-256 über Inhalt und Render-Optionen, d.h. ein Artefakt ist unveränderlich
+und kann nie veralten. Geschrieben wird atomar (temporäre Datei + os.replace),
+Leser sehen also nur vollständige Dateien. Die Erzeugung läuft unter einem
+prozessübergreifenden Dateisperre (flock), damit kein QR-Code doppelt berechnet
+wird, wenn mehrere Worker ihn gleichzeitig anfordern.
+
+Aufbau des Verzeichnisses:
+    <directory>/ab/abcdef....svg   Artefakte (zweistelliges Präfix als Unterordner,
+                                   Varianten: .svg, .svg.gz, .png)
+    <directory>/.locks/ab.lock     Sperren (gestreift nach Präfix)
+"""
+import fcntl
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+from src.adapters.services.logger_service import LoggerService
+
+
+# Bei Änderung des Render-Formats erhöhen: alte Artefakte werden nicht mehr
+# adressiert und beim nächsten Cleanup entfernt
+ARTIFACT_FORMAT_VERSION = 2
+
+ARTIFACT_SUFFIX = '.svg'
+LOCK_DIRECTORY = '.locks'
+
+
+def artifact_key(payload: str, error_correction: str, box_size: int, border: int,
+                 encoder: str = 'svg-path') -> str:
+    """Inhaltsadresse eines QR-Codes (SHA-256 über Inhalt, Render-Optionen und Encoder)"""
+    material = (f"{ARTIFACT_FORMAT_VERSION}\x1f{payload}\x1f{error_correction}\x1f{box_size}\x1f{border}"
+                f"\x1f{encoder}")
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+class QRArtifactStore:
+    """Prozessübergreifender Dateispeicher für gerenderte QR-Codes (SVG)"""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.logger = LoggerService()
+        # Vom aktuellen Thread gehaltene Sperren (abgeleitete Varianten wie .svg.gz
+        # werden unter derselben Sperre aus dem .svg erzeugt)
+        self._held = threading.local()
+        os.makedirs(os.path.join(directory, LOCK_DIRECTORY), exist_ok=True)
+
+    def path(self, key: str, suffix: str = ARTIFACT_SUFFIX) -> str:
+        return os.path.join(self.directory, key[:2], key + suffix)
+
+    def get(self, key: str, suffix: str = ARTIFACT_SUFFIX) -> Optional[bytes]:
+        try:
+            with open(self.path(key, suffix), 'rb') as artifact:
+                return artifact.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, data: bytes, suffix: str = ARTIFACT_SUFFIX) -> None:
+        """Artefakt atomar schreiben (temporäre Datei im Zielordner + os.replace)"""
+        target = self.path(key, suffix)
+        folder = os.path.dirname(target)
+        os.makedirs(folder, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=folder, prefix='.tmp-', suffix=suffix)
+        try:
+            with os.fdopen(fd, 'wb') as temp_file:
+                temp_file.write(data)
+            os.replace(temp_path, target)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def get_or_create(self, key: str, render: Callable[[], bytes],
+                      suffix: str = ARTIFACT_SUFFIX) -> bytes:
+        """Artefakt lesen oder - unter Sperre, genau einmal über alle Prozesse - erzeugen"""
+        data = self.get(key, suffix)
+        if data is not None:
+            return data
+        with self._locked(key[:2]):
+            # Ein anderer Worker kann es erzeugt haben, während wir gewartet haben
+            data = self.get(key, suffix)
+            if data is None:
+                data = render()
+                self.put(key, data, suffix)
+        return data
+
+    def exists(self, key: str, suffix: str = ARTIFACT_SUFFIX) -> bool:
+        return os.path.exists(self.path(key, suffix))
+
+    def cleanup(self, live_keys: Iterable[str], older_than: Optional[float] = None) -> int:
+        """Artefakte entfernen, die kein Gerät mehr adressiert
+
+        Args:
+            live_keys: Schlüssel aller noch benötigten Artefakte
+            older_than: Nur Dateien mit mtime vor diesem Zeitpunkt löschen
+                (schützt Artefakte, die während des Durchlaufs entstanden sind)
+
+        Returns:
+            Anzahl gelöschter Dateien
+        """
+        live = set(live_keys)
+        cutoff = time.time() if older_than is None else older_than
+        removed = 0
+        for key, path in self._iter_artifacts():
+            if key in live:
+                continue
+            try:
+                if os.path.getmtime(path) >= cutoff:
+                    continue
+                os.unlink(path)
+                removed += 1
+            except FileNotFoundError:
+                continue
+        self.logger.info(f"QR artifact cleanup: {removed} files removed", directory=self.directory)
+        return removed
+
+    @contextmanager
+    def exclusive(self, name: str) -> Iterator[bool]:
+        """Nicht-blockierende, prozessübergreifende Sperre (z.B. für den Warm-up)
+
+        Liefert True, wenn die Sperre erworben wurde, sonst False.
+        """
+        with open(os.path.join(self.directory, LOCK_DIRECTORY, name + '.lock'), 'a') as lock_file:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def stats(self) -> Dict[str, int]:
+        files = 0
+        size_bytes = 0
+        for _, path in self._iter_artifacts():
+            try:
+                size_bytes += os.path.getsize(path)
+                files += 1
+            except FileNotFoundError:
+                continue
+        return {'files': files, 'size_bytes': size_bytes}
+
+    @contextmanager
+    def _locked(self, stripe: str) -> Iterator[None]:
+        held = self._held.__dict__.setdefault('stripes', set())
+        if stripe in held:
+            # flock ist pro Dateideskriptor - erneutes Sperren würde sich selbst blockieren
+            yield
+            return
+        held.add(stripe)
+        try:
+            with self._flocked(stripe):
+                yield
+        finally:
+            held.discard(stripe)
+
+    @contextmanager
+    def _flocked(self, stripe: str) -> Iterator[None]:
+        with open(os.path.join(self.directory, LOCK_DIRECTORY, stripe + '.lock'), 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _iter_artifacts(self) -> Iterator[tuple]:
+        for prefix in os.listdir(self.directory):
+            folder = os.path.join(self.directory, prefix)
+            if prefix == LOCK_DIRECTORY or not os.path.isdir(folder):
+                continue
+            for name in os.listdir(folder):
+                if not name.startswith('.tmp-'):
+                    # Alle Varianten (.svg, .svg.gz, .png) hängen am selben Schlüssel
+                    yield name.split('.', 1)[0], os.path.join(folder, name)
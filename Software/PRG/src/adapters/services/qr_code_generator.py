@@ -1,56 +1,446 @@
+"""QR Code Generator Service - Für Device IDs - SVG Version
 
-"""QR Code Generator Service - Für Device IDs - SVG Version"""
-import qrcode
-import qrcode.image.svg
+Erzeugte QR-Codes werden prozesslokal in einem LRU-Cache gehalten (Schlüssel:
+Inhalt + Render-Optionen), wiederholte Anfragen für dasselbe Gerät überspringen
+den Encoder. Größe über QR_CACHE_MAX_BYTES / QR_CACHE_MAX_ENTRIES.
+
+Ist QR_STORE_DIR gesetzt, liegt dahinter der gemeinsame QRArtifactStore auf der
+Platte: Worker-Neustarts starten nicht kalt, und jeder QR-Code wird über alle
+Worker hinweg nur einmal berechnet.
+
+Das eigentliche Kodieren übernimmt ein QRGenerator-Adapter (qr_generators),
+den der Container per QR_ENCODER / QR_ERROR_CORRECTION auswählt.
+"""
+import os
+import re
 import base64
-from io import BytesIO
-from typing import Optional
+import gzip
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.adapters.services.byte_cache import ByteLRUCache
+from src.adapters.services.qr_artifact_store import QRArtifactStore, artifact_key
+from src.adapters.services.qr_generators import BaseQRGenerator, PNGQRGenerator, SVGPathQRGenerator
+from src.adapters.services.logger_service import LoggerService
+
+# Ein SVG-QR-Code (Base64) ist ca. 3-6 KB groß: 8 MB reichen für einige tausend Geräte
+_cache = ByteLRUCache(
+    max_bytes=int(os.getenv('QR_CACHE_MAX_BYTES', str(8 * 1024 * 1024))),
+    max_entries=int(os.getenv('QR_CACHE_MAX_ENTRIES', '10000'))
+)
+
+# Batch-Erzeugung: Anzahl Prozesse (Standard: alle Kerne) und Mindestanzahl
+# fehlender QR-Codes, ab der sich der Start eines Prozess-Pools lohnt
+QR_WORKERS = int(os.getenv('QR_WORKERS', '0')) or os.cpu_count() or 1
+PARALLEL_QR_THRESHOLD = 50
+
+# Prozess-Pools starten per "spawn" statt fork: ein fork() aus einem Prozess mit
+# laufenden Threads (Gunicorn-Worker, QR-Warm-up) kann gehaltene Sperren in das
+# Kind kopieren und dort blockieren
+_POOL_CONTEXT = multiprocessing.get_context('spawn')
+
+# Gemeinsamer Dateispeicher (optional, z.B. Volume unter /var/cache/benning/qr)
+_store: Optional[QRArtifactStore] = None
+if os.getenv('QR_STORE_DIR'):
+    _store = QRArtifactStore(os.environ['QR_STORE_DIR'])
+
+
+# Ausgabeformate für Bild-Endpunkte: Format -> Dateiendung im Artefaktspeicher
+IMAGE_SUFFIXES = {
+    'svg': '.svg',
+    'svg.gz': '.svg.gz',
+    'png': '.png',
+    'pdf': '.pdfform',
+}
+
+# PNG-Ausgabe: Kantenlänge eines Moduls in Pixeln (Etikettendruck, ca. 300 dpi)
+PNG_BOX_SIZE = 10
+
+# SVG-Encoder und Standardoptionen (Fehlerkorrektur, Modulgröße, Ruhezone) aller
+# gespeicherten QR-Codes; austauschbar über QRCodeGenerator.use_encoder
+_encoder: BaseQRGenerator = SVGPathQRGenerator()
+_png_encoder: BaseQRGenerator = PNGQRGenerator(box_size=PNG_BOX_SIZE)
+
+
+def qr_payload(device_id: str, customer: str = "") -> str:
+    """Inhalt des QR-Codes ("Kunde|ID" bzw. nur ID)"""
+    return f"{customer}|{device_id}" if customer else device_id
+
+
+def qr_version(device_id: str, customer: str = "", image_format: str = 'svg') -> str:
+    """Kurzer Versionsschlüssel aus Inhalt und Render-Optionen der Variante (für unveränderliche Bild-URLs)"""
+    return _image_key(qr_payload(device_id, customer), image_format)[:16]
+
+
+def _default_key(qr_data: str, encoder: Optional[BaseQRGenerator] = None) -> str:
+    """Artefakt-Schlüssel mit Encoder und Standardoptionen (Standard: aktiver Encoder)"""
+    encoder = encoder or _encoder
+    return artifact_key(qr_data, encoder.error_correction, encoder.box_size, encoder.border, encoder.name)
+
+
+def _default_cache_key(qr_data: str, encoder: Optional[BaseQRGenerator] = None) -> tuple:
+    """Cache-Schlüssel des Base64-SVG mit Encoder und Standardoptionen (Standard: aktiver Encoder)"""
+    encoder = encoder or _encoder
+    return (qr_data, encoder.name, encoder.error_correction, encoder.box_size, encoder.border)
+
+
+def _image_encoder(image_format: str) -> BaseQRGenerator:
+    """Encoder, der eine Bildvariante erzeugt (PNG: PNG-Encoder, SVG/PDF-Form: SVG-Encoder)"""
+    return _png_encoder if image_format == 'png' else _encoder
+
+
+def _image_key(qr_data: str, image_format: str) -> str:
+    """Artefakt-Schlüssel (und ETag) einer Bildvariante mit den Optionen ihres Encoders"""
+    return _default_key(qr_data, _image_encoder(image_format))
+
+
+def _image_cache_key(qr_data: str, image_format: str) -> tuple:
+    """Cache-Schlüssel einer Bildvariante mit den Optionen ihres Encoders"""
+    return _default_cache_key(qr_data, _image_encoder(image_format)) + (image_format,)
+
+
+_SVG_VIEWBOX = re.compile(rb'viewBox="0 0 ([\d.]+) ([\d.]+)"')
+# SvgPathImage: ein Segment pro Modul; SVGRectRunQRGenerator: ein Segment pro Lauf
+_SVG_MODULE = re.compile(rb'M([\d.]+),([\d.]+)H')
+_SVG_RUN = re.compile(rb'M([\d.]+) ([\d.]+)h([\d.]+)')
+
+
+def _pdf_form(size: int, rows: Dict[int, List[int]]) -> bytes:
+    """PDF-Content-Stream im Einheitsquadrat aus dunklen Modulen ({Zeile: [Spalten]})
+
+    Benachbarte Module einer Zeile werden zu einem Rechteck zusammengefasst;
+    die Koordinaten sind ganze Module, skaliert über eine cm-Matrix auf 1 x 1.
+    """
+    ops = [f"{1 / size:.6f} 0 0 {1 / size:.6f} 0 0 cm"]
+    for y in sorted(rows):
+        columns = sorted(rows[y])
+        pdf_y = size - 1 - y
+        start = previous = columns[0]
+        for x in columns[1:] + [None]:
+            if x is not None and x == previous + 1:
+                previous = x
+                continue
+            ops.append(f"{start} {pdf_y} {previous - start + 1} 1 re")
+            if x is not None:
+                start = previous = x
+    ops.append("f")
+    return "\n".join(ops).encode('ascii')
+
+
+def _render_pdf_form(qr_data: str) -> bytes:
+    """QR-Code direkt als PDF-Form kodieren (wenn noch kein SVG-Artefakt existiert)"""
+    matrix = _encoder.matrix(qr_data)
+    rows = {y: [x for x, dark in enumerate(row) if dark] for y, row in enumerate(matrix)}
+    return _pdf_form(len(matrix), {y: columns for y, columns in rows.items() if columns})
+
+
+def _svg_to_pdf_form(svg: bytes, module_size: float) -> bytes:
+    """Gerendertes QR-SVG in einen PDF-Content-Stream im Einheitsquadrat umsetzen
+
+    Liest die Module aus dem Pfad des SVG-Artefakts - deutlich schneller als
+    erneutes Kodieren. `module_size` ist die Kantenlänge eines Moduls in
+    viewBox-Einheiten (Encoder.module_size).
+    """
+    def modules(value: bytes) -> int:
+        return round(float(value) / module_size)
+
+    size = modules(_SVG_VIEWBOX.search(svg).group(1))
+    rows: Dict[int, List[int]] = {}
+    for x, y in _SVG_MODULE.findall(svg):
+        rows.setdefault(modules(y), []).append(modules(x))
+    for x, y, length in _SVG_RUN.findall(svg):
+        rows.setdefault(modules(y), []).extend(range(modules(x), modules(x) + modules(length)))
+    return _pdf_form(size, rows)
+
+
+def _existing_svg(qr_data: str) -> Optional[bytes]:
+    """Bereits erzeugtes SVG (In-Process-Cache oder Artefaktspeicher), sonst None"""
+    svg = _cache.get(_image_cache_key(qr_data, 'svg'))
+    if svg is not None:
+        return svg
+    encoded = _cache.get(_default_cache_key(qr_data))
+    if encoded is not None:
+        return base64.b64decode(encoded)
+    if _store is not None:
+        return _store.get(_default_key(qr_data))
+    return None
+
+
+def _render_image(qr_data: str, image_format: str) -> bytes:
+    if image_format == 'pdf':
+        svg = _existing_svg(qr_data)
+        return _svg_to_pdf_form(svg, _encoder.module_size) if svg is not None else _render_pdf_form(qr_data)
+    if image_format == 'svg':
+        return _encoder.encode(qr_data)
+    if image_format == 'svg.gz':
+        # Vorkomprimierte Variante; mtime=0 hält die Bytes (und den ETag) stabil
+        return gzip.compress(QRCodeGenerator.render_image(qr_data, 'svg'), mtime=0)
+    return _png_encoder.encode(qr_data)
+
+
+def _init_pool_worker(encoder_class: type, error_correction: str, box_size: int, border: int,
+                      store_dir: Optional[str]) -> None:
+    """Kindprozess eines Pools: Encoder und Dateispeicher des Elternprozesses übernehmen"""
+    QRCodeGenerator.use_encoder(encoder_class(error_correction=error_correction, box_size=box_size, border=border))
+    QRCodeGenerator.use_artifact_store(QRArtifactStore(store_dir) if store_dir else None)
+
+
+def _process_pool(workers: int, encoder: Optional[BaseQRGenerator] = None) -> ProcessPoolExecutor:
+    """Prozess-Pool (spawn) mit Encoder (Standard: aktiver Encoder) und Dateispeicher dieses Prozesses"""
+    encoder = encoder or _encoder
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=_POOL_CONTEXT,
+        initializer=_init_pool_worker,
+        initargs=(type(encoder), encoder.error_correction, encoder.box_size, encoder.border,
+                  _store.directory if _store is not None else None)
+    )
 
 
 class QRCodeGenerator:
     """Generiert QR-Codes für Device IDs als SVG"""
-    
+
     @staticmethod
-    def generate_qr_code(device_id: str, customer: str = "") -> Optional[bytes]:
+    def generate_qr_code(device_id: str, customer: str = "", error_correction: Optional[str] = None,
+                         box_size: Optional[int] = None, border: Optional[int] = None,
+                         encoder: Optional[BaseQRGenerator] = None) -> Optional[bytes]:
         """
         Generiert einen QR-Code für eine Device ID als SVG Base64
-        
+
         Args:
             device_id: Die Device ID (z.B. "Parloa-00001")
             customer: Der Kundenname (optional)
-            
+            error_correction: Fehlerkorrektur-Stufe (L, M, Q, H; Standard: Encoder)
+            box_size: Kantenlänge eines Moduls (Standard: Encoder)
+            border: Ruhezone in Modulen (Standard: Encoder)
+            encoder: SVG-Encoder (Standard: aktiver Encoder, siehe use_encoder)
+
         Returns:
             QR-Code als Base64 String (bytes) oder None bei Fehler
         """
+        qr_data = qr_payload(device_id, customer)
         try:
-            qr_data = f"{customer}|{device_id}" if customer else device_id
-            
-            # Erstelle QR-Code mit SVG Factory
-            qr_code = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=10,
-                border=4,
-                image_factory=qrcode.image.svg.SvgPathImage,
-            )
-            qr_code.add_data(qr_data)
-            qr_code.make(fit=True)
-            
-            # Erstelle SVG Image
-            img = qr_code.make_image()
-            
-            # Speichere SVG als Bytes
-            svg_bytes = BytesIO()
-            img.save(svg_bytes)
-            svg_bytes.seek(0)
-            
+            encoder = (encoder or _encoder).with_settings(error_correction, box_size, border)
+        except ValueError as e:
+            LoggerService().error(f"Error generating QR code: {e}", exception=e, device_id=device_id)
+            return None
+        key = (qr_data, encoder.name, encoder.error_correction, encoder.box_size, encoder.border)
+        cached = _cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            if _store is not None:
+                svg = _store.get_or_create(
+                    artifact_key(qr_data, encoder.error_correction, encoder.box_size, encoder.border,
+                                 encoder.name),
+                    lambda: encoder.encode(qr_data)
+                )
+            else:
+                svg = encoder.encode(qr_data)
             # Konvertiere zu Base64
-            svg_data = svg_bytes.getvalue()
-            base64_svg = base64.b64encode(svg_data).decode('utf-8')
-            
-            print(f"✓ QR-Code (SVG) generiert für {device_id}")
-            return base64_svg.encode('utf-8')
+            qr_code_bytes = base64.b64encode(svg)
         except Exception as e:
-            print(f"Error generating QR code: {e}")
+            LoggerService().error(f"Error generating QR code: {e}", exception=e, device_id=device_id)
             return None
 
+        _cache.put(key, qr_code_bytes)
+        return qr_code_bytes
+
+    @staticmethod
+    def generate_many(codes: Sequence[Tuple[str, str]], workers: Optional[int] = None,
+                      threshold: int = PARALLEL_QR_THRESHOLD,
+                      encoder: Optional[BaseQRGenerator] = None) -> List[Optional[bytes]]:
+        """Generiert viele QR-Codes (Standardoptionen), Reihenfolge wie die Eingabe
+
+        Treffer aus In-Process-Cache und Artefaktspeicher werden direkt
+        übernommen; nur die fehlenden QR-Codes werden - ab `threshold` Stück -
+        in einem Prozess-Pool berechnet (CPU-gebunden, ohne GIL).
+
+        Args:
+            codes: (device_id, customer)-Paare
+            workers: Anzahl Prozesse (Standard: QR_WORKERS)
+            threshold: Mindestanzahl fehlender QR-Codes für den Prozess-Pool
+            encoder: SVG-Encoder (Standard: aktiver Encoder, siehe use_encoder)
+
+        Returns:
+            QR-Codes als Base64 (bytes), None bei Fehler
+        """
+        workers = workers or QR_WORKERS
+        encoder = encoder or _encoder
+        results: List[Optional[bytes]] = [None] * len(codes)
+        missing = []
+        for index, (device_id, customer) in enumerate(codes):
+            qr_data = qr_payload(device_id, customer)
+            cached = _cache.get(_default_cache_key(qr_data, encoder))
+            if cached is None and _store is not None:
+                svg = _store.get(_default_key(qr_data, encoder))
+                if svg is not None:
+                    cached = base64.b64encode(svg)
+                    _cache.put(_default_cache_key(qr_data, encoder), cached)
+            if cached is None:
+                missing.append(index)
+            else:
+                results[index] = cached
+
+        if not missing:
+            return results
+        ids = [codes[i][0] for i in missing]
+        customers = [codes[i][1] or "" for i in missing]
+        if len(missing) < threshold or workers < 2:
+            for index, device_id, customer in zip(missing, ids, customers):
+                results[index] = QRCodeGenerator.generate_qr_code(device_id, customer, encoder=encoder)
+            return results
+
+        chunksize = max(1, len(missing) // (workers * 4))
+        # Kindprozesse erzeugen mit `encoder` als aktivem Encoder (Pool-Initializer)
+        with _process_pool(workers, encoder) as executor:
+            codes_iter = executor.map(QRCodeGenerator.generate_qr_code, ids, customers, chunksize=chunksize)
+            for index, device_id, customer, qr_code in zip(missing, ids, customers, codes_iter):
+                results[index] = qr_code
+                # Ergebnisse der Kindprozesse auch im eigenen Cache halten
+                if qr_code is not None:
+                    _cache.put(_default_cache_key(qr_payload(device_id, customer), encoder), qr_code)
+        return results
+
+    @staticmethod
+    def images_many(codes: Sequence[Tuple[str, str]], image_format: str, workers: Optional[int] = None,
+                    threshold: int = PARALLEL_QR_THRESHOLD) -> List[bytes]:
+        """Bilddateien vieler QR-Codes, Reihenfolge wie die Eingabe (vgl. generate_many)
+
+        Treffer aus In-Process-Cache und Artefaktspeicher werden direkt
+        übernommen, fehlende ab `threshold` Stück im Prozess-Pool erzeugt und
+        im In-Process-Cache abgelegt.
+        """
+        if image_format not in IMAGE_SUFFIXES:
+            raise ValueError(f"image_format must be one of {list(IMAGE_SUFFIXES)}, got '{image_format}'")
+        workers = workers or QR_WORKERS
+        payloads = [qr_payload(device_id, customer) for device_id, customer in codes]
+        results: List[Optional[bytes]] = [None] * len(codes)
+        missing = []
+        for index, qr_data in enumerate(payloads):
+            cached = _cache.get(_image_cache_key(qr_data, image_format))
+            if cached is None and _store is not None:
+                cached = _store.get(_image_key(qr_data, image_format), IMAGE_SUFFIXES[image_format])
+                if cached is not None:
+                    _cache.put(_image_cache_key(qr_data, image_format), cached)
+            if cached is None:
+                missing.append(index)
+            else:
+                results[index] = cached
+
+        if len(missing) < threshold or workers < 2:
+            for index in missing:
+                results[index] = QRCodeGenerator.render_image(payloads[index], image_format)
+            return results
+
+        chunksize = max(1, len(missing) // (workers * 4))
+        with _process_pool(workers) as executor:
+            rendered = executor.map(QRCodeGenerator.render_image, [payloads[i] for i in missing],
+                                    [image_format] * len(missing), chunksize=chunksize)
+            for index, data in zip(missing, rendered):
+                results[index] = data
+                _cache.put(_image_cache_key(payloads[index], image_format), data)
+        return results
+
+    @staticmethod
+    def image(device_id: str, customer: str = "", image_format: str = 'svg') -> Tuple[str, bytes]:
+        """QR-Code als Bilddatei (Standardoptionen) für den Bild-Endpunkt
+
+        Args:
+            device_id: Die Device ID
+            customer: Der Kundenname
+            image_format: 'svg', 'svg.gz' (gzip-komprimiertes SVG), 'png' oder
+                'pdf' (Content-Stream für ein PDF-Form-XObject, Einheitsquadrat)
+
+        Returns:
+            (Artefakt-Schlüssel, Bytes) - der Schlüssel enthält die Optionen des
+            Encoders der Variante und dient als starker ETag
+        """
+        qr_data = qr_payload(device_id, customer)
+        return _image_key(qr_data, image_format), QRCodeGenerator.render_image(qr_data, image_format)
+
+    @staticmethod
+    def render_image(qr_data: str, image_format: str) -> bytes:
+        """Bilddatei zu einem QR-Inhalt (In-Process-Cache, dann Artefaktspeicher)"""
+        if image_format not in IMAGE_SUFFIXES:
+            raise ValueError(f"image_format must be one of {list(IMAGE_SUFFIXES)}, got '{image_format}'")
+        # Schlüssel aus dem Encoder der Variante: ein Encoder-Wechsel (use_encoder,
+        # PNG_BOX_SIZE) macht alte Bytes im Cache und im Dateispeicher unerreichbar
+        cache_key = _image_cache_key(qr_data, image_format)
+        cached = _cache.get(cache_key)
+        if cached is not None:
+            return cached
+        if _store is not None:
+            data = _store.get_or_create(
+                _image_key(qr_data, image_format),
+                lambda: _render_image(qr_data, image_format),
+                suffix=IMAGE_SUFFIXES[image_format]
+            )
+        else:
+            data = _render_image(qr_data, image_format)
+        _cache.put(cache_key, data)
+        return data
+
+    @staticmethod
+    def ensure_stored(device_id: str, customer: str = "",
+                      encoder: Optional[BaseQRGenerator] = None) -> Optional[str]:
+        """QR-Code mit Standardoptionen im Dateispeicher sicherstellen (Warm-up)
+
+        Umgeht den In-Process-Cache, damit ein Warm-up über alle Geräte ihn
+        nicht verdrängt.
+
+        Returns:
+            Schlüssel des Artefakts oder None, wenn kein Dateispeicher konfiguriert ist
+        """
+        store = _store
+        if store is None:
+            return None
+        encoder = encoder or _encoder
+        qr_data = qr_payload(device_id, customer)
+        key = _default_key(qr_data, encoder)
+        store.get_or_create(key, lambda: encoder.encode(qr_data))
+        return key
+
+    @staticmethod
+    def encoder() -> BaseQRGenerator:
+        """Aktiver SVG-Encoder (QRGenerator-Adapter) mit den Standardoptionen"""
+        return _encoder
+
+    @staticmethod
+    def use_encoder(encoder: BaseQRGenerator) -> None:
+        """SVG-Encoder setzen (z.B. SVGRectRunQRGenerator oder andere Fehlerkorrektur)
+
+        Der Encoder ist Teil der Cache- und Artefakt-Schlüssel; bereits erzeugte
+        QR-Codes anderer Encoder werden nicht weiterverwendet.
+
+        Raises:
+            ValueError: Wenn der Adapter kein SVG erzeugt
+        """
+        global _encoder, _png_encoder
+        if encoder.mimetype != 'image/svg+xml':
+            raise ValueError(f"QR encoder must produce SVG, got '{encoder.mimetype}'")
+        _encoder = encoder
+        _png_encoder = PNGQRGenerator(error_correction=encoder.error_correction, box_size=PNG_BOX_SIZE,
+                                      border=encoder.border)
+
+    @staticmethod
+    def artifact_store() -> Optional[QRArtifactStore]:
+        """Konfigurierter Dateispeicher (None = nur In-Process-Cache)"""
+        return _store
+
+    @staticmethod
+    def use_artifact_store(store: Optional[QRArtifactStore]) -> None:
+        """Dateispeicher setzen (None deaktiviert ihn)"""
+        global _store
+        _store = store
+
+    @staticmethod
+    def cache_stats() -> Dict[str, float]:
+        """Trefferquote und Füllstand des QR-Code-Caches (pro Prozess)"""
+        return _cache.stats()
+
+    @staticmethod
+    def clear_cache() -> None:
+        """QR-Code-Cache leeren"""
+        _cache.clear()
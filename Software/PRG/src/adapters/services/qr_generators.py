@@ -0,0 +1,202 @@
+"""QR Generator Adapters - Implementierungen des QRGenerator-Ports
+
+Drei Ausgabeformate mit gemeinsamen Einstellungen (Fehlerkorrektur,
+Modulgröße, Ruhezone):
+- SVGPathQRGenerator: SVG mit einem Pfad-Segment pro Modul (qrcode SvgPathImage),
+  bisheriges Format der gespeicherten QR-Codes
+- SVGRectRunQRGenerator: kompaktes SVG, zusammenhängende Module einer Zeile als
+  ein Rechteck-Segment - kleiner und ohne XML-Baum schneller zu erzeugen
+- PNGQRGenerator: Rasterbild (pypng), box_size = Pixel pro Modul
+
+Welches Format für welchen Zweck (Bildschirm, Druck, Etikett) am günstigsten
+ist, zeigt benchmarks/bench_qr_generators.py.
+"""
+import os
+import tempfile
+from abc import abstractmethod
+from io import BytesIO
+from typing import Dict, List, Optional, Type
+
+import qrcode
+import qrcode.image.pure
+import qrcode.image.svg
+
+from src.core.ports.qr_generator import QRGenerator
+from src.adapters.services.logger_service import LoggerService
+
+
+# Fehlerkorrektur-Stufen (Anteil rekonstruierbarer Daten: L 7%, M 15%, Q 25%, H 30%)
+ERROR_CORRECTION_LEVELS = {
+    'L': qrcode.constants.ERROR_CORRECT_L,
+    'M': qrcode.constants.ERROR_CORRECT_M,
+    'Q': qrcode.constants.ERROR_CORRECT_Q,
+    'H': qrcode.constants.ERROR_CORRECT_H,
+}
+
+
+class BaseQRGenerator(QRGenerator):
+    """Gemeinsame Einstellungen und Fehlerbehandlung der QR-Adapter"""
+    name = ''
+    file_extension = ''
+
+    def __init__(self, error_correction: str = 'L', box_size: int = 10, border: int = 4):
+        if error_correction not in ERROR_CORRECTION_LEVELS:
+            raise ValueError(f"error_correction must be one of {list(ERROR_CORRECTION_LEVELS)}, "
+                             f"got '{error_correction}'")
+        if box_size < 1:
+            raise ValueError("box_size must be positive")
+        if border < 0:
+            raise ValueError("border must not be negative")
+        self.error_correction = error_correction
+        self.box_size = box_size
+        self.border = border
+        self.logger = LoggerService()
+
+    def with_settings(self, error_correction: Optional[str] = None, box_size: Optional[int] = None,
+                      border: Optional[int] = None) -> 'BaseQRGenerator':
+        """Gleicher Adapter mit abweichenden Einstellungen (None = unverändert)"""
+        if ((error_correction is None or error_correction == self.error_correction)
+                and (box_size is None or box_size == self.box_size)
+                and (border is None or border == self.border)):
+            return self
+        return type(self)(
+            error_correction=error_correction or self.error_correction,
+            box_size=box_size if box_size is not None else self.box_size,
+            border=border if border is not None else self.border
+        )
+
+    def _qr(self, data: str, image_factory=None) -> qrcode.QRCode:
+        qr_code = qrcode.QRCode(
+            version=1,
+            error_correction=ERROR_CORRECTION_LEVELS[self.error_correction],
+            box_size=self.box_size,
+            border=self.border,
+            image_factory=image_factory,
+        )
+        qr_code.add_data(data)
+        qr_code.make(fit=True)
+        return qr_code
+
+    def matrix(self, data: str) -> List[List[bool]]:
+        """Modulmatrix inkl. Ruhezone (True = dunkel)"""
+        return self._qr(data).get_matrix()
+
+    @property
+    def module_size(self) -> float:
+        """Kantenlänge eines Moduls in Bildkoordinaten (SVG: viewBox-Einheiten, PNG: Pixel)"""
+        return float(self.box_size)
+
+    @abstractmethod
+    def encode(self, data: str) -> bytes:
+        """Bild erzeugen (Fehler werden weitergereicht)"""
+        pass
+
+    def generate(self, data: str) -> Optional[bytes]:
+        try:
+            return self.encode(data)
+        except Exception as e:
+            self.logger.error(f"Error generating QR code: {e}", exception=e, generator=self.name)
+            return None
+
+    def generate_to_file(self, data: str, filename: str) -> bool:
+        """Bild atomar in eine Datei schreiben"""
+        content = self.generate(data)
+        if content is None:
+            return False
+        folder = os.path.dirname(os.path.abspath(filename))
+        try:
+            fd, temp_path = tempfile.mkstemp(dir=folder, prefix='.tmp-', suffix=self.file_extension)
+            with os.fdopen(fd, 'wb') as temp_file:
+                temp_file.write(content)
+            os.replace(temp_path, filename)
+            return True
+        except OSError as e:
+            self.logger.error(f"Failed to write QR code to {filename}: {e}", exception=e)
+            return False
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(error_correction='{self.error_correction}', "
+                f"box_size={self.box_size}, border={self.border})")
+
+
+class SVGPathQRGenerator(BaseQRGenerator):
+    """SVG mit einem Pfad-Segment pro dunklem Modul (qrcode SvgPathImage)"""
+    name = 'svg-path'
+    mimetype = 'image/svg+xml'
+    file_extension = '.svg'
+
+    @property
+    def module_size(self) -> float:
+        # SvgPathImage rechnet in mm: box_size / 10 pro Modul
+        return self.box_size / 10
+
+    def encode(self, data: str) -> bytes:
+        svg_bytes = BytesIO()
+        self._qr(data, qrcode.image.svg.SvgPathImage).make_image().save(svg_bytes)
+        return svg_bytes.getvalue()
+
+
+class SVGRectRunQRGenerator(BaseQRGenerator):
+    """Kompaktes SVG: dunkle Module einer Zeile als ein Rechteck-Segment pro Lauf
+
+    Koordinaten in Modulen (viewBox), Größe wie SvgPathImage (box_size / 10 mm
+    pro Modul); crispEdges verhindert Haarlinien zwischen den Zeilen.
+    """
+    name = 'svg-rect'
+    mimetype = 'image/svg+xml'
+    file_extension = '.svg'
+
+    @property
+    def module_size(self) -> float:
+        return 1.0
+
+    def encode(self, data: str) -> bytes:
+        matrix = self.matrix(data)
+        size = len(matrix)
+        segments = []
+        for y, row in enumerate(matrix):
+            x = 0
+            while x < size:
+                if not row[x]:
+                    x += 1
+                    continue
+                start = x
+                while x < size and row[x]:
+                    x += 1
+                segments.append(f"M{start} {y}h{x - start}v1h-{x - start}z")
+        length = f"{size * self.box_size / 10:g}mm"
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{length}" height="{length}" '
+            f'viewBox="0 0 {size} {size}" shape-rendering="crispEdges">'
+            f'<path d="{"".join(segments)}"/></svg>'
+        ).encode('ascii')
+
+
+class PNGQRGenerator(BaseQRGenerator):
+    """PNG-Rasterbild (pypng), box_size = Pixel pro Modul"""
+    name = 'png'
+    mimetype = 'image/png'
+    file_extension = '.png'
+
+    def encode(self, data: str) -> bytes:
+        png_bytes = BytesIO()
+        self._qr(data, qrcode.image.pure.PyPNGImage).make_image().save(png_bytes)
+        return png_bytes.getvalue()
+
+
+QR_GENERATORS: Dict[str, Type[BaseQRGenerator]] = {
+    generator.name: generator for generator in (SVGPathQRGenerator, SVGRectRunQRGenerator, PNGQRGenerator)
+}
+
+
+def create_qr_generator(name: str, **settings) -> BaseQRGenerator:
+    """QR-Adapter nach Namen erzeugen ('svg-path', 'svg-rect', 'png')
+
+    Raises:
+        ValueError: Bei unbekanntem Namen oder ungültigen Einstellungen
+    """
+    try:
+        generator_class = QR_GENERATORS[name]
+    except KeyError:
+        raise ValueError(f"QR generator must be one of {sorted(QR_GENERATORS)}, got '{name}'")
+    return generator_class(**settings)
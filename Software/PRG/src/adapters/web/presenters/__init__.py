@@ -0,0 +1,47 @@
+"""Presenter für Web-Ausgaben (JSON-Serialisierung)"""
+from src.adapters.web.presenters.json_encoder import (
+    FastJSONProvider,
+    dumps,
+    loads,
+    iter_json_array,
+    stream_json_array
+)
+from src.adapters.web.presenters.device_serializer import (
+    DeviceSerializer,
+    get_serializer,
+    register_serializer
+)
+from src.adapters.web.presenters.qr_presenter import qr_data_uri, qr_image_url
+from src.adapters.web.presenters.ics_presenter import ICS_MIMETYPE, render_ics
+from src.adapters.web.presenters.label_sheet_pdf import PDF_MIMETYPE, iter_label_sheet_pdf
+from src.adapters.web.presenters.zpl_export import ZPL_MIMETYPE, get_zpl_layout, iter_zpl
+from src.adapters.web.presenters.table_export import (
+    CSV_MIMETYPE,
+    XLSX_MIMETYPE,
+    iter_csv,
+    iter_xlsx
+)
+
+__all__ = [
+    'FastJSONProvider',
+    'dumps',
+    'loads',
+    'iter_json_array',
+    'stream_json_array',
+    'DeviceSerializer',
+    'get_serializer',
+    'register_serializer',
+    'qr_data_uri',
+    'qr_image_url',
+    'CSV_MIMETYPE',
+    'XLSX_MIMETYPE',
+    'iter_csv',
+    'iter_xlsx',
+    'PDF_MIMETYPE',
+    'iter_label_sheet_pdf',
+    'ZPL_MIMETYPE',
+    'get_zpl_layout',
+    'iter_zpl',
+    'ICS_MIMETYPE',
+    'render_ics'
+]
@@ -0,0 +1,393 @@
+"""Geräteliste als PDF (WeasyPrint) - HTML-Vorlagen und PDF-Erzeugung
+
+Gemeinsam genutzt vom synchronen Export (/pdf/devices) und den PDF-Jobs im
+Hintergrund. WeasyPrint wird erst beim Schreiben importiert, damit die
+Web-App auch ohne die (systemabhängige) Bibliothek startet.
+"""
+from datetime import datetime
+from typing import BinaryIO, Callable, Dict, List, Optional, Sequence, Union
+
+from jinja2 import Environment
+
+from src.core.domain.device import Device
+from src.core.domain.inspection import Inspection
+
+
+# Anzahl Prüfungen pro Gerät in der Kunden-Geräteliste
+HISTORY_PER_DEVICE = 3
+
+# Alle Geräte: Spalte "Letzte Prüfung"
+DEVICE_LIST_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="de">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Geräteliste</title>
+    <style>
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+
+        body {
+            font-family: Arial, sans-serif;
+            font-size: 11pt;
+            color: #333;
+            background: white;
+        }
+
+        .header {
+            text-align: center;
+            margin-bottom: 30px;
+            border-bottom: 2px solid #333;
+            padding-bottom: 15px;
+        }
+
+        .header h1 {
+            font-size: 24pt;
+            margin-bottom: 5px;
+            color: #1a1a1a;
+        }
+
+        .header p {
+            font-size: 10pt;
+            color: #666;
+        }
+
+        .metadata {
+            display: flex;
+            justify-content: space-between;
+            margin-bottom: 20px;
+            font-size: 10pt;
+            color: #666;
+        }
+
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-top: 20px;
+        }
+
+        thead {
+            background-color: #f0f0f0;
+            border-top: 2px solid #333;
+            border-bottom: 2px solid #333;
+        }
+
+        th {
+            padding: 10px;
+            text-align: left;
+            font-weight: bold;
+            font-size: 10pt;
+            color: #333;
+        }
+
+        td {
+            padding: 8px 10px;
+            border-bottom: 1px solid #ddd;
+            font-size: 10pt;
+        }
+
+        tbody tr:nth-child(even) {
+            background-color: #f9f9f9;
+        }
+
+        tbody tr:hover {
+            background-color: #f0f0f0;
+        }
+
+        .status-active {
+            color: #28a745;
+            font-weight: bold;
+        }
+
+        .status-inactive {
+            color: #dc3545;
+            font-weight: bold;
+        }
+
+        .status-maintenance {
+            color: #ffc107;
+            font-weight: bold;
+        }
+
+        .status-retired {
+            color: #6c757d;
+            font-weight: bold;
+        }
+
+        .empty-message {
+            text-align: center;
+            padding: 40px;
+            color: #999;
+            font-size: 12pt;
+        }
+
+        .footer {
+            margin-top: 30px;
+            padding-top: 15px;
+            border-top: 1px solid #ddd;
+            font-size: 9pt;
+            color: #999;
+            text-align: center;
+        }
+
+        @page {
+            size: A4;
+            margin: 20mm;
+        }
+
+        @media print {
+            body {
+                margin: 0;
+                padding: 0;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>Benning Device Manager</h1>
+        <p>Geräteliste</p>
+    </div>
+
+    <div class="metadata">
+        <div>
+            <strong>Gesamtzahl Geräte:</strong> {{ devices|length }}
+        </div>
+        <div>
+            <strong>Generiert:</strong> {{ generated_date }}
+        </div>
+    </div>
+
+    {% if devices %}
+    <table>
+        <thead>
+            <tr>
+                <th>ID</th>
+                <th>Kundenname</th>
+                <th>Geräte-ID</th>
+                <th>Name</th>
+                <th>Typ</th>
+                <th>Seriennummer</th>
+                <th>Standort</th>
+                <th>Letzte Prüfung</th>
+                <th>Status</th>
+            </tr>
+        </thead>
+        <tbody>
+            {% for device in devices %}
+            {% set latest = history.get(device.id, [None])[0] %}
+            <tr>
+                <td>{{ device.id }}</td>
+                <td>{{ device.customer }}</td>
+                <td>{{ device.customer_device_id }}</td>
+                <td>{{ device.name }}</td>
+                <td>{{ device.type or '-' }}</td>
+                <td>{{ device.serial_number or '-' }}</td>
+                <td>{{ device.location or '-' }}</td>
+                <td>{{ latest.inspection_date.strftime('%d.%m.%Y') ~ ' (' ~ latest.result ~ ')' if latest else '-' }}</td>
+                <td>
+                    <span class="status-{{ device.status or 'active' }}">
+                        {{ device.status or 'active' }}
+                    </span>
+                </td>
+            </tr>
+            {% endfor %}
+        </tbody>
+    </table>
+    {% else %}
+    <div class="empty-message">
+        <p>Keine Geräte vorhanden</p>
+    </div>
+    {% endif %}
+
+    <div class="footer">
+        <p>Benning Device Manager | Geräteliste PDF Export</p>
+    </div>
+</body>
+</html>
+"""
+
+# Geräte eines Kunden: Spalte "Letzte Prüfungen" (HISTORY_PER_DEVICE)
+CUSTOMER_DEVICE_LIST_TEMPLATE = """
+<!DOCTYPE html>
+<html lang="de">
+<head>
+    <meta charset="UTF-8">
+    <title>Geräteliste - {{ customer }}</title>
+    <style>
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+
+        body {
+            font-family: Arial, sans-serif;
+            font-size: 11pt;
+            color: #333;
+        }
+
+        .header {
+            text-align: center;
+            margin-bottom: 30px;
+            border-bottom: 2px solid #333;
+            padding-bottom: 15px;
+        }
+
+        .header h1 {
+            font-size: 24pt;
+            margin-bottom: 5px;
+        }
+
+        .header p {
+            font-size: 12pt;
+            color: #666;
+        }
+
+        .metadata {
+            display: flex;
+            justify-content: space-between;
+            margin-bottom: 20px;
+            font-size: 10pt;
+            color: #666;
+        }
+
+        table {
+            width: 100%;
+            border-collapse: collapse;
+        }
+
+        thead {
+            background-color: #f0f0f0;
+            border-top: 2px solid #333;
+            border-bottom: 2px solid #333;
+        }
+
+        th {
+            padding: 10px;
+            text-align: left;
+            font-weight: bold;
+        }
+
+        td {
+            padding: 8px 10px;
+            border-bottom: 1px solid #ddd;
+        }
+
+        tbody tr:nth-child(even) {
+            background-color: #f9f9f9;
+        }
+
+        .empty-message {
+            text-align: center;
+            padding: 40px;
+            color: #999;
+        }
+
+        @page {
+            size: A4;
+            margin: 20mm;
+        }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>Benning Device Manager</h1>
+        <p>Geräteliste für Kunde: <strong>{{ customer }}</strong></p>
+    </div>
+
+    <div class="metadata">
+        <div>
+            <strong>Kundenname:</strong> {{ customer }}
+        </div>
+        <div>
+            <strong>Anzahl Geräte:</strong> {{ devices|length }}
+        </div>
+        <div>
+            <strong>Generiert:</strong> {{ generated_date }}
+        </div>
+    </div>
+
+    {% if devices %}
+    <table>
+        <thead>
+            <tr>
+                <th>Geräte-ID</th>
+                <th>Name</th>
+                <th>Typ</th>
+                <th>Seriennummer</th>
+                <th>Standort</th>
+                <th>Status</th>
+                <th>Letzte Prüfungen</th>
+            </tr>
+        </thead>
+        <tbody>
+            {% for device in devices %}
+            <tr>
+                <td>{{ device.customer_device_id }}</td>
+                <td>{{ device.name }}</td>
+                <td>{{ device.type or '-' }}</td>
+                <td>{{ device.serial_number or '-' }}</td>
+                <td>{{ device.location or '-' }}</td>
+                <td>{{ device.status or 'active' }}</td>
+                <td>
+                    {% for inspection in history.get(device.id, []) %}
+                    {{ inspection.inspection_date.strftime('%d.%m.%Y') }} ({{ inspection.result }}){% if not loop.last %}<br>{% endif %}
+                    {% else %}-{% endfor %}
+                </td>
+            </tr>
+            {% endfor %}
+        </tbody>
+    </table>
+    {% else %}
+    <div class="empty-message">
+        <p>Keine Geräte für diesen Kunden vorhanden</p>
+    </div>
+    {% endif %}
+</body>
+</html>
+"""
+
+# Wie render_template_string: HTML-Ausgabe wird maskiert
+_environment = Environment(autoescape=True)
+_templates = {
+    False: _environment.from_string(DEVICE_LIST_TEMPLATE),
+    True: _environment.from_string(CUSTOMER_DEVICE_LIST_TEMPLATE),
+}
+
+
+def render_device_list_html(devices: Sequence[Device], history: Dict[int, List[Inspection]],
+                            customer: Optional[str] = None,
+                            generated_at: Optional[datetime] = None) -> str:
+    """HTML der Geräteliste (mit customer: Kundenliste mit Prüfhistorie)"""
+    return _templates[customer is not None].render(
+        customer=customer,
+        devices=devices,
+        history=history,
+        generated_date=(generated_at or datetime.now()).strftime('%d.%m.%Y %H:%M:%S')
+    )
+
+
+def write_device_list_pdf(html: str, target: Union[str, BinaryIO],
+                          on_layout: Optional[Callable[[int], None]] = None) -> int:
+    """HTML mit WeasyPrint als PDF schreiben
+
+    Args:
+        html: Gerenderte Geräteliste
+        target: Dateipfad oder binäres Dateiobjekt
+        on_layout: Wird nach dem Seitenumbruch (teuerster Schritt) mit der Seitenzahl aufgerufen
+
+    Returns:
+        Anzahl Seiten
+    """
+    from weasyprint import HTML
+
+    document = HTML(string=html).render()
+    if on_layout is not None:
+        on_layout(len(document.pages))
+    document.write_pdf(target)
+    return len(document.pages)
@@ -0,0 +1,106 @@
+"""Device Serializer - Registry mit vorkompilierten Feldsätzen
+
+Statt in jeder Route ein eigenes Dict-Literal zu bauen, wird pro Verwendungs-
+zweck (list/detail/export) ein Feldsatz registriert. Der Zugriff auf die
+Attribute erfolgt über einen einmalig erzeugten `operator.attrgetter`, d.h. ein
+einziger C-Aufruf pro Gerät statt N einzelner Attributzugriffe.
+"""
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from src.core.domain.device import Device
+
+
+# ANCHOR: Feldsätze
+LIST_FIELDS = (
+    'id', 'customer', 'customer_device_id', 'name', 'type', 'location',
+    'manufacturer', 'serial_number', 'status',
+    # DGUV3 Prüfwerte
+    'r_pe', 'r_iso', 'i_pe', 'i_b',
+)
+
+DETAIL_FIELDS = (
+    'id', 'customer', 'customer_device_id', 'name', 'type', 'serial_number',
+    'manufacturer', 'model', 'location', 'purchase_date', 'last_inspection',
+    'next_inspection', 'status', 'notes',
+    # DGUV3 Prüfwerte
+    'r_pe', 'r_iso', 'i_pe', 'i_b',
+    # USB-Kabel Felder
+    'cable_type', 'test_result', 'internal_resistance', 'emarker_active',
+    'inspection_notes',
+)
+
+# Prüfplanung: schlanke Karte mit Terminen
+DUE_FIELDS = (
+    'id', 'customer', 'customer_device_id', 'name', 'type', 'location',
+    'status', 'last_inspection', 'next_inspection',
+)
+
+# Flache Spaltenreihenfolge für Tabellen-Exporte (CSV/XLSX)
+EXPORT_FIELDS = (
+    'customer_device_id', 'customer', 'name', 'type', 'manufacturer', 'model',
+    'serial_number', 'location', 'status', 'purchase_date', 'last_inspection',
+    'next_inspection',
+    'r_pe', 'r_iso', 'i_pe', 'i_b',
+    'cable_type', 'test_result', 'internal_resistance', 'emarker_active',
+    'notes', 'inspection_notes',
+)
+
+
+class DeviceSerializer:
+    """Vorkompilierter Serializer für einen Feldsatz"""
+
+    __slots__ = ('name', 'fields', '_getter')
+
+    def __init__(self, name: str, fields: Sequence[str]):
+        if len(fields) < 2:
+            raise ValueError("A serializer needs at least two fields")
+        self.name = name
+        self.fields: Tuple[str, ...] = tuple(fields)
+        self._getter = attrgetter(*self.fields)
+
+    def to_row(self, device: Device) -> Tuple[Any, ...]:
+        """Werte als Tupel in Feldreihenfolge (für Tabellen-Exporte)"""
+        return self._getter(device)
+
+    def to_dict(self, device: Device) -> Dict[str, Any]:
+        """Werte als Dict (JSON-fähig über den schnellen Encoder)"""
+        return dict(zip(self.fields, self._getter(device)))
+
+    def many(self, devices: Iterable[Device]) -> List[Dict[str, Any]]:
+        """Liste von Geräten serialisieren"""
+        fields = self.fields
+        getter = self._getter
+        return [dict(zip(fields, getter(d))) for d in devices]
+
+    def __repr__(self) -> str:
+        return f"DeviceSerializer(name={self.name}, fields={len(self.fields)})"
+
+
+# ANCHOR: Registry
+_registry: Dict[str, DeviceSerializer] = {}
+
+
+def register_serializer(name: str, fields: Sequence[str]) -> DeviceSerializer:
+    """Registriere (oder ersetze) einen Feldsatz"""
+    serializer = DeviceSerializer(name, fields)
+    _registry[name] = serializer
+    return serializer
+
+
+def get_serializer(name: str) -> DeviceSerializer:
+    """Hole registrierten Serializer
+
+    Raises:
+        KeyError: Wenn kein Serializer mit diesem Namen registriert ist
+    """
+    try:
+        return _registry[name]
+    except KeyError:
+        raise KeyError(f"Unknown device serializer '{name}' (known: {sorted(_registry)})")
+
+
+register_serializer('list', LIST_FIELDS)
+register_serializer('detail', DETAIL_FIELDS)
+register_serializer('due', DUE_FIELDS)
+register_serializer('export', EXPORT_FIELDS)
@@ -0,0 +1,81 @@
+"""iCalendar-Presenter (RFC 5545) für den Prüftermin-Feed"""
+from datetime import datetime, timedelta, timezone
+from typing import List
+
+from src.core.domain.calendar_feed import CalendarEvent, CalendarFeed
+
+
+ICS_MIMETYPE = 'text/calendar'
+
+# Maximale Zeilenlänge in Oktetten (ohne CRLF)
+_LINE_LIMIT = 75
+
+
+def _escape(text: str) -> str:
+    return (text.replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+
+def _fold(line: str) -> str:
+    """Lange Zeilen nach 75 Oktetten umbrechen (UTF-8-Zeichen nicht teilen)"""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= _LINE_LIMIT:
+        return line
+    parts = []
+    current = ''
+    size = 0
+    limit = _LINE_LIMIT
+    for char in line:
+        width = len(char.encode('utf-8'))
+        if size + width > limit:
+            parts.append(current)
+            current, size, limit = '', 0, _LINE_LIMIT - 1  # Folgezeilen beginnen mit Leerzeichen
+        current += char
+        size += width
+    parts.append(current)
+    return '\r\n '.join(parts)
+
+
+def _event_lines(event: CalendarEvent, stamp: str) -> List[str]:
+    lines = [
+        'BEGIN:VEVENT',
+        f'UID:{event.uid}',
+        f'DTSTAMP:{stamp}',
+        f"DTSTART;VALUE=DATE:{event.day.strftime('%Y%m%d')}",
+        f"DTEND;VALUE=DATE:{(event.day + timedelta(days=1)).strftime('%Y%m%d')}",
+        f'SUMMARY:{_escape(event.summary)}',
+    ]
+    if event.description:
+        lines.append(f'DESCRIPTION:{_escape(event.description)}')
+    if event.location:
+        lines.append(f'LOCATION:{_escape(event.location)}')
+    lines.append('TRANSP:TRANSPARENT')
+    lines.append('END:VEVENT')
+    return lines
+
+
+def render_ics(feed: CalendarFeed) -> bytes:
+    """Feed als VCALENDAR rendern
+
+    DTSTAMP ist der Änderungsstand des Feeds (nicht die Renderzeit), damit
+    alle Worker für denselben Stand byte-identische Kalender und damit
+    denselben ETag liefern.
+    """
+    stamp_time = feed.changed_at or datetime(1970, 1, 1)
+    if stamp_time.tzinfo is not None:
+        stamp_time = stamp_time.astimezone(timezone.utc).replace(tzinfo=None)
+    stamp = stamp_time.strftime('%Y%m%dT%H%M%SZ')
+
+    lines = [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        'PRODID:-//Benning Device Manager//Prüftermine//DE',
+        'CALSCALE:GREGORIAN',
+        'METHOD:PUBLISH',
+        f'X-WR-CALNAME:{_escape(f"Prüftermine {feed.customer}")}',
+        'REFRESH-INTERVAL;VALUE=DURATION:PT15M',
+    ]
+    for event in sorted(feed.events, key=lambda e: (e.day, e.uid)):
+        lines.extend(_event_lines(event, stamp))
+    lines.append('END:VCALENDAR')
+    return ('\r\n'.join(_fold(line) for line in lines) + '\r\n').encode('utf-8')
@@ -0,0 +1,115 @@
+"""Schneller JSON-Encoder - orjson mit stdlib-Fallback
+
+Behandelt date, datetime und Decimal nativ (ISO-Format bzw. JSON-Zahl) und
+stellt einen Flask JSONProvider bereit, damit jedes `jsonify()` der Anwendung
+denselben Encoder verwendet. Für große Arrays gibt es einen Streaming-Pfad,
+der die Antwort blockweise erzeugt statt als einen großen String.
+"""
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Iterable, Iterator
+
+from flask import Response
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - Fallback ohne orjson
+    orjson = None
+
+
+# Anzahl Elemente pro Chunk im Streaming-Pfad
+STREAM_CHUNK_SIZE = 500
+
+
+def _default(obj: Any) -> Any:
+    """Fallback für Typen, die der Encoder nicht nativ kennt"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, bytes):
+        return obj.decode('utf-8')
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    def dumps(obj: Any) -> bytes:
+        """Serialisiere Objekt zu JSON (bytes)"""
+        return orjson.dumps(obj, default=_default)
+
+    def loads(data: Any) -> Any:
+        """Deserialisiere JSON (str oder bytes)"""
+        return orjson.loads(data)
+else:  # pragma: no cover
+    def dumps(obj: Any) -> bytes:
+        """Serialisiere Objekt zu JSON (bytes)"""
+        return json.dumps(obj, default=_default, ensure_ascii=False,
+                          separators=(',', ':')).encode('utf-8')
+
+    def loads(data: Any) -> Any:
+        """Deserialisiere JSON (str oder bytes)"""
+        return json.loads(data)
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON Provider auf Basis des schnellen Encoders"""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return dumps(obj).decode('utf-8')
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype=self.mimetype)
+
+
+def iter_json_array(items: Iterable[Any], serialize: Callable[[Any], Any],
+                    prefix: bytes = b'', suffix: bytes = b'',
+                    chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """Erzeuge ein JSON-Array blockweise
+
+    Args:
+        items: Beliebiges Iterable (auch Generator / Server-Side-Cursor)
+        serialize: Funktion Element -> JSON-fähiges Objekt
+        prefix: Bytes vor dem Array (z.B. b'{"success":true,"data":')
+        suffix: Bytes nach dem Array (z.B. b'}')
+        chunk_size: Elemente pro erzeugtem Chunk
+
+    Yields:
+        JSON-Fragmente als bytes
+    """
+    yield prefix + b'['
+    buffer = []
+    first = True
+    for item in items:
+        buffer.append(dumps(serialize(item)))
+        if len(buffer) >= chunk_size:
+            chunk = b','.join(buffer)
+            yield chunk if first else b',' + chunk
+            first = False
+            buffer = []
+    if buffer:
+        chunk = b','.join(buffer)
+        yield chunk if first else b',' + chunk
+    yield b']' + suffix
+
+
+def stream_json_array(items: Iterable[Any], serialize: Callable[[Any], Any],
+                      key: str = 'data', **envelope: Any) -> Response:
+    """Streaming-Response der Form {<envelope...>, "<key>": [...]}
+
+    Args:
+        items: Zu serialisierende Elemente
+        serialize: Funktion Element -> JSON-fähiges Objekt
+        key: Name des Array-Felds
+        **envelope: Zusätzliche Felder vor dem Array (z.B. success=True)
+    """
+    head = dumps(envelope)[:-1]  # schließende Klammer entfernen
+    separator = b',' if envelope else b''
+    prefix = head + separator + dumps(key) + b':'
+    return Response(iter_json_array(items, serialize, prefix=prefix, suffix=b'}'),
+                    mimetype='application/json')
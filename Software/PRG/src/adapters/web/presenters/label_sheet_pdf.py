@@ -0,0 +1,177 @@
+"""Etikettenbogen als PDF (QR-Code + customer_device_id + Name) - Streaming
+
+Das PDF wird Seite für Seite direkt als Byte-Stream geschrieben (ohne
+PDF-Bibliothek und ohne das ganze Dokument im Speicher):
+- jeder QR-Code ist ein Form-XObject und wird pro Dokument nur einmal
+  geschrieben - mehrere Kopien desselben Etiketts verweisen auf dasselbe Objekt
+- Seiten werden geschrieben, sobald sie voll sind; Seitenbaum (Pages), Katalog
+  und Querverweistabelle folgen am Ende (Objekte dürfen in beliebiger
+  Reihenfolge stehen)
+- alle Streams sind mit Flate komprimiert, Schriften sind die PDF-Standard-
+  schriften Helvetica/Helvetica-Bold (WinAnsi, keine Einbettung)
+"""
+import zlib
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+
+from src.core.domain.device import Device
+from src.core.domain.label_sheet import LabelTemplate, paginate_labels
+
+
+PDF_MIMETYPE = 'application/pdf'
+
+# Millimeter -> PDF-Punkte
+MM = 72 / 25.4
+
+# Innenabstand im Etikett (mm) und maximale Schriftgrößen (pt)
+LABEL_PADDING_MM = 2.0
+ID_FONT_SIZE = 9.0
+NAME_FONT_SIZE = 7.0
+
+# Mittlere Zeichenbreite von Helvetica in em (für Kürzen/Verkleinern)
+_AVERAGE_CHAR_WIDTH = 0.56
+
+# Feste Objektnummern; XObjects, Seiten und Inhalte werden fortlaufend vergeben
+_CATALOG_ID, _PAGES_ID, _FONT_ID, _BOLD_FONT_ID = 1, 2, 3, 4
+_FIRST_DYNAMIC_ID = 5
+
+# (Schlüssel, Content-Stream im Einheitsquadrat) eines QR-Codes
+QRForm = Tuple[str, bytes]
+
+
+class _PDFStream:
+    """Zählt geschriebene Bytes und merkt sich Objekt-Offsets für die xref-Tabelle"""
+
+    def __init__(self):
+        self.position = 0
+        self.offsets: Dict[int, int] = {}
+        self.next_id = _FIRST_DYNAMIC_ID
+
+    def allocate(self) -> int:
+        obj_id = self.next_id
+        self.next_id += 1
+        return obj_id
+
+    def raw(self, data: bytes) -> bytes:
+        self.position += len(data)
+        return data
+
+    def obj(self, obj_id: int, body: str) -> bytes:
+        self.offsets[obj_id] = self.position
+        return self.raw(f"{obj_id} 0 obj\n{body}\nendobj\n".encode('latin-1'))
+
+    def stream(self, obj_id: int, dictionary: str, data: bytes) -> bytes:
+        compressed = zlib.compress(data)
+        self.offsets[obj_id] = self.position
+        return self.raw(
+            f"{obj_id} 0 obj\n<< {dictionary} /Filter /FlateDecode /Length {len(compressed)} >>\nstream\n"
+            .encode('latin-1') + compressed + b"\nendstream\nendobj\n"
+        )
+
+    def xref_and_trailer(self) -> bytes:
+        start = self.position
+        size = max(self.offsets) + 1
+        lines = [f"xref\n0 {size}\n", "0000000000 65535 f \n"]
+        lines.extend(f"{self.offsets[obj_id]:010d} 00000 n \n" for obj_id in range(1, size))
+        lines.append(f"trailer\n<< /Size {size} /Root {_CATALOG_ID} 0 R >>\nstartxref\n{start}\n%%EOF\n")
+        return self.raw(''.join(lines).encode('latin-1'))
+
+
+def _pdf_text(text: str) -> str:
+    """Text als PDF-String-Literal (WinAnsi, Sonderzeichen maskiert)"""
+    encoded = text.encode('cp1252', errors='replace').decode('latin-1')
+    return '(' + encoded.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)') + ')'
+
+
+def _fit(text: str, max_size: float, width_pt: float, min_size: float = 5.0) -> Tuple[str, float]:
+    """Schriftgröße verkleinern bzw. Text kürzen, damit er in width_pt passt"""
+    if not text:
+        return '', max_size
+    size = min(max_size, width_pt / (len(text) * _AVERAGE_CHAR_WIDTH))
+    if size >= min_size:
+        return text, size
+    max_chars = max(1, int(width_pt / (min_size * _AVERAGE_CHAR_WIDTH)))
+    return text[:max_chars - 1] + '…', min_size
+
+
+def _label_ops(template: LabelTemplate, slot: int, device: Device, qr_name: str) -> str:
+    """Zeichenbefehle für ein Etikett: QR links, Texte rechts daneben"""
+    left_mm, top_mm = template.slot(slot)
+    padding = LABEL_PADDING_MM
+    qr_mm = min(template.label_height - 2 * padding, template.label_width * 0.5)
+    x = (left_mm + padding) * MM
+    y = (template.page_height - top_mm - padding - qr_mm) * MM
+    qr_pt = qr_mm * MM
+    ops = [f"q {qr_pt:.2f} 0 0 {qr_pt:.2f} {x:.2f} {y:.2f} cm /{qr_name} Do Q"]
+
+    text_x = x + qr_pt + padding * MM
+    text_width = (left_mm + template.label_width - padding) * MM - text_x
+    text_top = (template.page_height - top_mm - padding) * MM
+    identifier, id_size = _fit(device.customer_device_id or '', ID_FONT_SIZE, text_width)
+    name, name_size = _fit(device.name or '', NAME_FONT_SIZE, text_width)
+    baseline = text_top - id_size
+    ops.append(f"BT /F2 {id_size:.2f} Tf {text_x:.2f} {baseline:.2f} Td {_pdf_text(identifier)} Tj ET")
+    if name:
+        baseline -= name_size * 1.3
+        ops.append(f"BT /F1 {name_size:.2f} Tf {text_x:.2f} {baseline:.2f} Td {_pdf_text(name)} Tj ET")
+    return '\n'.join(ops)
+
+
+def iter_label_sheet_pdf(devices: Iterable[Device], template: LabelTemplate,
+                         qr_form: Callable[[Device], QRForm], skip: int = 0) -> Iterator[bytes]:
+    """Etikettenbogen-PDF seitenweise erzeugen
+
+    Args:
+        devices: Geräte in Druckreihenfolge (Kopien = mehrfach enthalten)
+        template: Bogenvorlage
+        qr_form: Liefert (Schlüssel, Content-Stream) des QR-Codes eines Geräts
+        skip: Auf dem ersten Bogen bereits verbrauchte Etiketten
+    """
+    pdf = _PDFStream()
+    page_width = template.page_width * MM
+    page_height = template.page_height * MM
+    media_box = f"[0 0 {page_width:.2f} {page_height:.2f}]"
+    xobjects: Dict[str, int] = {}
+    page_ids: List[int] = []
+
+    yield pdf.raw(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    yield pdf.obj(_FONT_ID, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+    yield pdf.obj(_BOLD_FONT_ID,
+                  "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>")
+
+    for page in paginate_labels(devices, template, skip=skip):
+        chunks = []
+        used: Dict[str, int] = {}
+        ops = []
+        for slot, device in page:
+            key, form = qr_form(device)
+            obj_id = xobjects.get(key)
+            if obj_id is None:
+                # Jeder QR-Code nur einmal im Dokument
+                obj_id = xobjects[key] = pdf.allocate()
+                chunks.append(pdf.stream(obj_id, "/Type /XObject /Subtype /Form /BBox [0 0 1 1]", form))
+            name = f"Q{obj_id}"
+            used[name] = obj_id
+            ops.append(_label_ops(template, slot, device, name))
+
+        content_id = pdf.allocate()
+        chunks.append(pdf.stream(content_id, "", '\n'.join(ops).encode('latin-1')))
+        page_id = pdf.allocate()
+        resources = ' '.join(f"/{name} {obj_id} 0 R" for name, obj_id in used.items())
+        chunks.append(pdf.obj(page_id, (
+            f"<< /Type /Page /Parent {_PAGES_ID} 0 R /MediaBox {media_box} "
+            f"/Resources << /Font << /F1 {_FONT_ID} 0 R /F2 {_BOLD_FONT_ID} 0 R >> "
+            f"/XObject << {resources} >> >> /Contents {content_id} 0 R >>"
+        )))
+        page_ids.append(page_id)
+        yield b''.join(chunks)
+
+    if not page_ids:
+        # Gültiges Dokument auch ohne Etiketten: eine leere Seite
+        page_id = pdf.allocate()
+        page_ids.append(page_id)
+        yield pdf.obj(page_id, f"<< /Type /Page /Parent {_PAGES_ID} 0 R /MediaBox {media_box} >>")
+
+    kids = ' '.join(f"{page_id} 0 R" for page_id in page_ids)
+    yield pdf.obj(_PAGES_ID, f"<< /Type /Pages /Kids [{kids}] /Count {len(page_ids)} >>")
+    yield pdf.obj(_CATALOG_ID, f"<< /Type /Catalog /Pages {_PAGES_ID} 0 R >>")
+    yield pdf.xref_and_trailer()
@@ -0,0 +1,49 @@
+"""QR-Code Presenter - gespeicherte QR-Codes für Templates aufbereiten
+
+Die QR-Codes werden beim Anlegen/Ändern eines Geräts einmalig erzeugt und in
+devices.qr_code gespeichert (Base64-kodiertes SVG). Beim Rendern wird daraus nur
+noch eine Data-URI gebaut - der QR-Encoder läuft nie im Seitenaufbau.
+
+Listen- und Detailseiten verweisen stattdessen auf den Bild-Endpunkt
+/qr/<customer_device_id>.svg (qr_image_url): kleineres HTML, Browser-Cache und
+paralleles, verzögertes Laden. Der Parameter v ändert sich mit dem QR-Inhalt,
+daher kann die Antwort als unveränderlich gecacht werden.
+"""
+from typing import Optional, Union
+from flask import url_for
+from src.core.domain.device import Device
+from src.adapters.services.qr_code_generator import qr_version
+
+
+SVG_DATA_URI_PREFIX = "data:image/svg+xml;base64,"
+
+
+def qr_data_uri(qr_code: Optional[Union[bytes, str]]) -> Optional[str]:
+    """Gespeicherten QR-Code (Base64-SVG) als Data-URI für <img src="...">
+
+    Returns:
+        Data-URI oder None, wenn (noch) kein QR-Code gespeichert ist
+    """
+    if not qr_code:
+        return None
+    if isinstance(qr_code, bytes):
+        qr_code = qr_code.decode('ascii')
+    if qr_code.startswith('data:'):
+        return qr_code
+    return SVG_DATA_URI_PREFIX + qr_code
+
+
+def qr_image_url(device: Device, image_format: str = 'svg') -> Optional[str]:
+    """URL des QR-Bildes eines Geräts (mit Inhaltsversion v für Immutable-Caching)
+
+    Returns:
+        URL oder None, wenn das Gerät (noch) keine customer_device_id hat
+    """
+    if not device.customer_device_id:
+        return None
+    return url_for(
+        'qr.qr_image',
+        customer_device_id=device.customer_device_id,
+        image_format=image_format,
+        v=qr_version(device.customer_device_id, device.customer or "", image_format)
+    )
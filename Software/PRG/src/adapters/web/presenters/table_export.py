@@ -0,0 +1,183 @@
+"""Tabellen-Exporte (CSV/XLSX) als Byte-Stream
+
+Beide Formate werden zeilenweise aus einem Iterable erzeugt (z.B. dem
+Server-Side-Cursor des Repositories) und blockweise ausgegeben. Der Speicher-
+bedarf hängt nur von der Chunk-Größe ab, nicht von der Anzahl der Geräte; die
+Kopfzeile geht sofort raus, noch bevor die erste Datenbankzeile gelesen ist.
+
+XLSX wird im "write-only"-Verfahren geschrieben: das Arbeitsblatt ist ein
+Zip-Eintrag, der mit Data-Descriptor (ohne Seek) direkt in den Ausgabepuffer
+gestreamt wird, Zellen als Inline-Strings (keine Shared-String-Tabelle).
+"""
+import csv
+import io
+import re
+import zipfile
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Iterable, Iterator, List, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+from src.core.domain.device import Device
+from src.adapters.web.presenters.device_serializer import DeviceSerializer
+
+
+# Zeilen pro ausgegebenem Chunk
+EXPORT_CHUNK_SIZE = 500
+
+CSV_MIMETYPE = 'text/csv'
+XLSX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return 'ja' if value else 'nein'
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def iter_csv(devices: Iterable[Device], serializer: DeviceSerializer,
+             chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[bytes]:
+    """CSV (UTF-8 mit BOM für Excel) blockweise erzeugen"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(serializer.fields)
+    yield ('\ufeff' + buffer.getvalue()).encode('utf-8')
+    buffer.seek(0)
+    buffer.truncate()
+
+    to_row = serializer.to_row
+    pending = 0
+    for device in devices:
+        writer.writerow([_csv_value(value) for value in to_row(device)])
+        pending += 1
+        if pending >= chunk_size:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if pending:
+        yield buffer.getvalue().encode('utf-8')
+
+
+# ANCHOR: XLSX
+_XLSX_STATIC_PARTS: Tuple[Tuple[str, str], ...] = (
+    ('[Content_Types].xml',
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+     '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+     '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+     '<Default Extension="xml" ContentType="application/xml"/>'
+     '<Override PartName="/xl/workbook.xml" '
+     'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+     '<Override PartName="/xl/worksheets/sheet1.xml" '
+     'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+     '</Types>'),
+    ('_rels/.rels',
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+     '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+     '<Relationship Id="rId1" '
+     'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+     'Target="xl/workbook.xml"/>'
+     '</Relationships>'),
+    ('xl/workbook.xml',
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+     '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+     'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+     '<sheets><sheet name="Geräte" sheetId="1" r:id="rId1"/></sheets>'
+     '</workbook>'),
+    ('xl/_rels/workbook.xml.rels',
+     '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+     '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+     '<Relationship Id="rId1" '
+     'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+     'Target="worksheets/sheet1.xml"/>'
+     '</Relationships>'),
+)
+
+_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<sheetData>'
+)
+_SHEET_TAIL = '</sheetData></worksheet>'
+
+# In XML 1.0 unzulässige Steuerzeichen (z.B. aus Freitext-Notizen)
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _column_letters(count: int) -> List[str]:
+    """Spaltenbuchstaben A, B, ..., Z, AA, ... für `count` Spalten"""
+    letters = []
+    for index in range(1, count + 1):
+        name = ''
+        while index:
+            index, remainder = divmod(index - 1, 26)
+            name = chr(65 + remainder) + name
+        letters.append(name)
+    return letters
+
+
+def _xlsx_cell(ref: str, value: Any) -> str:
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float, Decimal)):
+        return f'<c r="{ref}"><v>{value}</v></c>'
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    text = escape(_INVALID_XML_CHARS.sub('', str(value)))
+    return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _xlsx_row(number: int, columns: Sequence[str], values: Sequence[Any]) -> str:
+    cells = ''.join(_xlsx_cell(f'{column}{number}', value) for column, value in zip(columns, values))
+    return f'<row r="{number}">{cells}</row>'
+
+
+class _StreamBuffer(io.RawIOBase):
+    """Nicht-seekbarer Ausgabepuffer für zipfile - wird vom Generator geleert"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def iter_xlsx(devices: Iterable[Device], serializer: DeviceSerializer,
+              chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[bytes]:
+    """XLSX-Arbeitsmappe blockweise erzeugen (ein Blatt, Kopfzeile + Geräte)"""
+    output = _StreamBuffer()
+    columns = _column_letters(len(serializer.fields))
+    with zipfile.ZipFile(output, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _XLSX_STATIC_PARTS:
+            archive.writestr(name, content)
+        with archive.open('xl/worksheets/sheet1.xml', 'w') as sheet:
+            sheet.write((_SHEET_HEAD + _xlsx_row(1, columns, serializer.fields)).encode('utf-8'))
+            yield output.drain()
+
+            to_row = serializer.to_row
+            rows: List[str] = []
+            number = 1
+            for device in devices:
+                number += 1
+                rows.append(_xlsx_row(number, columns, to_row(device)))
+                if len(rows) >= chunk_size:
+                    sheet.write(''.join(rows).encode('utf-8'))
+                    rows = []
+                    yield output.drain()
+            sheet.write((''.join(rows) + _SHEET_TAIL).encode('utf-8'))
+    yield output.drain()
@@ -0,0 +1,123 @@
+"""Geräte-Etiketten als ZPL (Zebra Programming Language) für Thermodrucker
+
+Jedes Etikett ist ein eigener ^XA...^XZ-Block; der QR-Code wird mit dem
+druckereigenen Befehl ^BQ erzeugt, es werden also keine Rasterbilder
+übertragen. Viele Etiketten werden zu einer Datei zusammengefasst, die direkt
+an den Drucker geschickt werden kann (z.B. über Port 9100 oder lp -o raw).
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, Optional
+
+from src.core.domain.device import Device
+from src.adapters.services.qr_code_generator import qr_payload
+
+
+ZPL_MIMETYPE = 'application/x-zpl'
+
+# Etiketten pro ausgegebenem Chunk
+ZPL_CHUNK_SIZE = 200
+
+# QR-Kapazität (Bytes, Fehlerkorrektur L) je Version -> Module pro Seite
+_QR_BYTE_CAPACITY_L = ((17, 21), (32, 25), (53, 29), (78, 33), (106, 37), (134, 41), (154, 45), (192, 49))
+
+
+@dataclass(frozen=True)
+class ZPLLayout:
+    """Etikettenformat eines Thermodruckers
+
+    Attributes:
+        name: Kurzname (z.B. "50x25")
+        width_mm / height_mm: Etikettengröße in mm
+        dpi: Druckauflösung (203 oder 300)
+        margin_mm: Rand rundum in mm (Ruhezone des QR-Codes)
+    """
+    name: str
+    width_mm: float
+    height_mm: float
+    dpi: int = 203
+    margin_mm: float = 2.0
+
+    def dots(self, mm: float) -> int:
+        return int(round(mm * self.dpi / 25.4))
+
+
+ZPL_LAYOUTS: Dict[str, ZPLLayout] = {
+    layout.name: layout for layout in (
+        ZPLLayout('50x25', 50.0, 25.0),
+        ZPLLayout('57x32', 57.0, 32.0),
+        ZPLLayout('100x50', 100.0, 50.0),
+        ZPLLayout('50x25-300dpi', 50.0, 25.0, dpi=300),
+    )
+}
+
+DEFAULT_ZPL_LAYOUT = '50x25'
+
+
+def get_zpl_layout(name: str) -> ZPLLayout:
+    """Etikettenformat nach Namen
+
+    Raises:
+        ValueError: Bei unbekanntem Format
+    """
+    try:
+        return ZPL_LAYOUTS[name]
+    except KeyError:
+        raise ValueError(f"layout must be one of {sorted(ZPL_LAYOUTS)}, got '{name}'")
+
+
+def _field(text: Optional[str]) -> str:
+    """Feldinhalt für ^FH (Steuerzeichen ^ ~ und das Hex-Zeichen _ maskieren)"""
+    return (text or '').replace('_', '_5F').replace('^', '_5E').replace('~', '_7E')
+
+
+def _qr_modules(payload: str) -> int:
+    length = len(payload.encode('utf-8'))
+    for capacity, modules in _QR_BYTE_CAPACITY_L:
+        if length <= capacity:
+            return modules
+    return _QR_BYTE_CAPACITY_L[-1][1]
+
+
+def render_zpl_label(device: Device, layout: ZPLLayout, copies: int = 1) -> str:
+    """ZPL-Block für ein Etikett: QR links, customer_device_id und Name rechts"""
+    payload = qr_payload(device.customer_device_id, device.customer or "")
+    margin = layout.dots(layout.margin_mm)
+    width = layout.dots(layout.width_mm)
+    height = layout.dots(layout.height_mm)
+
+    # Modulgröße (Vergrößerung 1-10) so wählen, dass der QR-Code in die Höhe passt
+    magnification = max(1, min(10, (height - 2 * margin) // _qr_modules(payload)))
+    qr_size = magnification * _qr_modules(payload)
+    text_x = margin + qr_size + margin
+    text_width = max(1, width - text_x - margin)
+    id_height = max(18, min(40, height // 5))
+    name_height = max(14, id_height * 3 // 4)
+
+    lines = [
+        "^XA",
+        "^CI28",
+        f"^PW{width}",
+        f"^LL{height}",
+        f"^FO{margin},{margin}^BQN,2,{magnification}^FH^FDLA,{_field(payload)}^FS",
+        f"^FO{text_x},{margin}^A0N,{id_height},{id_height}^FB{text_width},1,0,L,0"
+        f"^FH^FD{_field(device.customer_device_id)}^FS",
+        f"^FO{text_x},{margin + id_height + margin}^A0N,{name_height},{name_height}^FB{text_width},3,0,L,0"
+        f"^FH^FD{_field(device.name)}^FS",
+    ]
+    if copies > 1:
+        lines.append(f"^PQ{copies}")
+    lines.append("^XZ")
+    return "\n".join(lines) + "\n"
+
+
+def iter_zpl(devices: Iterable[Device], layout: ZPLLayout, copies: int = 1,
+             chunk_size: int = ZPL_CHUNK_SIZE) -> Iterator[bytes]:
+    """ZPL-Datei für viele Etiketten blockweise erzeugen (Kopien über ^PQ)"""
+    pending = []
+    for device in devices:
+        pending.append(render_zpl_label(device, layout, copies))
+        if len(pending) >= chunk_size:
+            yield ''.join(pending).encode('utf-8')
+            pending = []
+    if pending:
+        yield ''.join(pending).encode('utf-8')
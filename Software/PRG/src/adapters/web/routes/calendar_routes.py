@@ -0,0 +1,38 @@
+"""Calendar Routes - Prüftermine als iCalendar-Feed (GET /calendar/<kunde>.ics)
+
+Kalender-Clients fragen typischerweise alle 15 Minuten ab. Der Feed wird pro
+Kunde zwischengespeichert und mit ETag ausgeliefert; bei unverändertem Stand
+kostet ein Abruf eine Index-Abfrage und eine leere 304-Antwort.
+"""
+from flask import Blueprint, Response, request, jsonify
+from src.config.dependencies import container
+from src.adapters.web.presenters import ICS_MIMETYPE
+
+calendar_bp = Blueprint('calendar', __name__, url_prefix='/calendar')
+
+
+@calendar_bp.route('/<customer>.ics', methods=['GET'])
+def customer_calendar(customer: str):
+    """Prüftermine eines Kunden (?mode=device|location)"""
+    try:
+        feed = container.calendar_feed_usecase.execute(
+            customer.strip(),
+            mode=request.args.get('mode', 'device')
+        )
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'error_type': 'validation_error'
+        }), 400
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+    if feed is None:
+        return jsonify({'success': False, 'error': f"No devices for customer '{customer}'"}), 404
+
+    response = Response(feed.body, mimetype=ICS_MIMETYPE)
+    response.set_etag(feed.etag)
+    # Immer revalidieren - unveränderter Stand ergibt 304 ohne Body
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['Content-Disposition'] = f'inline; filename="pruefungen_{feed.customer}.ics"'
+    return response.make_conditional(request)
@@ -1,6 +1,8 @@
 """Device Routes - Mit DGUV3-Prüfwerten erweitert"""
 from flask import Blueprint, request, jsonify, render_template, flash, redirect, url_for
 from src.core.domain.device import Device
+from src.core.domain import dates
+from src.core.domain.device_query import DeviceQuery, MEASUREMENT_FIELDS
 from src.config.dependencies import container
 from src.adapters.web.dto.device_dto import (
     create_device_request_from_json,
@@ -9,10 +11,25 @@ from src.adapters.web.dto.device_dto import (
 from datetime import datetime
 import mysql.connector
 import logging
+from src.adapters.web.presenters import get_serializer, stream_json_array
+from src.adapters.importers import ST725ProtocolReader
 from src.adapters.services.qr_code_generator import QRCodeGenerator
+from itertools import chain
 
 logger = logging.getLogger(__name__)
 
+# Vorkompilierte Feldsätze (siehe presenters/device_serializer.py)
+_list_serializer = get_serializer('list')
+_detail_serializer = get_serializer('detail')
+_due_serializer = get_serializer('due')
+
+# Ab dieser Anzahl Geräte wird die Liste gestreamt statt am Stück kodiert
+STREAM_THRESHOLD = 1000
+
+# Seitengröße für paginierte Abfragen
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
 device_bp = Blueprint('devices', __name__, url_prefix='/api/devices')
 
 def _combine_date_time_fields(date_str, time_str):
@@ -53,6 +70,62 @@ def _clean_date_field(value):
     return value
 
 
+def _parse_within_days(value):
+    """Parse Zeitfenster wie "30d", "2w" oder "30" zu Tagen"""
+    if not value:
+        return 30
+    value = value.strip().lower()
+    factor = 1
+    if value.endswith('w'):
+        factor, value = 7, value[:-1]
+    elif value.endswith('d'):
+        value = value[:-1]
+    days = int(value) * factor
+    if days < 0:
+        raise ValueError("within must not be negative")
+    return days
+
+
+def _parse_page_size(value):
+    """Parse limit-Parameter (1..MAX_PAGE_SIZE)"""
+    if not value:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(int(value), MAX_PAGE_SIZE))
+
+
+def _split_list_arg(value):
+    """Komma-getrennte Query-Parameter zu Tupel"""
+    return tuple(part.strip() for part in value.split(',') if part.strip()) if value else ()
+
+
+def _device_query_from_args(args):
+    """Baue DeviceQuery aus Query-Parametern (None wenn kein Filter angegeben)
+    
+    Unterstützt: customer, status, type, location, next_inspection_from/_to,
+    last_inspection_from/_to, min_<messwert>, max_<messwert>, sort, limit
+    
+    Raises:
+        ValueError: Bei ungültigen Werten
+    """
+    if not args:
+        return None
+    query = DeviceQuery(
+        customer=args.get('customer', '').strip() or None,
+        statuses=_split_list_arg(args.get('status')),
+        types=_split_list_arg(args.get('type')),
+        location_prefix=args.get('location', '').strip() or None,
+        next_inspection_from=dates.normalize_date(args.get('next_inspection_from')),
+        next_inspection_to=dates.normalize_date(args.get('next_inspection_to')),
+        last_inspection_from=dates.normalize_datetime(args.get('last_inspection_from')),
+        last_inspection_to=dates.normalize_datetime(args.get('last_inspection_to')),
+        min_values={m: float(args[f'min_{m}']) for m in MEASUREMENT_FIELDS if args.get(f'min_{m}')},
+        max_values={m: float(args[f'max_{m}']) for m in MEASUREMENT_FIELDS if args.get(f'max_{m}')},
+        sort=_split_list_arg(args.get('sort')) or ('-id',),
+        limit=int(args['limit']) if args.get('limit') else None
+    )
+    return query
+
+
 def _clean_float_field(value):
     """Convert empty string to None for float fields with validation"""
     if not value or (isinstance(value, str) and not value.strip()):
@@ -63,29 +136,57 @@ def _clean_float_field(value):
         return None
 
 
+def _device_from_create_request(create_request, data):
+    """Baue Device aus validiertem CreateDeviceRequest und Roh-JSON (Prüfwerte)"""
+    return Device(
+        customer=create_request.customer,
+        customer_device_id=create_request.customer_device_id,
+        name=create_request.name,
+        type=create_request.type,
+        location=create_request.location,
+        manufacturer=create_request.manufacturer,
+        serial_number=create_request.serial_number,
+        purchase_date=_clean_date_field(create_request.purchase_date),
+        last_inspection=_combine_date_time_fields(
+            data.get('last_inspection_date'),
+            data.get('last_inspection_time')
+        ),
+
+        next_inspection=_clean_date_field(data.get('next_inspection')),
+        status=create_request.status,
+        notes=create_request.notes,
+        # NEU: DGUV3 Prüfwerte aus Request auslesen
+        r_pe=_clean_float_field(data.get('r_pe')),
+        r_iso=_clean_float_field(data.get('r_iso')),
+        i_pe=_clean_float_field(data.get('i_pe')),
+        i_b=_clean_float_field(data.get('i_b')),
+        # USB-Kabel Felder (NEU)
+        cable_type=data.get('cable_type'),
+        test_result=data.get('test_result'),
+        internal_resistance=_clean_float_field(data.get('internal_resistance')),
+        emarker_active=data.get('emarker_active') if data.get('emarker_active') is not None else None,
+        inspection_notes=data.get('inspection_notes')
+    )
+
+
 @device_bp.route('', methods=['GET'])
 def list_devices():
-    """List all devices"""
+    """List devices (optional gefiltert, siehe _device_query_from_args)"""
     try:
-        devices = container.list_devices_usecase.execute()
+        try:
+            query = _device_query_from_args(request.args)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e),
+                'error_type': 'validation_error'
+            }), 400
+        devices = container.list_devices_usecase.execute(query)
+        if len(devices) > STREAM_THRESHOLD:
+            return stream_json_array(devices, _list_serializer.to_dict, success=True)
         return jsonify({
             'success': True,
-            'data': [{
-                'id': d.id,
-                'customer': d.customer,
-                'customer_device_id': d.customer_device_id,
-                'name': d.name,
-                'type': d.type,
-                'location': d.location,
-                'manufacturer': d.manufacturer,
-                'serial_number': d.serial_number,
-                'status': d.status,
-                # NEU: DGUV3 Prüfwerte
-                'r_pe': d.r_pe,
-                'r_iso': d.r_iso,
-                'i_pe': d.i_pe,
-                'i_b': d.i_b
-            } for d in devices]
+            'data': _list_serializer.many(devices)
         })
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -108,26 +209,7 @@ def get_device(customer_device_id: str):
         if device:
             return jsonify({
                 'success': True,
-                'device': {
-                    'id': device.id,
-                    'customer': device.customer,
-                    'customer_device_id': device.customer_device_id,
-                    'name': device.name,
-                    'type': device.type,
-                    'location': device.location,
-                    'manufacturer': device.manufacturer,
-                    'serial_number': device.serial_number,
-                    'purchase_date': str(device.purchase_date) if device.purchase_date else None,
-                    'last_inspection': str(device.last_inspection) if device.last_inspection else None,
-                    'next_inspection': str(device.next_inspection) if device.next_inspection else None,
-                    'status': device.status,
-                    'notes': device.notes,
-                    # NEU: DGUV3 Prüfwerte
-                    'r_pe': device.r_pe,
-                    'r_iso': device.r_iso,
-                    'i_pe': device.i_pe,
-                    'i_b': device.i_b
-                }
+                'device': _detail_serializer.to_dict(device)
             })
         return jsonify({'success': False, 'error': 'Device not found'}), 404
     except Exception as e:
@@ -164,6 +246,157 @@ def get_next_customer_device_id():
         }), 500
 
 
+@device_bp.route('/due', methods=['GET'])
+def list_due_devices():
+    """Devices due for inspection: GET /api/devices/due?within=30d&customer=&location=&cursor="""
+    try:
+        try:
+            within_days = _parse_within_days(request.args.get('within'))
+            limit = _parse_page_size(request.args.get('limit'))
+        except ValueError:
+            return jsonify({
+                'success': False,
+                'error': 'within must look like 30d, 2w or 30 and limit must be a number',
+                'error_type': 'validation_error'
+            }), 400
+        
+        today = dates.today()
+        page = container.list_due_devices_usecase.execute(
+            within_days=within_days,
+            customer=request.args.get('customer', '').strip() or None,
+            location=request.args.get('location', '').strip() or None,
+            limit=limit,
+            cursor=request.args.get('cursor') or None
+        )
+        data = []
+        for device in page.items:
+            item = _due_serializer.to_dict(device)
+            item['days_until_inspection'] = device.days_until_inspection(today)
+            data.append(item)
+        return jsonify({
+            'success': True,
+            'within_days': within_days,
+            'data': data,
+            'next_cursor': page.next_cursor
+        })
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'error_type': 'validation_error'
+        }), 400
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@device_bp.route('/route-plan', methods=['GET'])
+def plan_inspection_route():
+    """Prüfroute pro Raum: GET /api/devices/route-plan?customer=&within=30d&from="""
+    try:
+        customer = request.args.get('customer', '').strip()
+        if not customer:
+            return jsonify({
+                'success': False,
+                'error': 'customer is required',
+                'error_type': 'validation_error'
+            }), 400
+        try:
+            within_days = _parse_within_days(request.args.get('within'))
+            start = dates.normalize_date(request.args.get('from') or None)
+            plan = container.plan_inspection_route_usecase.execute(customer, within_days, start)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e),
+                'error_type': 'validation_error'
+            }), 400
+        
+        today = dates.today()
+        rooms = []
+        for room in plan.rooms:
+            items = []
+            for device in room.devices:
+                item = _due_serializer.to_dict(device)
+                item['days_until_inspection'] = device.days_until_inspection(today)
+                items.append(item)
+            rooms.append({
+                'path': list(room.path),
+                'location': room.location,
+                'device_count': len(room.devices),
+                'overdue': room.overdue_count(today),
+                'devices': items
+            })
+        return jsonify({
+            'success': True,
+            'customer': plan.customer,
+            'from': plan.start,
+            'until': plan.until,
+            'total_devices': plan.total_devices,
+            'rooms': rooms
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@device_bp.route('/drift', methods=['GET'])
+def analyze_measurement_drift():
+    """Drift-Analyse: GET /api/devices/drift?customer=&metric=&horizon=2&min_samples=3&since=&all=false"""
+    try:
+        try:
+            trends = container.analyze_drift_usecase.execute(
+                customer=request.args.get('customer', '').strip() or None,
+                metric=request.args.get('metric') or None,
+                since=dates.normalize_datetime(request.args.get('since') or None),
+                horizon_years=float(request.args.get('horizon') or 2),
+                min_samples=int(request.args.get('min_samples') or 3),
+                only_degrading=request.args.get('all', '').lower() not in ('1', 'true', 'yes')
+            )
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e),
+                'error_type': 'validation_error'
+            }), 400
+        return jsonify({
+            'success': True,
+            'count': len(trends),
+            'data': [trend.to_dict() for trend in trends]
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@device_bp.route('/<customer_device_id>/measurements', methods=['GET'])
+def get_device_measurements(customer_device_id: str):
+    """Messwert-Zeitreihe und Trend eines Geräts: ?metric=r_pe&since=2020-01-01"""
+    try:
+        device = container.get_device_usecase.execute(customer_device_id.strip())
+        if not device:
+            return jsonify({'success': False, 'error': 'Device not found'}), 404
+        try:
+            metric = request.args.get('metric') or None
+            since = dates.normalize_datetime(request.args.get('since') or None)
+            series = container.list_measurements_usecase.execute(device.id, metric=metric, since=since)
+            trends = container.analyze_drift_usecase.execute(
+                device_ids=[device.id], metric=metric, since=since,
+                min_samples=2, only_degrading=False
+            )
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e),
+                'error_type': 'validation_error'
+            }), 400
+        return jsonify({
+            'success': True,
+            'customer_device_id': device.customer_device_id,
+            'series': {name: [[m.measured_at, m.value] for m in items] for name, items in series.items()},
+            'trends': {trend.metric: trend.to_dict() for trend in trends}
+        })
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @device_bp.route('', methods=['POST'])
 def create_device():
     """Create a new device"""
@@ -178,63 +411,12 @@ def create_device():
                 'errors': errors
             }), 400
         
-        # Generiere customer_device_id automatisch wenn nicht vorhanden
-        if not create_request.customer_device_id:
-            # Hole die nächste ID für diesen Kunden
-            next_id_response = container.device_repository.get_next_customer_device_id(create_request.customer)
-            create_request.customer_device_id = next_id_response
-        
-        device = Device(
-            customer=create_request.customer,
-            customer_device_id=create_request.customer_device_id,
-            name=create_request.name,
-            type=create_request.type,
-            location=create_request.location,
-            manufacturer=create_request.manufacturer,
-            serial_number=create_request.serial_number,
-            purchase_date=_clean_date_field(create_request.purchase_date),
-            last_inspection=_combine_date_time_fields(
-                data.get('last_inspection_date'),
-                data.get('last_inspection_time')
-            ),
-
-            next_inspection=_clean_date_field(data.get('next_inspection')),
-            status=create_request.status,
-            notes=create_request.notes,
-            # NEU: DGUV3 Prüfwerte aus Request auslesen
-            r_pe=_clean_float_field(data.get('r_pe')),
-            r_iso=_clean_float_field(data.get('r_iso')),
-            i_pe=_clean_float_field(data.get('i_pe')),
-            i_b=_clean_float_field(data.get('i_b')),
-            # USB-Kabel Felder (NEU)
-            cable_type=data.get('cable_type'),
-            test_result=data.get('test_result'),
-            internal_resistance=_clean_float_field(data.get('internal_resistance')),
-            emarker_active=data.get('emarker_active') if data.get('emarker_active') is not None else None,
-            inspection_notes=data.get('inspection_notes')
-        )
+        # Fehlende customer_device_id reserviert CreateDeviceUseCase
+        device = _device_from_create_request(create_request, data)
         created = container.create_device_usecase.execute(device)
         return jsonify({
             'success': True,
-            'device': {
-                'id': created.id,
-                'customer_device_id': created.customer_device_id,
-                'customer': created.customer,
-                'name': created.name,
-                'type': created.type,
-                # NEU: DGUV3 Prüfwerte in Response
-                'r_pe': created.r_pe,
-                'r_iso': created.r_iso,
-                'i_pe': created.i_pe,
-                'i_b': created.i_b,
-                # USB-Kabel Felder in Response (NEU)
-                'cable_type': created.cable_type,
-                'test_result': created.test_result,
-                'internal_resistance': created.internal_resistance,
-                'emarker_active': created.emarker_active,
-                'inspection_notes': created.inspection_notes
-                
-            },
+            'device': _detail_serializer.to_dict(created),
             'message': 'Device created successfully'
         }), 201
     except ValueError as e:
@@ -282,6 +464,170 @@ def create_device():
         }), 500
 
 
+@device_bp.route('/bulk', methods=['POST'])
+def create_devices_bulk():
+    """Create many devices: POST /api/devices/bulk {"devices": [...]}
+    
+    Ungültige Einträge werden mit Index gemeldet, gültige trotzdem angelegt.
+    Antwort 201 wenn alle angelegt wurden, sonst 207 (Multi-Status).
+    """
+    try:
+        data = request.json or {}
+        items = data.get('devices')
+        if not isinstance(items, list) or not items:
+            return jsonify({
+                'success': False,
+                'error': 'devices must be a non-empty list',
+                'error_type': 'validation_error'
+            }), 400
+        
+        # Validierung pro Eintrag (gleiche DTOs wie POST /api/devices)
+        devices, positions, item_errors = [], [], []
+        for index, item in enumerate(items):
+            create_request, errors = create_device_request_from_json(item if isinstance(item, dict) else {})
+            try:
+                if errors:
+                    raise ValueError('; '.join(errors))
+                devices.append(_device_from_create_request(create_request, item))
+                positions.append(index)
+            except ValueError as e:
+                item_errors.append({'index': index, 'error': str(e), 'customer_device_id': None})
+        
+        result = container.create_devices_usecase.execute(devices)
+        for error in result.errors:
+            error_dict = error.to_dict()
+            error_dict['index'] = positions[error.index]
+            item_errors.append(error_dict)
+        item_errors.sort(key=lambda e: e['index'])
+        
+        return jsonify({
+            'success': not item_errors,
+            'created': _list_serializer.many(result.created),
+            'errors': item_errors,
+            'message': f'{len(result.created)} of {len(items)} devices created'
+        }), 201 if not item_errors else 207
+    except Exception as e:
+        import traceback
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'error_type': 'unexpected_error',
+            'details': traceback.format_exc()
+        }), 500
+
+
+@device_bp.route('/import/st725', methods=['POST'])
+def import_st725_protocols():
+    """Import BENNING ST 725 protocols: POST /api/devices/import/st725 (multipart)
+    
+    Felder:
+        file: eine oder mehrere Protokolldateien (*.csv oder *.xls)
+        customer: Kunde (optional, sonst "Auftraggeber" aus dem Protokollkopf)
+        inspector: Prüfer (optional, sonst aus dem Protokollkopf)
+        dry_run: "true" = nur prüfen, nichts speichern
+    """
+    try:
+        files = request.files.getlist('file')
+        if not files:
+            return jsonify({
+                'success': False,
+                'error': 'file is required',
+                'error_type': 'validation_error'
+            }), 400
+        dry_run = request.form.get('dry_run', 'false').lower() in ('1', 'true', 'yes')
+        
+        # Erst alle Kopfbereiche lesen und prüfen: eine Datei ohne Kunde darf nicht
+        # abgelehnt werden, nachdem frühere Dateien bereits importiert wurden
+        imports = []
+        for upload in files:
+            reader = ST725ProtocolReader()
+            records = reader.read(upload.filename or '', upload.stream)
+            # Erster Datensatz: danach sind Kunde/Prüfer aus dem Kopfbereich bekannt
+            first = next(records, None)
+            if first is not None:
+                records = chain([first], records)
+            customer = request.form.get('customer') or reader.metadata.get('customer')
+            if not customer:
+                return jsonify({
+                    'success': False,
+                    'error': f'customer is required (not found in {upload.filename})',
+                    'error_type': 'validation_error'
+                }), 400
+            imports.append((upload.filename, reader, records, customer))
+        
+        reports = []
+        for filename, reader, records, customer in imports:
+            report = container.import_protocol_usecase.execute(
+                records,
+                customer=customer,
+                inspector=request.form.get('inspector') or reader.metadata.get('inspector'),
+                dry_run=dry_run
+            )
+            reports.append({'file': filename, 'customer': customer, **report.to_dict()})
+        
+        return jsonify({
+            'success': all(not r['errors'] for r in reports),
+            'dry_run': dry_run,
+            'reports': reports
+        })
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'error_type': 'validation_error'
+        }), 400
+    except Exception as e:
+        import traceback
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'error_type': 'unexpected_error',
+            'details': traceback.format_exc()
+        }), 500
+
+
+@device_bp.route('/qr-codes/backfill', methods=['POST'])
+def backfill_qr_codes():
+    """Generate stored QR codes for existing devices: POST /api/devices/qr-codes/backfill?limit=1000
+    
+    Geräte, die vor der QR-Speicherung angelegt wurden, haben keinen QR-Code.
+    Mehrfach aufrufen, bis 'updated' 0 ist.
+    """
+    try:
+        limit = request.args.get('limit', 1000, type=int)
+        if limit < 1:
+            return jsonify({
+                'success': False,
+                'error': 'limit must be positive',
+                'error_type': 'validation_error'
+            }), 400
+        
+        updated = container.backfill_qr_codes_usecase.execute(max_devices=limit)
+        return jsonify({
+            'success': True,
+            'updated': updated,
+            'message': f'{updated} QR codes generated'
+        })
+    except Exception as e:
+        import traceback
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'error_type': 'unexpected_error',
+            'details': traceback.format_exc()
+        }), 500
+
+
+@device_bp.route('/qr-codes/cache', methods=['GET'])
+def qr_code_cache_stats():
+    """Trefferquote und Füllstand des QR-Code-Caches dieses Worker-Prozesses"""
+    stats = QRCodeGenerator.cache_stats()
+    store = QRCodeGenerator.artifact_store()
+    if store is not None:
+        stats['store'] = store.stats()
+    return jsonify({'success': True, 'data': stats})
+
+
 @device_bp.route('/<customer_device_id>', methods=['PUT'])
 def update_device(customer_device_id: str):
     """Update an existing device"""
@@ -322,20 +668,12 @@ def update_device(customer_device_id: str):
             i_b=_clean_float_field(data.get('i_b'))
         )
         updated = container.update_device_usecase.execute(device)
+        # Gespeicherten Stand neu lesen: das Device aus dem Request kennt weder
+        # id noch Prüftermine, Modell oder USB-Prüfwerte
+        stored = container.get_device_usecase.execute(customer_device_id)
         return jsonify({
             'success': True,
-            'device': {
-                'id': updated.id,
-                'customer_device_id': updated.customer_device_id,
-                'customer': updated.customer,
-                'name': updated.name,
-                'type': updated.type,
-                # NEU: DGUV3 Prüfwerte in Response
-                'r_pe': updated.r_pe,
-                'r_iso': updated.r_iso,
-                'i_pe': updated.i_pe,
-                'i_b': updated.i_b
-            },
+            'device': _detail_serializer.to_dict(stored or updated),
             'message': 'Device updated successfully'
         })
     except ValueError as e:
@@ -406,30 +744,17 @@ def delete_device(customer_device_id: str):
 def devices_print():
     """Druckansicht für alle Geräte"""
     try:
-        devices = container.device_repository.get_all()
-        # Sortieren nach ID (neueste zuerst)
-        devices.sort(key=lambda x: x.id, reverse=True)
-        
-        # Generiere QR-Codes für jedes Gerät
-        for device in devices:
-            try:
-                qr_code_data = QRCodeGenerator.generate_qr_code(
-                    device_id=device.customer_device_id,
-                    customer=device.customer
-                )
-                if qr_code_data:
-                    device.qr_code = f"data:image/svg+xml;base64,{qr_code_data.decode('utf-8')}"
-                else:
-                    device.qr_code = None
-            except Exception as e:
-                logger.error(f"Fehler beim Generieren des QR-Codes für {device.customer_device_id}: {str(e)}")
-                device.qr_code = None
+        # Neueste zuerst; QR-Codes lädt die Seite über /qr/<id>.svg (Altbestand ohne
+        # gespeicherten QR-Code nachziehen: flask backfill-qr)
+        devices = container.list_devices_usecase.execute(DeviceQuery(sort=('-id',)))
         
         # Aktuelles Datum für Deckseite
         from datetime import datetime
         current_date = datetime.now().strftime('%d.%m.%Y')
         
-        return render_template('device-print.html', devices=devices, current_date=current_date)
+        # Lokale Vorlage (device-print.html, nicht versioniert) vor der mitgelieferten
+        return render_template(['device-print.html', 'device_print.html'],
+                               devices=devices, current_date=current_date)
     except Exception as e:
         logger.error(f"Fehler beim Laden der Druckansicht: {str(e)}")
         flash('Fehler beim Laden der Druckansicht', 'error')
@@ -0,0 +1,211 @@
+"""Export Routes - Geräteliste als CSV/XLSX, QR-Etiketten als PDF-Bogen oder ZPL (Streaming)
+
+Die Antwort wird aus dem Server-Side-Cursor des Repositories erzeugt; das erste
+Byte (Kopfzeile) geht sofort raus, der Speicherbedarf bleibt auch bei sehr
+großen Beständen konstant.
+"""
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from src.core.domain import dates
+from src.core.domain.device import Device
+from src.core.domain.device_query import DeviceQuery
+from src.core.domain.label_sheet import DEFAULT_LABEL_TEMPLATE, get_label_template
+from src.adapters.web.presenters.zpl_export import DEFAULT_ZPL_LAYOUT
+from src.config.dependencies import container
+from src.core.usecases.device_usecases import ListLabelDevicesUseCase
+from src.adapters.services.qr_code_generator import QRCodeGenerator
+from src.adapters.web.presenters import (
+    CSV_MIMETYPE,
+    PDF_MIMETYPE,
+    XLSX_MIMETYPE,
+    ZPL_MIMETYPE,
+    get_serializer,
+    get_zpl_layout,
+    iter_csv,
+    iter_label_sheet_pdf,
+    iter_xlsx,
+    iter_zpl
+)
+
+export_bp = Blueprint('export', __name__, url_prefix='/export')
+
+_export_serializer = get_serializer('export')
+
+# Format -> (Generator, MIME-Type)
+EXPORT_FORMATS = {
+    'csv': (iter_csv, CSV_MIMETYPE),
+    'xlsx': (iter_xlsx, XLSX_MIMETYPE),
+}
+
+
+def _export_query_from_args(args) -> DeviceQuery:
+    """Baue DeviceQuery aus Query-Parametern
+
+    Unterstützt: customer, status (kommagetrennt), location,
+    next_inspection_from/_to, last_inspection_from/_to
+
+    Raises:
+        ValueError: Bei ungültigen Werten
+    """
+    statuses = tuple(s.strip() for s in args.get('status', '').split(',') if s.strip())
+    return DeviceQuery(
+        customer=args.get('customer', '').strip() or None,
+        statuses=statuses,
+        location_prefix=args.get('location', '').strip() or None,
+        next_inspection_from=dates.normalize_date(args.get('next_inspection_from') or None),
+        next_inspection_to=dates.normalize_date(args.get('next_inspection_to') or None),
+        last_inspection_from=dates.normalize_datetime(args.get('last_inspection_from') or None),
+        last_inspection_to=dates.normalize_datetime(args.get('last_inspection_to') or None),
+        sort=('customer', 'customer_device_id')
+    )
+
+
+@export_bp.route('/devices.<fmt>', methods=['GET'])
+def export_devices(fmt: str):
+    """Geräteliste als CSV oder XLSX streamen (optional gefiltert)"""
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({
+            'success': False,
+            'error': f"Unsupported export format '{fmt}' (supported: {sorted(EXPORT_FORMATS)})"
+        }), 404
+    try:
+        query = _export_query_from_args(request.args)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'error_type': 'validation_error'
+        }), 400
+
+    generate, mimetype = EXPORT_FORMATS[fmt]
+    devices = container.export_devices_usecase.execute(query)
+    filename = f"geraete_{datetime.now().strftime('%Y%m%d_%H%M')}.{fmt}"
+    return Response(
+        stream_with_context(generate(devices, _export_serializer)),
+        mimetype=mimetype,
+        headers={
+            'Content-Disposition': f'attachment; filename="{filename}"',
+            # Reverse-Proxy (nginx) soll nicht puffern
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+
+# Geräte pro Vorab-Block: QR-Codes eines Blocks werden gemeinsam (ggf. parallel)
+# erzeugt; der Block muss in den In-Process-Cache passen
+LABEL_PREFETCH_CHUNK = 500
+
+
+def _prefetch_qr_codes(devices: Iterable[Device], chunk_size: int = LABEL_PREFETCH_CHUNK) -> Iterator[Device]:
+    """Fehlende QR-Codes blockweise im Prozess-Pool erzeugen, bevor die Seiten gebaut werden"""
+    chunk: List[Device] = []
+    for device in devices:
+        chunk.append(device)
+        if len(chunk) >= chunk_size:
+            yield from _with_qr_codes(chunk)
+            chunk = []
+    yield from _with_qr_codes(chunk)
+
+
+def _with_qr_codes(chunk: List[Device]) -> List[Device]:
+    unique = {(d.customer_device_id, d.customer or "") for d in chunk}
+    QRCodeGenerator.images_many(sorted(unique), 'pdf')
+    return chunk
+
+
+def _qr_form(device: Device):
+    """QR-Code als PDF-Form (In-Process-Cache / Artefaktspeicher)"""
+    return QRCodeGenerator.image(device.customer_device_id, device.customer or "", 'pdf')
+
+
+@export_bp.route('/labels.pdf', methods=['GET'])
+def export_label_sheet():
+    """QR-Etikettenbogen als PDF streamen
+
+    Query-Parameter: customer und/oder ids (kommagetrennte customer_device_ids),
+    template (z.B. avery-3x8), copies (pro Gerät), skip (verbrauchte Etiketten
+    auf dem ersten Bogen)
+    """
+    try:
+        template = get_label_template(request.args.get('template', DEFAULT_LABEL_TEMPLATE))
+        skip = int(request.args.get('skip', 0))
+        if not 0 <= skip < template.labels_per_page:
+            raise ValueError(f"skip must be between 0 and {template.labels_per_page - 1}")
+        ids = [i.strip() for i in request.args.get('ids', '').split(',') if i.strip()]
+        devices = container.list_label_devices_usecase.execute(
+            customer=request.args.get('customer', '').strip() or None,
+            customer_device_ids=ids,
+            copies=int(request.args.get('copies', 1))
+        )
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'error_type': 'validation_error'
+        }), 400
+
+    filename = f"etiketten_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
+    return Response(
+        stream_with_context(iter_label_sheet_pdf(_prefetch_qr_codes(devices), template, _qr_form, skip=skip)),
+        mimetype=PDF_MIMETYPE,
+        headers={
+            'Content-Disposition': f'inline; filename="{filename}"',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+
+# Anzahl Etiketten in der Vorschau (?preview=1)
+ZPL_PREVIEW_LABELS = 5
+
+
+def _optional_int(value: Optional[str]) -> Optional[int]:
+    return int(value) if value not in (None, '') else None
+
+
+@export_bp.route('/labels.zpl', methods=['GET'])
+def export_zpl_labels():
+    """Etiketten für Thermodrucker als ZPL-Datei streamen
+
+    Query-Parameter: customer, ids (kommagetrennt) oder due_within (Tage,
+    Fälligkeitsliste), layout (z.B. 50x25), copies (pro Gerät, ^PQ),
+    preview=1 (Probelauf: erste Etiketten als Text, Gesamtzahl im Header
+    X-Label-Count)
+    """
+    try:
+        layout = get_zpl_layout(request.args.get('layout', DEFAULT_ZPL_LAYOUT))
+        copies = int(request.args.get('copies', 1))
+        if not 1 <= copies <= ListLabelDevicesUseCase.MAX_COPIES:
+            raise ValueError(f"copies must be between 1 and {ListLabelDevicesUseCase.MAX_COPIES}")
+        ids = [i.strip() for i in request.args.get('ids', '').split(',') if i.strip()]
+        # Kopien druckt der Drucker selbst (^PQ) - jedes Gerät nur einmal rendern
+        devices = container.list_label_devices_usecase.execute(
+            customer=request.args.get('customer', '').strip() or None,
+            customer_device_ids=ids,
+            due_within_days=_optional_int(request.args.get('due_within'))
+        )
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'error_type': 'validation_error'
+        }), 400
+
+    if request.args.get('preview') in ('1', 'true'):
+        devices = iter(devices)
+        first = list(islice(devices, ZPL_PREVIEW_LABELS))
+        total = len(first) + sum(1 for _ in devices)
+        body = b''.join(iter_zpl(first, layout, copies))
+        return Response(body, mimetype='text/plain', headers={'X-Label-Count': str(total * copies)})
+
+    filename = f"etiketten_{layout.name}_{datetime.now().strftime('%Y%m%d_%H%M')}.zpl"
+    return Response(
+        stream_with_context(iter_zpl(devices, layout, copies)),
+        mimetype=ZPL_MIMETYPE,
+        headers={
+            'Content-Disposition': f'attachment; filename="{filename}"',
+            'X-Accel-Buffering': 'no'
+        }
+    )
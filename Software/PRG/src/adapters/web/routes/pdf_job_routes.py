@@ -0,0 +1,97 @@
+"""PDF Job Routes - Geräteliste als PDF im Hintergrund erzeugen
+
+    POST /pdf/jobs                  Export einreihen (customer optional) -> 202 + Job
+    GET  /pdf/jobs/<id>             Status und Fortschritt abfragen
+    GET  /pdf/jobs/<id>/download    Fertige PDF herunterladen
+
+Gerendert wird im separaten PDF-Worker (flask pdf-worker); die Web-Worker
+legen nur den Job an und liefern die fertige Datei aus.
+"""
+import os
+from flask import Blueprint, request, jsonify, send_file, url_for
+from src.config.dependencies import container
+from src.core.domain.export_job import JOB_DONE
+from src.adapters.web.presenters import PDF_MIMETYPE
+
+pdf_jobs_bp = Blueprint('pdf_jobs', __name__, url_prefix='/pdf/jobs')
+
+# Empfohlener Abstand zwischen zwei Statusabfragen (Sekunden)
+POLL_INTERVAL_SECONDS = 2
+
+
+def _job_response(job) -> dict:
+    data = job.to_dict()
+    data['status_url'] = url_for('pdf_jobs.get_job', job_id=job.id)
+    if job.status == JOB_DONE:
+        data['download_url'] = url_for('pdf_jobs.download_job', job_id=job.id)
+    return data
+
+
+def _not_found(job_id: str):
+    return jsonify({
+        'success': False,
+        'error': f"PDF job '{job_id}' not found",
+        'error_type': 'not_found'
+    }), 404
+
+
+@pdf_jobs_bp.route('', methods=['POST'])
+def create_job():
+    """PDF-Export einreihen (JSON, Formular oder ?customer=)"""
+    payload = request.get_json(silent=True) or {}
+    customer = (payload.get('customer') or request.values.get('customer') or '').strip() or None
+    try:
+        job = container.enqueue_pdf_export_usecase.execute(customer=customer)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'error_type': 'validation_error'
+        }), 400
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+    response = jsonify({'success': True, 'job': _job_response(job)})
+    response.status_code = 202
+    response.headers['Location'] = url_for('pdf_jobs.get_job', job_id=job.id)
+    return response
+
+
+@pdf_jobs_bp.route('/<job_id>', methods=['GET'])
+def get_job(job_id: str):
+    """Status und Fortschritt eines Jobs"""
+    try:
+        job = container.get_export_job_usecase.execute(job_id)
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+    if job is None:
+        return _not_found(job_id)
+
+    response = jsonify({'success': True, 'job': _job_response(job)})
+    response.headers['Cache-Control'] = 'no-store'
+    if job.is_active:
+        response.headers['Retry-After'] = str(POLL_INTERVAL_SECONDS)
+    return response
+
+
+@pdf_jobs_bp.route('/<job_id>/download', methods=['GET'])
+def download_job(job_id: str):
+    """Fertige PDF eines Jobs"""
+    try:
+        job = container.get_export_job_usecase.execute(job_id)
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+    if job is None:
+        return _not_found(job_id)
+    if job.status != JOB_DONE:
+        return jsonify({
+            'success': False,
+            'error': f"PDF job is {job.status}",
+            'error_type': 'not_ready',
+            'job': _job_response(job)
+        }), 409
+
+    path = os.path.join(container.pdf_job_directory, os.path.basename(job.filename))
+    if not os.path.exists(path):
+        return jsonify({'success': False, 'error': 'PDF file expired', 'error_type': 'gone'}), 410
+    return send_file(path, mimetype=PDF_MIMETYPE, as_attachment=True, download_name=job.download_name)
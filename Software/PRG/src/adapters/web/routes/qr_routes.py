@@ -0,0 +1,54 @@
+"""QR Routes - QR-Codes als eigene, cachebare Bilder (GET /qr/<customer_device_id>.svg|png)
+
+Statt jeden QR-Code als Base64-Data-URI in das HTML einzubetten (+33% Größe,
+kein Browser-Cache), verweisen die Seiten auf diesen Endpunkt:
+- starker ETag = Inhaltsadresse des QR-Codes (304 bei If-None-Match)
+- mit passendem ?v=<version> unveränderlich cachebar (Cache-Control: immutable)
+- SVG wird bei Accept-Encoding: gzip vorkomprimiert ausgeliefert
+"""
+from flask import Blueprint, Response, request, jsonify
+from src.config.dependencies import container
+from src.adapters.services.qr_code_generator import QRCodeGenerator
+
+qr_bp = Blueprint('qr', __name__, url_prefix='/qr')
+
+IMAGE_MIMETYPES = {
+    'svg': 'image/svg+xml',
+    'png': 'image/png',
+}
+
+# Ein Jahr - die URL enthält die Inhaltsversion, ändert sich also mit dem QR-Code
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+
+
+@qr_bp.route('/<customer_device_id>.<image_format>', methods=['GET'])
+def qr_image(customer_device_id: str, image_format: str):
+    """QR-Code eines Geräts als SVG oder PNG"""
+    if image_format not in IMAGE_MIMETYPES:
+        return jsonify({'success': False, 'error': f"Unsupported image format '{image_format}'"}), 404
+    try:
+        # Nur customer laden (kein SELECT * mit qr_code BLOB pro Bild)
+        customer = container.get_device_customer_usecase.execute(customer_device_id)
+        if customer is None:
+            return jsonify({'success': False, 'error': f"Device '{customer_device_id}' not found"}), 404
+
+        variant = image_format
+        if image_format == 'svg' and 'gzip' in request.accept_encodings:
+            variant = 'svg.gz'
+        key, body = QRCodeGenerator.image(customer_device_id, customer, variant)
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+    response = Response(body, mimetype=IMAGE_MIMETYPES[image_format])
+    # Jede Kodierung ist eine eigene Repräsentation mit eigenem starken ETag
+    response.set_etag(f"{key}.{variant}")
+    if variant == 'svg.gz':
+        response.headers['Content-Encoding'] = 'gzip'
+    if image_format == 'svg':
+        response.vary.add('Accept-Encoding')
+    if request.args.get('v') == key[:16]:
+        response.headers['Cache-Control'] = IMMUTABLE_CACHE_CONTROL
+    else:
+        # Ohne (oder mit veralteter) Version immer revalidieren
+        response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
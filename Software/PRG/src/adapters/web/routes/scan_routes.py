@@ -0,0 +1,32 @@
+"""Scan Routes - QR-Scan auflösen (GET /scan?payload=Kunde|Kunde-00001)
+
+Handscanner senden den Rohinhalt des QR-Codes; die Antwort ist eine schlanke
+Gerätekarte mit Prüfstatus aus dem In-Memory-Index (ohne SELECT * pro Scan).
+"""
+from flask import Blueprint, request, jsonify
+from src.config.dependencies import container
+from src.core.domain import dates
+
+scan_bp = Blueprint('scan', __name__, url_prefix='/scan')
+
+
+@scan_bp.route('', methods=['GET'])
+def resolve_scan():
+    """Gerätekarte zu einem gescannten QR-Inhalt"""
+    try:
+        card = container.resolve_scan_usecase.execute(request.args.get('payload', ''))
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'error_type': 'validation_error'
+        }), 400
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+    if card is None:
+        return jsonify({'success': False, 'error': 'Device not found', 'error_type': 'not_found'}), 404
+
+    response = jsonify({'success': True, 'device': card.to_dict(dates.today())})
+    # Prüfstatus ändert sich mit jeder Prüfung - nicht zwischenspeichern
+    response.headers['Cache-Control'] = 'no-store'
+    return response
@@ -1,15 +1,50 @@
 """Dependency Injection Container - Hexagonal Architecture - KORRIGIERTE VERSION"""
 import os
+import tempfile
 from threading import Lock
 from src.adapters.persistence.mysql_device_repository import MySQLDeviceRepository
+from src.adapters.persistence.mysql_inspection_repository import MySQLInspectionRepository
+from src.adapters.persistence.mysql_measurement_repository import MySQLMeasurementRepository
+from src.adapters.persistence.sqlite_export_job_repository import SQLiteExportJobRepository
+from src.adapters.persistence.converters import DECIMAL_EXACT
 from src.core.usecases.device_usecases import (
     CreateDeviceUseCase,
+    CreateDevicesUseCase,
     ListDevicesUseCase,
+    ExportDevicesUseCase,
+    ListLabelDevicesUseCase,
+    ListDueDevicesUseCase,
+    PlanInspectionRouteUseCase,
     GetDeviceUseCase,
+    GetDeviceCustomerUseCase,
     UpdateDeviceUseCase,
+    BackfillQRCodesUseCase,
+    WarmUpQRArtifactStoreUseCase,
     DeleteDeviceUseCase
 )
+from src.core.usecases.inspection_usecases import (
+    RecordInspectionUseCase,
+    ListInspectionsUseCase,
+    LoadInspectionHistoryUseCase
+)
+from src.core.usecases.import_usecases import ImportInspectionProtocolUseCase
+from src.core.usecases.calendar_usecases import CalendarFeedUseCase
+from src.core.usecases.scan_usecases import ResolveScanUseCase
+from src.core.usecases.export_job_usecases import (
+    EnqueuePDFExportUseCase,
+    GetExportJobUseCase,
+    RunPDFExportJobUseCase
+)
+from src.core.usecases.measurement_usecases import AnalyzeMeasurementDriftUseCase, ListMeasurementsUseCase
+from src.adapters.web.presenters.ics_presenter import render_ics
+from src.adapters.web.presenters.device_list_pdf import (
+    HISTORY_PER_DEVICE,
+    render_device_list_html,
+    write_device_list_pdf
+)
 from src.adapters.services.logger_service import LoggerService
+from src.adapters.services.qr_code_generator import QRCodeGenerator
+from src.adapters.services.qr_generators import create_qr_generator
 
 
 class Container:
@@ -34,6 +69,7 @@ class Container:
         
         self.logger = LoggerService()
         self._init_repositories()
+        self._init_services()
         self._init_usecases()
         self._initialized = True
     
@@ -63,6 +99,42 @@ class Container:
                 database=db_name
             )
             
+            # Prüfhistorie (gleiche Datenbank)
+            self.inspection_repository = MySQLInspectionRepository(
+                host=db_host,
+                port=db_port,
+                user=db_user,
+                password=db_password,
+                database=db_name
+            )
+            
+            # Prüfprotokolle (PDF, Tabellenexport): DECIMAL-Messwerte exakt als Decimal
+            self.protocol_device_repository = MySQLDeviceRepository(
+                host=db_host,
+                port=db_port,
+                user=db_user,
+                password=db_password,
+                database=db_name,
+                decimals=DECIMAL_EXACT
+            )
+            self.protocol_inspection_repository = MySQLInspectionRepository(
+                host=db_host,
+                port=db_port,
+                user=db_user,
+                password=db_password,
+                database=db_name,
+                decimals=DECIMAL_EXACT
+            )
+            
+            # Messwert-Zeitreihe (gleiche Datenbank)
+            self.measurement_repository = MySQLMeasurementRepository(
+                host=db_host,
+                port=db_port,
+                user=db_user,
+                password=db_password,
+                database=db_name
+            )
+            
             # FIX: Test database connection
             self.logger.info("Testing database connection...")
             try:
@@ -88,17 +160,89 @@ class Container:
             print(f"{'='*70}\n")
             raise
     
+    def _init_services(self):
+        """Initialize service adapters"""
+        # QR-Encoder: 'svg-path' (Standard), 'svg-rect' (kompakter); Fehlerkorrektur L/M/Q/H
+        self.qr_generator = create_qr_generator(
+            os.getenv('QR_ENCODER', 'svg-path'),
+            error_correction=os.getenv('QR_ERROR_CORRECTION', 'L')
+        )
+        # Use Cases erhalten den Encoder per Konstruktor; die Bild-Endpunkte (/qr,
+        # Etikettenbögen) nutzen den hier gesetzten aktiven Encoder
+        QRCodeGenerator.use_encoder(self.qr_generator)
+        self.logger.info("QR encoder initialized", encoder=repr(self.qr_generator))
+        
+        # PDF-Jobs: Warteschlange (SQLite) und fertige Dateien in einem Verzeichnis,
+        # gemeinsam für Web-App und PDF-Worker (z.B. Volume unter /var/cache/benning/pdf-jobs)
+        self.pdf_job_directory = os.getenv(
+            'PDF_JOB_DIR', os.path.join(tempfile.gettempdir(), 'benning-pdf-jobs')
+        )
+        os.makedirs(self.pdf_job_directory, exist_ok=True)
+        self.export_job_repository = SQLiteExportJobRepository(
+            os.path.join(self.pdf_job_directory, 'jobs.sqlite3')
+        )
+    
     def _init_usecases(self):
         """Initialize all use cases"""
         try:
             self.logger.info("Initializing use cases")
             
             # Device Use Cases
-            self.create_device_usecase = CreateDeviceUseCase(self.device_repository)
+            self.create_device_usecase = CreateDeviceUseCase(self.device_repository, qr_generator=self.qr_generator)
+            self.create_devices_usecase = CreateDevicesUseCase(self.device_repository, qr_generator=self.qr_generator)
             self.list_devices_usecase = ListDevicesUseCase(self.device_repository)
+            self.export_devices_usecase = ExportDevicesUseCase(self.protocol_device_repository)
+            self.list_protocol_devices_usecase = ListDevicesUseCase(self.protocol_device_repository)
+            self.list_label_devices_usecase = ListLabelDevicesUseCase(self.device_repository)
+            self.list_due_devices_usecase = ListDueDevicesUseCase(self.device_repository)
+            self.plan_inspection_route_usecase = PlanInspectionRouteUseCase(self.device_repository)
             self.get_device_usecase = GetDeviceUseCase(self.device_repository)
-            self.update_device_usecase = UpdateDeviceUseCase(self.device_repository)
+            self.get_device_customer_usecase = GetDeviceCustomerUseCase(self.device_repository)
+            self.update_device_usecase = UpdateDeviceUseCase(self.device_repository, qr_generator=self.qr_generator)
             self.delete_device_usecase = DeleteDeviceUseCase(self.device_repository)
+            self.backfill_qr_codes_usecase = BackfillQRCodesUseCase(self.device_repository,
+                                                                    qr_generator=self.qr_generator)
+            self.warm_up_qr_store_usecase = WarmUpQRArtifactStoreUseCase(self.device_repository,
+                                                                         qr_generator=self.qr_generator)
+            
+            # Inspection Use Cases
+            self.record_inspection_usecase = RecordInspectionUseCase(self.inspection_repository)
+            self.list_inspections_usecase = ListInspectionsUseCase(self.inspection_repository)
+            self.load_inspection_history_usecase = LoadInspectionHistoryUseCase(self.inspection_repository)
+            self.load_protocol_history_usecase = LoadInspectionHistoryUseCase(self.protocol_inspection_repository)
+            
+            # Measurement Use Cases (Zeitreihe / Drift)
+            self.list_measurements_usecase = ListMeasurementsUseCase(self.measurement_repository)
+            self.analyze_drift_usecase = AnalyzeMeasurementDriftUseCase(self.measurement_repository)
+            
+            # Import Use Cases
+            self.import_protocol_usecase = ImportInspectionProtocolUseCase(
+                self.device_repository,
+                self.inspection_repository,
+                self.create_devices_usecase
+            )
+            
+            # Calendar Use Cases (Feed-Cache pro Kunde, pro Worker-Prozess)
+            self.calendar_feed_usecase = CalendarFeedUseCase(self.device_repository, render=render_ics)
+            
+            # PDF Export Jobs (Rendering im separaten PDF-Worker: flask pdf-worker)
+            self.enqueue_pdf_export_usecase = EnqueuePDFExportUseCase(self.export_job_repository)
+            self.get_export_job_usecase = GetExportJobUseCase(self.export_job_repository)
+            self.run_pdf_export_job_usecase = RunPDFExportJobUseCase(
+                self.export_job_repository,
+                self.protocol_device_repository,
+                self.protocol_inspection_repository,
+                directory=self.pdf_job_directory,
+                render_html=render_device_list_html,
+                write_pdf=write_device_list_pdf,
+                customer_history=HISTORY_PER_DEVICE
+            )
+            
+            # Scan Use Cases (Index pro Kunde und Worker-Prozess, Prüfung höchstens alle SCAN_INDEX_TTL s)
+            self.resolve_scan_usecase = ResolveScanUseCase(
+                self.device_repository,
+                ttl=float(os.getenv('SCAN_INDEX_TTL', '2'))
+            )
             
             self.logger.info("All use cases initialized successfully")
             
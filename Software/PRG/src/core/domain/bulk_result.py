@@ -0,0 +1,107 @@
+"""Bulk Result - Ergebnis von Massenoperationen mit Fehlern pro Eintrag"""
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from src.core.domain.device import Device
+
+
+@dataclass
+class BulkItemError:
+    """Fehler für einen einzelnen Eintrag einer Massenoperation
+
+    Attributes:
+        index: Position des Eintrags in der Eingabe
+        error: Fehlermeldung
+        customer_device_id: Kunden-ID, falls bereits vergeben
+    """
+    index: int
+    error: str
+    customer_device_id: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {
+            'index': self.index,
+            'error': self.error,
+            'customer_device_id': self.customer_device_id
+        }
+
+
+@dataclass
+class BulkCreateResult:
+    """Ergebnis einer Massenanlage von Geräten"""
+    created: List[Device] = field(default_factory=list)
+    errors: List[BulkItemError] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return not self.errors
+
+
+@dataclass
+class ImportReport:
+    """Ergebnis (bzw. Vorschau bei dry_run) eines Protokoll-Imports
+
+    Attributes:
+        dry_run: True = nichts wurde geschrieben
+        rows: Gelesene Messzeilen (ohne leere Vorlagenzeilen)
+        matched: Zeilen, die einem vorhandenen Gerät zugeordnet wurden
+        created: Neu angelegte (bzw. anzulegende) Geräte
+        inspections: Gespeicherte (bzw. zu speichernde) Prüfungen
+        errors: Übersprungene Zeilen (index = Zeilennummer in der Datei)
+    """
+    dry_run: bool = False
+    rows: int = 0
+    matched: int = 0
+    created: int = 0
+    inspections: int = 0
+    errors: List[BulkItemError] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return not self.errors
+
+    def to_dict(self) -> dict:
+        return {
+            'dry_run': self.dry_run,
+            'rows': self.rows,
+            'matched': self.matched,
+            'created': self.created,
+            'inspections': self.inspections,
+            'errors': [error.to_dict() for error in self.errors]
+        }
+
+
+@dataclass
+class BackfillProgress:
+    """Fortschritt eines QR-Backfills (nach jedem gespeicherten Batch)
+
+    Attributes:
+        scanned: Geprüfte Geräte
+        updated: Gespeicherte (fehlende oder veraltete) QR-Codes
+        stale: Davon veraltete QR-Codes (nur bei refresh_stale)
+        failed: Geräte, deren QR-Code nicht erzeugt werden konnte
+        last_id: Höchste bearbeitete Geräte-id (Wiederaufsetzpunkt)
+        elapsed: Laufzeit in Sekunden
+    """
+    scanned: int = 0
+    updated: int = 0
+    stale: int = 0
+    failed: int = 0
+    last_id: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Geprüfte Geräte pro Sekunde"""
+        return self.scanned / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            'scanned': self.scanned,
+            'updated': self.updated,
+            'stale': self.stale,
+            'failed': self.failed,
+            'last_id': self.last_id,
+            'elapsed': round(self.elapsed, 3),
+            'rate': round(self.rate, 1)
+        }
@@ -0,0 +1,81 @@
+"""Kalender-Feed - fällige Prüfungen als Ganztagstermine
+
+Ein Termin pro Gerät (mode="device") oder ein Sammeltermin pro Standort und
+Tag (mode="location"; Standort = oberste Ebene der Standort-Hierarchie).
+Die UIDs sind stabil, damit Kalender-Clients Termine aktualisieren statt
+doppelt anzulegen.
+"""
+import hashlib
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.core.domain.device import Device
+from src.core.domain.device_query import DUE_STATUSES
+from src.core.domain.route_plan import natural_key, parse_location
+
+
+FEED_MODES = ('device', 'location')
+
+# Domain-Teil der Termin-UIDs
+UID_DOMAIN = 'benning-device-manager'
+
+
+@dataclass(frozen=True)
+class CalendarEvent:
+    """Ganztagstermin (DTSTART = day)"""
+    uid: str
+    day: date
+    summary: str
+    description: str = ''
+    location: Optional[str] = None
+
+
+@dataclass
+class CalendarFeed:
+    """Kalender eines Kunden inkl. gerenderter Form und ETag
+
+    Attributes:
+        changed_at: Letzte Änderung an den Geräten des Kunden (DTSTAMP)
+    """
+    customer: str
+    mode: str
+    events: List[CalendarEvent] = field(default_factory=list)
+    changed_at: Optional[datetime] = None
+    body: bytes = b''
+    etag: str = ''
+
+
+def device_event(device: Device) -> Optional[CalendarEvent]:
+    """Termin für ein Gerät (None wenn keine Prüfung geplant ist)"""
+    if device.next_inspection is None or device.status not in DUE_STATUSES:
+        return None
+    label = device.customer_device_id or f"#{device.id}"
+    return CalendarEvent(
+        uid=f"device-{device.id}@{UID_DOMAIN}",
+        day=device.next_inspection,
+        summary=f"Prüfung {label}: {device.name}",
+        description=f"DGUV V3 Prüfung {label} ({device.type or 'Gerät'})",
+        location=device.location
+    )
+
+
+def location_day_events(customer: str, events: Iterable[CalendarEvent]) -> List[CalendarEvent]:
+    """Gerätetermine zu einem Sammeltermin pro Standort und Tag zusammenfassen"""
+    groups: Dict[Tuple[str, date], List[CalendarEvent]] = defaultdict(list)
+    for event in events:
+        groups[(parse_location(event.location)[0], event.day)].append(event)
+
+    merged = []
+    for (site, day), items in groups.items():
+        items.sort(key=lambda e: natural_key(e.location or ''))
+        digest = hashlib.sha1(f"{customer}|{site}".encode('utf-8')).hexdigest()[:12]
+        merged.append(CalendarEvent(
+            uid=f"site-{digest}-{day.strftime('%Y%m%d')}@{UID_DOMAIN}",
+            day=day,
+            summary=f"Prüfung {site}: {len(items)} Geräte",
+            description='\n'.join(f"{e.summary} ({e.location or '-'})" for e in items),
+            location=site
+        ))
+    return merged
@@ -0,0 +1,94 @@
+"""Datums-Normalisierung - Kanonische Datums-/Zeitwerte für Domain-Objekte
+
+Die Datenbank liefert je nach Spaltentyp `date` (next_inspection, purchase_date)
+oder `datetime` (last_inspection). Formulare liefern ISO-Strings. Diese Helfer
+bringen alle Varianten einmalig in eine kanonische Form:
+
+    - Kalenderdaten  -> datetime.date
+    - Zeitpunkte     -> zeitzonenbewusstes datetime.datetime (APP_TIMEZONE)
+
+Naive Zeitpunkte werden als lokale Zeit der Anwendung interpretiert, da MySQL
+DATETIME-Spalten ohne Zeitzone speichert.
+"""
+import os
+from datetime import date, datetime, tzinfo
+from typing import Optional, Union
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+
+def _load_timezone() -> tzinfo:
+    """Lade Anwendungs-Zeitzone (Fallback: Systemzeitzone)"""
+    try:
+        return ZoneInfo(os.getenv('APP_TIMEZONE', 'Europe/Berlin'))
+    except (ZoneInfoNotFoundError, ValueError):
+        return datetime.now().astimezone().tzinfo
+
+
+APP_TIMEZONE: tzinfo = _load_timezone()
+
+DateLike = Union[date, datetime, str, None]
+
+
+def now() -> datetime:
+    """Aktueller Zeitpunkt in der Anwendungs-Zeitzone"""
+    return datetime.now(APP_TIMEZONE)
+
+
+def today() -> date:
+    """Aktuelles Datum in der Anwendungs-Zeitzone"""
+    return datetime.now(APP_TIMEZONE).date()
+
+
+def normalize_date(value: DateLike) -> Optional[date]:
+    """Normalisiere Kalenderdatum (date, datetime oder ISO-String) zu `date`
+
+    Raises:
+        ValueError: Wenn ein String nicht im ISO-Format vorliegt
+    """
+    if value is None:
+        return None
+    # Schnellpfad: reines date (datetime ist Subklasse von date!)
+    if type(value) is date:
+        return value
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(APP_TIMEZONE)
+        return value.date()
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+        try:
+            return datetime.fromisoformat(value).date()
+        except ValueError:
+            raise ValueError(f"Ungültiges Datum: '{value}' (erwartet YYYY-MM-DD)")
+    raise ValueError(f"Ungültiger Datumstyp: {type(value).__name__}")
+
+
+def normalize_datetime(value: DateLike) -> Optional[datetime]:
+    """Normalisiere Zeitpunkt (date, datetime oder ISO-String) zu zeitzonenbewusstem `datetime`
+
+    Reine Daten werden auf 00:00 Uhr lokaler Zeit gesetzt.
+
+    Raises:
+        ValueError: Wenn ein String nicht im ISO-Format vorliegt
+    """
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            return value.replace(tzinfo=APP_TIMEZONE)
+        if value.tzinfo is APP_TIMEZONE:
+            return value
+        return value.astimezone(APP_TIMEZONE)
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day, tzinfo=APP_TIMEZONE)
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+        try:
+            return normalize_datetime(datetime.fromisoformat(value))
+        except ValueError:
+            raise ValueError(f"Ungültiger Zeitpunkt: '{value}' (erwartet ISO-Format)")
+    raise ValueError(f"Ungültiger Datumstyp: {type(value).__name__}")
@@ -1,7 +1,8 @@
 """Device Entity - Hexagonal Architecture mit customer_device_id, DGUV3-Prüfwerten und USB-Kabel Feldern"""
 from dataclasses import dataclass
 from typing import Optional
-from datetime import date
+from datetime import date, datetime
+from src.core.domain.dates import normalize_date, normalize_datetime, today
 
 
 
@@ -20,9 +21,9 @@ class Device:
         manufacturer: Hersteller
         model: Modell
         location: Standort
-        purchase_date: Kaufdatum
-        last_inspection: Letzte Inspektion
-        next_inspection: Nächste Inspektion
+        purchase_date: Kaufdatum (date)
+        last_inspection: Letzte Inspektion (zeitzonenbewusstes datetime)
+        next_inspection: Nächste Inspektion (date)
         status: Status (active, inactive, maintenance, retired)
         qr_code: QR-Code als Bytes (PNG/Base64)
         notes: Notizen
@@ -54,7 +55,7 @@ class Device:
     model: Optional[str] = None
     location: Optional[str] = None
     purchase_date: Optional[date] = None
-    last_inspection: Optional[date] = None
+    last_inspection: Optional[datetime] = None
     next_inspection: Optional[date] = None
     status: str = "active"
     qr_code: Optional[bytes] = None
@@ -79,6 +80,10 @@ class Device:
             raise ValueError("Device name is required")
         if not self.customer:
             raise ValueError("Customer is required")
+        # Datumswerte einmalig kanonisieren (DB liefert date/datetime, Formulare Strings)
+        self.purchase_date = normalize_date(self.purchase_date)
+        self.last_inspection = normalize_datetime(self.last_inspection)
+        self.next_inspection = normalize_date(self.next_inspection)
     
     def __str__(self) -> str:
         """String representation"""
@@ -95,12 +100,26 @@ class Device:
         """Check if device is active"""
         return self.status == "active"
     
-    def is_due_for_inspection(self) -> bool:
-        """Check if device is due for inspection"""
-        if not self.next_inspection:
+    # ANCHOR: Prüftermine
+    def is_due_for_inspection(self, on: Optional[date] = None) -> bool:
+        """Check if device is due for inspection (no date planned or date reached)"""
+        if self.next_inspection is None:
             return True
-        from datetime import datetime
-        return datetime.now().date() >= self.next_inspection
+        return self.next_inspection <= (on or today())
+    
+    def is_overdue(self, on: Optional[date] = None) -> bool:
+        """Prüft ob der geplante Prüftermin überschritten ist"""
+        return self.next_inspection is not None and self.next_inspection < (on or today())
+    
+    def days_until_inspection(self, on: Optional[date] = None) -> Optional[int]:
+        """Tage bis zur nächsten Prüfung (negativ wenn überfällig, None wenn nicht geplant)"""
+        if self.next_inspection is None:
+            return None
+        return (self.next_inspection - (on or today())).days
+    
+    def inspected_since(self, since: datetime) -> bool:
+        """Prüft ob die letzte Prüfung nach `since` stattfand (naive Zeiten gelten als lokale Zeit)"""
+        return self.last_inspection is not None and self.last_inspection > normalize_datetime(since)
     
     # ANCHOR: DGUV3 Grenzwertprüfungen
     def is_r_pe_within_limit(self) -> bool:
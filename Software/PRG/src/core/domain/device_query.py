@@ -0,0 +1,140 @@
+"""Device Query Objects - Filter/Sortierung für die Repository-Ebene und
+seitenweise Ergebnisse mit Keyset-Pagination"""
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from src.core.domain.device import Device
+
+
+# ANCHOR: Keyset-Cursor
+def encode_cursor(next_inspection: date, device_id: int) -> str:
+    """Kodiere Keyset-Position (next_inspection, id) als Cursor-String"""
+    return f"{next_inspection.isoformat()}_{device_id}"
+
+
+def decode_cursor(cursor: str) -> Tuple[date, int]:
+    """Dekodiere Cursor-String zu (next_inspection, id)
+
+    Raises:
+        ValueError: Wenn der Cursor ungültig ist
+    """
+    try:
+        day, device_id = cursor.split('_', 1)
+        return date.fromisoformat(day), int(device_id)
+    except (ValueError, AttributeError):
+        raise ValueError(f"Ungültiger Cursor: '{cursor}'")
+
+
+@dataclass
+class DevicePage:
+    """Eine Ergebnisseite mit Cursor auf die nächste Seite
+
+    Attributes:
+        items: Geräte dieser Seite
+        next_cursor: Cursor für die Folgeseite (None = letzte Seite)
+    """
+    items: List[Device] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+# ANCHOR: Änderungsstand
+class ChangeMarker(NamedTuple):
+    """Änderungsstand der Geräte eines Kunden (COUNT/MAX(updated_at))
+
+    updated_at hat Sekundenauflösung: eine Änderung in derselben Sekunde wie
+    der zuletzt gelesene Stand ändert den Marker nicht. Ein darauf aufgebauter
+    Cache gilt deshalb erst als `settled`, wenn die Datenbankzeit bei der
+    Abfrage (observed_at) bereits in einer späteren Sekunde lag; bis dahin
+    muss die letzte Sekunde erneut gelesen werden.
+
+    Attributes:
+        count: Anzahl Geräte
+        changed_at: Letztes updated_at (None ohne Geräte)
+        observed_at: Datenbankzeit der Abfrage (None = unbekannt)
+    """
+    count: int
+    changed_at: Optional[datetime]
+    observed_at: Optional[datetime] = None
+
+    @property
+    def state(self) -> Tuple[int, Optional[datetime]]:
+        """Vergleichbarer Stand ohne Abfragezeitpunkt"""
+        return self.count, self.changed_at
+
+    @property
+    def settled(self) -> bool:
+        """True wenn spätere Änderungen ein größeres updated_at erhalten"""
+        if self.changed_at is None:
+            return True
+        if self.observed_at is None:
+            return False
+        return self.observed_at.replace(microsecond=0) > self.changed_at.replace(microsecond=0)
+
+
+# ANCHOR: DeviceQuery
+# Messwerte, die über min_values/max_values gefiltert werden können
+MEASUREMENT_FIELDS = ('r_pe', 'r_iso', 'i_pe', 'i_b', 'internal_resistance')
+
+# Felder, nach denen sortiert werden darf (Präfix "-" = absteigend)
+SORTABLE_FIELDS = (
+    'id', 'customer', 'customer_device_id', 'name', 'type', 'location', 'status',
+    'purchase_date', 'last_inspection', 'next_inspection',
+) + MEASUREMENT_FIELDS
+
+VALID_STATUSES = ('active', 'inactive', 'maintenance', 'retired')
+
+# Status, bei denen ein Gerät für die Prüfplanung relevant ist
+DUE_STATUSES = ('active', 'maintenance')
+
+
+@dataclass
+class DeviceQuery:
+    """Typisierte Geräteabfrage - wird vom Repository in ein SQL-Statement übersetzt
+
+    Alle Filter sind optional und werden UND-verknüpft.
+
+    Attributes:
+        customer: Kundenname (exakt, Groß-/Kleinschreibung egal)
+        statuses: Erlaubte Status (z.B. ("active", "maintenance"))
+        types: Erlaubte Gerätetypen
+        location_prefix: Standort-Präfix (z.B. "Berlin - Büro")
+        next_inspection_from / next_inspection_to: Bereich nächste Prüfung (inklusive)
+        last_inspection_from / last_inspection_to: Bereich letzte Prüfung (inklusive)
+        min_values / max_values: Messwert-Schwellen, z.B. {"r_pe": 0.3}
+        sort: Sortierfelder, z.B. ("next_inspection", "-id")
+        limit: Maximale Anzahl Geräte
+    """
+    customer: Optional[str] = None
+    statuses: Tuple[str, ...] = ()
+    types: Tuple[str, ...] = ()
+    location_prefix: Optional[str] = None
+    next_inspection_from: Optional[date] = None
+    next_inspection_to: Optional[date] = None
+    last_inspection_from: Optional[datetime] = None
+    last_inspection_to: Optional[datetime] = None
+    min_values: Dict[str, float] = field(default_factory=dict)
+    max_values: Dict[str, float] = field(default_factory=dict)
+    sort: Tuple[str, ...] = ('-id',)
+    limit: Optional[int] = None
+
+    def __post_init__(self):
+        """Validate query after initialization"""
+        self.statuses = tuple(self.statuses)
+        self.types = tuple(self.types)
+        self.sort = tuple(self.sort)
+        for status in self.statuses:
+            if status not in VALID_STATUSES:
+                raise ValueError(f"status must be one of {list(VALID_STATUSES)}, got '{status}'")
+        for metric in list(self.min_values) + list(self.max_values):
+            if metric not in MEASUREMENT_FIELDS:
+                raise ValueError(f"measurement must be one of {list(MEASUREMENT_FIELDS)}, got '{metric}'")
+        for key in self.sort:
+            if key.lstrip('-') not in SORTABLE_FIELDS:
+                raise ValueError(f"sort field must be one of {list(SORTABLE_FIELDS)}, got '{key}'")
+        if self.limit is not None and self.limit < 1:
+            raise ValueError("limit must be positive")
@@ -0,0 +1,92 @@
+"""Export Job - im Hintergrund erzeugter PDF-Export mit Fortschritt
+
+Ein Job wird von der Web-App angelegt (queued), von einem PDF-Worker
+übernommen (running) und endet mit einer herunterladbaren Datei (done) oder
+einer Fehlermeldung (failed).
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+# Export-Arten: alle Geräte bzw. Geräte eines Kunden (inkl. Prüfhistorie)
+EXPORT_KINDS = ('devices', 'customer')
+
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+JOB_STATUSES = (JOB_QUEUED, JOB_RUNNING, JOB_DONE, JOB_FAILED)
+
+# Jobs, die noch eine Datei liefern werden
+ACTIVE_JOB_STATUSES = (JOB_QUEUED, JOB_RUNNING)
+
+
+@dataclass
+class ExportJob:
+    """PDF-Export-Job
+
+    Attributes:
+        id: Zufällige Job-ID (hex)
+        kind: Export-Art (siehe EXPORT_KINDS)
+        customer: Kunde (nur bei kind="customer")
+        status: queued, running, done oder failed
+        stage: Aktueller Arbeitsschritt (z.B. "loading", "layout")
+        progress: Fortschritt 0.0 - 1.0
+        attempts: Anzahl Starts (Wiederholung nach Worker-Absturz)
+        error: Fehlermeldung bei failed
+        filename: Dateiname der fertigen PDF im Job-Verzeichnis
+        size_bytes / pages: Größe und Seitenzahl der fertigen PDF
+    """
+    id: str
+    kind: str
+    customer: Optional[str] = None
+    status: str = JOB_QUEUED
+    stage: Optional[str] = None
+    progress: float = 0.0
+    attempts: int = 0
+    error: Optional[str] = None
+    filename: Optional[str] = None
+    size_bytes: Optional[int] = None
+    pages: Optional[int] = None
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        """Validate job after initialization"""
+        if self.kind not in EXPORT_KINDS:
+            raise ValueError(f"kind must be one of {list(EXPORT_KINDS)}, got '{self.kind}'")
+        if self.kind == 'customer' and not self.customer:
+            raise ValueError("customer is required for customer exports")
+        if self.status not in JOB_STATUSES:
+            raise ValueError(f"status must be one of {list(JOB_STATUSES)}, got '{self.status}'")
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in ACTIVE_JOB_STATUSES
+
+    @property
+    def download_name(self) -> str:
+        """Dateiname für den Download (wie beim synchronen Export)"""
+        stamp = (self.finished_at or self.created_at or datetime.now()).strftime('%Y%m%d_%H%M%S')
+        if self.kind == 'customer':
+            return f"geraete_{self.customer}_{stamp}.pdf"
+        return f"geraete_liste_{stamp}.pdf"
+
+    def to_dict(self) -> dict:
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'customer': self.customer,
+            'status': self.status,
+            'stage': self.stage,
+            'progress': round(self.progress, 3),
+            'attempts': self.attempts,
+            'error': self.error,
+            'size_bytes': self.size_bytes,
+            'pages': self.pages,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
@@ -1,26 +1,81 @@
-"""Inspection Domain Model"""
+"""Inspection Domain Model - eine Zeile der Prüfhistorie (inspections)"""
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 
+from src.core.domain.dates import normalize_datetime, now
+
+
+VALID_RESULTS = ('pass', 'fail', 'pending')
+
+# USB-Kabel Testergebnisse -> Prüfergebnis
+USB_TEST_RESULTS = {
+    'bestanden': 'pass',
+    'nicht_bestanden': 'fail',
+    'verloren': 'fail',
+    'nicht_vorhanden': 'fail',
+}
+
+
 @dataclass
 class Inspection:
-    """Inspection Entity"""
+    """Inspection Entity - unveränderlicher Eintrag der Prüfhistorie
+    
+    Jede Prüfung wird als neue Zeile angehängt; das Gerät selbst hält nur den
+    aktuellen Stand (letzte/nächste Prüfung, Status, letzte Messwerte).
+    
+    Attributes:
+        device_id: Numerische Geräte-ID
+        inspection_date: Prüfzeitpunkt (zeitzonenbewusst, Default: jetzt)
+        result: Prüfergebnis (pass, fail, pending)
+        inspector: Prüfer
+        notes: Notizen
+        r_pe / r_iso / i_pe / i_b: DGUV3 Prüfwerte
+        cable_type / test_result / internal_resistance / emarker_active: USB-Kabel Prüfung
+    """
     id: Optional[int] = None
     device_id: int = 0
-    inspection_type: str = ""
-    status: str = "pending"
-    result: str = ""
-    notes: str = ""
-    inspector: str = ""
+    inspection_date: Optional[datetime] = None
+    result: str = "pending"
+    inspector: Optional[str] = None
+    notes: Optional[str] = None
+    
+    # ANCHOR: DGUV3 Prüfwerte
+    r_pe: Optional[float] = None
+    r_iso: Optional[float] = None
+    i_pe: Optional[float] = None
+    i_b: Optional[float] = None
+    
+    # ANCHOR: USB-Kabel Prüfung
+    cable_type: Optional[str] = None
+    test_result: Optional[str] = None
+    internal_resistance: Optional[float] = None
+    emarker_active: Optional[bool] = None
+    
     created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
 
     def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.now()
-        if self.updated_at is None:
-            self.updated_at = datetime.now()
+        """Validate inspection after initialization"""
+        if not self.device_id:
+            raise ValueError("device_id is required")
+        if self.result not in VALID_RESULTS:
+            raise ValueError(f"result must be one of {list(VALID_RESULTS)}, got '{self.result}'")
+        self.inspection_date = normalize_datetime(self.inspection_date) or now()
+
+    @classmethod
+    def from_usb_test(cls, device_id: int, test_result: str, **fields) -> "Inspection":
+        """Inspection aus einem USB-Kabel Testergebnis (bestanden, nicht_bestanden, ...)"""
+        if test_result not in USB_TEST_RESULTS:
+            raise ValueError(f"test_result must be one of {list(USB_TEST_RESULTS)}, got '{test_result}'")
+        return cls(device_id=device_id, result=USB_TEST_RESULTS[test_result], test_result=test_result, **fields)
+
+    def resulting_device_status(self) -> Optional[str]:
+        """Gerätestatus nach dieser Prüfung (None = unverändert)"""
+        if self.result == 'pass':
+            return 'active'
+        if self.result == 'fail':
+            return 'maintenance'
+        return None
 
     def __repr__(self):
-        return f"Inspection(id={self.id}, device_id={self.device_id}, status={self.status})"
+        return f"Inspection(id={self.id}, device_id={self.device_id}, result={self.result})"
@@ -0,0 +1,117 @@
+"""Etikettenbögen - Rastervorlagen für QR-Aufkleber (A4, Avery-kompatibel)
+
+Eine Vorlage beschreibt das Raster eines Bogens in Millimetern (Ränder,
+Etikettengröße, Abstand von Etikett zu Etikett). Die Etiketten werden
+zeilenweise von oben links gefüllt; `skip` überspringt bereits verbrauchte
+Etiketten auf dem ersten Bogen.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Tuple, TypeVar
+
+
+A4_WIDTH_MM = 210.0
+A4_HEIGHT_MM = 297.0
+
+T = TypeVar('T')
+
+
+@dataclass(frozen=True)
+class LabelTemplate:
+    """Raster eines Etikettenbogens
+
+    Attributes:
+        name: Kurzname (z.B. "avery-3x8")
+        columns / rows: Etiketten pro Zeile / Spalte
+        label_width / label_height: Etikettengröße in mm
+        margin_left / margin_top: Abstand des ersten Etiketts zum Blattrand in mm
+        pitch_x / pitch_y: Abstand von Etikett- zu Etikett-Anfang in mm
+        page_width / page_height: Blattgröße in mm
+    """
+    name: str
+    columns: int
+    rows: int
+    label_width: float
+    label_height: float
+    margin_left: float
+    margin_top: float
+    pitch_x: float
+    pitch_y: float
+    page_width: float = A4_WIDTH_MM
+    page_height: float = A4_HEIGHT_MM
+
+    def __post_init__(self):
+        """Validate template after initialization"""
+        if self.columns < 1 or self.rows < 1:
+            raise ValueError("columns and rows must be positive")
+        if self.pitch_x < self.label_width or self.pitch_y < self.label_height:
+            raise ValueError("pitch must not be smaller than the label size")
+        right = self.margin_left + (self.columns - 1) * self.pitch_x + self.label_width
+        bottom = self.margin_top + (self.rows - 1) * self.pitch_y + self.label_height
+        if right > self.page_width + 0.01 or bottom > self.page_height + 0.01:
+            raise ValueError(f"labels of template '{self.name}' exceed the page")
+
+    @property
+    def labels_per_page(self) -> int:
+        return self.columns * self.rows
+
+    def slot(self, index: int) -> Tuple[float, float]:
+        """Linke obere Ecke des Etiketts `index` (0 = oben links) in mm ab oben links"""
+        row, column = divmod(index, self.columns)
+        return (self.margin_left + column * self.pitch_x,
+                self.margin_top + row * self.pitch_y)
+
+
+# Gängige A4-Bögen (Maße laut Herstellerangaben)
+LABEL_TEMPLATES: Dict[str, LabelTemplate] = {
+    template.name: template for template in (
+        # Avery L7159: 24 Etiketten 63,5 x 33,9 mm
+        LabelTemplate('avery-3x8', 3, 8, 63.5, 33.9, 7.2, 12.9, 66.0, 33.9),
+        # Avery L7160: 21 Etiketten 63,5 x 38,1 mm
+        LabelTemplate('avery-3x7', 3, 7, 63.5, 38.1, 7.2, 15.15, 66.0, 38.1),
+        # Avery L7163: 14 Etiketten 99,1 x 38,1 mm
+        LabelTemplate('avery-2x7', 2, 7, 99.1, 38.1, 4.65, 15.15, 101.6, 38.1),
+        # Avery L7651: 65 Etiketten 38,1 x 21,2 mm (nur QR + ID)
+        LabelTemplate('avery-5x13', 5, 13, 38.1, 21.2, 4.75, 10.7, 40.6, 21.2),
+    )
+}
+
+DEFAULT_LABEL_TEMPLATE = 'avery-3x8'
+
+
+def get_label_template(name: str) -> LabelTemplate:
+    """Vorlage nach Namen
+
+    Raises:
+        ValueError: Bei unbekannter Vorlage
+    """
+    try:
+        return LABEL_TEMPLATES[name]
+    except KeyError:
+        raise ValueError(f"template must be one of {sorted(LABEL_TEMPLATES)}, got '{name}'")
+
+
+def paginate_labels(items: Iterable[T], template: LabelTemplate,
+                    skip: int = 0) -> Iterator[List[Tuple[int, T]]]:
+    """Etiketten seitenweise auf Rasterplätze verteilen (lazy, Seite für Seite)
+
+    Args:
+        items: Zu druckende Einträge (z.B. Geräte)
+        template: Bogenvorlage
+        skip: Auf dem ersten Bogen bereits verbrauchte Etiketten
+
+    Yields:
+        Pro Seite eine Liste von (Rasterplatz, Eintrag)
+    """
+    if not 0 <= skip < template.labels_per_page:
+        raise ValueError(f"skip must be between 0 and {template.labels_per_page - 1}")
+    page: List[Tuple[int, T]] = []
+    slot = skip
+    for item in items:
+        page.append((slot, item))
+        slot += 1
+        if slot == template.labels_per_page:
+            yield page
+            page = []
+            slot = 0
+    if page:
+        yield page
@@ -0,0 +1,140 @@
+"""Messwert-Zeitreihe - kompakte Einzelmesswerte und Trend (Drift) pro Gerät
+
+Jede Prüfung liefert bis zu fünf Messwerte; in der Zeitreihe wird jeder als
+eigene Zeile (device_id, measured_at, metric, value) abgelegt. Der Trend ist
+die Steigung einer linearen Regression über die Zeit (Einheit pro Jahr), daraus
+wird abgeschätzt, wann ein Gerät seinen DGUV V3 Grenzwert erreicht.
+"""
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from src.core.domain.inspection import Inspection
+
+
+# ANCHOR: Metrik-Codes
+# Codes werden in der Datenbank gespeichert (TINYINT) - niemals umnummerieren
+METRIC_CODES: Dict[str, int] = {
+    'r_pe': 1,
+    'r_iso': 2,
+    'i_pe': 3,
+    'i_b': 4,
+    'internal_resistance': 5,
+}
+METRIC_NAMES: Dict[int, str] = {code: name for name, code in METRIC_CODES.items()}
+
+# Grenzwert und Richtung: +1 = Grenzwert wird von unten erreicht (Wert steigt),
+# -1 = von oben (Wert fällt). Siehe Device.is_*_within_limit.
+METRIC_LIMITS: Dict[str, Tuple[float, int]] = {
+    'r_pe': (0.3, 1),
+    'r_iso': (1.0, -1),
+    'i_pe': (3.5, 1),
+    'i_b': (0.5, 1),
+}
+
+DAYS_PER_YEAR = 365.25
+
+
+@dataclass
+class Measurement:
+    """Ein Messwert eines Geräts zu einem Zeitpunkt"""
+    device_id: int
+    measured_at: datetime
+    metric: str
+    value: float
+
+    def __post_init__(self):
+        if self.metric not in METRIC_CODES:
+            raise ValueError(f"metric must be one of {list(METRIC_CODES)}, got '{self.metric}'")
+
+    @property
+    def metric_code(self) -> int:
+        return METRIC_CODES[self.metric]
+
+    def to_dict(self) -> dict:
+        return {'measured_at': self.measured_at, 'metric': self.metric, 'value': self.value}
+
+
+def measurements_from_inspection(inspection: Inspection) -> List[Measurement]:
+    """Messwerte einer Prüfung (nicht gemessene Werte entfallen)"""
+    return [
+        Measurement(inspection.device_id, inspection.inspection_date, metric, float(value))
+        for metric in METRIC_CODES
+        for value in (getattr(inspection, metric),)
+        if value is not None
+    ]
+
+
+@dataclass
+class MetricTrend:
+    """Trend eines Messwerts eines Geräts
+
+    Attributes:
+        samples: Anzahl Messungen
+        first_at / last_at: Zeitpunkt der ersten / letzten Messung
+        first_value / last_value: Erster / letzter Messwert
+        slope_per_year: Steigung der Regressionsgeraden (None bei nur einem Zeitpunkt)
+    """
+    device_id: int
+    metric: str
+    samples: int
+    first_at: datetime
+    last_at: datetime
+    first_value: float
+    last_value: float
+    slope_per_year: Optional[float] = None
+    customer_device_id: Optional[str] = None
+
+    @property
+    def drift(self) -> float:
+        """Änderung zwischen erster und letzter Messung"""
+        return self.last_value - self.first_value
+
+    @property
+    def limit(self) -> Optional[float]:
+        entry = METRIC_LIMITS.get(self.metric)
+        return entry[0] if entry else None
+
+    def years_to_limit(self) -> Optional[float]:
+        """Jahre bis zum Grenzwert bei gleichbleibendem Trend
+
+        0.0 = Grenzwert bereits erreicht; None = kein Grenzwert oder Trend
+        bewegt sich vom Grenzwert weg.
+        """
+        entry = METRIC_LIMITS.get(self.metric)
+        if entry is None:
+            return None
+        limit, direction = entry
+        if (limit - self.last_value) * direction <= 0:
+            return 0.0
+        if not self.slope_per_year or self.slope_per_year * direction <= 0:
+            return None
+        return (limit - self.last_value) / self.slope_per_year
+
+    def projected_limit_date(self) -> Optional[date]:
+        years = self.years_to_limit()
+        if years is None:
+            return None
+        return self.last_at.date() + timedelta(days=round(years * DAYS_PER_YEAR))
+
+    def is_degrading(self, horizon_years: float) -> bool:
+        """Erreicht das Gerät den Grenzwert innerhalb des Horizonts?"""
+        years = self.years_to_limit()
+        return years is not None and years <= horizon_years
+
+    def to_dict(self) -> dict:
+        return {
+            'device_id': self.device_id,
+            'customer_device_id': self.customer_device_id,
+            'metric': self.metric,
+            'samples': self.samples,
+            'first_at': self.first_at,
+            'last_at': self.last_at,
+            'first_value': self.first_value,
+            'last_value': self.last_value,
+            'drift': round(self.drift, 4),
+            'slope_per_year': round(self.slope_per_year, 4) if self.slope_per_year is not None else None,
+            'limit': self.limit,
+            'years_to_limit': self.years_to_limit(),
+            'projected_limit_date': self.projected_limit_date()
+        }
@@ -0,0 +1,110 @@
+"""Prüfroute - fällige Geräte nach Standort-Hierarchie gruppiert
+
+Standorte sind Freitext wie "Berlin - Büro - MB1" (Standort - Gebäude/Bereich -
+Raum). Die Route gruppiert die fälligen Geräte eines Kunden pro Raum und
+ordnet die Räume so, dass Räume desselben Standorts/Gebäudes direkt
+aufeinander folgen ("MB2" vor "MB10").
+"""
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.core.domain.device import Device
+
+
+# Trenner zwischen den Ebenen: " - ", " / " oder " > " (Bindestriche in Namen bleiben erhalten)
+LOCATION_SEPARATOR = re.compile(r'\s+[-–/>]\s+')
+
+# Gruppe für Geräte ohne Standortangabe (wird zuletzt abgearbeitet)
+UNASSIGNED_LOCATION = 'Ohne Standort'
+
+_DIGITS = re.compile(r'(\d+)')
+
+
+def parse_location(location: Optional[str]) -> Tuple[str, ...]:
+    """Freitext-Standort in Hierarchie-Ebenen zerlegen
+
+    "Berlin - Büro - MB1" -> ("Berlin", "Büro", "MB1"); leer -> ("Ohne Standort",)
+    """
+    if not location or not location.strip():
+        return (UNASSIGNED_LOCATION,)
+    parts = tuple(part.strip() for part in LOCATION_SEPARATOR.split(location.strip()) if part.strip())
+    return parts or (UNASSIGNED_LOCATION,)
+
+
+def natural_key(text: Optional[str]) -> Tuple:
+    """Sortierschlüssel mit Zahlen als Zahlen ("MB2" < "MB10")"""
+    return tuple(
+        (0, int(part), '') if part.isdigit() else (1, 0, part.casefold())
+        for part in _DIGITS.split(text or '') if part
+    )
+
+
+def _path_key(path: Tuple[str, ...]) -> Tuple:
+    return (path == (UNASSIGNED_LOCATION,), tuple(natural_key(part) for part in path))
+
+
+@dataclass
+class RoomWorklist:
+    """Arbeitsliste eines Raums (unterste Ebene der Standort-Hierarchie)"""
+    path: Tuple[str, ...]
+    devices: List[Device] = field(default_factory=list)
+
+    @property
+    def location(self) -> str:
+        return ' - '.join(self.path)
+
+    @property
+    def room(self) -> str:
+        return self.path[-1]
+
+    def overdue_count(self, on: date) -> int:
+        return sum(1 for device in self.devices
+                   if device.next_inspection is not None and device.next_inspection < on)
+
+
+@dataclass
+class RoutePlan:
+    """Geordnete Prüfroute eines Kunden für ein Zeitfenster
+
+    Attributes:
+        customer: Kundenname
+        until: Letztes Fälligkeitsdatum (inklusive)
+        start: Erstes Fälligkeitsdatum (None = inklusive aller überfälligen)
+        rooms: Raum-Arbeitslisten in Begehungsreihenfolge
+    """
+    customer: str
+    until: date
+    start: Optional[date] = None
+    rooms: List[RoomWorklist] = field(default_factory=list)
+
+    @property
+    def total_devices(self) -> int:
+        return sum(len(room.devices) for room in self.rooms)
+
+    def sites(self) -> List[Tuple[str, List[RoomWorklist]]]:
+        """Räume nach oberster Ebene (Standort) zusammengefasst - für die Druckansicht"""
+        sites: List[Tuple[str, List[RoomWorklist]]] = []
+        for room in self.rooms:
+            if not sites or sites[-1][0] != room.path[0]:
+                sites.append((room.path[0], []))
+            sites[-1][1].append(room)
+        return sites
+
+
+def build_route_plan(devices: Iterable[Device], customer: str, until: date,
+                     start: Optional[date] = None) -> RoutePlan:
+    """Gruppiere Geräte in einem Durchlauf nach Raum und ordne die Räume"""
+    rooms: Dict[Tuple[str, ...], RoomWorklist] = {}
+    for device in devices:
+        path = parse_location(device.location)
+        room = rooms.get(path)
+        if room is None:
+            room = rooms[path] = RoomWorklist(path)
+        room.devices.append(device)
+
+    ordered = [rooms[path] for path in sorted(rooms, key=_path_key)]
+    for room in ordered:
+        room.devices.sort(key=lambda d: natural_key(d.customer_device_id or d.name))
+    return RoutePlan(customer=customer, until=until, start=start, rooms=ordered)
@@ -0,0 +1,99 @@
+"""Scan - QR-Inhalt auflösen und schlanke Gerätekarte mit Prüfstatus
+
+Der QR-Code eines Geräts enthält "Kunde|customer_device_id" (ältere Codes
+ohne Kunde nur die ID). Die Karte enthält nur, was ein Handscanner beim Gang
+durch einen Raum anzeigt - keine Messwerte, keinen QR-Code.
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional, Tuple
+
+from src.core.domain.device import Device
+from src.core.domain.device_query import DUE_STATUSES
+
+
+# Prüfung gilt als "bald fällig", wenn sie in höchstens so vielen Tagen ansteht
+DUE_SOON_DAYS = 30
+
+# Längster sinnvoller QR-Inhalt (Schutz vor Müll-Eingaben)
+MAX_PAYLOAD_LENGTH = 512
+
+
+def parse_qr_payload(payload: Optional[str]) -> Tuple[Optional[str], str]:
+    """QR-Inhalt in (Kunde, customer_device_id) zerlegen (Kunde None bei reiner ID)
+
+    Scanner hängen oft Zeilenende oder Leerzeichen an - diese werden entfernt.
+
+    Raises:
+        ValueError: Bei leerem oder zu langem Inhalt
+    """
+    text = (payload or '').strip()
+    if not text:
+        raise ValueError("payload is required")
+    if len(text) > MAX_PAYLOAD_LENGTH:
+        raise ValueError(f"payload must not exceed {MAX_PAYLOAD_LENGTH} characters")
+    customer, separator, customer_device_id = text.rpartition('|')
+    customer_device_id = customer_device_id.strip()
+    if not customer_device_id:
+        raise ValueError("payload contains no device id")
+    if not separator:
+        return None, customer_device_id
+    return customer.strip() or None, customer_device_id
+
+
+@dataclass(frozen=True)
+class DeviceCard:
+    """Schlanke Gerätekarte für die Scan-Antwort"""
+    id: Optional[int]
+    customer: str
+    customer_device_id: str
+    name: str
+    type: Optional[str] = None
+    location: Optional[str] = None
+    status: Optional[str] = None
+    next_inspection: Optional[date] = None
+
+    @classmethod
+    def from_device(cls, device: Device) -> 'DeviceCard':
+        return cls(
+            id=device.id,
+            customer=device.customer,
+            customer_device_id=device.customer_device_id,
+            name=device.name,
+            type=device.type,
+            location=device.location,
+            status=device.status,
+            next_inspection=device.next_inspection
+        )
+
+    def due_status(self, on: date, soon_days: int = DUE_SOON_DAYS) -> str:
+        """Prüfstatus am Tag `on`
+
+        Returns:
+            'inactive' (Status ohne Prüfpflicht), 'unplanned' (kein Termin),
+            'overdue', 'due_soon' (innerhalb soon_days) oder 'ok'
+        """
+        if self.status not in DUE_STATUSES:
+            return 'inactive'
+        if self.next_inspection is None:
+            return 'unplanned'
+        days = (self.next_inspection - on).days
+        if days < 0:
+            return 'overdue'
+        if days <= soon_days:
+            return 'due_soon'
+        return 'ok'
+
+    def to_dict(self, on: date) -> dict:
+        return {
+            'id': self.id,
+            'customer': self.customer,
+            'customer_device_id': self.customer_device_id,
+            'name': self.name,
+            'type': self.type,
+            'location': self.location,
+            'status': self.status,
+            'next_inspection': self.next_inspection.isoformat() if self.next_inspection else None,
+            'days_until_inspection': (self.next_inspection - on).days if self.next_inspection else None,
+            'due_status': self.due_status(on)
+        }
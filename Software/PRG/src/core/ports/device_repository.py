@@ -1,7 +1,9 @@
 """Device Repository Port - Hexagonal Architecture Interface"""
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional, Sequence
 from src.core.domain.device import Device
+from src.core.domain.device_query import ChangeMarker, DevicePage, DeviceQuery
 
 
 class DeviceRepository(ABC):
@@ -26,6 +28,19 @@ class DeviceRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def create_many(self, devices: List[Device], batch_size: int = 200) -> Dict[int, str]:
+        """Create many devices in batched transactions
+        
+        Args:
+            devices: Devices with customer_device_id assigned
+            batch_size: Devices per transaction
+            
+        Returns:
+            Error message per failed device index (empty if all were created)
+        """
+        pass
+    
     @abstractmethod
     def get_by_id(self, device_id: int) -> Optional[Device]:
         """Get device by numeric ID
@@ -50,6 +65,34 @@ class DeviceRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_customer_of(self, customer_device_id: str) -> Optional[str]:
+        """Get only the customer of a device (no other columns, no QR code BLOB)
+        
+        Args:
+            customer_device_id: Customer-formatted device ID
+            
+        Returns:
+            Customer ("" if not set) or None if the device does not exist
+        """
+        pass
+    
+    @abstractmethod
+    def get_by_identifiers(self, customer_device_ids: Sequence[str] = (),
+                           serial_numbers: Sequence[str] = (),
+                           customer: Optional[str] = None) -> List[Device]:
+        """Get devices matching any of the given customer device IDs or serial numbers
+        
+        Args:
+            customer_device_ids: Customer-formatted device IDs
+            serial_numbers: Serial numbers
+            customer: Only devices of this customer (None = all customers)
+            
+        Returns:
+            Matching devices (unordered)
+        """
+        pass
+    
     @abstractmethod
     def get_all(self) -> List[Device]:
         """Get all devices
@@ -59,6 +102,51 @@ class DeviceRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def find(self, query: DeviceQuery) -> List[Device]:
+        """Find devices matching a query
+        
+        Filters, sorting and limit are pushed down to the data store.
+        
+        Args:
+            query: DeviceQuery with filters, sort and limit
+            
+        Returns:
+            List of matching devices
+        """
+        pass
+    
+    @abstractmethod
+    def iter_find(self, query: DeviceQuery, fetch_size: int = 1000) -> Iterator[Device]:
+        """Stream devices matching a query without loading them all at once
+        
+        Args:
+            query: DeviceQuery with filters, sort and limit
+            fetch_size: Rows fetched per round-trip
+            
+        Yields:
+            Matching devices in query order
+        """
+        pass
+    
+    @abstractmethod
+    def get_due_for_inspection(self, until: date, customer: Optional[str] = None,
+                               location: Optional[str] = None, limit: int = 100,
+                               cursor: Optional[str] = None) -> DevicePage:
+        """Get devices due for inspection up to a date (including overdue ones)
+        
+        Args:
+            until: Last due date (inclusive)
+            customer: Optional customer filter
+            location: Optional location prefix filter
+            limit: Page size
+            cursor: Keyset cursor of the previous page
+            
+        Returns:
+            DevicePage ordered by (next_inspection, id)
+        """
+        pass
+    
     @abstractmethod
     def update(self, device: Device) -> Device:
         """Update an existing device
@@ -74,6 +162,69 @@ class DeviceRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def get_change_marker(self, customer: str) -> ChangeMarker:
+        """Get a cheap change marker for a customer's devices
+        
+        Args:
+            customer: Customer name
+            
+        Returns:
+            ChangeMarker (number of devices, latest updated_at, database time of the query)
+        """
+        pass
+    
+    @abstractmethod
+    def get_changed_since(self, customer: str, since: Optional[datetime] = None) -> List[Device]:
+        """Get a customer's devices changed at or after a point in time
+        
+        Args:
+            customer: Customer name
+            since: Lower bound for updated_at (None = all devices)
+            
+        Returns:
+            List of devices (unordered)
+        """
+        pass
+    
+    @abstractmethod
+    def get_without_qr_code(self, limit: int = 200, after_id: int = 0) -> List[Device]:
+        """Get devices that have no stored QR code yet
+        
+        Args:
+            limit: Maximum number of devices
+            after_id: Only devices with id > after_id
+            
+        Returns:
+            List of devices ordered by id
+        """
+        pass
+    
+    @abstractmethod
+    def get_qr_code_batch(self, limit: int = 200, after_id: int = 0) -> List[Device]:
+        """Get devices including their stored QR code (for stale checks)
+        
+        Args:
+            limit: Maximum number of devices
+            after_id: Only devices with id > after_id
+            
+        Returns:
+            List of devices ordered by id (only id, customer, customer_device_id, name, qr_code)
+        """
+        pass
+    
+    @abstractmethod
+    def update_qr_codes(self, qr_codes: Dict[int, bytes]) -> int:
+        """Store generated QR codes
+        
+        Args:
+            qr_codes: Mapping device id -> QR code bytes
+            
+        Returns:
+            Number of updated devices
+        """
+        pass
+    
     @abstractmethod
     def delete(self, customer_device_id: str) -> bool:
         """Delete a device
@@ -89,9 +240,24 @@ class DeviceRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def reserve_customer_device_ids(self, customer: str, count: int) -> List[str]:
+        """Reserve a contiguous block of customer device IDs
+        
+        Gleichzeitige Aufrufe erhalten disjunkte Blöcke.
+        
+        Args:
+            customer: Customer name
+            count: Number of IDs
+            
+        Returns:
+            IDs in ascending order (e.g. ["Parloa-00004", "Parloa-00005"])
+        """
+        pass
+    
     @abstractmethod
     def get_next_customer_device_id(self, customer: str) -> str:
-        """Get next customer device ID
+        """Get next customer device ID (Vorschau, reserviert nichts)
         
         Args:
             customer: Customer name
@@ -0,0 +1,92 @@
+"""Export Job Repository Port - Persistente Warteschlange für PDF-Export-Jobs"""
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence
+from src.core.domain.export_job import ExportJob
+
+
+class ExportJobRepository(ABC):
+    """Abstract repository for background export jobs
+
+    Wird von mehreren Prozessen (Web-Worker, PDF-Worker) gleichzeitig genutzt;
+    claim_next muss deshalb atomar sein.
+    """
+
+    @abstractmethod
+    def create(self, job: ExportJob) -> ExportJob:
+        """Store a new queued job
+
+        Returns:
+            Job with created_at set
+        """
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        """Get job by id"""
+        pass
+
+    @abstractmethod
+    def find_active(self, kind: str, customer: Optional[str] = None) -> Optional[ExportJob]:
+        """Get the newest queued or running job for the same export"""
+        pass
+
+    @abstractmethod
+    def claim_next(self) -> Optional[ExportJob]:
+        """Atomically mark the oldest queued job as running
+
+        Returns:
+            Claimed job (attempts incremented) or None if the queue is empty
+        """
+        pass
+
+    @abstractmethod
+    def update_progress(self, job_id: str, stage: str, progress: float) -> None:
+        """Store progress of a running job (also counts as heartbeat)"""
+        pass
+
+    @abstractmethod
+    def heartbeat(self, job_ids: Sequence[str]) -> None:
+        """Mark running jobs as alive"""
+        pass
+
+    @abstractmethod
+    def complete(self, job_id: str, filename: str, size_bytes: int, pages: Optional[int] = None) -> None:
+        """Mark job as done"""
+        pass
+
+    @abstractmethod
+    def fail(self, job_id: str, error: str) -> None:
+        """Mark job as failed"""
+        pass
+
+    @abstractmethod
+    def requeue(self, job_id: str, error: str, max_attempts: int) -> bool:
+        """Put a running job back into the queue (worker process crashed or timed out)
+
+        The attempt stays counted; a job that already reached max_attempts is
+        marked as failed with the given error instead.
+
+        Returns:
+            True if requeued, False if failed
+        """
+        pass
+
+    @abstractmethod
+    def requeue_stale(self, timeout_seconds: float, max_attempts: int) -> int:
+        """Requeue running jobs without heartbeat (worker crashed or restarted)
+
+        Jobs that already reached max_attempts are marked as failed instead.
+
+        Returns:
+            Number of requeued or failed jobs
+        """
+        pass
+
+    @abstractmethod
+    def expire(self, older_than_seconds: float) -> List[ExportJob]:
+        """Delete finished jobs older than the given age
+
+        Returns:
+            Deleted jobs (so the caller can remove their files)
+        """
+        pass
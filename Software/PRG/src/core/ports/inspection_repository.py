@@ -0,0 +1,77 @@
+"""Inspection Repository Port - Abstract interface for the inspection history"""
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+from src.core.domain.inspection import Inspection
+
+
+class InspectionRepository(ABC):
+    """Abstract Inspection Repository Interface"""
+    
+    @abstractmethod
+    def record(self, inspection: Inspection, next_inspection: Optional[date],
+               device_status: Optional[str]) -> Inspection:
+        """Append an inspection and update the device in one transaction
+        
+        Args:
+            inspection: Inspection to append
+            next_inspection: New next inspection date of the device (None = unchanged)
+            device_status: New device status (None = unchanged)
+            
+        Returns:
+            Inspection with assigned ID
+            
+        Raises:
+            Exception: If the transaction fails (nothing is written)
+        """
+        pass
+    
+    @abstractmethod
+    def record_many(self, entries: Sequence[Tuple[Inspection, Optional[date], Optional[str]]]) -> List[Inspection]:
+        """Append many inspections and update their devices in one transaction
+        
+        Args:
+            entries: (inspection, next_inspection, device_status) per inspection
+            
+        Returns:
+            The recorded inspections
+        """
+        pass
+    
+    @abstractmethod
+    def get_latest(self, device_id: int) -> Optional[Inspection]:
+        """Get the latest inspection of a device
+        
+        Args:
+            device_id: Numeric device ID
+            
+        Returns:
+            Latest inspection or None
+        """
+        pass
+    
+    @abstractmethod
+    def list_for_device(self, device_id: int, limit: int = 50) -> List[Inspection]:
+        """Get the inspection history of a device, newest first
+        
+        Args:
+            device_id: Numeric device ID
+            limit: Maximum number of inspections
+            
+        Returns:
+            List of inspections
+        """
+        pass
+    
+    @abstractmethod
+    def list_for_devices(self, device_ids: Sequence[int], per_device: int = 5) -> Dict[int, List[Inspection]]:
+        """Get the latest inspections of many devices in a constant number of queries
+        
+        Args:
+            device_ids: Numeric device IDs
+            per_device: Maximum number of inspections per device
+            
+        Returns:
+            Mapping device_id -> inspections, newest first (devices without history are missing)
+        """
+        pass
@@ -0,0 +1,54 @@
+"""Measurement Repository Port - Abstract interface for the measurement time series"""
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional, Sequence
+from src.core.domain.measurement import Measurement, MetricTrend
+
+
+class MeasurementRepository(ABC):
+    """Abstract Measurement Repository Interface"""
+
+    @abstractmethod
+    def append_many(self, measurements: Sequence[Measurement]) -> int:
+        """Append measurements in batches (idempotent per device, metric and time)
+
+        Args:
+            measurements: Measurements to append
+
+        Returns:
+            Number of measurements written
+        """
+        pass
+
+    @abstractmethod
+    def get_series(self, device_id: int, metric: Optional[str] = None,
+                   since: Optional[datetime] = None) -> List[Measurement]:
+        """Get the measurement series of a device
+
+        Args:
+            device_id: Numeric device ID
+            metric: Optional metric filter (e.g. "r_pe")
+            since: Only measurements at or after this time
+
+        Returns:
+            Measurements ordered by metric and time
+        """
+        pass
+
+    @abstractmethod
+    def get_trends(self, customer: Optional[str] = None, device_ids: Sequence[int] = (),
+                   metric: Optional[str] = None, since: Optional[datetime] = None,
+                   min_samples: int = 2) -> List[MetricTrend]:
+        """Compute per-device trends (first/last value, regression slope) in the database
+
+        Args:
+            customer: Optional customer filter
+            device_ids: Optional device filter
+            metric: Optional metric filter
+            since: Only measurements at or after this time
+            min_samples: Minimum number of measurements per device and metric
+
+        Returns:
+            One trend per device and metric
+        """
+        pass
@@ -3,12 +3,21 @@ from abc import ABC, abstractmethod
 from typing import Optional
 
 class QRGenerator(ABC):
-    """Abstract QR Generator"""
+    """Abstract QR Generator
+
+    Adapter legen Ausgabeformat und Render-Optionen (Fehlerkorrektur,
+    Modulgröße, Ruhezone) bei der Erzeugung fest.
+    """
+
+    # MIME-Typ der erzeugten Bilder (z.B. "image/svg+xml")
+    mimetype: str = ''
 
     @abstractmethod
     def generate(self, data: str) -> Optional[bytes]:
+        """QR-Code zu `data` als Bild-Bytes, None bei Fehler"""
         pass
 
     @abstractmethod
     def generate_to_file(self, data: str, filename: str) -> bool:
+        """QR-Code in eine Datei schreiben, False bei Fehler"""
         pass
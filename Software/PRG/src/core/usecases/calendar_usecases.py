@@ -0,0 +1,91 @@
+"""Calendar Use Cases - Prüftermine als abonnierbarer Kalender-Feed"""
+import hashlib
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Callable, Dict, Optional
+from src.core.domain.device_query import ChangeMarker
+from src.core.domain.calendar_feed import (
+    FEED_MODES,
+    CalendarEvent,
+    CalendarFeed,
+    device_event,
+    location_day_events
+)
+from src.core.ports.device_repository import DeviceRepository
+from src.adapters.services.logger_service import LoggerService
+
+
+@dataclass
+class _FeedState:
+    """Zwischengespeicherter Stand eines Kunden-Feeds"""
+    marker: ChangeMarker
+    # Gerät -> Termin (None = Gerät ohne geplante Prüfung, zählt aber zum Bestand)
+    events: Dict[int, Optional[CalendarEvent]] = field(default_factory=dict)
+    # Modus -> gerenderter Feed
+    feeds: Dict[str, CalendarFeed] = field(default_factory=dict)
+
+
+class CalendarFeedUseCase:
+    """Build a customer's calendar feed, maintained incrementally per customer
+
+    Pro Abruf nur eine Änderungsprüfung (COUNT/MAX(updated_at)). Bei
+    unverändertem Stand wird der gerenderte Feed samt ETag aus dem Cache
+    geliefert; sonst werden nur die seit dem letzten Stand geänderten Geräte
+    geladen. Solange der Stand nicht `settled` ist (Aufbau in derselben
+    Sekunde wie die letzte Änderung), wird die letzte Sekunde bei jedem Abruf
+    erneut gelesen. Weicht die Anzahl danach ab (gelöschte oder umgehängte Geräte),
+    wird der Feed einmal vollständig neu aufgebaut.
+    """
+    def __init__(self, repository: DeviceRepository, render: Callable[[CalendarFeed], bytes]):
+        self.repository = repository
+        self.render = render
+        self._states: Dict[str, _FeedState] = {}
+        self._lock = Lock()
+        self.logger = LoggerService()
+
+    def execute(self, customer: str, mode: str = 'device') -> Optional[CalendarFeed]:
+        """Feed eines Kunden (None wenn der Kunde keine Geräte hat)
+
+        Raises:
+            ValueError: Bei unbekanntem Modus
+        """
+        if mode not in FEED_MODES:
+            raise ValueError(f"mode must be one of {list(FEED_MODES)}, got '{mode}'")
+        marker = self.repository.get_change_marker(customer)
+        if marker.count == 0:
+            return None
+
+        with self._lock:
+            state = self._states.get(customer)
+            if state is None or state.marker.state != marker.state or not state.marker.settled:
+                state = self._refresh(customer, state, marker)
+                self._states[customer] = state
+            feed = state.feeds.get(mode)
+            if feed is None:
+                feed = self._build_feed(customer, mode, state)
+                state.feeds[mode] = feed
+            return feed
+
+    def _refresh(self, customer: str, state: Optional[_FeedState], marker: ChangeMarker) -> _FeedState:
+        count = marker.count
+        if state is not None and state.marker.changed_at is not None:
+            changed = self.repository.get_changed_since(customer, state.marker.changed_at)
+            events = dict(state.events)
+            for device in changed:
+                events[device.id] = device_event(device)
+            if len(events) == count:
+                self.logger.debug(f"Calendar feed updated incrementally for {customer}", changed=len(changed))
+                return _FeedState(marker=marker, events=events)
+
+        devices = self.repository.get_changed_since(customer)
+        self.logger.debug(f"Calendar feed rebuilt for {customer}", devices=len(devices))
+        return _FeedState(marker=marker, events={device.id: device_event(device) for device in devices})
+
+    def _build_feed(self, customer: str, mode: str, state: _FeedState) -> CalendarFeed:
+        events = [event for event in state.events.values() if event is not None]
+        if mode == 'location':
+            events = location_day_events(customer, events)
+        feed = CalendarFeed(customer=customer, mode=mode, events=events, changed_at=state.marker.changed_at)
+        feed.body = self.render(feed)
+        feed.etag = hashlib.sha256(feed.body).hexdigest()[:32]
+        return feed
@@ -1,20 +1,138 @@
 """Device Use Cases - Hexagonal Architecture mit customer_device_id"""
+import time
+from collections import defaultdict
+from datetime import date, timedelta
 from src.core.domain.device import Device
+from src.core.domain.bulk_result import BackfillProgress, BulkCreateResult, BulkItemError
+from src.core.domain.device_query import DUE_STATUSES, DevicePage, DeviceQuery
+from src.core.domain.route_plan import RoutePlan, build_route_plan
+from src.core.domain import dates
 from src.core.ports.device_repository import DeviceRepository
-from src.adapters.services.qr_code_generator import QRCodeGenerator
+from src.core.ports.qr_generator import QRGenerator
+from src.adapters.services.qr_code_generator import PARALLEL_QR_THRESHOLD, QR_WORKERS, QRCodeGenerator
 from src.adapters.services.logger_service import LoggerService
-from typing import List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence
 
 
 class ListDevicesUseCase:
-    """List all devices"""
+    """List devices - all or filtered/sorted by a DeviceQuery"""
     def __init__(self, repository: DeviceRepository):
         self.repository = repository
         self.logger = LoggerService()
     
-    def execute(self) -> List[Device]:
-        self.logger.debug("ListDevicesUseCase executed")
-        return self.repository.get_all()
+    def execute(self, query: Optional[DeviceQuery] = None) -> List[Device]:
+        self.logger.debug("ListDevicesUseCase executed", filtered=query is not None)
+        if query is None:
+            return self.repository.get_all()
+        return self.repository.find(query)
+
+
+class ExportDevicesUseCase:
+    """Stream devices for table exports (CSV/XLSX) in stable export order"""
+    def __init__(self, repository: DeviceRepository):
+        self.repository = repository
+        self.logger = LoggerService()
+    
+    def execute(self, query: Optional[DeviceQuery] = None) -> Iterator[Device]:
+        self.logger.debug("ExportDevicesUseCase executed", filtered=query is not None)
+        if query is None:
+            query = DeviceQuery(sort=('customer', 'customer_device_id'))
+        return self.repository.iter_find(query)
+
+
+class ListLabelDevicesUseCase:
+    """Devices for QR labels - a selection, the due-list or all devices of a customer"""
+    MAX_COPIES = 10
+    
+    def __init__(self, repository: DeviceRepository):
+        self.repository = repository
+        self.logger = LoggerService()
+    
+    def execute(self, customer: Optional[str] = None, customer_device_ids: Sequence[str] = (),
+                copies: int = 1, due_within_days: Optional[int] = None) -> Iterator[Device]:
+        self.logger.debug("ListLabelDevicesUseCase executed", customer=customer,
+                          selected=len(customer_device_ids), copies=copies, due_within_days=due_within_days)
+        if not customer and not customer_device_ids and due_within_days is None:
+            raise ValueError("customer, customer_device_ids or due_within_days is required")
+        if due_within_days is not None and due_within_days < 0:
+            raise ValueError("due_within_days must not be negative")
+        if not 1 <= copies <= self.MAX_COPIES:
+            raise ValueError(f"copies must be between 1 and {self.MAX_COPIES}")
+        
+        if customer_device_ids:
+            found = {d.customer_device_id: d for d in self.repository.get_by_identifiers(customer_device_ids)}
+            if customer:
+                found = {key: d for key, d in found.items() if d.customer == customer}
+            unknown = [cid for cid in customer_device_ids if cid not in found]
+            if unknown:
+                raise ValueError(f"Unknown devices: {', '.join(unknown[:10])}")
+            # Reihenfolge der Auswahl beibehalten
+            devices: Iterable[Device] = [found[cid] for cid in dict.fromkeys(customer_device_ids)]
+        elif due_within_days is not None:
+            # Fällige Geräte (inkl. überfällige) in Prüfreihenfolge
+            devices = self.repository.iter_find(DeviceQuery(
+                customer=customer,
+                statuses=DUE_STATUSES,
+                next_inspection_to=dates.today() + timedelta(days=due_within_days),
+                sort=('next_inspection', 'id')
+            ))
+        else:
+            devices = self.repository.iter_find(DeviceQuery(customer=customer, sort=('customer_device_id',)))
+        return self._with_copies(devices, copies)
+    
+    @staticmethod
+    def _with_copies(devices: Iterable[Device], copies: int) -> Iterator[Device]:
+        for device in devices:
+            for _ in range(copies):
+                yield device
+
+
+class ListDueDevicesUseCase:
+    """List devices due for inspection within the next N days (inkl. überfällige)"""
+    def __init__(self, repository: DeviceRepository):
+        self.repository = repository
+        self.logger = LoggerService()
+    
+    def execute(self, within_days: int = 30, customer: Optional[str] = None,
+                location: Optional[str] = None, limit: int = 100,
+                cursor: Optional[str] = None) -> DevicePage:
+        self.logger.debug(f"ListDueDevicesUseCase executed for {within_days} days", customer=customer)
+        until = dates.today() + timedelta(days=within_days)
+        return self.repository.get_due_for_inspection(
+            until=until,
+            customer=customer,
+            location=location,
+            limit=limit,
+            cursor=cursor
+        )
+
+
+class PlanInspectionRouteUseCase:
+    """Build an inspection route: due devices of a customer grouped by location hierarchy
+    
+    Eine Abfrage (Index idx_customer_next_inspection_status), danach ein
+    Gruppierungsdurchlauf im Speicher.
+    """
+    def __init__(self, repository: DeviceRepository):
+        self.repository = repository
+        self.logger = LoggerService()
+    
+    def execute(self, customer: str, within_days: int = 30,
+                start: Optional[date] = None) -> RoutePlan:
+        self.logger.debug(f"PlanInspectionRouteUseCase executed for {customer}", within_days=within_days)
+        if not customer:
+            raise ValueError("Customer is required")
+        until = dates.today() + timedelta(days=within_days)
+        if start is not None and start > until:
+            raise ValueError("start must not be after the end of the window")
+        devices = self.repository.find(DeviceQuery(
+            customer=customer,
+            statuses=DUE_STATUSES,
+            next_inspection_from=start,
+            next_inspection_to=until,
+            sort=('next_inspection',)
+        ))
+        return build_route_plan(devices, customer=customer, until=until, start=start)
 
 
 class GetDeviceUseCase:
@@ -28,10 +146,22 @@ class GetDeviceUseCase:
         return self.repository.get_by_customer_device_id(customer_device_id)
 
 
+class GetDeviceCustomerUseCase:
+    """Get only the customer of a device (QR-Bilder brauchen nur customer_device_id + customer)"""
+    def __init__(self, repository: DeviceRepository):
+        self.repository = repository
+        self.logger = LoggerService()
+    
+    def execute(self, customer_device_id: str) -> Optional[str]:
+        self.logger.debug(f"GetDeviceCustomerUseCase executed for {customer_device_id}")
+        return self.repository.get_customer_of(customer_device_id)
+
+
 class CreateDeviceUseCase:
     """Create a new device with QR-Code generation"""
-    def __init__(self, repository: DeviceRepository):
+    def __init__(self, repository: DeviceRepository, qr_generator: Optional[QRGenerator] = None):
         self.repository = repository
+        self.qr_generator = qr_generator
         self.logger = LoggerService()
     
     def execute(self, device: Device) -> Device:
@@ -39,14 +169,15 @@ class CreateDeviceUseCase:
         
         # Generate customer_device_id if not provided
         if not device.customer_device_id and device.customer:
-            device.customer_device_id = self.repository.get_next_customer_device_id(device.customer)
+            device.customer_device_id = self.repository.reserve_customer_device_ids(device.customer, 1)[0]
             self.logger.debug(f"Generated customer_device_id: {device.customer_device_id}")
         
         # Generate QR-Code wenn customer_device_id vorhanden ist
         if device.customer_device_id:
             qr_code_bytes = QRCodeGenerator.generate_qr_code(
                 device_id=device.customer_device_id,
-                customer=device.customer or ""
+                customer=device.customer or "",
+                encoder=self.qr_generator
             )
             if qr_code_bytes:
                 device.qr_code = qr_code_bytes
@@ -57,19 +188,214 @@ class CreateDeviceUseCase:
         return created_device
 
 
+class CreateDevicesUseCase:
+    """Create many devices at once (Onboarding)
+    
+    - reserviert pro Kunde einen zusammenhängenden ID-Block (eine Abfrage pro Kunde)
+    - erzeugt QR-Codes parallel in einem Prozess-Pool (CPU-gebunden)
+    - schreibt in Batches mit einer Transaktion pro Batch
+    - meldet Fehler pro Gerät, ohne den Rest abzubrechen
+    """
+    # Unterhalb dieser Anzahl lohnt der Start eines Prozess-Pools nicht
+    PARALLEL_QR_THRESHOLD = PARALLEL_QR_THRESHOLD
+    
+    def __init__(self, repository: DeviceRepository, batch_size: int = 200,
+                 qr_workers: Optional[int] = None, qr_generator: Optional[QRGenerator] = None):
+        self.repository = repository
+        self.batch_size = batch_size
+        self.qr_workers = qr_workers or QR_WORKERS
+        self.qr_generator = qr_generator
+        self.logger = LoggerService()
+    
+    def execute(self, devices: List[Device]) -> BulkCreateResult:
+        self.logger.debug(f"CreateDevicesUseCase executed for {len(devices)} devices")
+        result = BulkCreateResult()
+        if not devices:
+            return result
+        
+        # 1. ID-Blöcke pro Kunde reservieren
+        pending = self._assign_customer_device_ids(devices, result)
+        
+        # 2. QR-Codes parallel erzeugen
+        self._generate_qr_codes([devices[i] for i in pending])
+        
+        # 3. Batch-Insert mit Fehlern pro Gerät
+        errors = self.repository.create_many([devices[i] for i in pending], batch_size=self.batch_size)
+        for position, index in enumerate(pending):
+            device = devices[index]
+            if position in errors:
+                result.errors.append(BulkItemError(index, errors[position], device.customer_device_id))
+            else:
+                result.created.append(device)
+        
+        result.errors.sort(key=lambda e: e.index)
+        self.logger.info(
+            f"Devices created: {len(result.created)}",
+            failed=len(result.errors)
+        )
+        return result
+    
+    def _assign_customer_device_ids(self, devices: List[Device], result: BulkCreateResult) -> List[int]:
+        """Vergib fehlende customer_device_ids blockweise; liefert Indizes der anlegbaren Geräte"""
+        missing = defaultdict(list)
+        for index, device in enumerate(devices):
+            if not device.customer_device_id:
+                missing[device.customer].append(index)
+        
+        failed = set()
+        for customer, indices in missing.items():
+            try:
+                block = self.repository.reserve_customer_device_ids(customer, len(indices))
+            except Exception as e:
+                self.logger.error(f"Failed to reserve IDs for {customer}: {e}", exception=e)
+                for index in indices:
+                    result.errors.append(BulkItemError(index, f"ID reservation failed: {e}"))
+                failed.update(indices)
+                continue
+            for index, customer_device_id in zip(indices, block):
+                devices[index].customer_device_id = customer_device_id
+        
+        return [i for i in range(len(devices)) if i not in failed]
+    
+    def _generate_qr_codes(self, devices: List[Device]) -> None:
+        """Erzeuge QR-Codes (ab PARALLEL_QR_THRESHOLD im Prozess-Pool)"""
+        codes = QRCodeGenerator.generate_many(
+            [(d.customer_device_id, d.customer or "") for d in devices],
+            workers=self.qr_workers,
+            threshold=self.PARALLEL_QR_THRESHOLD,
+            encoder=self.qr_generator
+        )
+        for device, qr_code in zip(devices, codes):
+            device.qr_code = qr_code
+
+
 class UpdateDeviceUseCase:
     """Update an existing device"""
-    def __init__(self, repository: DeviceRepository):
+    def __init__(self, repository: DeviceRepository, qr_generator: Optional[QRGenerator] = None):
         self.repository = repository
+        self.qr_generator = qr_generator
         self.logger = LoggerService()
     
     def execute(self, device: Device) -> Device:
         self.logger.debug(f"UpdateDeviceUseCase executed for {device.customer_device_id}")
+        
+        # QR-Code neu erzeugen (Inhalt hängt von customer ab) und mit speichern
+        if device.customer_device_id:
+            device.qr_code = QRCodeGenerator.generate_qr_code(
+                device_id=device.customer_device_id,
+                customer=device.customer or "",
+                encoder=self.qr_generator
+            )
+        
         updated_device = self.repository.update(device)
         self.logger.info(f"Device updated: {updated_device.customer_device_id}")
         return updated_device
 
 
+class BackfillQRCodesUseCase:
+    """Generate and store QR codes for devices created before QR persistence
+    
+    Arbeitet in Batches über den Primärschlüssel; jeder Batch wird in einer
+    Transaktion gespeichert, ein Abbruch verliert also höchstens einen Batch.
+    Mit `after_id` = letzter gemeldeter `last_id` lässt sich ein abgebrochener
+    Lauf fortsetzen; bereits aktuelle QR-Codes werden ohnehin nicht neu geschrieben.
+    """
+    def __init__(self, repository: DeviceRepository, batch_size: int = 200,
+                 qr_generator: Optional[QRGenerator] = None):
+        self.repository = repository
+        self.batch_size = batch_size
+        self.qr_generator = qr_generator
+        self.logger = LoggerService()
+    
+    def execute(self, max_devices: Optional[int] = None, refresh_stale: bool = False, after_id: int = 0,
+                workers: Optional[int] = None,
+                on_batch: Optional[Callable[[BackfillProgress], None]] = None) -> int:
+        """Fehlende (und optional veraltete) QR-Codes erzeugen und speichern
+        
+        Args:
+            max_devices: Maximale Anzahl geprüfter Geräte pro Aufruf
+            refresh_stale: Auch gespeicherte QR-Codes prüfen, die nicht mehr dem
+                aktuellen Inhalt bzw. Encoder entsprechen
+            after_id: Nur Geräte mit id > after_id (Wiederaufsetzpunkt)
+            workers: Prozesse für die QR-Erzeugung (Standard: QR_WORKERS)
+            on_batch: Wird nach jedem gespeicherten Batch mit dem Fortschritt aufgerufen
+        
+        Returns:
+            Anzahl gespeicherter QR-Codes
+        """
+        self.logger.debug("BackfillQRCodesUseCase executed", max_devices=max_devices,
+                          refresh_stale=refresh_stale, after_id=after_id)
+        fetch = self.repository.get_qr_code_batch if refresh_stale else self.repository.get_without_qr_code
+        progress = BackfillProgress(last_id=after_id)
+        started_at = time.perf_counter()
+        while max_devices is None or progress.scanned < max_devices:
+            limit = self.batch_size if max_devices is None else min(self.batch_size, max_devices - progress.scanned)
+            devices = fetch(limit=limit, after_id=progress.last_id)
+            if not devices:
+                break
+            codes = QRCodeGenerator.generate_many(
+                [(device.customer_device_id, device.customer or "") for device in devices], workers=workers,
+                encoder=self.qr_generator
+            )
+            qr_codes = {}
+            for device, qr_code in zip(devices, codes):
+                if not qr_code:
+                    progress.failed += 1
+                elif device.qr_code is None:
+                    qr_codes[device.id] = qr_code
+                elif bytes(device.qr_code) != qr_code:
+                    qr_codes[device.id] = qr_code
+                    progress.stale += 1
+            progress.updated += self.repository.update_qr_codes(qr_codes)
+            progress.scanned += len(devices)
+            progress.last_id = devices[-1].id
+            progress.elapsed = time.perf_counter() - started_at
+            if on_batch is not None:
+                on_batch(progress)
+        self.logger.info(f"QR codes backfilled: {progress.updated}", **progress.to_dict())
+        return progress.updated
+
+
+class WarmUpQRArtifactStoreUseCase:
+    """Pre-render QR codes of all devices into the shared artifact store
+    
+    Läuft pro Deployment nur in einem Worker (nicht-blockierende Dateisperre);
+    anschließend werden Artefakte gelöscht, die kein Gerät mehr adressiert
+    (gelöschte Geräte, geänderter Kunde), sofern sie vor dem Durchlauf entstanden sind.
+    """
+    def __init__(self, repository: DeviceRepository, qr_generator: Optional[QRGenerator] = None):
+        self.repository = repository
+        self.qr_generator = qr_generator
+        self.logger = LoggerService()
+    
+    def execute(self, cleanup: bool = True) -> Optional[dict]:
+        store = QRCodeGenerator.artifact_store()
+        if store is None:
+            self.logger.debug("WarmUpQRArtifactStoreUseCase skipped: no artifact store configured")
+            return None
+        
+        with store.exclusive('warmup') as acquired:
+            if not acquired:
+                self.logger.debug("QR warm-up already running in another worker")
+                return None
+            started_at = time.time()
+            live_keys = set()
+            query = DeviceQuery(sort=('id',))
+            for device in self.repository.iter_find(query):
+                if not device.customer_device_id:
+                    continue
+                try:
+                    key = QRCodeGenerator.ensure_stored(device.customer_device_id, device.customer or "",
+                                                        encoder=self.qr_generator)
+                    live_keys.add(key)
+                except Exception as e:
+                    self.logger.error(f"QR warm-up failed for {device.customer_device_id}: {e}", exception=e)
+            removed = store.cleanup(live_keys, older_than=started_at) if cleanup else 0
+        
+        self.logger.info(f"QR artifact store warmed: {len(live_keys)} devices", removed=removed)
+        return {'devices': len(live_keys), 'removed': removed}
+
+
 class DeleteDeviceUseCase:
     """Delete a device"""
     def __init__(self, repository: DeviceRepository):
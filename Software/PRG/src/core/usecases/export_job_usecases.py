@@ -0,0 +1,118 @@
+"""Export Job Use Cases - PDF-Exporte als Hintergrund-Jobs"""
+import os
+import tempfile
+import uuid
+from typing import Callable, Dict, List, Optional, Sequence
+from src.core.domain.device import Device
+from src.core.domain.device_query import DeviceQuery
+from src.core.domain.export_job import ExportJob
+from src.core.domain.inspection import Inspection
+from src.core.ports.device_repository import DeviceRepository
+from src.core.ports.export_job_repository import ExportJobRepository
+from src.core.ports.inspection_repository import InspectionRepository
+from src.adapters.services.logger_service import LoggerService
+
+
+class EnqueuePDFExportUseCase:
+    """Queue a PDF export (all devices or one customer) for the PDF worker
+
+    Läuft für denselben Export bereits ein Job (queued/running), wird dieser
+    zurückgegeben statt einen zweiten anzulegen.
+    """
+    def __init__(self, repository: ExportJobRepository):
+        self.repository = repository
+        self.logger = LoggerService()
+
+    def execute(self, customer: Optional[str] = None) -> ExportJob:
+        kind = 'customer' if customer else 'devices'
+        existing = self.repository.find_active(kind, customer)
+        if existing is not None:
+            self.logger.debug(f"PDF export already queued: {existing.id}", kind=kind, customer=customer)
+            return existing
+        job = self.repository.create(ExportJob(id=uuid.uuid4().hex, kind=kind, customer=customer))
+        self.logger.info(f"PDF export queued: {job.id}", kind=kind, customer=customer)
+        return job
+
+
+class GetExportJobUseCase:
+    """Get an export job (status, progress, result file)"""
+    def __init__(self, repository: ExportJobRepository):
+        self.repository = repository
+        self.logger = LoggerService()
+
+    def execute(self, job_id: str) -> Optional[ExportJob]:
+        self.logger.debug(f"GetExportJobUseCase executed for {job_id}")
+        return self.repository.get(job_id)
+
+
+class RunPDFExportJobUseCase:
+    """Render a claimed PDF export job into the job directory (läuft im PDF-Worker-Prozess)
+
+    Die Datei wird unter temporärem Namen geschrieben und erst nach
+    Fertigstellung umbenannt; Fortschritt wird nach jedem Schritt gespeichert.
+    """
+    def __init__(self, job_repository: ExportJobRepository, device_repository: DeviceRepository,
+                 inspection_repository: InspectionRepository, directory: str,
+                 render_html: Callable[..., str],
+                 write_pdf: Callable[[str, str, Optional[Callable[[int], None]]], int],
+                 customer_history: int = 3):
+        self.job_repository = job_repository
+        self.device_repository = device_repository
+        self.inspection_repository = inspection_repository
+        self.directory = directory
+        self.render_html = render_html
+        self.write_pdf = write_pdf
+        self.customer_history = customer_history
+        self.logger = LoggerService()
+
+    def execute(self, job_id: str) -> bool:
+        """Job ausführen; Fehler werden am Job gespeichert
+
+        Returns:
+            True wenn die PDF erzeugt wurde
+        """
+        job = self.job_repository.get(job_id)
+        if job is None:
+            self.logger.warning(f"PDF export job {job_id} not found")
+            return False
+        try:
+            self._progress(job, 'loading', 0.05)
+            devices = self._devices(job)
+            self._progress(job, 'history', 0.2)
+            history = self._history(job, devices)
+            self._progress(job, 'html', 0.3)
+            html = self.render_html(devices, history, customer=job.customer)
+            self._progress(job, 'layout', 0.4)
+
+            filename = f"{job.id}.pdf"
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix='.tmp-', suffix='.pdf')
+            os.close(fd)
+            try:
+                pages = self.write_pdf(html, temp_path,
+                                       lambda page_count: self._progress(job, 'writing', 0.85))
+                os.replace(temp_path, os.path.join(self.directory, filename))
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.unlink(temp_path)
+                raise
+            size_bytes = os.path.getsize(os.path.join(self.directory, filename))
+            self.job_repository.complete(job.id, filename, size_bytes, pages)
+            self.logger.info(f"PDF export finished: {job.id}", devices=len(devices), pages=pages,
+                             size_bytes=size_bytes)
+            return True
+        except Exception as e:
+            self.logger.error(f"PDF export {job.id} failed: {e}", exception=e)
+            self.job_repository.fail(job.id, str(e))
+            return False
+
+    def _progress(self, job: ExportJob, stage: str, progress: float) -> None:
+        self.job_repository.update_progress(job.id, stage, progress)
+
+    def _devices(self, job: ExportJob) -> List[Device]:
+        if job.kind == 'customer':
+            return self.device_repository.find(DeviceQuery(customer=job.customer, sort=('customer_device_id',)))
+        return self.device_repository.find(DeviceQuery(sort=('id',)))
+
+    def _history(self, job: ExportJob, devices: Sequence[Device]) -> Dict[int, List[Inspection]]:
+        per_device = self.customer_history if job.kind == 'customer' else 1
+        return self.inspection_repository.list_for_devices([device.id for device in devices], per_device=per_device)
@@ -0,0 +1,162 @@
+"""Import Use Cases - Prüfprotokolle externer Prüfgeräte (BENNING ST 725)"""
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from src.core.domain.device import Device
+from src.core.domain.inspection import Inspection
+from src.core.domain.bulk_result import BulkItemError, ImportReport
+from src.core.ports.device_repository import DeviceRepository
+from src.core.ports.inspection_repository import InspectionRepository
+from src.core.usecases.device_usecases import CreateDevicesUseCase
+from src.core.usecases.inspection_usecases import DEFAULT_INTERVAL_DAYS, plan_next_inspection
+from src.adapters.importers.st725_reader import ProtocolRecord
+from src.adapters.services.logger_service import LoggerService
+
+
+def device_type_for(test_sequence: Optional[str]) -> str:
+    """Gerätetyp aus dem Prüfablauf ableiten (z.B. "SK I" -> Schutzklasse 1)"""
+    sequence = (test_sequence or '').upper().replace(' ', '')
+    if 'SKII' in sequence or 'SK2' in sequence:
+        return 'Elektrogerät Schutzklasse 2'
+    if 'SKI' in sequence or 'SK1' in sequence:
+        return 'Elektrogerät Schutzklasse 1'
+    return 'Elektrogerät'
+
+
+class ImportInspectionProtocolUseCase:
+    """Import protocol records: Geräte abgleichen/anlegen, Prüfungen anhängen
+
+    - Datensätze werden als Stream in Batches verarbeitet (kein Laden der ganzen Datei)
+    - Abgleich über ID-Nr. gegen customer_device_id oder serial_number (eine Abfrage pro Batch)
+    - unbekannte Geräte über den Massenanlage-Pfad (CreateDevicesUseCase)
+    - Prüfungen pro Batch in einer Transaktion (record_many)
+    - dry_run: nur lesen und abgleichen, Bericht ohne Schreibzugriffe
+    """
+    def __init__(self, device_repository: DeviceRepository, inspection_repository: InspectionRepository,
+                 create_devices_usecase: CreateDevicesUseCase, batch_size: int = 500,
+                 interval_days: int = DEFAULT_INTERVAL_DAYS):
+        self.device_repository = device_repository
+        self.inspection_repository = inspection_repository
+        self.create_devices_usecase = create_devices_usecase
+        self.batch_size = batch_size
+        self.interval_days = interval_days
+        self.logger = LoggerService()
+
+    def execute(self, records: Iterable[ProtocolRecord], customer: str,
+                inspector: Optional[str] = None, dry_run: bool = False) -> ImportReport:
+        self.logger.debug(f"ImportInspectionProtocolUseCase executed for {customer}", dry_run=dry_run)
+        if not customer:
+            raise ValueError("Customer is required")
+
+        report = ImportReport(dry_run=dry_run)
+        # ID-Nr. -> Gerät (vorhanden oder in diesem Import angelegt)
+        known: Dict[str, Device] = {}
+        existing: Set[str] = set()
+        batch: List[ProtocolRecord] = []
+        for record in records:
+            report.rows += 1
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                self._import_batch(batch, customer, inspector, dry_run, known, existing, report)
+                batch = []
+        if batch:
+            self._import_batch(batch, customer, inspector, dry_run, known, existing, report)
+
+        report.errors.sort(key=lambda e: e.index)
+        self.logger.info(
+            f"Protocol import {'checked' if dry_run else 'finished'}: {report.rows} rows",
+            matched=report.matched,
+            created=report.created,
+            inspections=report.inspections,
+            failed=len(report.errors)
+        )
+        return report
+
+    def _import_batch(self, batch: List[ProtocolRecord], customer: str, inspector: Optional[str],
+                      dry_run: bool, known: Dict[str, Device], existing: Set[str],
+                      report: ImportReport) -> None:
+        # 1. Abgleich mit vorhandenen Geräten (nur des importierenden Kunden)
+        lookup = [r.id_number for r in batch if r.id_number and r.id_number not in known]
+        if lookup:
+            for device in self.device_repository.get_by_identifiers(lookup, lookup, customer=customer):
+                for key in (device.customer_device_id, device.serial_number):
+                    if key and key not in known:
+                        known[key] = device
+                        existing.add(key)
+
+        # 2. Zeilen zuordnen, neue Geräte sammeln
+        assigned: List[Tuple[ProtocolRecord, str]] = []
+        new_devices: Dict[str, Device] = {}
+        for record in batch:
+            error = self._validate(record)
+            if error:
+                report.errors.append(BulkItemError(record.row_number, error, record.id_number))
+                continue
+            key = record.id_number
+            if key in existing:
+                report.matched += 1
+            elif key not in known and key not in new_devices:
+                new_devices[key] = self._new_device(record, customer)
+            assigned.append((record, key))
+
+        # 3. Neue Geräte über den Massenanlage-Pfad
+        if new_devices:
+            report.created += len(new_devices)
+            if dry_run:
+                known.update(new_devices)
+            else:
+                keys = list(new_devices)
+                result = self.create_devices_usecase.execute(list(new_devices.values()))
+                failed = {keys[error.index]: error.error for error in result.errors}
+                report.created -= len(failed)
+                for key, device in new_devices.items():
+                    if key not in failed:
+                        known[key] = device
+                for record, key in assigned:
+                    if key in failed:
+                        report.errors.append(BulkItemError(record.row_number, failed[key], key))
+                assigned = [(record, key) for record, key in assigned if key not in failed]
+
+        # 4. Prüfungen in einer Transaktion anhängen
+        report.inspections += len(assigned)
+        if dry_run or not assigned:
+            return
+        entries = []
+        for record, key in assigned:
+            inspection = self._to_inspection(record, known[key], inspector)
+            next_inspection = record.next_inspection or plan_next_inspection(inspection, self.interval_days)
+            entries.append((inspection, next_inspection, inspection.resulting_device_status()))
+        self.inspection_repository.record_many(entries)
+
+    def _validate(self, record: ProtocolRecord) -> Optional[str]:
+        """Fehlermeldung für nicht importierbare Zeilen"""
+        if not record.id_number:
+            return "ID-Nr. fehlt - Gerät kann nicht zugeordnet werden"
+        if record.inspection_date is None:
+            return "Prüfdatum fehlt oder ist ungültig"
+        return None
+
+    def _new_device(self, record: ProtocolRecord, customer: str) -> Device:
+        """Gerät für eine unbekannte ID-Nr. (Kunden-ID-Format oder Seriennummer)"""
+        is_customer_id = record.id_number.startswith(f"{customer}-")
+        return Device(
+            name=record.name or f"Prüfobjekt {record.id_number}",
+            customer=customer,
+            customer_device_id=record.id_number if is_customer_id else None,
+            serial_number=None if is_customer_id else record.id_number,
+            type=device_type_for(record.test_sequence),
+            last_inspection=record.inspection_date,
+            next_inspection=record.next_inspection
+        )
+
+    def _to_inspection(self, record: ProtocolRecord, device: Device, inspector: Optional[str]) -> Inspection:
+        notes = f"ST 725 Prüfablauf: {record.test_sequence}" if record.test_sequence else None
+        return Inspection(
+            device_id=device.id,
+            inspection_date=record.inspection_date,
+            result=record.result,
+            inspector=inspector,
+            notes=notes,
+            r_pe=record.r_pe,
+            r_iso=record.r_iso,
+            i_pe=record.i_pe,
+            i_b=record.i_b
+        )
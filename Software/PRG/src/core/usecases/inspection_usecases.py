@@ -0,0 +1,77 @@
+"""Inspection Use Cases - Prüfhistorie und Prüfplanung"""
+import os
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence
+from src.core.domain.inspection import Inspection
+from src.core.ports.inspection_repository import InspectionRepository
+from src.adapters.services.logger_service import LoggerService
+
+
+# Standard-Prüfintervall (DGUV V3: je nach Einsatzbedingungen 6-24 Monate)
+DEFAULT_INTERVAL_DAYS = int(os.getenv('INSPECTION_INTERVAL_DAYS', '365'))
+
+
+def plan_next_inspection(inspection: Inspection, interval_days: int = DEFAULT_INTERVAL_DAYS) -> Optional[date]:
+    """Nächsten Prüftermin aus Ergebnis und Intervall ableiten
+    
+    - bestanden: Prüfdatum + Intervall
+    - nicht bestanden: Prüfdatum (sofort wieder fällig)
+    - pending: None (Termin bleibt unverändert)
+    """
+    inspection_day = inspection.inspection_date.date()
+    if inspection.result == 'pass':
+        return inspection_day + timedelta(days=interval_days)
+    if inspection.result == 'fail':
+        return inspection_day
+    return None
+
+
+class RecordInspectionUseCase:
+    """Record an inspection: Historie anhängen + Gerät aktualisieren (eine Transaktion)
+    
+    - bestanden: Gerät aktiv, nächste Prüfung = Prüfdatum + Intervall
+    - nicht bestanden: Gerät in Wartung, sofort wieder fällig (Prüfdatum)
+    - pending: Status und nächste Prüfung bleiben unverändert
+    """
+    def __init__(self, repository: InspectionRepository, interval_days: int = DEFAULT_INTERVAL_DAYS):
+        self.repository = repository
+        self.interval_days = interval_days
+        self.logger = LoggerService()
+    
+    def execute(self, inspection: Inspection, next_inspection: Optional[date] = None) -> Inspection:
+        self.logger.debug(f"RecordInspectionUseCase executed for device {inspection.device_id}",
+                          result=inspection.result)
+        if next_inspection is None:
+            next_inspection = plan_next_inspection(inspection, self.interval_days)
+        
+        recorded = self.repository.record(
+            inspection,
+            next_inspection=next_inspection,
+            device_status=inspection.resulting_device_status()
+        )
+        self.logger.info(f"Inspection recorded: {recorded.id}", device_id=recorded.device_id,
+                         result=recorded.result)
+        return recorded
+
+
+class ListInspectionsUseCase:
+    """List the inspection history of a device (newest first)"""
+    def __init__(self, repository: InspectionRepository):
+        self.repository = repository
+        self.logger = LoggerService()
+    
+    def execute(self, device_id: int, limit: int = 50) -> List[Inspection]:
+        self.logger.debug(f"ListInspectionsUseCase executed for device {device_id}")
+        return self.repository.list_for_device(device_id, limit=limit)
+
+
+class LoadInspectionHistoryUseCase:
+    """Load the latest inspections for many devices at once (Berichte, PDFs, Protokolle)"""
+    def __init__(self, repository: InspectionRepository):
+        self.repository = repository
+        self.logger = LoggerService()
+    
+    def execute(self, device_ids: Sequence[int], per_device: int = 5) -> Dict[int, List[Inspection]]:
+        self.logger.debug(f"LoadInspectionHistoryUseCase executed for {len(device_ids)} devices",
+                          per_device=per_device)
+        return self.repository.list_for_devices(device_ids, per_device=per_device)
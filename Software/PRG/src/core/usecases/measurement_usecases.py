@@ -0,0 +1,68 @@
+"""Measurement Use Cases - Messwert-Zeitreihe und Drift-Analyse"""
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+from src.core.domain.measurement import METRIC_CODES, Measurement, MetricTrend
+from src.core.ports.measurement_repository import MeasurementRepository
+from src.adapters.services.logger_service import LoggerService
+
+
+# Standard-Horizont der Drift-Analyse: Grenzwert innerhalb von zwei Prüfintervallen
+DEFAULT_HORIZON_YEARS = 2.0
+
+
+def _validate_metric(metric: Optional[str]) -> None:
+    if metric is not None and metric not in METRIC_CODES:
+        raise ValueError(f"metric must be one of {list(METRIC_CODES)}, got '{metric}'")
+
+
+class ListMeasurementsUseCase:
+    """Measurement series of one device, grouped by metric"""
+    def __init__(self, repository: MeasurementRepository):
+        self.repository = repository
+        self.logger = LoggerService()
+
+    def execute(self, device_id: int, metric: Optional[str] = None,
+                since: Optional[datetime] = None) -> Dict[str, List[Measurement]]:
+        self.logger.debug(f"ListMeasurementsUseCase executed for device {device_id}", metric=metric)
+        _validate_metric(metric)
+        series: Dict[str, List[Measurement]] = {}
+        for measurement in self.repository.get_series(device_id, metric=metric, since=since):
+            series.setdefault(measurement.metric, []).append(measurement)
+        return series
+
+
+class AnalyzeMeasurementDriftUseCase:
+    """Find devices whose measurements drift toward their DGUV V3 limit
+
+    Die Trends (erster/letzter Wert, Regressionssteigung) werden in einer
+    Aggregat-Abfrage in der Datenbank berechnet; hier wird nur noch gegen
+    Grenzwert und Horizont bewertet und nach Dringlichkeit sortiert.
+    """
+    def __init__(self, repository: MeasurementRepository):
+        self.repository = repository
+        self.logger = LoggerService()
+
+    def execute(self, customer: Optional[str] = None, metric: Optional[str] = None,
+                since: Optional[datetime] = None, horizon_years: float = DEFAULT_HORIZON_YEARS,
+                min_samples: int = 3, only_degrading: bool = True,
+                device_ids: Sequence[int] = ()) -> List[MetricTrend]:
+        self.logger.debug("AnalyzeMeasurementDriftUseCase executed", customer=customer, metric=metric)
+        _validate_metric(metric)
+        if min_samples < 2:
+            raise ValueError("min_samples must be at least 2")
+        if horizon_years <= 0:
+            raise ValueError("horizon_years must be positive")
+
+        trends = self.repository.get_trends(customer=customer, device_ids=device_ids, metric=metric,
+                                            since=since, min_samples=min_samples)
+        if only_degrading:
+            trends = [trend for trend in trends if trend.is_degrading(horizon_years)]
+
+        def urgency(trend: MetricTrend):
+            years = trend.years_to_limit()
+            return (years is None, years if years is not None else 0.0,
+                    -abs(trend.slope_per_year or 0.0), trend.device_id)
+
+        trends.sort(key=urgency)
+        self.logger.info(f"Drift analysis: {len(trends)} trends", only_degrading=only_degrading)
+        return trends
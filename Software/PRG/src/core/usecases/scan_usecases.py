@@ -0,0 +1,120 @@
+"""Scan Use Cases - QR-Scans ohne Datenbankzugriff pro Scan auflösen"""
+import time
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Callable, Dict, Optional, Tuple
+from src.core.domain.device import Device
+from src.core.domain.device_query import ChangeMarker
+from src.core.domain.scan import DeviceCard, parse_qr_payload
+from src.core.ports.device_repository import DeviceRepository
+from src.adapters.services.logger_service import LoggerService
+
+
+@dataclass
+class _ScanIndex:
+    """Gerätekarten eines Kunden (customer_device_id -> Karte)"""
+    marker: ChangeMarker
+    checked_at: float
+    cards: Dict[str, DeviceCard] = field(default_factory=dict)
+    # Geräte-id -> customer_device_id (für geänderte IDs bei inkrementeller Aktualisierung)
+    identifiers: Dict[int, str] = field(default_factory=dict)
+
+
+class ResolveScanUseCase:
+    """Resolve a scanned QR payload to a device card from a per-customer in-memory index
+
+    Der Index eines Kunden wird beim ersten Scan aufgebaut und danach höchstens
+    alle `ttl` Sekunden gegen den Änderungsstand (COUNT/MAX(updated_at))
+    geprüft - Scans dazwischen kosten keinen Datenbankzugriff. Geänderte
+    Geräte werden inkrementell übernommen; weicht die Anzahl ab (gelöschte
+    oder umgehängte Geräte), wird der Index neu aufgebaut. Solange der Stand
+    nicht `settled` ist (letzte Änderung in der Sekunde der Prüfung), wird die
+    letzte Sekunde bei jeder Prüfung erneut gelesen. Ein unbekanntes
+    Gerät löst sofort eine Prüfung aus (gerade angelegte Geräte).
+
+    Prüfung und Aufbau laufen unter einer Sperre pro Kunde: ein kalter Index
+    blockiert nur Scans desselben Kunden.
+    """
+    def __init__(self, repository: DeviceRepository, ttl: float = 2.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.repository = repository
+        self.ttl = ttl
+        self.clock = clock
+        self._indexes: Dict[str, _ScanIndex] = {}
+        self._locks: Dict[str, Lock] = {}
+        # Schützt nur das Anlegen der Sperren pro Kunde
+        self._lock = Lock()
+        self.logger = LoggerService()
+
+    def execute(self, payload: str) -> Optional[DeviceCard]:
+        """Gerätekarte zum QR-Inhalt (None wenn unbekannt)
+
+        Raises:
+            ValueError: Bei leerem oder ungültigem Inhalt
+        """
+        customer, customer_device_id = parse_qr_payload(payload)
+        if customer is None:
+            # Alte QR-Codes ohne Kunde: direkt über den eindeutigen Schlüssel
+            device = self.repository.get_by_customer_device_id(customer_device_id)
+            return DeviceCard.from_device(device) if device is not None else None
+
+        with self._customer_lock(customer):
+            index, validated = self._index(customer, force=False)
+            card = index.cards.get(customer_device_id) if index is not None else None
+            if card is None and index is not None and not validated:
+                index, _ = self._index(customer, force=True)
+                card = index.cards.get(customer_device_id) if index is not None else None
+            return card
+
+    def _customer_lock(self, customer: str) -> Lock:
+        """Sperre für Index-Prüfung und -Aufbau eines Kunden"""
+        with self._lock:
+            lock = self._locks.get(customer)
+            if lock is None:
+                lock = self._locks[customer] = Lock()
+            return lock
+
+    def _index(self, customer: str, force: bool) -> Tuple[Optional[_ScanIndex], bool]:
+        """Index des Kunden, bei Bedarf geprüft/aktualisiert; (Index, jetzt geprüft)"""
+        now = self.clock()
+        index = self._indexes.get(customer)
+        if index is not None and not force and now - index.checked_at < self.ttl:
+            return index, False
+
+        marker = self.repository.get_change_marker(customer)
+        if marker.count == 0:
+            self._indexes.pop(customer, None)
+            return None, True
+        if index is not None and index.marker.state == marker.state and index.marker.settled:
+            index.checked_at = now
+            return index, True
+        index = self._refresh(customer, index, marker, now)
+        self._indexes[customer] = index
+        return index, True
+
+    def _refresh(self, customer: str, index: Optional[_ScanIndex],
+                 marker: ChangeMarker, now: float) -> _ScanIndex:
+        if index is not None and index.marker.changed_at is not None:
+            changed = self.repository.get_changed_since(customer, index.marker.changed_at)
+            cards = dict(index.cards)
+            identifiers = dict(index.identifiers)
+            for device in changed:
+                previous = identifiers.get(device.id)
+                if previous is not None and previous != device.customer_device_id:
+                    cards.pop(previous, None)
+                self._add(cards, identifiers, device)
+            if len(identifiers) == marker.count:
+                self.logger.debug(f"Scan index updated incrementally for {customer}", changed=len(changed))
+                return _ScanIndex(marker=marker, checked_at=now, cards=cards, identifiers=identifiers)
+
+        rebuilt = _ScanIndex(marker=marker, checked_at=now)
+        for device in self.repository.get_changed_since(customer):
+            self._add(rebuilt.cards, rebuilt.identifiers, device)
+        self.logger.debug(f"Scan index rebuilt for {customer}", devices=len(rebuilt.identifiers))
+        return rebuilt
+
+    @staticmethod
+    def _add(cards: Dict[str, DeviceCard], identifiers: Dict[int, str], device: Device) -> None:
+        identifiers[device.id] = device.customer_device_id
+        if device.customer_device_id:
+            cards[device.customer_device_id] = DeviceCard.from_device(device)
@@ -1,18 +1,44 @@
+import os
 import sys
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import timedelta
+from threading import Thread
 
 # Füge das Projektverzeichnis zum Python-Pfad hinzu BEVOR Module importiert werden
 project_root = Path(__file__).parent.parent
 if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
+import click
 from flask import Flask, render_template, request, jsonify, url_for
 from src.config.settings import get_config
 from src.config.dependencies import container
 from src.adapters.web.routes.device_routes import device_bp
-from src.adapters.services.qr_code_generator import QRCodeGenerator
+from src.adapters.web.routes.export_routes import export_bp
+from src.adapters.web.routes.calendar_routes import calendar_bp
+from src.adapters.web.routes.qr_routes import qr_bp
+from src.adapters.web.routes.scan_routes import scan_bp
+from src.adapters.web.routes.pdf_job_routes import pdf_jobs_bp
+from src.adapters.cli import register_commands
+from src.adapters.web.presenters import FastJSONProvider, qr_data_uri, qr_image_url
 from src.core.domain.device import Device
+from src.core.domain.device_query import DeviceQuery
+from src.core.domain.inspection import Inspection
+from src.core.domain import dates
+
+def _start_qr_warm_up():
+    """QR-Artefakte aller Geräte im Hintergrund vorrendern (nur mit QR_STORE_DIR)
+
+    Jeder Gunicorn-Worker startet den Thread, die Dateisperre im Use Case lässt
+    aber nur einen Worker tatsächlich arbeiten. Nur für den Webserver: unter der
+    Flask-CLI (backfill-qr, pdf-worker, ...) läuft create_app im Click-Kontext,
+    dort würde der Thread neben den Prozess-Pools der Befehle rendern.
+    """
+    if not os.getenv('QR_STORE_DIR') or os.getenv('QR_STORE_WARMUP', '1') == '0':
+        return
+    if click.get_current_context(silent=True) is not None:
+        return
+    Thread(target=container.warm_up_qr_store_usecase.execute, name='qr-warm-up', daemon=True).start()
 
 def create_app():
     app = Flask(__name__, 
@@ -21,7 +47,20 @@ def create_app():
     
     config = get_config()
     app.config.from_object(config)
+    # Schneller JSON-Encoder für alle jsonify()-Antworten (date/datetime/Decimal nativ)
+    app.json = FastJSONProvider(app)
+    # Gespeicherte QR-Codes als Data-URI rendern (ohne QR-Encoder)
+    app.add_template_filter(qr_data_uri, 'qr_data_uri')
+    # QR-Codes als eigene, cachebare Bilder referenzieren (/qr/<id>.svg)
+    app.add_template_filter(qr_image_url, 'qr_url')
     app.register_blueprint(device_bp)
+    app.register_blueprint(export_bp)
+    app.register_blueprint(calendar_bp)
+    app.register_blueprint(qr_bp)
+    app.register_blueprint(scan_bp)
+    app.register_blueprint(pdf_jobs_bp)
+    register_commands(app)
+    _start_qr_warm_up()
 
     # ========================================================================
     # ANCHOR: DASHBOARD - INDEX
@@ -37,8 +76,8 @@ def create_app():
     def index():
         """Dashboard mit Statistiken und Kreisdiagramm"""
         try:
-            # Hole alle Geräte
-            devices_list = container.list_devices_usecase.execute()
+            # Hole alle Geräte (explizite Spaltenliste, ohne qr_code BLOB)
+            devices_list = container.list_devices_usecase.execute(DeviceQuery(sort=('-id',)))
             
             # Berechne Statistiken
             total_devices = len(devices_list)
@@ -50,25 +89,17 @@ def create_app():
             active_devices = 0
             maintenance_devices = 0
             retired_devices = 0
-            three_months_ago = datetime.now() - timedelta(days=90)          
+            # Datumswerte sind bereits im Repository normalisiert (date / aware datetime)
+            current_date = dates.today()
+            three_months_ago = dates.now() - timedelta(days=90)
             for device in devices_list:
                 # Zähle überfällige Prüfungen
-                if device.next_inspection:
-                    try:
-                        next_insp = datetime.fromisoformat(str(device.next_inspection))
-                        if next_insp < datetime.now():
-                            overdue += 1
-                    except:
-                        pass
+                if device.is_overdue(current_date):
+                    overdue += 1
                 
                 # Zähle Prüfungen in letzten 3 Monaten
-                if device.last_inspection:
-                    try:
-                        last_insp = datetime.fromisoformat(str(device.last_inspection))
-                        if last_insp > three_months_ago:
-                            recent_inspections += 1
-                    except:
-                        pass
+                if device.inspected_since(three_months_ago):
+                    recent_inspections += 1
                 
                 # Zähle Geräte nach Status
                 if device.status == 'active':
@@ -106,33 +137,16 @@ def create_app():
     # ========================================================================
     # ANCHOR: GERÄTELISTE
     # Hauptaufgabe: Alle Geräte mit QR-Codes anzeigen
-    # - Lade alle Geräte aus der Datenbank
-    # - Generiere QR-Code für jedes Gerät
+    # - Lade alle Geräte aus der Datenbank (ohne QR-Code-Spalte)
+    # - QR-Codes als Bild-URLs (/qr/<id>.svg), vom Browser verzögert geladen und gecacht
     # - Zeige in Tabellenformat mit Suchfunktion
     # ========================================================================
     @app.route('/devices')
     def devices():
         """Geräteliste mit QR-Codes und Suchfunktion"""
         try:
-            # Hole alle Geräte aus der Datenbank
-            devices_list = container.list_devices_usecase.execute()
-            
-            # Generiere QR-Codes für jedes Gerät
-            for device in devices_list:
-                try:
-                    # Generiere QR-Code basierend auf customer_device_id
-                    qr_code_data = QRCodeGenerator.generate_qr_code(
-                        device_id=device.customer_device_id,
-                        customer=device.customer
-                    )
-                    # Konvertiere zu String für HTML
-                    if qr_code_data:
-                        device.qr_code = f"data:image/svg+xml;base64,{qr_code_data.decode('utf-8')}"
-                    else:
-                        device.qr_code = None
-                except Exception as e:
-                    print(f"Error generating QR code for {device.customer_device_id}: {e}")
-                    device.qr_code = None
+            # Hole alle Geräte aus der Datenbank (Spaltenliste ohne qr_code-BLOB)
+            devices_list = container.list_devices_usecase.execute(DeviceQuery())
             
             return render_template('devices.html', devices=devices_list)
         except Exception as e:
@@ -142,9 +156,8 @@ def create_app():
     # ========================================================================
     # ANCHOR: GERÄTEDETAILS
     # Hauptaufgabe: Detaillierte Informationen zu einem spezifischen Gerät
-    # - Lade Gerätedaten nach ID
-    # - Generiere QR-Code
-    # - Zeige Inspektionshistorie
+    # - Lade Gerätedaten nach ID (inkl. gespeichertem QR-Code)
+    # - Zeige Inspektionshistorie aus der inspections-Tabelle
     # ========================================================================
     @app.route('/device/<int:device_id>')
     def device_detail(device_id):
@@ -152,18 +165,8 @@ def create_app():
         try:
             device = container.device_repository.get_by_id(device_id)
             if device:
-                # Generiere QR-Code
-                qr_code_data = QRCodeGenerator.generate_qr_code(
-                    device_id=device.customer_device_id,
-                    customer=device.customer
-                )
-                if qr_code_data:
-                    device.qr_code = f"data:image/svg+xml;base64,{qr_code_data.decode('utf-8')}"
-                else:
-                    device.qr_code = None
-                
-                # Hole Inspektionen (placeholder)
-                inspections = []
+                # Prüfhistorie (neueste zuerst, Index idx_device_date)
+                inspections = container.list_inspections_usecase.execute(device.id)
                 return render_template('device_detail.html', device=device, inspections=inspections)
             else:
                 return render_template('error.html', error='Device nicht gefunden'), 404
@@ -296,32 +299,46 @@ def create_app():
                 notes=data.get('notes')
             )
             
-            # Speichere Gerät in Datenbank
-            saved_device = container.device_repository.create(device)
+            # Speichere Gerät in Datenbank (Use Case erzeugt ID und QR-Code)
+            saved_device = container.create_device_usecase.execute(device)
             
             print(f"✓ Gerät erstellt: {saved_device.name} (ID: {saved_device.customer_device_id})")
             if data.get('cable_type'):
                 print(f"  USB-Inspektion: {data['cable_type']} - {data['test_result']}")
             
-            # TODO: Speichere USB-Inspektionsdaten wenn vorhanden
-            # if data.get('cable_type') and data.get('test_result'):
-            #     inspection = container.create_inspection_usecase.execute({
-            #         'device_id': saved_device.id,
-            #         'cable_type': data['cable_type'],
-            #         'test_result': data['test_result'],
-            #         'internal_resistance': data.get('internal_resistance'),
-            #         'emarker_active': data.get('emarker_active'),
-            #         'notes': data.get('inspection_notes')
-            #     })
+            # Speichere USB-Inspektion als Eintrag der Prüfhistorie (aktualisiert
+            # last_inspection/next_inspection/Status in derselben Transaktion).
+            # Das Gerät ist zu diesem Zeitpunkt bereits gespeichert: ein Fehler
+            # hier ergibt trotzdem 201 mit der Geräte-ID, damit der Client die
+            # Prüfung nachträgt statt das Gerät erneut anzulegen.
+            inspection_error = None
+            if data.get('cable_type') and data.get('test_result'):
+                try:
+                    container.record_inspection_usecase.execute(Inspection.from_usb_test(
+                        device_id=saved_device.id,
+                        test_result=data['test_result'],
+                        inspection_date=data.get('last_inspection'),
+                        cable_type=data['cable_type'],
+                        internal_resistance=data.get('internal_resistance'),
+                        emarker_active=data.get('emarker_active'),
+                        notes=data.get('inspection_notes')
+                    ), next_inspection=dates.normalize_date(data.get('next_inspection')))
+                except Exception as e:
+                    print(f"✗ Fehler beim Speichern der USB-Inspektion: {e}")
+                    inspection_error = str(e)
             
-            return jsonify({
+            response = {
                 'status': 'success',
                 'message': 'Gerät erfolgreich gespeichert',
                 'device_id': saved_device.id,
                 'device_name': saved_device.name,
                 'customer_device_id': saved_device.customer_device_id,
                 'device_status': device_status
-            }), 201
+            }
+            if inspection_error is not None:
+                response['message'] = 'Gerät gespeichert, USB-Inspektion fehlgeschlagen'
+                response['inspection_error'] = inspection_error
+            return jsonify(response), 201
             
         except Exception as e:
             print(f"✗ Fehler beim Speichern des Geräts: {e}")
@@ -375,28 +392,29 @@ def create_app():
                                 'message': 'Erforderliche Felder fehlen: cable_type, test_result'
                             }), 400
                         
-                        # TODO: Speichere Inspektionsdaten
-                        # inspection = container.create_inspection_usecase.execute({
-                        #     'device_id': device_id,
-                        #     'cable_type': inspection_data['cable_type'],
-                        #     'test_result': inspection_data['test_result'],
-                        #     'internal_resistance': inspection_data.get('internal_resistance'),
-                        #     'emarker_active': inspection_data.get('emarker_active'),
-                        #     'notes': inspection_data.get('notes')
-                        # })
-                        
-                        # Aktualisiere Gerätestatus basierend auf Inspektionsergebnis
-                        if inspection_data['test_result'] == 'bestanden':
-                            device.status = 'active'
-                        else:
-                            device.status = 'maintenance'
-                        
-                        # TODO: Speichere aktualisiertes Gerät
-                        # container.device_repository.update(device)
+                        # Prüfung anhängen und Gerät (Termine, Status) in einer Transaktion aktualisieren
+                        try:
+                            inspection = Inspection.from_usb_test(
+                                device_id=device_id,
+                                test_result=inspection_data['test_result'],
+                                cable_type=inspection_data['cable_type'],
+                                internal_resistance=inspection_data.get('internal_resistance'),
+                                emarker_active=inspection_data.get('emarker_active'),
+                                inspector=inspection_data.get('inspector'),
+                                notes=inspection_data.get('notes')
+                            )
+                        except ValueError as e:
+                            return jsonify({
+                                'status': 'error',
+                                'message': str(e)
+                            }), 400
+                        inspection = container.record_inspection_usecase.execute(inspection)
                         
                         return jsonify({
                             'status': 'success',
-                            'message': 'Inspektion erfolgreich gespeichert'
+                            'message': 'Inspektion erfolgreich gespeichert',
+                            'inspection_id': inspection.id,
+                            'result': inspection.result
                         }), 201
                     except Exception as e:
                         return jsonify({
@@ -429,6 +447,31 @@ def create_app():
             print(f"Error loading schutzklasse page: {e}")
             return render_template('schutzklasse.html', error=str(e))
 
+    # ========================================================================
+    # ANCHOR: PRÜFROUTE
+    # Hauptaufgabe: Druckbare Arbeitsliste für die Begehung beim Kunden
+    # - Fällige Geräte eines Kunden (eine Abfrage)
+    # - Gruppiert nach Standort-Hierarchie ("Berlin - Büro - MB1"), pro Raum
+    # ========================================================================
+    @app.route('/route-plan')
+    def route_plan():
+        """Prüfroute pro Raum (Druckansicht)"""
+        customer = request.args.get('customer', '').strip()
+        try:
+            within_days = int(request.args.get('within') or 30)
+        except ValueError:
+            within_days = 30
+        context = {'customer': customer, 'within_days': within_days, 'plan': None, 'today': dates.today()}
+        if not customer:
+            return render_template('route_plan.html', **context)
+        try:
+            context['plan'] = container.plan_inspection_route_usecase.execute(customer, within_days)
+            return render_template('route_plan.html', **context)
+        except ValueError as e:
+            return render_template('route_plan.html', error=str(e), **context), 400
+        except Exception as e:
+            return render_template('error.html', error=str(e)), 500
+
     return app
 
 if __name__ == '__main__':
@@ -0,0 +1,166 @@
+"""Tests für die Massenanlage von Geräten (CreateDevicesUseCase / create_many)"""
+import pytest
+import json
+from unittest.mock import Mock, patch
+from mysql.connector import Error
+from src.main import create_app
+from src.core.domain.device import Device
+from src.core.domain.bulk_result import BulkCreateResult, BulkItemError
+from src.core.usecases.device_usecases import CreateDevicesUseCase
+from src.adapters.persistence.mysql_device_repository import MySQLDeviceRepository
+
+
+def _devices(count, customer="Parloa"):
+    return [Device(name=f"Gerät {i}", customer=customer, type="Elektrowerkzeug") for i in range(count)]
+
+
+class TestCreateDevicesUseCase:
+    """Tests für CreateDevicesUseCase"""
+
+    def test_reserves_one_block_per_customer(self):
+        """Test: Ein ID-Block pro Kunde statt einer Abfrage pro Gerät"""
+        repository = Mock()
+        repository.reserve_customer_device_ids.side_effect = \
+            lambda customer, count: [f"{customer}-{n:05d}" for n in range(1, count + 1)]
+        repository.create_many.return_value = {}
+        devices = _devices(3) + _devices(2, customer="Miro")
+
+        result = CreateDevicesUseCase(repository).execute(devices)
+
+        assert repository.reserve_customer_device_ids.call_count == 2
+        assert [d.customer_device_id for d in result.created] == [
+            "Parloa-00001", "Parloa-00002", "Parloa-00003", "Miro-00001", "Miro-00002"
+        ]
+        assert all(d.qr_code for d in result.created)
+        assert result.success is True
+
+    def test_reports_per_item_errors_without_aborting(self):
+        """Test: Fehler eines Geräts brechen die Anlage der anderen nicht ab"""
+        repository = Mock()
+        repository.reserve_customer_device_ids.return_value = ["Parloa-00001", "Parloa-00002", "Parloa-00003"]
+        repository.create_many.return_value = {1: "Duplicate entry 'SN1'"}
+
+        result = CreateDevicesUseCase(repository).execute(_devices(3))
+
+        assert len(result.created) == 2
+        assert result.errors[0].index == 1
+        assert result.errors[0].customer_device_id == "Parloa-00002"
+
+    def test_reservation_failure_marks_customer_items(self):
+        """Test: Fehlgeschlagene ID-Reservierung betrifft nur diesen Kunden"""
+        repository = Mock()
+        repository.reserve_customer_device_ids.side_effect = \
+            lambda customer, count: (_ for _ in ()).throw(RuntimeError("DB down")) if customer == "Miro" \
+            else [f"{customer}-00001"]
+        repository.create_many.return_value = {}
+
+        result = CreateDevicesUseCase(repository).execute(_devices(1) + _devices(1, customer="Miro"))
+
+        assert [d.customer for d in result.created] == ["Parloa"]
+        assert result.errors[0].index == 1
+
+
+class TestRepositoryCreateMany:
+    """Tests für MySQLDeviceRepository.create_many"""
+
+    @patch('src.adapters.persistence.mysql_device_repository.mysql.connector.connect')
+    def test_failed_batch_is_retried_row_by_row(self, mock_connect):
+        """Test: Fehlerhafter Batch wird zurückgerollt und zeilenweise wiederholt"""
+        cursor = Mock()
+        cursor.executemany.side_effect = Error("Duplicate entry")
+        cursor.execute.side_effect = [None, Error("Duplicate entry 'SN1'"), None]
+        cursor.fetchall.return_value = []
+        mock_connect.return_value.cursor.return_value = cursor
+        repository = MySQLDeviceRepository('localhost', 3306, 'test', 'test', 'test_db')
+        devices = _devices(2)
+        devices[0].customer_device_id, devices[1].customer_device_id = "Parloa-00001", "Parloa-00002"
+
+        errors = repository.create_many(devices, batch_size=10)
+
+        assert list(errors) == [1]
+        assert mock_connect.return_value.rollback.call_count == 2
+
+
+class TestReserveCustomerDeviceIds:
+    """Tests für MySQLDeviceRepository.reserve_customer_device_ids"""
+
+    @patch('src.adapters.persistence.mysql_device_repository.mysql.connector.connect')
+    def test_block_is_taken_from_locked_counter(self, mock_connect):
+        """Test: Zählerzeile wird gesperrt und in derselben Transaktion hochgezählt"""
+        cursor = Mock()
+        cursor.fetchone.side_effect = [(7,), (5,)]
+        mock_connect.return_value.cursor.return_value = cursor
+        repository = MySQLDeviceRepository('localhost', 3306, 'test', 'test', 'test_db')
+
+        ids = repository.reserve_customer_device_ids("Parloa", 3)
+
+        assert ids == ["Parloa-00008", "Parloa-00009", "Parloa-00010"]
+        statements = [call[0][0] for call in cursor.execute.call_args_list]
+        assert statements[0].startswith("INSERT IGNORE INTO customer_device_counters")
+        assert statements[1].endswith("FOR UPDATE")
+        assert cursor.execute.call_args_list[3][0] == (
+            "UPDATE customer_device_counters SET last_number = %s WHERE customer = %s", (10, "Parloa")
+        )
+        mock_connect.return_value.start_transaction.assert_called_once()
+        assert mock_connect.return_value.commit.call_count == 2
+
+    @patch('src.adapters.persistence.mysql_device_repository.mysql.connector.connect')
+    def test_manually_assigned_ids_are_skipped(self, mock_connect):
+        """Test: Höhere manuell vergebene Nummern haben Vorrang vor dem Zähler"""
+        cursor = Mock()
+        cursor.fetchone.side_effect = [(2,), (40,)]
+        mock_connect.return_value.cursor.return_value = cursor
+        repository = MySQLDeviceRepository('localhost', 3306, 'test', 'test', 'test_db')
+
+        assert repository.reserve_customer_device_ids("Parloa", 1) == ["Parloa-00041"]
+
+    @patch('src.adapters.persistence.mysql_device_repository.mysql.connector.connect')
+    def test_failed_reservation_is_rolled_back(self, mock_connect):
+        """Test: Fehler im Zähler-Update rollt zurück und wird weitergegeben"""
+        cursor = Mock()
+        cursor.fetchone.side_effect = [(2,), (2,)]
+        cursor.execute.side_effect = [None, None, None, Error("Lock wait timeout")]
+        mock_connect.return_value.cursor.return_value = cursor
+        repository = MySQLDeviceRepository('localhost', 3306, 'test', 'test', 'test_db')
+
+        with pytest.raises(Error):
+            repository.reserve_customer_device_ids("Parloa", 1)
+        mock_connect.return_value.rollback.assert_called_once()
+        mock_connect.return_value.close.assert_called_once()
+
+
+class TestBulkRoute:
+    """Tests für POST /api/devices/bulk"""
+
+    @pytest.fixture
+    def client(self):
+        app = create_app()
+        app.config['TESTING'] = True
+        return app.test_client()
+
+    def test_invalid_items_are_reported_with_original_index(self, client):
+        """Test: Validierungsfehler und DB-Fehler behalten den Index der Eingabe"""
+        created = Device(id=5, name="B", customer="Parloa", customer_device_id="Parloa-00005")
+        with patch('src.config.dependencies.container.create_devices_usecase.execute') as mock_execute:
+            mock_execute.return_value = BulkCreateResult(
+                created=[created],
+                errors=[BulkItemError(1, "Duplicate entry", "Parloa-00006")]
+            )
+
+            response = client.post('/api/devices/bulk', json={'devices': [
+                {'customer': 'Parloa', 'name': '', 'type': 'X'},
+                {'customer': 'Parloa', 'name': 'B', 'type': 'X'},
+                {'customer': 'Parloa', 'name': 'C', 'type': 'X'},
+            ]})
+
+            assert response.status_code == 207
+            data = json.loads(response.data)
+            assert [e['index'] for e in data['errors']] == [0, 2]
+            assert data['created'][0]['customer_device_id'] == "Parloa-00005"
+            assert len(mock_execute.call_args[0][0]) == 2
+
+    def test_empty_list_returns_400(self, client):
+        """Test: Leere Liste ergibt 400"""
+        response = client.post('/api/devices/bulk', json={'devices': []})
+
+        assert response.status_code == 400
@@ -0,0 +1,195 @@
+"""Tests für den iCalendar-Feed der Prüftermine"""
+import pytest
+from datetime import date, datetime, timedelta
+from unittest.mock import Mock, patch
+from src.main import create_app
+from src.core.domain.calendar_feed import CalendarFeed, device_event, location_day_events
+from src.core.domain.device import Device
+from src.core.domain.device_query import ChangeMarker
+from src.core.usecases.calendar_usecases import CalendarFeedUseCase
+from src.adapters.persistence.mysql_device_repository import MySQLDeviceRepository
+from src.adapters.web.presenters import render_ics
+
+
+def _marker(count, changed_at, observed_after=timedelta(seconds=5)):
+    return ChangeMarker(count, changed_at, changed_at + observed_after if changed_at else None)
+
+
+def _device(device_id, next_inspection=date(2025, 3, 10), location="Berlin - Büro - MB1", status='active'):
+    return Device(id=device_id, name=f"Gerät {device_id}", customer="Parloa", location=location,
+                  customer_device_id=f"Parloa-{device_id:05d}", status=status,
+                  next_inspection=next_inspection)
+
+
+class TestCalendarEvents:
+    """Tests für Termine und ICS-Ausgabe"""
+
+    def test_device_event_only_for_planned_due_devices(self):
+        """Test: Termin nur mit nächster Prüfung und aktivem Status"""
+        event = device_event(_device(1))
+
+        assert event.uid.startswith('device-1@')
+        assert event.day == date(2025, 3, 10)
+        assert device_event(_device(2, next_inspection=None)) is None
+        assert device_event(_device(3, status='retired')) is None
+
+    def test_location_day_groups_by_site_and_day(self):
+        """Test: Sammeltermin pro Standort (oberste Ebene) und Tag"""
+        events = [device_event(d) for d in (
+            _device(1), _device(2, location="Berlin - Lager"),
+            _device(3, location="Hamburg"), _device(4, next_inspection=date(2025, 3, 11))
+        )]
+
+        merged = {(e.location, e.day): e for e in location_day_events("Parloa", events)}
+
+        assert merged[("Berlin", date(2025, 3, 10))].summary == "Prüfung Berlin: 2 Geräte"
+        assert len(merged) == 3
+
+    def test_render_ics_escapes_and_folds(self):
+        """Test: RFC 5545 - CRLF, Escaping, Zeilen max. 75 Oktette, Ganztagstermin"""
+        device = _device(1)
+        device.name = "Verlängerung; 3-fach, " + "sehr lang " * 10
+        feed = CalendarFeed(customer="Parloa", mode='device', events=[device_event(device)],
+                            changed_at=datetime(2025, 1, 2, 3, 4, 5))
+
+        body = render_ics(feed)
+        lines = body.split(b'\r\n')
+
+        assert lines[0] == b'BEGIN:VCALENDAR'
+        assert all(len(line) <= 75 for line in lines)
+        assert b'DTSTART;VALUE=DATE:20250310' in body
+        assert b'DTEND;VALUE=DATE:20250311' in body
+        assert b'DTSTAMP:20250102T030405Z' in body
+        unfolded = body.replace(b'\r\n ', b'')
+        assert 'Verlängerung\\; 3-fach\\,'.encode('utf-8') in unfolded
+
+
+class TestCalendarFeedUseCase:
+    """Tests für den inkrementell gepflegten Feed"""
+
+    @pytest.fixture
+    def repository(self):
+        repository = Mock()
+        repository.get_change_marker.return_value = _marker(2, datetime(2025, 1, 1, 12, 0))
+        repository.get_changed_since.return_value = [_device(1), _device(2)]
+        return repository
+
+    def test_unchanged_marker_serves_cached_feed(self, repository):
+        """Test: Gleicher Änderungsstand -> keine Geräteabfrage, gleicher ETag"""
+        usecase = CalendarFeedUseCase(repository, render=render_ics)
+
+        first = usecase.execute("Parloa")
+        second = usecase.execute("Parloa")
+
+        assert second is first
+        assert repository.get_changed_since.call_count == 1
+        assert repository.get_change_marker.call_count == 2
+        assert len(first.events) == 2
+
+    def test_loads_only_changed_devices(self, repository):
+        """Test: Neuer Stand -> nur geänderte Geräte ab letztem Stand laden"""
+        usecase = CalendarFeedUseCase(repository, render=render_ics)
+        first = usecase.execute("Parloa")
+
+        repository.get_change_marker.return_value = _marker(2, datetime(2025, 1, 1, 13, 0))
+        repository.get_changed_since.return_value = [_device(2, next_inspection=date(2025, 4, 1))]
+        second = usecase.execute("Parloa")
+
+        repository.get_changed_since.assert_called_with("Parloa", datetime(2025, 1, 1, 12, 0))
+        assert sorted(e.day for e in second.events) == [date(2025, 3, 10), date(2025, 4, 1)]
+        assert second.etag != first.etag
+
+    def test_change_in_same_second_is_picked_up(self, repository):
+        """Test: Aufbau in derselben Sekunde wie die letzte Änderung -> letzte Sekunde erneut lesen"""
+        changed_at = datetime(2025, 1, 1, 12, 0, 0)
+        repository.get_change_marker.return_value = _marker(2, changed_at, timedelta(milliseconds=300))
+        usecase = CalendarFeedUseCase(repository, render=render_ics)
+        first = usecase.execute("Parloa")
+
+        # Zweite Änderung in derselben Sekunde: Marker bleibt gleich
+        repository.get_change_marker.return_value = _marker(2, changed_at, timedelta(seconds=1, milliseconds=200))
+        repository.get_changed_since.return_value = [_device(2, next_inspection=date(2025, 4, 1))]
+        second = usecase.execute("Parloa")
+        third = usecase.execute("Parloa")
+
+        repository.get_changed_since.assert_called_with("Parloa", changed_at)
+        assert sorted(e.day for e in second.events) == [date(2025, 3, 10), date(2025, 4, 1)]
+        assert second.etag != first.etag
+        assert third is second
+        assert repository.get_changed_since.call_count == 2
+
+    def test_deleted_device_triggers_full_rebuild(self, repository):
+        """Test: Weniger Geräte als im Cache -> vollständiger Neuaufbau"""
+        usecase = CalendarFeedUseCase(repository, render=render_ics)
+        usecase.execute("Parloa")
+
+        repository.get_change_marker.return_value = _marker(1, datetime(2025, 1, 1, 12, 0))
+        repository.get_changed_since.side_effect = [[], [_device(1)]]
+        feed = usecase.execute("Parloa")
+
+        assert repository.get_changed_since.call_args_list[-1][0] == ("Parloa",)
+        assert [e.uid for e in feed.events] == ['device-1@benning-device-manager']
+
+    def test_unknown_customer_and_invalid_mode(self, repository):
+        """Test: Kunde ohne Geräte -> None, ungültiger Modus -> ValueError"""
+        usecase = CalendarFeedUseCase(repository, render=render_ics)
+        with pytest.raises(ValueError):
+            usecase.execute("Parloa", mode='week')
+        repository.get_change_marker.return_value = _marker(0, None)
+        assert usecase.execute("Unbekannt") is None
+
+
+class TestChangeMarker:
+    """Tests für den Änderungsstand"""
+
+    def test_settled_only_after_the_second_has_passed(self):
+        """Test: Stand gilt erst als stabil, wenn die DB-Zeit in einer späteren Sekunde lag"""
+        changed_at = datetime(2025, 1, 1, 12, 0, 0)
+
+        assert _marker(2, changed_at, timedelta(milliseconds=900)).settled is False
+        assert _marker(2, changed_at, timedelta(seconds=1)).settled is True
+        assert ChangeMarker(2, changed_at).settled is False
+        assert ChangeMarker(0, None).settled is True
+
+    @patch('src.adapters.persistence.mysql_device_repository.mysql.connector.connect')
+    def test_repository_reads_database_time(self, mock_connect):
+        """Test: Marker enthält NOW() der Datenbank"""
+        cursor = mock_connect.return_value.cursor.return_value
+        cursor.fetchone.return_value = (2, datetime(2025, 1, 1, 12, 0), datetime(2025, 1, 1, 12, 5))
+        repository = MySQLDeviceRepository('localhost', 3306, 'test', 'test', 'test_db')
+
+        marker = repository.get_change_marker("Parloa")
+
+        assert "NOW()" in cursor.execute.call_args[0][0]
+        assert marker == ChangeMarker(2, datetime(2025, 1, 1, 12, 0), datetime(2025, 1, 1, 12, 5))
+        assert marker.settled is True
+
+
+class TestCalendarRoute:
+    """Tests für GET /calendar/<kunde>.ics"""
+
+    @pytest.fixture
+    def client(self):
+        app = create_app()
+        app.config['TESTING'] = True
+        return app.test_client()
+
+    def test_etag_and_304(self, client):
+        """Test: ETag wird gesetzt, If-None-Match ergibt 304 ohne Body"""
+        feed = CalendarFeed(customer="Parloa", mode='device', events=[device_event(_device(1))])
+        feed.body = render_ics(feed)
+        feed.etag = 'abc123'
+        with patch('src.config.dependencies.container.calendar_feed_usecase.execute', return_value=feed):
+            response = client.get('/calendar/Parloa.ics')
+            cached = client.get('/calendar/Parloa.ics', headers={'If-None-Match': '"abc123"'})
+
+        assert response.status_code == 200
+        assert response.mimetype == 'text/calendar'
+        assert response.headers['ETag'] == '"abc123"'
+        assert cached.status_code == 304
+        assert cached.data == b''
+
+    def test_unknown_customer_returns_404(self, client):
+        """Test: Kunde ohne Geräte ergibt 404"""
+        with patch('src.config.dependencies.container.calendar_feed_usecase.execute', return_value=None):
+            assert client.get('/calendar/Unbekannt.ics').status_code == 404
@@ -1,7 +1,8 @@
 """Unit Tests für Device Domain Model - Saubere Version"""
 import pytest
-from datetime import datetime
+from datetime import date, datetime
 from src.core.domain.device import Device
+from src.core.domain.dates import APP_TIMEZONE, normalize_datetime
 
 
 class TestDeviceCreation:
@@ -270,3 +271,63 @@ class TestDeviceEdgeCases:
         
         assert device.created_at == original_created
         assert device.updated_at > original_created
+
+
+class TestDeviceInspectionDates:
+    """Tests für kanonische Prüfdaten und Vergleichs-API"""
+
+    def test_dates_are_normalized_on_creation(self):
+        """Test: date/datetime/String werden einmalig kanonisiert"""
+        device = Device(
+            name="Test",
+            customer="Parloa",
+            purchase_date="2023-01-15",
+            last_inspection=datetime(2024, 1, 15, 10, 30),
+            next_inspection=datetime(2025, 1, 15, 0, 0)
+        )
+
+        assert type(device.purchase_date) is date
+        assert device.last_inspection.tzinfo is APP_TIMEZONE
+        assert device.last_inspection.hour == 10
+        assert device.next_inspection == date(2025, 1, 15)
+
+    def test_empty_date_string_becomes_none(self):
+        """Test: Leere Strings werden zu None"""
+        device = Device(name="Test", customer="Parloa", next_inspection="")
+        assert device.next_inspection is None
+
+    def test_invalid_date_string_raises(self):
+        """Test: Ungültiges Datum löst ValueError aus"""
+        with pytest.raises(ValueError):
+            Device(name="Test", customer="Parloa", next_inspection="15.01.2025")
+
+    def test_due_and_overdue(self):
+        """Test: Fälligkeit und Überfälligkeit relativ zu einem Stichtag"""
+        device = Device(name="Test", customer="Parloa", next_inspection=date(2025, 1, 15))
+
+        assert device.is_due_for_inspection(date(2025, 1, 15)) is True
+        assert device.is_overdue(date(2025, 1, 15)) is False
+        assert device.is_overdue(date(2025, 1, 16)) is True
+        assert device.days_until_inspection(date(2025, 1, 10)) == 5
+
+    def test_device_without_next_inspection_is_due(self):
+        """Test: Ohne geplanten Termin ist ein Gerät fällig, aber nicht überfällig"""
+        device = Device(name="Test", customer="Parloa")
+
+        assert device.is_due_for_inspection() is True
+        assert device.is_overdue() is False
+        assert device.days_until_inspection() is None
+
+    def test_inspected_since(self):
+        """Test: Vergleich der letzten Prüfung mit zeitzonenbewusstem Zeitpunkt"""
+        device = Device(name="Test", customer="Parloa", last_inspection="2024-01-15T10:00:00")
+
+        assert device.inspected_since(normalize_datetime("2024-01-01")) is True
+        assert device.inspected_since(normalize_datetime("2024-02-01")) is False
+
+    def test_inspected_since_accepts_naive_datetime(self):
+        """Test: Naive Zeitpunkte werden als lokale Zeit verglichen"""
+        device = Device(name="Test", customer="Parloa", last_inspection="2024-01-15T10:00:00")
+
+        assert device.inspected_since(datetime(2024, 1, 1)) is True
+        assert device.inspected_since(datetime(2024, 1, 15, 10, 0)) is False
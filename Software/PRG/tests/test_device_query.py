@@ -0,0 +1,131 @@
+"""Tests für DeviceQuery und die SQL-Übersetzung im Repository"""
+import pytest
+import json
+from datetime import date
+from unittest.mock import Mock, patch
+from src.main import create_app
+from src.core.domain.device_query import DeviceQuery
+from src.core.usecases.device_usecases import ListDevicesUseCase
+from src.adapters.persistence.mysql_device_repository import MySQLDeviceRepository
+
+
+@pytest.fixture
+def repository():
+    """Repository ohne Verbindung (nur SQL-Aufbau)"""
+    return MySQLDeviceRepository('localhost', 3306, 'test', 'test', 'test_db')
+
+
+class TestDeviceQueryValidation:
+    """Tests für die Validierung der Abfrage"""
+
+    def test_invalid_status_raises(self):
+        """Test: Unbekannter Status löst ValueError aus"""
+        with pytest.raises(ValueError):
+            DeviceQuery(statuses=('kaputt',))
+
+    def test_invalid_sort_field_raises(self):
+        """Test: Sortierung nur über Whitelist (kein SQL aus Benutzereingaben)"""
+        with pytest.raises(ValueError):
+            DeviceQuery(sort=('name; DROP TABLE devices',))
+
+    def test_invalid_measurement_raises(self):
+        """Test: Messwert-Schwellen nur für bekannte Messwerte"""
+        with pytest.raises(ValueError):
+            DeviceQuery(max_values={'voltage': 1.0})
+
+
+class TestBuildSelect:
+    """Tests für MySQLDeviceRepository._build_select"""
+
+    def test_empty_query_selects_all_with_stable_order(self, repository):
+        """Test: Ohne Filter keine WHERE-Klausel, Sortierung nach id"""
+        sql, params = repository._build_select(DeviceQuery())
+
+        assert "WHERE" not in sql
+        assert sql.endswith("ORDER BY id DESC")
+        assert params == ()
+
+    def test_all_filters_are_pushed_down(self, repository):
+        """Test: Alle Filter landen parametrisiert in einem Statement"""
+        sql, params = repository._build_select(DeviceQuery(
+            customer='Parloa',
+            statuses=('active', 'maintenance'),
+            types=('USB-Kabel',),
+            location_prefix='Berlin',
+            next_inspection_from=date(2025, 1, 1),
+            next_inspection_to=date(2025, 1, 31),
+            max_values={'r_pe': 0.3},
+            sort=('next_inspection', '-name'),
+            limit=50
+        ))
+
+        assert "customer = %s" in sql
+        assert "status IN (%s, %s)" in sql
+        assert "type IN (%s)" in sql
+        assert "location LIKE %s" in sql
+        assert "next_inspection >= %s AND next_inspection <= %s" in sql
+        assert "r_pe <= %s" in sql
+        assert "ORDER BY next_inspection ASC, name DESC, id DESC LIMIT %s" in sql
+        assert params == ('Parloa', 'active', 'maintenance', 'USB-Kabel', 'Berlin%',
+                          date(2025, 1, 1), date(2025, 1, 31), 0.3, 50)
+
+
+class TestListDevicesUseCaseWithQuery:
+    """Tests für ListDevicesUseCase mit DeviceQuery"""
+
+    def test_without_query_uses_get_all(self):
+        """Test: Ohne Query bleibt get_all() der Pfad"""
+        repository = Mock()
+        ListDevicesUseCase(repository).execute()
+
+        repository.get_all.assert_called_once_with()
+        repository.find.assert_not_called()
+
+    def test_with_query_uses_find(self):
+        """Test: Mit Query wird an find() delegiert"""
+        repository = Mock()
+        query = DeviceQuery(customer='Parloa')
+        ListDevicesUseCase(repository).execute(query)
+
+        repository.find.assert_called_once_with(query)
+
+
+class TestListRouteFilters:
+    """Tests für Filterparameter an GET /api/devices"""
+
+    @pytest.fixture
+    def client(self):
+        app = create_app()
+        app.config['TESTING'] = True
+        return app.test_client()
+
+    def test_query_parameters_build_device_query(self, client):
+        """Test: Query-Parameter werden zu DeviceQuery"""
+        with patch('src.config.dependencies.container.list_devices_usecase.execute') as mock_execute:
+            mock_execute.return_value = []
+
+            response = client.get('/api/devices?customer=Parloa&status=active,maintenance&max_r_pe=0.3&sort=name')
+
+            assert response.status_code == 200
+            query = mock_execute.call_args[0][0]
+            assert query.customer == 'Parloa'
+            assert query.statuses == ('active', 'maintenance')
+            assert query.max_values == {'r_pe': 0.3}
+            assert query.sort == ('name',)
+
+    def test_invalid_filter_returns_400(self, client):
+        """Test: Ungültiger Filter ergibt 400"""
+        response = client.get('/api/devices?status=kaputt')
+
+        assert response.status_code == 400
+        assert json.loads(response.data)['error_type'] == 'validation_error'
+
+    def test_dashboard_uses_device_query(self, client):
+        """Test: Dashboard liest über DeviceQuery (explizite Spalten, ohne qr_code)"""
+        with patch('src.config.dependencies.container.list_devices_usecase.execute') as mock_execute:
+            mock_execute.return_value = []
+
+            response = client.get('/')
+
+            assert response.status_code == 200
+            assert mock_execute.call_args[0][0].sort == ('-id',)
@@ -404,8 +404,10 @@ class TestDeviceUpdateRoute:
             status='maintenance'
         )
         
-        with patch('src.config.dependencies.container.update_device_usecase.execute') as mock_execute:
+        with patch('src.config.dependencies.container.update_device_usecase.execute') as mock_execute, \
+                patch('src.config.dependencies.container.get_device_usecase.execute') as mock_get:
             mock_execute.return_value = updated_device
+            mock_get.return_value = updated_device
             
             response = client.put('/api/devices/Parloa-00001',
                                  data=json.dumps(payload),
@@ -432,8 +434,10 @@ class TestDeviceUpdateRoute:
             type='Test'
         )
         
-        with patch('src.config.dependencies.container.update_device_usecase.execute') as mock_execute:
+        with patch('src.config.dependencies.container.update_device_usecase.execute') as mock_execute, \
+                patch('src.config.dependencies.container.get_device_usecase.execute') as mock_get:
             mock_execute.return_value = updated_device
+            mock_get.return_value = updated_device
             
             response = client.put('/api/devices/Test-Kunde-00001',
                                  data=json.dumps(payload),
@@ -460,6 +464,42 @@ class TestDeviceUpdateRoute:
             assert response.status_code == 500
             data = json.loads(response.data)
             assert data['success'] is False
+    
+    def test_update_device_returns_stored_device(self, client):
+        """Test: Antwort enthält den gespeicherten Stand (id, Prüftermine, Modell)"""
+        payload = {
+            'customer': 'Parloa',
+            'name': 'Elektroschrauber',
+            'type': 'Elektrowerkzeug'
+        }
+        stored_device = Device(
+            id=7,
+            customer='Parloa',
+            customer_device_id='Parloa-00007',
+            name='Elektroschrauber',
+            type='Elektrowerkzeug',
+            model='GSR 12V',
+            last_inspection=date(2024, 1, 15),
+            next_inspection=date(2025, 1, 15),
+            cable_type='USB-C'
+        )
+        
+        with patch('src.config.dependencies.container.update_device_usecase.execute') as mock_execute, \
+                patch('src.config.dependencies.container.get_device_usecase.execute') as mock_get:
+            mock_execute.side_effect = lambda device: device
+            mock_get.return_value = stored_device
+            
+            response = client.put('/api/devices/Parloa-00007',
+                                 data=json.dumps(payload),
+                                 content_type='application/json')
+            
+            assert response.status_code == 200
+            device = json.loads(response.data)['device']
+            assert device['id'] == 7
+            assert device['model'] == 'GSR 12V'
+            assert device['next_inspection'] == '2025-01-15'
+            assert device['cable_type'] == 'USB-C'
+            mock_get.assert_called_once_with('Parloa-00007')
 
 
 class TestDeviceDeleteRoute:
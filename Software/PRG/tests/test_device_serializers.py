@@ -0,0 +1,93 @@
+"""Tests für Device Serializer Registry und schnellen JSON-Encoder"""
+import pytest
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from src.core.domain.device import Device
+from src.adapters.web.presenters import (
+    dumps,
+    get_serializer,
+    iter_json_array,
+    register_serializer
+)
+
+
+@pytest.fixture
+def device():
+    """Gerät mit Datums- und Decimal-Werten wie aus der Datenbank"""
+    return Device(
+        id=1,
+        customer="Parloa",
+        customer_device_id="Parloa-00001",
+        name="Elektroschrauber",
+        type="Elektrowerkzeug",
+        purchase_date=date(2023, 1, 15),
+        last_inspection=datetime(2024, 1, 15, 10, 30),
+        next_inspection=date(2025, 1, 15),
+        r_pe=Decimal("0.150")
+    )
+
+
+class TestFastJSONEncoder:
+    """Tests für den JSON-Encoder"""
+
+    def test_encodes_date_datetime_and_decimal(self, device):
+        """Test: date, datetime und Decimal werden nativ kodiert"""
+        data = json.loads(dumps({
+            'next': device.next_inspection,
+            'last': device.last_inspection,
+            'r_pe': device.r_pe
+        }))
+
+        assert data['next'] == "2025-01-15"
+        assert data['last'].startswith("2024-01-15T10:30:00")
+        assert data['r_pe'] == 0.15
+
+    @pytest.mark.parametrize("count", [0, 1, 3, 7])
+    def test_streamed_array_is_valid_json(self, count):
+        """Test: Gestreamtes Array ergibt unabhängig von der Chunk-Größe gültiges JSON"""
+        chunks = iter_json_array(range(count), lambda i: {'n': i},
+                                 prefix=b'{"success":true,"data":', suffix=b'}',
+                                 chunk_size=2)
+        data = json.loads(b''.join(chunks))
+
+        assert data['success'] is True
+        assert [item['n'] for item in data['data']] == list(range(count))
+
+
+class TestDeviceSerializerRegistry:
+    """Tests für die Serializer Registry"""
+
+    def test_list_serializer_fields(self, device):
+        """Test: List-Feldsatz enthält nur die Listenfelder"""
+        result = get_serializer('list').to_dict(device)
+
+        assert result['customer_device_id'] == "Parloa-00001"
+        assert 'notes' not in result
+        assert 'next_inspection' not in result
+
+    def test_detail_serializer_contains_dates(self, device):
+        """Test: Detail-Feldsatz enthält Prüfdaten"""
+        result = get_serializer('detail').to_dict(device)
+
+        assert result['next_inspection'] == date(2025, 1, 15)
+        assert 'cable_type' in result
+
+    def test_export_row_matches_field_order(self, device):
+        """Test: Export-Zeile folgt der Feldreihenfolge"""
+        serializer = get_serializer('export')
+        row = serializer.to_row(device)
+
+        assert len(row) == len(serializer.fields)
+        assert row[0] == "Parloa-00001"
+
+    def test_register_custom_serializer(self, device):
+        """Test: Eigene Feldsätze können registriert werden"""
+        register_serializer('test_minimal', ('id', 'name'))
+
+        assert get_serializer('test_minimal').to_dict(device) == {'id': 1, 'name': "Elektroschrauber"}
+
+    def test_unknown_serializer_raises(self):
+        """Test: Unbekannter Name löst KeyError aus"""
+        with pytest.raises(KeyError):
+            get_serializer('does-not-exist')
@@ -1,4 +1,5 @@
 """Unit Tests für Device Use Cases"""
+import base64
 import pytest
 from unittest.mock import Mock, MagicMock
 from src.core.domain.device import Device
@@ -9,6 +10,7 @@ from src.core.usecases.device_usecases import (
     UpdateDeviceUseCase,
     DeleteDeviceUseCase
 )
+from src.adapters.services.qr_generators import SVGRectRunQRGenerator
 
 
 class TestGetDeviceUseCase:
@@ -110,6 +112,17 @@ class TestCreateDeviceUseCase:
         assert result.id == 1
         mock_repo.create.assert_called_once_with(device)
 
+    def test_create_device_uses_injected_qr_generator(self):
+        """Test: Der QR-Code entsteht mit dem übergebenen Encoder (nicht dem globalen)"""
+        mock_repo = Mock()
+        mock_repo.create.side_effect = lambda device: device
+        device = Device(name="Bohrer", customer="Parloa", customer_device_id="Parloa-00001")
+        generator = SVGRectRunQRGenerator(error_correction='Q')
+        
+        result = CreateDeviceUseCase(mock_repo, qr_generator=generator).execute(device)
+        
+        assert base64.b64decode(result.qr_code) == generator.encode("Parloa|Parloa-00001")
+
     def test_create_device_with_minimal_data(self):
         """Test: Device mit minimalen Daten erstellen"""
         mock_repo = Mock()
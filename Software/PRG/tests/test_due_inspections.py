@@ -0,0 +1,106 @@
+"""Tests für die Prüfplanung: fällige Geräte mit Keyset-Pagination"""
+import pytest
+import json
+from datetime import date
+from unittest.mock import Mock, patch
+from src.main import create_app
+from src.core.domain.device import Device
+from src.core.domain.device_query import DevicePage, decode_cursor, encode_cursor
+from src.adapters.persistence.mysql_device_repository import MySQLDeviceRepository
+
+COLUMNS = ('id', 'customer', 'customer_device_id', 'name', 'next_inspection', 'status')
+
+
+@pytest.fixture
+def client():
+    """Test Client"""
+    app = create_app()
+    app.config['TESTING'] = True
+    return app.test_client()
+
+
+@pytest.fixture
+def due_device():
+    """Fälliges Gerät"""
+    return Device(
+        id=3,
+        customer="Parloa",
+        customer_device_id="Parloa-00003",
+        name="Wasserkocher",
+        location="Berlin - Büro - MB1",
+        next_inspection=date(2025, 1, 15)
+    )
+
+
+class TestKeysetCursor:
+    """Tests für Cursor-Kodierung"""
+
+    def test_roundtrip(self):
+        """Test: Cursor kodieren und dekodieren"""
+        assert decode_cursor(encode_cursor(date(2025, 1, 15), 42)) == (date(2025, 1, 15), 42)
+
+    def test_invalid_cursor_raises(self):
+        """Test: Ungültiger Cursor löst ValueError aus"""
+        with pytest.raises(ValueError):
+            decode_cursor("kaputt")
+
+
+class TestDueRepositoryQuery:
+    """Tests für MySQLDeviceRepository.get_due_for_inspection"""
+
+    @patch('src.adapters.persistence.mysql_device_repository.mysql.connector.connect')
+    def test_query_uses_keyset_and_returns_next_cursor(self, mock_connect):
+        """Test: Keyset-Bedingung, Limit+1 und Cursor auf die Folgeseite"""
+        cursor = Mock()
+        cursor.column_names = COLUMNS
+        cursor.fetchall.return_value = [
+            (1, 'Parloa', 'Parloa-00001', 'A', date(2025, 1, 10), 'active'),
+            (2, 'Parloa', 'Parloa-00002', 'B', date(2025, 1, 12), 'active'),
+            (3, 'Parloa', 'Parloa-00003', 'C', date(2025, 1, 12), 'active'),
+        ]
+        mock_connect.return_value.cursor.return_value = cursor
+        repository = MySQLDeviceRepository('localhost', 3306, 'test', 'test', 'test_db')
+
+        page = repository.get_due_for_inspection(
+            until=date(2025, 2, 1),
+            customer='Parloa',
+            location='Berlin_',
+            limit=2,
+            cursor=encode_cursor(date(2025, 1, 1), 9)
+        )
+
+        query, params = cursor.execute.call_args[0]
+        assert query.index("customer = %s") < query.index("next_inspection <= %s")
+        assert "ORDER BY next_inspection, id LIMIT %s" in query
+        assert "qr_code" not in query
+        assert params[0] == 'Parloa'
+        assert 'Berlin\\_%' in params
+        assert params[-1] == 3
+        assert [d.id for d in page.items] == [1, 2]
+        assert page.next_cursor == encode_cursor(date(2025, 1, 12), 2)
+
+
+class TestDueRoute:
+    """Tests für GET /api/devices/due"""
+
+    def test_due_devices_success(self, client, due_device):
+        """Test: Fällige Geräte mit Zeitfenster und Cursor"""
+        with patch('src.config.dependencies.container.list_due_devices_usecase.execute') as mock_execute:
+            mock_execute.return_value = DevicePage(items=[due_device], next_cursor="2025-01-15_3")
+
+            response = client.get('/api/devices/due?within=2w&customer=Parloa')
+
+            assert response.status_code == 200
+            data = json.loads(response.data)
+            assert data['within_days'] == 14
+            assert data['data'][0]['customer_device_id'] == "Parloa-00003"
+            assert data['data'][0]['next_inspection'] == "2025-01-15"
+            assert 'days_until_inspection' in data['data'][0]
+            assert data['next_cursor'] == "2025-01-15_3"
+            assert mock_execute.call_args[1]['customer'] == 'Parloa'
+
+    def test_due_devices_invalid_window(self, client):
+        """Test: Ungültiges Zeitfenster ergibt 400"""
+        response = client.get('/api/devices/due?within=morgen')
+
+        assert response.status_code == 400
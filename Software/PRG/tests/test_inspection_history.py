@@ -0,0 +1,215 @@
+"""Tests für die Prüfhistorie (RecordInspectionUseCase / MySQLInspectionRepository)"""
+import json
+import pytest
+from datetime import date, datetime
+from unittest.mock import Mock, patch
+from mysql.connector import Error
+from src.core.domain.inspection import Inspection
+from src.core.usecases.inspection_usecases import RecordInspectionUseCase
+from src.adapters.persistence.mysql_inspection_repository import MySQLInspectionRepository
+from src.adapters.web.routes import pdf_export_route
+from src.main import create_app
+
+
+class TestInspectionDomain:
+    """Tests für Inspection"""
+
+    def test_usb_test_result_maps_to_result_and_status(self):
+        """Test: USB-Testergebnis bestimmt Ergebnis und Gerätestatus"""
+        passed = Inspection.from_usb_test(device_id=1, test_result='bestanden')
+        lost = Inspection.from_usb_test(device_id=1, test_result='verloren')
+
+        assert (passed.result, passed.resulting_device_status()) == ('pass', 'active')
+        assert (lost.result, lost.resulting_device_status()) == ('fail', 'maintenance')
+
+    def test_invalid_values_raise(self):
+        """Test: Ungültige Werte werden abgelehnt"""
+        with pytest.raises(ValueError):
+            Inspection(device_id=1, result='ok')
+        with pytest.raises(ValueError):
+            Inspection.from_usb_test(device_id=1, test_result='vielleicht')
+
+    def test_inspection_date_defaults_to_now_and_is_aware(self):
+        """Test: Prüfzeitpunkt ist zeitzonenbewusst"""
+        assert Inspection(device_id=1).inspection_date.tzinfo is not None
+
+
+class TestRecordInspectionUseCase:
+    """Tests für RecordInspectionUseCase"""
+
+    def _record(self, inspection, **kwargs):
+        repository = Mock()
+        repository.record.side_effect = lambda inspection, **kw: inspection
+        RecordInspectionUseCase(repository, interval_days=365).execute(inspection, **kwargs)
+        return repository.record.call_args.kwargs
+
+    def test_pass_schedules_next_inspection_after_interval(self):
+        """Test: Bestanden -> aktiv, nächste Prüfung nach Intervall"""
+        call = self._record(Inspection(device_id=1, result='pass', inspection_date=date(2025, 3, 1)))
+
+        assert call == {'next_inspection': date(2026, 3, 1), 'device_status': 'active'}
+
+    def test_fail_keeps_device_due(self):
+        """Test: Nicht bestanden -> Wartung, sofort wieder fällig"""
+        call = self._record(Inspection(device_id=1, result='fail', inspection_date=date(2025, 3, 1)))
+
+        assert call == {'next_inspection': date(2025, 3, 1), 'device_status': 'maintenance'}
+
+    def test_explicit_next_inspection_wins(self):
+        """Test: Vorgegebener Termin wird übernommen"""
+        call = self._record(Inspection(device_id=1, result='pass'), next_inspection=date(2030, 1, 1))
+
+        assert call['next_inspection'] == date(2030, 1, 1)
+
+
+class TestMySQLInspectionRepository:
+    """Tests für MySQLInspectionRepository"""
+
+    @pytest.fixture
+    def repository(self):
+        return MySQLInspectionRepository('localhost', 3306, 'test', 'test', 'test_db')
+
+    @patch('src.adapters.persistence.mysql_inspection_repository.mysql.connector.connect')
+    def test_record_inserts_and_updates_device_in_one_transaction(self, mock_connect, repository):
+        """Test: INSERT inspections + UPDATE devices über eine Verbindung, ein Commit"""
+        conn = mock_connect.return_value
+        cursor = Mock(lastrowid=42)
+        conn.cursor.return_value = cursor
+
+        inspection = repository.record(Inspection(device_id=7, result='pass', r_pe=0.12),
+                                       next_inspection=date(2026, 3, 1), device_status='active')
+
+        assert inspection.id == 42
+        assert mock_connect.call_count == 1
+        conn.start_transaction.assert_called_once()
+        conn.commit.assert_called_once()
+        insert_sql, update_sql = [c[0][0] for c in cursor.execute.call_args_list]
+        assert "INSERT INTO inspections" in insert_sql
+        assert "UPDATE devices" in update_sql
+        assert cursor.execute.call_args_list[1][0][1][-2] == 7
+
+    @patch('src.adapters.persistence.mysql_inspection_repository.mysql.connector.connect')
+    def test_record_rolls_back_on_failure(self, mock_connect, repository):
+        """Test: Fehler beim Geräte-Update rollt auch die Historie zurück"""
+        conn = mock_connect.return_value
+        cursor = Mock(lastrowid=42)
+        cursor.execute.side_effect = [None, Error("Lock wait timeout")]
+        conn.cursor.return_value = cursor
+
+        with pytest.raises(Error):
+            repository.record(Inspection(device_id=7, result='pass'), None, 'active')
+
+        conn.rollback.assert_called_once()
+        conn.commit.assert_not_called()
+
+    @patch('src.adapters.persistence.mysql_inspection_repository.mysql.connector.connect')
+    def test_get_latest_uses_index_order(self, mock_connect, repository):
+        """Test: Letzte Prüfung über ORDER BY inspection_date DESC, id DESC LIMIT 1"""
+        cursor = mock_connect.return_value.cursor.return_value
+        cursor.fetchall.return_value = [
+            (3, 7, datetime(2025, 3, 1, 10, 0), 'pass', None, None, 0.12, None, None, None,
+             None, None, None, None, None)
+        ]
+
+        latest = repository.get_latest(7)
+
+        query, params = cursor.execute.call_args[0]
+        assert "ORDER BY inspection_date DESC, id DESC LIMIT %s" in query
+        assert params == (7, 1)
+        assert latest.id == 3 and latest.r_pe == 0.12
+
+    @patch('src.adapters.persistence.mysql_inspection_repository.mysql.connector.connect')
+    def test_list_for_devices_uses_one_windowed_query(self, mock_connect, repository):
+        """Test: Historie vieler Geräte über eine Abfrage mit ROW_NUMBER()"""
+        cursor = mock_connect.return_value.cursor.return_value
+        row = lambda id, device_id: (id, device_id, datetime(2025, 3, id), 'pass', None, None,
+                                     None, None, None, None, None, None, None, None, None)
+        cursor.fetchall.return_value = [row(5, 1), row(2, 1), row(4, 3)]
+
+        history = repository.list_for_devices([1, 2, 3, 1], per_device=2)
+
+        assert cursor.execute.call_count == 1
+        query, params = cursor.execute.call_args[0]
+        assert "ROW_NUMBER() OVER (PARTITION BY device_id" in query
+        assert params == (1, 2, 3, 2)
+        assert [i.id for i in history[1]] == [5, 2]
+        assert 2 not in history
+
+    @patch('src.adapters.persistence.mysql_inspection_repository.HISTORY_CHUNK_SIZE', 2)
+    @patch('src.adapters.persistence.mysql_inspection_repository.mysql.connector.connect')
+    def test_list_for_devices_chunks_large_id_lists(self, mock_connect, repository):
+        """Test: Große ID-Listen werden in Blöcken über eine Verbindung abgefragt"""
+        cursor = mock_connect.return_value.cursor.return_value
+        cursor.fetchall.return_value = []
+
+        repository.list_for_devices([1, 2, 3, 4, 5])
+
+        assert cursor.execute.call_count == 3
+        assert mock_connect.call_count == 1
+
+    def test_list_for_devices_without_ids_skips_database(self, repository):
+        """Test: Leere ID-Liste ergibt leeres Ergebnis ohne Abfrage"""
+        with patch.object(repository, '_get_connection') as get_connection:
+            assert repository.list_for_devices([]) == {}
+            get_connection.assert_not_called()
+
+
+class TestPDFHistoryLoading:
+    """Tests für das Laden der Prüfhistorie im PDF-Export"""
+
+    def test_history_failure_is_logged_and_pdf_continues(self):
+        """Test: Fehler beim Laden der Historie wird geloggt, PDF ohne Historie"""
+        container = Mock()
+        container.load_protocol_history_usecase.execute.side_effect = Error("DB down")
+        device = Mock(id=1)
+
+        with patch.object(pdf_export_route.logger, 'error') as mock_error:
+            assert pdf_export_route.get_inspection_history(container, [device]) == {}
+
+        assert "DB down" in mock_error.call_args[0][0]
+
+
+class TestAddDeviceWithUSBInspection:
+    """Tests für POST /device/add mit USB-Inspektionsdaten"""
+
+    PAYLOAD = {'customer': 'Parloa', 'name': 'USB-C Kabel', 'type': 'USB-Kabel',
+               'cable_type': 'USB-C', 'test_result': 'bestanden'}
+
+    @pytest.fixture
+    def client(self):
+        app = create_app()
+        app.config['TESTING'] = True
+        return app.test_client()
+
+    @staticmethod
+    def _saved(device):
+        device.id = 42
+        device.customer_device_id = 'Parloa-00042'
+        return device
+
+    def test_inspection_failure_keeps_created_device(self, client):
+        """Test: Fehler beim Speichern der Prüfung ergibt 201 mit Geräte-ID und inspection_error"""
+        with patch('src.config.dependencies.container.create_device_usecase.execute') as mock_create, \
+                patch('src.config.dependencies.container.record_inspection_usecase.execute') as mock_record:
+            mock_create.side_effect = self._saved
+            mock_record.side_effect = Error("Lock wait timeout")
+
+            response = client.post('/device/add', json=self.PAYLOAD)
+
+            assert response.status_code == 201
+            data = json.loads(response.data)
+            assert data['device_id'] == 42
+            assert 'Lock wait timeout' in data['inspection_error']
+            mock_create.assert_called_once()
+
+    def test_successful_inspection_has_no_error_field(self, client):
+        """Test: Erfolgreiche Prüfung liefert kein inspection_error"""
+        with patch('src.config.dependencies.container.create_device_usecase.execute') as mock_create, \
+                patch('src.config.dependencies.container.record_inspection_usecase.execute') as mock_record:
+            mock_create.side_effect = self._saved
+
+            response = client.post('/device/add', json=self.PAYLOAD)
+
+            assert response.status_code == 201
+            assert 'inspection_error' not in json.loads(response.data)
+            assert mock_record.call_args[0][0].device_id == 42
@@ -0,0 +1,220 @@
+"""Tests für QR-Etikettenbögen (Vorlagen, PDF-Streaming, Route)"""
+import re
+import zlib
+import pytest
+from unittest.mock import Mock, patch
+from src.main import create_app
+from src.core.domain.device import Device
+from src.core.domain.label_sheet import LABEL_TEMPLATES, LabelTemplate, get_label_template, paginate_labels
+from src.core.usecases.device_usecases import ListLabelDevicesUseCase
+from src.adapters.services import QRCodeGenerator
+from src.adapters.services.qr_code_generator import _render_pdf_form, _svg_to_pdf_form
+from src.adapters.services.qr_generators import SVGPathQRGenerator, SVGRectRunQRGenerator
+from src.adapters.web.presenters import iter_label_sheet_pdf
+
+
+def _device(number: int, name: str = "Bohrer") -> Device:
+    return Device(id=number, name=name, customer="Parloa", customer_device_id=f"Parloa-{number:05d}")
+
+
+def _qr_form(device: Device):
+    return device.customer_device_id, b"0 0 1 1 re f"
+
+
+def _pdf(devices, template='avery-3x8', **kwargs) -> bytes:
+    return b''.join(iter_label_sheet_pdf(devices, LABEL_TEMPLATES[template], _qr_form, **kwargs))
+
+
+class TestLabelTemplate:
+    """Tests für LabelTemplate und paginate_labels"""
+
+    def test_slot_positions(self):
+        """Test: Raster wird zeilenweise von oben links gefüllt"""
+        template = get_label_template('avery-3x8')
+
+        assert template.labels_per_page == 24
+        assert template.slot(0) == (7.2, 12.9)
+        assert template.slot(4) == pytest.approx((73.2, 46.8))
+
+    def test_template_must_fit_page(self):
+        """Test: Zu großes Raster wird abgelehnt"""
+        with pytest.raises(ValueError, match="exceed"):
+            LabelTemplate('zu-gross', 4, 8, 63.5, 33.9, 7.2, 12.9, 66.0, 33.9)
+
+    def test_unknown_template(self):
+        """Test: Unbekannte Vorlage"""
+        with pytest.raises(ValueError, match="template must be one of"):
+            get_label_template('avery-9x9')
+
+    def test_paginate_with_skip(self):
+        """Test: skip verschiebt den ersten Bogen, Folgeseiten beginnen oben links"""
+        template = get_label_template('avery-2x7')
+        pages = list(paginate_labels(range(20), template, skip=10))
+
+        assert [len(page) for page in pages] == [4, 14, 2]
+        assert pages[0][0] == (10, 0)
+        assert pages[1][0] == (0, 4)
+
+    def test_paginate_rejects_invalid_skip(self):
+        """Test: skip muss kleiner als ein Bogen sein"""
+        with pytest.raises(ValueError):
+            list(paginate_labels([1], get_label_template('avery-2x7'), skip=14))
+
+
+class TestLabelSheetPDF:
+    """Tests für iter_label_sheet_pdf"""
+
+    def test_xref_offsets_point_to_objects(self):
+        """Test: Querverweistabelle stimmt mit den Objekt-Offsets überein"""
+        data = _pdf([_device(i) for i in range(30)])
+
+        start = int(data.rsplit(b'startxref\n', 1)[1].split(b'\n')[0])
+        lines = data[start:].split(b'\n')
+        size = int(lines[1].split()[1])
+        for obj_id in range(1, size):
+            offset = int(lines[2 + obj_id][:10])
+            assert data[offset:].startswith(f"{obj_id} 0 obj".encode())
+        assert data.startswith(b'%PDF-1.4')
+        assert data.endswith(b'%%EOF\n')
+
+    def test_pages_and_shared_qr_objects(self):
+        """Test: Kopien verweisen auf dasselbe QR-Objekt"""
+        devices = [_device(1), _device(1), _device(2)] * 10
+
+        data = _pdf(devices)
+
+        assert data.count(b'/Type /Page ') == 2
+        assert data.count(b'/Subtype /Form') == 2
+        assert b'/Count 2' in data
+
+    def test_streams_page_by_page(self):
+        """Test: Die erste Seite wird ausgegeben, bevor alle Geräte gelesen sind"""
+        consumed = []
+
+        def devices():
+            for number in range(100):
+                consumed.append(number)
+                yield _device(number)
+
+        chunks = iter_label_sheet_pdf(devices(), LABEL_TEMPLATES['avery-3x8'], _qr_form)
+        while b'/Type /Page ' not in next(chunks):
+            pass
+
+        assert len(consumed) <= 25
+
+    def test_text_is_escaped_and_shortened(self):
+        """Test: Klammern werden maskiert, lange Namen gekürzt"""
+        data = _pdf([_device(1, name="Säge (alt) " + "x" * 80)], template='avery-5x13')
+        content = b''.join(zlib.decompress(m) for m in re.findall(rb'stream\n(.*?)\nendstream', data, re.S))
+
+        assert b'(S\xe4ge \\(alt\\)' in content
+        assert b'\x85)' in content
+
+    def test_empty_selection_is_valid_document(self):
+        """Test: Ohne Etiketten entsteht ein gültiges, leeres Dokument"""
+        data = _pdf([])
+
+        assert b'/Count 1' in data
+
+
+class TestPDFForm:
+    """Tests für QR-Codes als PDF-Form"""
+
+    def test_form_from_svg_artifact_matches_direct_encoding(self):
+        """Test: Ableitung aus dem SVG-Artefakt ergibt dieselbe Form wie Kodieren"""
+        generator = SVGPathQRGenerator()
+        svg = generator.encode("Parloa|Parloa-00001")
+
+        assert _svg_to_pdf_form(svg, generator.module_size) == _render_pdf_form("Parloa|Parloa-00001")
+
+    def test_form_from_rect_run_svg_matches_direct_encoding(self):
+        """Test: Auch das kompakte Rechteck-SVG ergibt dieselbe Form"""
+        generator = SVGRectRunQRGenerator()
+        svg = generator.encode("Parloa|Parloa-00001")
+
+        assert _svg_to_pdf_form(svg, generator.module_size) == _render_pdf_form("Parloa|Parloa-00001")
+
+    @pytest.mark.parametrize('generator_class', [SVGPathQRGenerator, SVGRectRunQRGenerator])
+    @pytest.mark.parametrize('box_size', [3, 10, 20])
+    def test_form_from_svg_with_other_box_size(self, generator_class, box_size):
+        """Test: Die Modulgröße des Encoders bestimmt die Koordinaten (nicht fest 10)"""
+        generator = generator_class(box_size=box_size)
+        svg = generator.encode("Parloa|Parloa-00001")
+
+        assert _svg_to_pdf_form(svg, generator.module_size) == _render_pdf_form("Parloa|Parloa-00001")
+
+    def test_images_many_merges_cache_hits(self):
+        """Test: Bereits gerenderte Formen werden nicht neu erzeugt"""
+        QRCodeGenerator.clear_cache()
+        first = QRCodeGenerator.images_many([("Parloa-00001", "Parloa")], 'pdf')
+        with patch('src.adapters.services.qr_code_generator._render_pdf_form') as encoder:
+            again = QRCodeGenerator.images_many([("Parloa-00001", "Parloa"), ("Parloa-00001", "Parloa")], 'pdf')
+
+        encoder.assert_not_called()
+        assert again == first * 2
+        QRCodeGenerator.clear_cache()
+
+
+class TestListLabelDevicesUseCase:
+    """Tests für ListLabelDevicesUseCase"""
+
+    def test_selection_keeps_order_with_copies(self):
+        """Test: Auswahl in angefragter Reihenfolge, jede Kopie einzeln"""
+        repository = Mock()
+        repository.get_by_identifiers.return_value = [_device(1), _device(2)]
+
+        devices = list(ListLabelDevicesUseCase(repository).execute(
+            customer_device_ids=["Parloa-00002", "Parloa-00001"], copies=2))
+
+        assert [d.customer_device_id for d in devices] == [
+            "Parloa-00002", "Parloa-00002", "Parloa-00001", "Parloa-00001"]
+
+    def test_customer_streams_from_repository(self):
+        """Test: Ganzer Kunde über iter_find"""
+        repository = Mock()
+        repository.iter_find.return_value = iter([_device(1)])
+
+        devices = list(ListLabelDevicesUseCase(repository).execute(customer="Parloa"))
+
+        assert len(devices) == 1
+        assert repository.iter_find.call_args[0][0].customer == "Parloa"
+
+    def test_validation(self):
+        """Test: Auswahl erforderlich, unbekannte IDs und Kopienzahl werden abgelehnt"""
+        repository = Mock()
+        repository.get_by_identifiers.return_value = []
+        usecase = ListLabelDevicesUseCase(repository)
+
+        with pytest.raises(ValueError, match="required"):
+            usecase.execute()
+        with pytest.raises(ValueError, match="copies"):
+            usecase.execute(customer="Parloa", copies=0)
+        with pytest.raises(ValueError, match="Unknown devices: Parloa-00009"):
+            usecase.execute(customer_device_ids=["Parloa-00009"])
+
+
+class TestLabelRoute:
+    """Tests für GET /export/labels.pdf"""
+
+    @pytest.fixture
+    def client(self):
+        app = create_app()
+        app.config['TESTING'] = True
+        return app.test_client()
+
+    def test_streams_pdf(self, client):
+        """Test: PDF wird mit passendem MIME-Type gestreamt"""
+        with patch('src.config.dependencies.container.list_label_devices_usecase.execute',
+                   return_value=iter([_device(1), _device(2)])) as execute:
+            response = client.get('/export/labels.pdf?ids=Parloa-00001,Parloa-00002&copies=3&template=avery-3x7')
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/pdf'
+        assert response.data.startswith(b'%PDF')
+        assert execute.call_args.kwargs == {
+            'customer': None, 'customer_device_ids': ['Parloa-00001', 'Parloa-00002'], 'copies': 3}
+
+    def test_invalid_parameters(self, client):
+        """Test: Ungültige Vorlage oder skip ergibt 400"""
+        assert client.get('/export/labels.pdf?customer=Parloa&template=unknown').status_code == 400
+        assert client.get('/export/labels.pdf?customer=Parloa&skip=24').status_code == 400
@@ -0,0 +1,191 @@
+"""Tests für die Messwert-Zeitreihe und die Drift-Analyse"""
+import json
+import pytest
+from datetime import date, datetime
+from unittest.mock import Mock, patch
+from src.main import create_app
+from src.core.domain.device import Device
+from src.core.domain.inspection import Inspection
+from src.core.domain.measurement import Measurement, MetricTrend, measurements_from_inspection
+from src.core.usecases.measurement_usecases import AnalyzeMeasurementDriftUseCase, ListMeasurementsUseCase
+from src.adapters.persistence.mysql_inspection_repository import MySQLInspectionRepository
+from src.adapters.persistence.mysql_measurement_repository import MySQLMeasurementRepository
+
+
+def _trend(metric, first_value, last_value, slope, device_id=1):
+    return MetricTrend(device_id=device_id, metric=metric, samples=4,
+                       first_at=datetime(2021, 1, 1), last_at=datetime(2025, 1, 1),
+                       first_value=first_value, last_value=last_value, slope_per_year=slope)
+
+
+class TestMeasurementDomain:
+    """Tests für Measurement und MetricTrend"""
+
+    def test_measurements_from_inspection_skip_missing_values(self):
+        """Test: Nur gemessene Werte werden zu Zeilen"""
+        inspection = Inspection(device_id=7, result='pass', r_pe=0.12, i_b=0.05,
+                                inspection_date=datetime(2025, 1, 1, 9, 0))
+
+        measurements = measurements_from_inspection(inspection)
+
+        assert [(m.metric, m.metric_code, m.value) for m in measurements] == [('r_pe', 1, 0.12), ('i_b', 4, 0.05)]
+
+    def test_unknown_metric_raises(self):
+        """Test: Unbekannte Metrik wird abgelehnt"""
+        with pytest.raises(ValueError):
+            Measurement(1, datetime(2025, 1, 1), 'voltage', 230.0)
+
+    def test_years_to_limit_for_rising_metric(self):
+        """Test: Steigender Schutzleiterwiderstand erreicht 0,3 Ohm"""
+        trend = _trend('r_pe', 0.10, 0.20, 0.025)
+
+        assert trend.years_to_limit() == pytest.approx(4.0)
+        assert trend.projected_limit_date() == date(2029, 1, 1)
+        assert not trend.is_degrading(2.0)
+        assert trend.is_degrading(5.0)
+
+    def test_years_to_limit_for_falling_metric(self):
+        """Test: Fallender Isolationswiderstand erreicht 1,0 MOhm"""
+        assert _trend('r_iso', 50.0, 21.0, -10.0).years_to_limit() == pytest.approx(2.0)
+        assert _trend('r_iso', 20.0, 25.0, 1.0).years_to_limit() is None
+
+    def test_limit_already_reached_and_no_limit(self):
+        """Test: Grenzwert überschritten -> 0, Metrik ohne Grenzwert -> None"""
+        assert _trend('i_b', 0.3, 0.6, 0.1).years_to_limit() == 0.0
+        assert _trend('internal_resistance', 0.1, 0.5, 0.1).years_to_limit() is None
+
+
+class TestMySQLMeasurementRepository:
+    """Tests für MySQLMeasurementRepository"""
+
+    @pytest.fixture
+    def repository(self):
+        return MySQLMeasurementRepository('localhost', 3306, 'test', 'test', 'test_db')
+
+    @patch('src.adapters.persistence.mysql_measurement_repository.MEASUREMENT_BATCH_SIZE', 2)
+    @patch('src.adapters.persistence.mysql_measurement_repository.mysql.connector.connect')
+    def test_append_many_batches_in_one_transaction(self, mock_connect, repository):
+        """Test: Mehrzeilige INSERTs in Batches, ein Commit"""
+        conn = mock_connect.return_value
+        cursor = conn.cursor.return_value
+        measurements = [Measurement(1, datetime(2025, 1, 1), 'r_pe', 0.1 * i) for i in range(5)]
+
+        assert repository.append_many(measurements) == 5
+
+        assert cursor.executemany.call_count == 3
+        assert cursor.executemany.call_args_list[0][0][1][0] == (1, datetime(2025, 1, 1), 1, 0.0)
+        conn.commit.assert_called_once()
+
+    @patch('src.adapters.persistence.mysql_measurement_repository.mysql.connector.connect')
+    def test_get_trends_computes_slope_in_sql(self, mock_connect, repository):
+        """Test: Regression und erster/letzter Wert in einer Aggregat-Abfrage"""
+        cursor = mock_connect.return_value.cursor.return_value
+        cursor.fetchall.return_value = [
+            (3, 1, 'Parloa-00003', 4, datetime(2021, 1, 1), datetime(2024, 1, 1), 0.1000000015, 0.2, 0.033)
+        ]
+
+        trends = repository.get_trends(customer='Parloa', metric='r_pe', min_samples=3)
+
+        sql, params = cursor.execute.call_args[0]
+        assert "SUM(x * value)" in sql and "FIRST_VALUE" in sql
+        assert "d.customer = %s" in sql and "m.metric = %s" in sql
+        assert params == ('Parloa', 1, 3)
+        assert trends[0].metric == 'r_pe'
+        assert trends[0].first_value == 0.1
+        assert trends[0].customer_device_id == 'Parloa-00003'
+
+    @patch('src.adapters.persistence.mysql_inspection_repository.mysql.connector.connect')
+    def test_recorded_inspection_appends_measurements(self, mock_connect):
+        """Test: Prüfung schreibt Messwerte in derselben Transaktion"""
+        conn = mock_connect.return_value
+        cursor = Mock(lastrowid=42)
+        conn.cursor.return_value = cursor
+        repository = MySQLInspectionRepository('localhost', 3306, 'test', 'test', 'test_db')
+        inspection = Inspection(device_id=7, result='pass', r_pe=0.12, inspection_date=datetime(2025, 1, 1, 9, 0))
+
+        repository.record(inspection, next_inspection=None, device_status='active')
+
+        sql, rows = cursor.executemany.call_args[0]
+        assert "INSERT INTO measurements" in sql
+        assert rows == [(7, inspection.inspection_date, 1, 0.12)]
+        conn.commit.assert_called_once()
+
+
+class TestMeasurementUseCases:
+    """Tests für ListMeasurementsUseCase und AnalyzeMeasurementDriftUseCase"""
+
+    def test_series_grouped_by_metric(self):
+        """Test: Zeitreihe pro Metrik"""
+        repository = Mock()
+        repository.get_series.return_value = [
+            Measurement(1, datetime(2024, 1, 1), 'r_pe', 0.1),
+            Measurement(1, datetime(2025, 1, 1), 'r_pe', 0.2),
+            Measurement(1, datetime(2025, 1, 1), 'i_b', 0.05),
+        ]
+
+        series = ListMeasurementsUseCase(repository).execute(1)
+
+        assert [m.value for m in series['r_pe']] == [0.1, 0.2]
+        assert len(series['i_b']) == 1
+
+    def test_drift_filters_and_orders_by_urgency(self):
+        """Test: Nur Geräte mit Grenzwert im Horizont, dringendste zuerst"""
+        repository = Mock()
+        repository.get_trends.return_value = [
+            _trend('r_pe', 0.10, 0.20, 0.05, device_id=1),   # 2 Jahre
+            _trend('r_pe', 0.10, 0.12, 0.001, device_id=2),  # 180 Jahre
+            _trend('i_b', 0.1, 0.45, 0.1, device_id=3),      # 0,5 Jahre
+        ]
+
+        trends = AnalyzeMeasurementDriftUseCase(repository).execute(customer='Parloa', horizon_years=2)
+
+        assert [t.device_id for t in trends] == [3, 1]
+        assert repository.get_trends.call_args[1]['min_samples'] == 3
+
+    def test_invalid_parameters(self):
+        """Test: Ungültige Metrik / Stichprobengröße"""
+        usecase = AnalyzeMeasurementDriftUseCase(Mock())
+        with pytest.raises(ValueError):
+            usecase.execute(metric='voltage')
+        with pytest.raises(ValueError):
+            usecase.execute(min_samples=1)
+
+
+class TestMeasurementRoutes:
+    """Tests für /api/devices/drift und /api/devices/<id>/measurements"""
+
+    @pytest.fixture
+    def client(self):
+        app = create_app()
+        app.config['TESTING'] = True
+        return app.test_client()
+
+    def test_drift_endpoint(self, client):
+        """Test: Drift-Liste mit Prognose"""
+        with patch('src.config.dependencies.container.analyze_drift_usecase.execute',
+                   return_value=[_trend('r_pe', 0.1, 0.2, 0.05)]) as mock_execute:
+            response = client.get('/api/devices/drift?customer=Parloa&metric=r_pe&horizon=3')
+
+        assert response.status_code == 200
+        item = json.loads(response.data)['data'][0]
+        assert item['years_to_limit'] == pytest.approx(2.0)
+        assert item['projected_limit_date'] == '2027-01-01'
+        assert mock_execute.call_args[1]['horizon_years'] == 3.0
+
+    def test_drift_invalid_metric_returns_400(self, client):
+        """Test: Ungültige Metrik ergibt 400"""
+        assert client.get('/api/devices/drift?metric=voltage').status_code == 400
+
+    def test_device_series(self, client):
+        """Test: Zeitreihe und Trend eines Geräts"""
+        device = Device(id=1, name="Bohrmaschine", customer="Parloa", customer_device_id="Parloa-00001")
+        with patch('src.config.dependencies.container.get_device_usecase.execute', return_value=device), \
+             patch('src.config.dependencies.container.list_measurements_usecase.execute',
+                   return_value={'r_pe': [Measurement(1, datetime(2025, 1, 1), 'r_pe', 0.2)]}), \
+             patch('src.config.dependencies.container.analyze_drift_usecase.execute',
+                   return_value=[_trend('r_pe', 0.1, 0.2, 0.05)]):
+            response = client.get('/api/devices/Parloa-00001/measurements')
+
+        data = json.loads(response.data)
+        assert data['series']['r_pe'] == [['2025-01-01T00:00:00', 0.2]]
+        assert data['trends']['r_pe']['drift'] == pytest.approx(0.1)
@@ -0,0 +1,287 @@
+"""Tests für PDF-Export-Jobs (Warteschlange, Rendering, Worker, Routen)"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import pytest
+from unittest.mock import Mock, patch
+from src.main import create_app
+from src.core.domain.device import Device
+from src.core.domain.export_job import ExportJob
+from src.core.usecases.export_job_usecases import EnqueuePDFExportUseCase, RunPDFExportJobUseCase
+from src.adapters.persistence.sqlite_export_job_repository import SQLiteExportJobRepository
+from src.adapters.services.pdf_export_worker import PDFExportWorker
+
+
+@pytest.fixture
+def repository(tmp_path):
+    return SQLiteExportJobRepository(str(tmp_path / 'jobs.sqlite3'))
+
+
+def _fake_pdf(html, path, on_layout=None):
+    if on_layout is not None:
+        on_layout(1)
+    with open(path, 'wb') as target:
+        target.write(b'%PDF-1.4 ' + html.encode('utf-8'))
+    return 1
+
+
+class TestSQLiteExportJobRepository:
+    """Tests für die persistente Job-Warteschlange"""
+
+    def test_claims_oldest_job_once(self, repository):
+        """Test: Jobs werden in Reihenfolge und jeweils nur einmal übernommen"""
+        repository.create(ExportJob(id='a', kind='devices'))
+        repository.create(ExportJob(id='b', kind='customer', customer='Parloa'))
+
+        first, second = repository.claim_next(), repository.claim_next()
+
+        assert (first.id, first.status, first.attempts) == ('a', 'running', 1)
+        assert second.id == 'b'
+        assert repository.claim_next() is None
+
+    def test_progress_and_completion(self, repository):
+        """Test: Fortschritt und Ergebnis werden gespeichert"""
+        repository.create(ExportJob(id='a', kind='devices'))
+        repository.claim_next()
+        repository.update_progress('a', 'layout', 0.4)
+        assert (repository.get('a').stage, repository.get('a').progress) == ('layout', 0.4)
+
+        repository.complete('a', 'a.pdf', 1234, pages=7)
+        job = repository.get('a')
+
+        assert (job.status, job.progress, job.size_bytes, job.pages) == ('done', 1.0, 1234, 7)
+        assert job.finished_at is not None
+
+    def test_find_active(self, repository):
+        """Test: Laufende Jobs desselben Exports werden gefunden"""
+        repository.create(ExportJob(id='a', kind='customer', customer='Parloa'))
+
+        assert repository.find_active('customer', 'Parloa').id == 'a'
+        assert repository.find_active('customer', 'Andere') is None
+        assert repository.find_active('devices') is None
+
+    def test_requeue_stale_jobs(self, repository):
+        """Test: Jobs ohne Lebenszeichen werden neu eingereiht, nach max_attempts abgebrochen"""
+        repository.create(ExportJob(id='a', kind='devices'))
+        repository.claim_next()
+
+        assert repository.requeue_stale(timeout_seconds=-1, max_attempts=2) == 1
+        assert repository.get('a').status == 'queued'
+        repository.claim_next()
+        repository.requeue_stale(timeout_seconds=-1, max_attempts=2)
+        assert repository.get('a').status == 'failed'
+
+    def test_requeue_counts_attempt(self, repository):
+        """Test: Neu eingereihte Jobs behalten den Versuch, nach max_attempts failed"""
+        repository.create(ExportJob(id='a', kind='devices'))
+        repository.claim_next()
+
+        assert repository.requeue('a', "crashed", max_attempts=2) is True
+        assert (repository.get('a').status, repository.get('a').error) == ('queued', "crashed")
+        assert repository.claim_next().attempts == 2
+        assert repository.requeue('a', "crashed", max_attempts=2) is False
+        assert repository.get('a').status == 'failed'
+
+    def test_survives_reopen(self, repository):
+        """Test: Jobs bleiben über einen Neustart erhalten"""
+        repository.create(ExportJob(id='a', kind='devices'))
+
+        assert SQLiteExportJobRepository(repository.path).get('a').status == 'queued'
+
+    def test_expire(self, repository):
+        """Test: Abgeschlossene Jobs werden nach Ablauf gelöscht"""
+        repository.create(ExportJob(id='a', kind='devices'))
+        repository.create(ExportJob(id='b', kind='customer', customer='Parloa'))
+        repository.claim_next()
+        repository.fail('a', 'kaputt')
+
+        assert [job.id for job in repository.expire(older_than_seconds=-1)] == ['a']
+        assert repository.get('a') is None and repository.get('b') is not None
+
+
+class TestExportJobUseCases:
+    """Tests für Einreihen und Ausführen"""
+
+    def test_enqueue_reuses_active_job(self, repository):
+        """Test: Gleicher Export während er läuft ergibt keinen zweiten Job"""
+        usecase = EnqueuePDFExportUseCase(repository)
+
+        first = usecase.execute(customer='Parloa')
+        assert usecase.execute(customer='Parloa').id == first.id
+        assert usecase.execute().id != first.id
+
+    def _run_usecase(self, repository, tmp_path, write_pdf=_fake_pdf):
+        devices = Mock()
+        devices.find.return_value = [Device(id=1, name="Bohrer", customer="Parloa",
+                                            customer_device_id="Parloa-00001")]
+        inspections = Mock()
+        inspections.list_for_devices.return_value = {}
+        render_html = Mock(return_value="<html>Parloa-00001</html>")
+        usecase = RunPDFExportJobUseCase(repository, devices, inspections, str(tmp_path),
+                                         render_html=render_html, write_pdf=write_pdf)
+        return usecase, devices, inspections, render_html
+
+    def test_run_writes_pdf(self, repository, tmp_path):
+        """Test: PDF landet im Job-Verzeichnis, Job ist fertig"""
+        repository.create(ExportJob(id='a', kind='customer', customer='Parloa'))
+        repository.claim_next()
+        usecase, devices, inspections, render_html = self._run_usecase(repository, tmp_path)
+
+        assert usecase.execute('a') is True
+        job = repository.get('a')
+        assert (job.status, job.filename, job.pages) == ('done', 'a.pdf', 1)
+        assert (tmp_path / 'a.pdf').read_bytes().startswith(b'%PDF')
+        assert devices.find.call_args[0][0].customer == 'Parloa'
+        assert inspections.list_for_devices.call_args.kwargs['per_device'] == 3
+        assert render_html.call_args.kwargs['customer'] == 'Parloa'
+
+    def test_run_failure_is_recorded(self, repository, tmp_path):
+        """Test: Fehler beim Rendern -> failed, keine halbe Datei"""
+        def broken_pdf(html, path, on_layout=None):
+            with open(path, 'wb') as target:
+                target.write(b'%PDF-1.4 halb')
+            raise RuntimeError("Pango fehlt")
+
+        repository.create(ExportJob(id='a', kind='devices'))
+        repository.claim_next()
+        usecase, _, _, _ = self._run_usecase(repository, tmp_path, write_pdf=broken_pdf)
+
+        assert usecase.execute('a') is False
+        assert repository.get('a').error == "Pango fehlt"
+        assert [name for name in os.listdir(tmp_path) if name.endswith('.pdf')] == []
+
+
+class TestPDFExportWorker:
+    """Tests für den Dispatcher"""
+
+    def test_processes_queue_until_idle(self, repository, tmp_path):
+        """Test: Alle Jobs werden abgearbeitet, Fehler am Job gespeichert"""
+        for job_id in ('a', 'b', 'c'):
+            repository.create(ExportJob(id=job_id, kind='devices'))
+
+        def run_job(job_id):
+            if job_id == 'b':
+                raise RuntimeError("abgestürzt")
+            repository.complete(job_id, f"{job_id}.pdf", 10)
+            return True
+
+        worker = PDFExportWorker(repository, str(tmp_path), processes=2, poll_interval=0.01,
+                                 run_job=run_job, executor_factory=lambda workers: ThreadPoolExecutor(workers))
+
+        assert worker.run(stop_when_idle=True) == 3
+        assert [repository.get(job_id).status for job_id in ('a', 'b', 'c')] == ['done', 'failed', 'done']
+
+    def test_crashed_pool_requeues_jobs(self, repository, tmp_path):
+        """Test: Absturz eines Kindprozesses reiht den Job neu ein statt ihn abzubrechen"""
+        repository.create(ExportJob(id='a', kind='devices'))
+        calls = []
+
+        def run_job(job_id):
+            calls.append(job_id)
+            if len(calls) == 1:
+                raise BrokenProcessPool("child terminated")
+            repository.complete(job_id, f"{job_id}.pdf", 10)
+            return True
+
+        worker = PDFExportWorker(repository, str(tmp_path), poll_interval=0.01, run_job=run_job,
+                                 executor_factory=lambda workers: ThreadPoolExecutor(workers))
+
+        assert worker.run(stop_when_idle=True) == 1
+        assert calls == ['a', 'a']
+        assert (repository.get('a').status, repository.get('a').attempts) == ('done', 2)
+
+    def test_crashing_job_fails_after_max_attempts(self, repository, tmp_path):
+        """Test: Ein Job, der jeden Kindprozess abstürzen lässt, endet nach max_attempts"""
+        repository.create(ExportJob(id='a', kind='devices'))
+
+        def run_job(job_id):
+            raise BrokenProcessPool("child terminated")
+
+        worker = PDFExportWorker(repository, str(tmp_path), poll_interval=0.01, max_attempts=2, run_job=run_job,
+                                 executor_factory=lambda workers: ThreadPoolExecutor(workers))
+        worker.run(stop_when_idle=True)
+
+        job = repository.get('a')
+        assert (job.status, job.attempts) == ('failed', 2)
+        assert "crashed" in job.error
+
+    def test_hung_job_times_out(self, repository, tmp_path):
+        """Test: Hängende Jobs werden nach job_timeout nicht mehr als lebendig gemeldet"""
+        repository.create(ExportJob(id='a', kind='devices'))
+        release = threading.Event()
+
+        worker = PDFExportWorker(repository, str(tmp_path), poll_interval=0.01, max_attempts=2, job_timeout=0.05,
+                                 run_job=lambda job_id: release.wait(5),
+                                 executor_factory=lambda workers: ThreadPoolExecutor(workers))
+        try:
+            worker.run(stop_when_idle=True)
+        finally:
+            release.set()
+
+        job = repository.get('a')
+        assert (job.status, job.attempts) == ('failed', 2)
+        assert "timed out" in job.error
+
+    def test_maintenance_removes_expired_files(self, repository, tmp_path):
+        """Test: Abgelaufene Jobs werden samt Datei entfernt"""
+        repository.create(ExportJob(id='a', kind='devices'))
+        repository.claim_next()
+        repository.complete('a', 'a.pdf', 3)
+        (tmp_path / 'a.pdf').write_bytes(b'pdf')
+
+        worker = PDFExportWorker(repository, str(tmp_path), retention=-1, poll_interval=0.01,
+                                 executor_factory=lambda workers: ThreadPoolExecutor(workers))
+        worker.run(stop_when_idle=True)
+
+        assert not (tmp_path / 'a.pdf').exists()
+        assert repository.get('a') is None
+
+
+class TestPDFJobRoutes:
+    """Tests für /pdf/jobs"""
+
+    @pytest.fixture
+    def client(self):
+        app = create_app()
+        app.config['TESTING'] = True
+        return app.test_client()
+
+    def test_enqueue_and_poll(self, client):
+        """Test: POST liefert 202 mit Status-URL, GET den Fortschritt"""
+        job = ExportJob(id='abc', kind='customer', customer='Parloa')
+        with patch('src.config.dependencies.container.enqueue_pdf_export_usecase.execute',
+                   return_value=job) as enqueue:
+            response = client.post('/pdf/jobs', json={'customer': 'Parloa'})
+
+        assert response.status_code == 202
+        assert response.headers['Location'].endswith('/pdf/jobs/abc')
+        assert enqueue.call_args.kwargs == {'customer': 'Parloa'}
+
+        job.status, job.stage, job.progress = 'running', 'layout', 0.4
+        with patch('src.config.dependencies.container.get_export_job_usecase.execute', return_value=job):
+            response = client.get('/pdf/jobs/abc')
+
+        assert response.json['job']['progress'] == 0.4
+        assert response.headers['Retry-After'] == '2'
+        assert 'download_url' not in response.json['job']
+
+    def test_download(self, client, tmp_path):
+        """Test: Download erst nach Fertigstellung, unbekannte Jobs 404"""
+        job = ExportJob(id='abc', kind='devices', status='running')
+        with patch('src.config.dependencies.container.get_export_job_usecase.execute', return_value=job):
+            assert client.get('/pdf/jobs/abc/download').status_code == 409
+
+        (tmp_path / 'abc.pdf').write_bytes(b'%PDF-1.4')
+        job.status, job.filename = 'done', 'abc.pdf'
+        with patch('src.config.dependencies.container.get_export_job_usecase.execute', return_value=job), \
+                patch('src.config.dependencies.container.pdf_job_directory', str(tmp_path)):
+            response = client.get('/pdf/jobs/abc/download')
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/pdf'
+        assert response.data == b'%PDF-1.4'
+        response.close()
+
+        with patch('src.config.dependencies.container.get_export_job_usecase.execute', return_value=None):
+            assert client.get('/pdf/jobs/xyz').status_code == 404
@@ -0,0 +1,94 @@
+"""Tests für DECIMAL-Prüfwerte (Decimal -> float beim Mapping, exakt für Protokolle)"""
+from decimal import Decimal
+from unittest.mock import patch
+import pytest
+from src.adapters.persistence.converters import DECIMAL_EXACT, decimal_converter, to_float
+from src.adapters.persistence.mysql_device_repository import MySQLDeviceRepository
+from src.adapters.persistence.mysql_inspection_repository import INSPECTION_COLUMNS, MySQLInspectionRepository
+from src.adapters.persistence.row_mapper import build_row_mapper
+
+
+class TestDecimalMapping:
+    """Tests für die Umwandlung der DECIMAL-Spalten"""
+
+    def test_to_float(self):
+        """Test: Decimal wird float, NULL bleibt None"""
+        assert type(to_float(Decimal('0.150'))) is float
+        assert to_float(Decimal('0.150')) == 0.15
+        assert to_float(None) is None
+
+    def test_row_mapper_casts_decimal_columns(self):
+        """Test: Generierter Mapper wandelt nur die DECIMAL-Spalten um"""
+        mapper = build_row_mapper(('id', 'customer', 'name', 'r_pe', 'i_b', 'internal_resistance'))
+
+        device = mapper((1, 'Parloa', 'Bohrer', Decimal('0.150'), None, Decimal('1.2')))
+
+        assert type(device.r_pe) is float and device.r_pe == 0.15
+        assert device.i_b is None
+        assert device.internal_resistance == 1.2
+
+    def test_dict_mapper_casts_decimal_columns(self):
+        """Test: Dict-Mapper liefert float-Prüfwerte"""
+        repository = MySQLDeviceRepository('localhost', 3306, 'test', 'test', 'test_db')
+
+        device = repository._map_to_device({'name': 'Bohrer', 'customer': 'Parloa', 'r_iso': Decimal('250.00')})
+
+        assert type(device.r_iso) is float
+
+    def test_inspection_mapper_casts_decimal_columns(self):
+        """Test: Prüfhistorie liefert float-Prüfwerte"""
+        repository = MySQLInspectionRepository('localhost', 3306, 'test', 'test', 'test_db')
+        row = dict.fromkeys(INSPECTION_COLUMNS)
+        row.update(device_id=1, inspection_date='2024-01-15', result='pass', r_pe=Decimal('0.150'))
+
+        inspection = repository._map_to_inspection(tuple(row[column] for column in INSPECTION_COLUMNS))
+
+        assert type(inspection.r_pe) is float and inspection.r_iso is None
+
+
+class TestExactDecimalMapping:
+    """Tests für den Modus decimals='exact' (Prüfprotokolle)"""
+
+    def test_unknown_mode_raises(self):
+        """Test: Unbekannter Modus wird abgelehnt"""
+        with pytest.raises(ValueError):
+            decimal_converter('double')
+        with pytest.raises(ValueError):
+            build_row_mapper(('id', 'r_pe'), decimals='double')
+        with pytest.raises(ValueError):
+            MySQLDeviceRepository('localhost', 3306, 'test', 'test', 'test_db', decimals='double')
+
+    def test_row_mapper_keeps_decimal(self):
+        """Test: Generierter Mapper übernimmt Decimal mit Skala der Spalte"""
+        mapper = build_row_mapper(('id', 'customer', 'name', 'r_pe', 'i_b'), decimals=DECIMAL_EXACT)
+
+        device = mapper((1, 'Parloa', 'Bohrer', Decimal('0.150'), None))
+
+        assert type(device.r_pe) is Decimal and str(device.r_pe) == '0.150'
+        assert device.i_b is None
+
+    def test_repositories_keep_decimal(self):
+        """Test: Dict-Mapper, Row-Mapper-Cache und Prüfhistorie liefern Decimal"""
+        devices = MySQLDeviceRepository('localhost', 3306, 'test', 'test', 'test_db', decimals=DECIMAL_EXACT)
+        inspections = MySQLInspectionRepository('localhost', 3306, 'test', 'test', 'test_db', decimals=DECIMAL_EXACT)
+        row = dict.fromkeys(INSPECTION_COLUMNS)
+        row.update(device_id=1, inspection_date='2024-01-15', result='pass', r_pe=Decimal('0.150'))
+
+        device = devices._map_to_device({'name': 'Bohrer', 'customer': 'Parloa', 'r_iso': Decimal('250.00')})
+        mapped = devices._row_mappers.get(('id', 'name', 'customer', 'r_iso'))((1, 'Bohrer', 'Parloa', Decimal('250.00')))
+        inspection = inspections._map_to_inspection(tuple(row[column] for column in INSPECTION_COLUMNS))
+
+        assert str(device.r_iso) == '250.00' and str(mapped.r_iso) == '250.00'
+        assert type(inspection.r_pe) is Decimal
+
+
+class TestRepositoryConnection:
+    """Tests für die Verbindungsparameter"""
+
+    @patch('src.adapters.persistence.mysql_device_repository.mysql.connector.connect')
+    def test_connection_keeps_default_converter(self, mock_connect):
+        """Test: Kein converter_class (C-Extension dekodiert weiterhin selbst)"""
+        repository = MySQLDeviceRepository('localhost', 3306, 'test', 'test', 'test_db')
+        repository._get_connection()
+
+        assert 'converter_class' not in mock_connect.call_args[1]
@@ -0,0 +1,169 @@
+"""Tests für den inhaltsadressierten QR-Artefaktspeicher"""
+import multiprocessing
+import os
+import time
+import click
+import pytest
+from unittest.mock import Mock, patch
+from src.main import create_app
+from src.core.domain.device import Device
+from src.core.usecases.device_usecases import WarmUpQRArtifactStoreUseCase
+from src.adapters.services import QRArtifactStore, QRCodeGenerator
+from src.adapters.services.qr_artifact_store import artifact_key
+
+
+def _render_counted(counter_path):
+    with open(counter_path, 'a') as counter:
+        counter.write('x')
+    time.sleep(0.2)
+    return b'<svg/>'
+
+
+def _worker(directory, counter_path):
+    store = QRArtifactStore(directory)
+    store.get_or_create('ab' * 32, lambda: _render_counted(counter_path))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return QRArtifactStore(str(tmp_path / 'qr'))
+
+
+class TestQRArtifactStore:
+    """Tests für QRArtifactStore"""
+
+    def test_key_depends_on_payload_and_options(self):
+        """Test: Schlüssel unterscheidet Inhalt und Render-Optionen"""
+        key = artifact_key('Parloa|Parloa-00001', 'L', 10, 4)
+
+        assert key == artifact_key('Parloa|Parloa-00001', 'L', 10, 4)
+        assert key != artifact_key('Parloa|Parloa-00002', 'L', 10, 4)
+        assert key != artifact_key('Parloa|Parloa-00001', 'H', 10, 4)
+
+    def test_put_is_atomic_and_leaves_no_temp_files(self, store):
+        """Test: Schreiben ersetzt die Datei vollständig ohne Reste"""
+        key = artifact_key('a', 'L', 10, 4)
+        store.put(key, b'<svg>1</svg>')
+        store.put(key, b'<svg>2</svg>')
+
+        folder = os.path.dirname(store.path(key))
+        assert store.get(key) == b'<svg>2</svg>'
+        assert os.listdir(folder) == [key + '.svg']
+
+    def test_get_or_create_renders_once(self, store):
+        """Test: Zweiter Zugriff liest von der Platte"""
+        render = Mock(return_value=b'<svg/>')
+        key = artifact_key('a', 'L', 10, 4)
+
+        assert store.get_or_create(key, render) == b'<svg/>'
+        assert store.get_or_create(key, render) == b'<svg/>'
+        render.assert_called_once()
+
+    def test_concurrent_processes_compute_once(self, store, tmp_path):
+        """Test: Mehrere Prozesse erzeugen dasselbe Artefakt nur einmal"""
+        counter_path = str(tmp_path / 'renders')
+        context = multiprocessing.get_context('fork')
+        workers = [context.Process(target=_worker, args=(store.directory, counter_path)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(10)
+
+        with open(counter_path) as counter:
+            assert counter.read() == 'x'
+        assert store.get('ab' * 32) == b'<svg/>'
+
+    def test_cleanup_removes_unreferenced_old_artifacts(self, store):
+        """Test: Cleanup löscht nur nicht adressierte Artefakte vor dem Stichzeitpunkt"""
+        live, stale, fresh = (artifact_key(p, 'L', 10, 4) for p in ('live', 'stale', 'fresh'))
+        store.put(live, b'1')
+        store.put(stale, b'2')
+        cutoff = time.time()
+        os.utime(store.path(live), (cutoff - 60, cutoff - 60))
+        os.utime(store.path(stale), (cutoff - 60, cutoff - 60))
+        store.put(fresh, b'3')
+        os.utime(store.path(fresh), (cutoff + 60, cutoff + 60))
+
+        removed = store.cleanup([live], older_than=cutoff)
+
+        assert removed == 1
+        assert store.exists(live) and store.exists(fresh)
+        assert not store.exists(stale)
+        assert store.stats() == {'files': 2, 'size_bytes': 2}
+
+    def test_exclusive_lock_is_not_reentrant_across_holders(self, store):
+        """Test: Zweiter Halter der Warm-up-Sperre wird abgewiesen"""
+        with store.exclusive('warmup') as first:
+            with store.exclusive('warmup') as second:
+                assert first is True
+                assert second is False
+        with store.exclusive('warmup') as again:
+            assert again is True
+
+
+class TestQRCodeGeneratorWithStore:
+    """Tests für QRCodeGenerator mit Dateispeicher"""
+
+    @pytest.fixture(autouse=True)
+    def configured_store(self, store):
+        QRCodeGenerator.clear_cache()
+        QRCodeGenerator.use_artifact_store(store)
+        yield store
+        QRCodeGenerator.use_artifact_store(None)
+        QRCodeGenerator.clear_cache()
+
+    def test_restart_reads_from_disk(self, configured_store):
+        """Test: Nach Verlust des In-Process-Caches wird nicht neu gerendert"""
+        first = QRCodeGenerator.generate_qr_code("Parloa-00001", "Parloa")
+        QRCodeGenerator.clear_cache()
+        with patch('src.adapters.services.qr_generators.qrcode.QRCode') as encoder:
+            second = QRCodeGenerator.generate_qr_code("Parloa-00001", "Parloa")
+
+        encoder.assert_not_called()
+        assert second == first
+        assert configured_store.stats()['files'] == 1
+
+    def test_warm_up_renders_devices_and_removes_deleted(self, configured_store):
+        """Test: Warm-up rendert alle Geräte und entfernt verwaiste Artefakte"""
+        orphan = artifact_key('Parloa|Parloa-00099', 'L', 10, 4)
+        configured_store.put(orphan, b'<svg/>')
+        os.utime(configured_store.path(orphan), (time.time() - 60, time.time() - 60))
+        repository = Mock()
+        repository.iter_find.return_value = iter([
+            Device(name='Bohrer', customer='Parloa', customer_device_id='Parloa-00001'),
+            Device(name='Säge', customer='Parloa', customer_device_id='Parloa-00002'),
+        ])
+
+        result = WarmUpQRArtifactStoreUseCase(repository).execute()
+
+        assert result == {'devices': 2, 'removed': 1}
+        assert not configured_store.exists(orphan)
+        assert configured_store.exists(artifact_key('Parloa|Parloa-00002', 'L', 10, 4))
+
+    def test_warm_up_skipped_without_store(self):
+        """Test: Ohne Dateispeicher passiert nichts"""
+        QRCodeGenerator.use_artifact_store(None)
+        repository = Mock()
+
+        assert WarmUpQRArtifactStoreUseCase(repository).execute() is None
+        repository.iter_find.assert_not_called()
+
+    def test_warm_up_starts_for_web_server_only(self, monkeypatch):
+        """Test: create_app startet den Warm-up-Thread, unter der Flask-CLI nicht"""
+        monkeypatch.setenv('QR_STORE_DIR', '/tmp/qr-store')
+        monkeypatch.delenv('QR_STORE_WARMUP', raising=False)
+        with patch('src.main.Thread') as thread:
+            create_app()
+            assert thread.call_count == 1
+
+            with click.Context(click.Command('backfill-qr')):
+                create_app()
+            assert thread.call_count == 1
+
+    def test_derived_variant_renders_under_same_lock(self, configured_store):
+        """Test: Abgeleitete Variante (svg.gz aus svg) blockiert nicht an der eigenen Sperre"""
+        key, compressed = QRCodeGenerator.image("Parloa-00001", "Parloa", 'svg.gz')
+
+        assert configured_store.exists(key, '.svg')
+        assert configured_store.exists(key, '.svg.gz')
+        assert compressed.startswith(b'\x1f\x8b')
@@ -0,0 +1,128 @@
+"""Tests für den LRU-Cache des QR-Code-Generators"""
+import json
+import pytest
+from unittest.mock import patch
+from src.main import create_app
+from src.adapters.services import ByteLRUCache, QRCodeGenerator
+
+
+class TestByteLRUCache:
+    """Tests für ByteLRUCache"""
+
+    def test_hit_miss_statistics(self):
+        """Test: Treffer und Fehlzugriffe werden gezählt"""
+        cache = ByteLRUCache(max_bytes=100)
+        cache.put('a', b'123')
+
+        assert cache.get('a') == b'123'
+        assert cache.get('b') is None
+        assert cache.stats()['hit_rate'] == 0.5
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        """Test: Byte-Limit verdrängt den am längsten ungenutzten Eintrag"""
+        cache = ByteLRUCache(max_bytes=10)
+        cache.put('a', b'1234')
+        cache.put('b', b'1234')
+        cache.get('a')
+        cache.put('c', b'1234')
+
+        assert cache.get('b') is None
+        assert cache.get('a') == b'1234'
+        assert cache.size_bytes == 8
+        assert cache.evictions == 1
+
+    def test_entry_limit_and_oversized_values(self):
+        """Test: Eintragslimit greift, zu große Werte werden nicht gespeichert"""
+        cache = ByteLRUCache(max_bytes=100, max_entries=2)
+        for key in 'abc':
+            cache.put(key, b'x')
+        cache.put('big', b'x' * 101)
+
+        assert len(cache) == 2
+        assert cache.get('big') is None
+
+    def test_replacing_key_updates_size(self):
+        """Test: Überschreiben korrigiert die Größe"""
+        cache = ByteLRUCache(max_bytes=100)
+        cache.put('a', b'12345')
+        cache.put('a', b'12')
+
+        assert cache.size_bytes == 2
+
+
+class TestQRCodeGeneratorCache:
+    """Tests für das Caching in QRCodeGenerator"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        QRCodeGenerator.clear_cache()
+        yield
+        QRCodeGenerator.clear_cache()
+
+    def test_repeated_payload_skips_encoder(self):
+        """Test: Zweiter Aufruf mit gleichem Inhalt kommt aus dem Cache"""
+        first = QRCodeGenerator.generate_qr_code("Parloa-00001", "Parloa")
+        with patch('src.adapters.services.qr_generators.qrcode.QRCode') as encoder:
+            second = QRCodeGenerator.generate_qr_code("Parloa-00001", "Parloa")
+
+        encoder.assert_not_called()
+        assert second == first
+        assert QRCodeGenerator.cache_stats()['hits'] == 1
+
+    def test_render_options_are_part_of_the_key(self):
+        """Test: Andere Render-Optionen ergeben einen eigenen Eintrag"""
+        default = QRCodeGenerator.generate_qr_code("Parloa-00001", "Parloa")
+        robust = QRCodeGenerator.generate_qr_code("Parloa-00001", "Parloa", error_correction='H')
+
+        assert default != robust
+        assert QRCodeGenerator.cache_stats()['entries'] == 2
+
+    def test_no_output_per_call(self, capsys):
+        """Test: Keine Konsolenausgabe pro generiertem QR-Code"""
+        QRCodeGenerator.generate_qr_code("Parloa-00002", "Parloa")
+
+        assert capsys.readouterr().out == ''
+
+    def test_stats_endpoint(self):
+        """Test: GET /api/devices/qr-codes/cache liefert die Statistik"""
+        app = create_app()
+        app.config['TESTING'] = True
+        QRCodeGenerator.generate_qr_code("Parloa-00003", "Parloa")
+
+        response = app.test_client().get('/api/devices/qr-codes/cache')
+
+        assert json.loads(response.data)['data']['entries'] == 1
+
+
+class TestGenerateMany:
+    """Tests für die Batch-Erzeugung QRCodeGenerator.generate_many"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        QRCodeGenerator.clear_cache()
+        yield
+        QRCodeGenerator.clear_cache()
+
+    def test_results_in_input_order_with_cache_hits_merged(self):
+        """Test: Reihenfolge bleibt erhalten, Cache-Treffer werden nicht neu berechnet"""
+        warm = QRCodeGenerator.generate_qr_code("Parloa-00002", "Parloa")
+        codes = [("Parloa-00001", "Parloa"), ("Parloa-00002", "Parloa"), ("Parloa-00003", "Parloa")]
+
+        with patch('src.adapters.services.qr_code_generator.QRCodeGenerator.generate_qr_code',
+                   side_effect=lambda device_id, customer, **options: device_id.encode()) as encoder:
+            results = QRCodeGenerator.generate_many(codes)
+
+        assert results == [b"Parloa-00001", warm, b"Parloa-00003"]
+        assert encoder.call_count == 2
+
+    def test_process_pool_matches_sequential(self):
+        """Test: Parallele Erzeugung liefert dieselben QR-Codes wie sequentiell"""
+        codes = [(f"Parloa-{i:05d}", "Parloa") for i in range(1, 9)]
+
+        parallel = QRCodeGenerator.generate_many(codes, workers=2, threshold=1)
+        QRCodeGenerator.clear_cache()
+        sequential = QRCodeGenerator.generate_many(codes, workers=1)
+
+        assert parallel == sequential
+        assert all(parallel)
+        assert QRCodeGenerator.cache_stats()['entries'] == len(codes)
@@ -0,0 +1,165 @@
+"""Tests für die QRGenerator-Adapter (SVG-Pfad, SVG-Rechtecklauf, PNG)"""
+import base64
+import os
+import pytest
+from src.core.ports.qr_generator import QRGenerator
+from src.adapters.services import QRCodeGenerator
+from src.adapters.services import qr_code_generator
+from src.adapters.services.qr_artifact_store import QRArtifactStore
+from src.adapters.services.qr_generators import (
+    PNGQRGenerator, QR_GENERATORS, SVGPathQRGenerator, SVGRectRunQRGenerator, create_qr_generator
+)
+
+
+PAYLOAD = "Parloa|Parloa-00001"
+
+
+def _dark_modules(generator, payload: str = PAYLOAD) -> set:
+    return {(x, y) for y, row in enumerate(generator.matrix(payload)) for x, dark in enumerate(row) if dark}
+
+
+class TestQRGenerators:
+    """Tests für die Adapter des QRGenerator-Ports"""
+
+    @pytest.mark.parametrize("name", sorted(QR_GENERATORS))
+    def test_adapters_implement_port(self, name):
+        """Test: Jeder Adapter erfüllt den Port und liefert Bytes"""
+        generator = create_qr_generator(name)
+
+        assert isinstance(generator, QRGenerator)
+        assert generator.generate(PAYLOAD)
+
+    def test_output_formats(self):
+        """Test: SVG- bzw. PNG-Ausgabe mit passendem MIME-Typ"""
+        assert SVGPathQRGenerator().generate(PAYLOAD).startswith(b'<?xml')
+        assert SVGRectRunQRGenerator().generate(PAYLOAD).startswith(b'<svg')
+        assert PNGQRGenerator().generate(PAYLOAD).startswith(b'\x89PNG')
+        assert PNGQRGenerator.mimetype == 'image/png'
+
+    def test_rect_runs_cover_exactly_the_dark_modules(self):
+        """Test: Das kompakte SVG zeichnet genau die dunklen Module der Matrix"""
+        import re
+        generator = SVGRectRunQRGenerator()
+        svg = generator.encode(PAYLOAD)
+        drawn = set()
+        for x, y, length in re.findall(rb'M(\d+) (\d+)h(\d+)', svg):
+            drawn.update((int(x) + offset, int(y)) for offset in range(int(length)))
+
+        assert drawn == _dark_modules(generator)
+        assert len(svg) < len(SVGPathQRGenerator().encode(PAYLOAD))
+
+    def test_error_correction_changes_matrix(self):
+        """Test: Höhere Fehlerkorrektur ergibt eine andere (größere) Matrix"""
+        low = SVGPathQRGenerator('L').matrix(PAYLOAD)
+        high = SVGPathQRGenerator('H').matrix(PAYLOAD)
+
+        assert len(high) >= len(low)
+        assert high != low
+
+    def test_invalid_settings_raise(self):
+        """Test: Ungültige Einstellungen und unbekannte Adapter werden abgelehnt"""
+        with pytest.raises(ValueError):
+            SVGPathQRGenerator(error_correction='X')
+        with pytest.raises(ValueError):
+            PNGQRGenerator(box_size=0)
+        with pytest.raises(ValueError):
+            create_qr_generator('jpeg')
+
+    def test_with_settings(self):
+        """Test: Gleiche Einstellungen liefern denselben Adapter, andere eine Kopie"""
+        generator = SVGRectRunQRGenerator()
+
+        assert generator.with_settings('L', 10, 4) is generator
+        other = generator.with_settings(error_correction='H')
+        assert isinstance(other, SVGRectRunQRGenerator)
+        assert (other.error_correction, other.box_size, other.border) == ('H', 10, 4)
+
+    def test_generate_returns_none_on_error(self):
+        """Test: Zu lange Inhalte führen zu None statt einer Exception"""
+        assert SVGPathQRGenerator().generate("x" * 5000) is None
+
+    def test_generate_to_file(self, tmp_path):
+        """Test: Datei wird vollständig geschrieben, keine temporären Reste"""
+        target = tmp_path / "qr.png"
+
+        assert PNGQRGenerator().generate_to_file(PAYLOAD, str(target)) is True
+        assert target.read_bytes() == PNGQRGenerator().encode(PAYLOAD)
+        assert os.listdir(tmp_path) == ["qr.png"]
+        assert PNGQRGenerator().generate_to_file(PAYLOAD, str(tmp_path / "missing" / "qr.png")) is False
+
+
+class TestInjectedEncoder:
+    """Tests für den austauschbaren Encoder des QRCodeGenerator"""
+
+    def test_use_encoder_switches_output_and_keys(self):
+        """Test: Der gesetzte Encoder erzeugt die SVGs und ist Teil der Schlüssel"""
+        previous = QRCodeGenerator.encoder()
+        QRCodeGenerator.clear_cache()
+        try:
+            path_key, _ = QRCodeGenerator.image("Parloa-00001", "Parloa")
+            QRCodeGenerator.use_encoder(SVGRectRunQRGenerator())
+            qr_code = QRCodeGenerator.generate_qr_code("Parloa-00001", "Parloa")
+            rect_key, _ = QRCodeGenerator.image("Parloa-00001", "Parloa")
+
+            assert base64.b64decode(qr_code) == SVGRectRunQRGenerator().encode(PAYLOAD)
+            assert rect_key != path_key
+        finally:
+            QRCodeGenerator.use_encoder(previous)
+            QRCodeGenerator.clear_cache()
+
+    def test_image_cache_and_etag_follow_encoder(self):
+        """Test: Nach use_encoder keine alten Bytes aus dem In-Process-Cache, ETag und v passen"""
+        previous = QRCodeGenerator.encoder()
+        QRCodeGenerator.clear_cache()
+        try:
+            path_key, path_svg = QRCodeGenerator.image("Parloa-00001", "Parloa")
+            QRCodeGenerator.use_encoder(SVGRectRunQRGenerator())
+            rect_key, rect_svg = QRCodeGenerator.image("Parloa-00001", "Parloa")
+
+            assert rect_key != path_key
+            assert rect_svg == SVGRectRunQRGenerator().encode(PAYLOAD) != path_svg
+            assert qr_code_generator.qr_version("Parloa-00001", "Parloa") == rect_key[:16]
+        finally:
+            QRCodeGenerator.use_encoder(previous)
+            QRCodeGenerator.clear_cache()
+
+    def test_png_key_includes_box_size(self, tmp_path, monkeypatch):
+        """Test: PNG-Artefakte liegen unter dem Schlüssel des PNG-Encoders (inkl. PNG_BOX_SIZE)"""
+        previous_store = QRCodeGenerator.artifact_store()
+        QRCodeGenerator.use_artifact_store(QRArtifactStore(str(tmp_path)))
+        QRCodeGenerator.clear_cache()
+        try:
+            svg_key, _ = QRCodeGenerator.image("Parloa-00001", "Parloa", 'svg')
+            png_key, png = QRCodeGenerator.image("Parloa-00001", "Parloa", 'png')
+            monkeypatch.setattr(qr_code_generator, 'PNG_BOX_SIZE', 4)
+            QRCodeGenerator.use_encoder(QRCodeGenerator.encoder())
+            small_key, small = QRCodeGenerator.image("Parloa-00001", "Parloa", 'png')
+
+            assert png_key != svg_key
+            assert small_key != png_key
+            assert small == PNGQRGenerator(box_size=4).encode(PAYLOAD) != png
+            assert qr_code_generator.qr_version("Parloa-00001", "Parloa", 'png') == small_key[:16]
+        finally:
+            monkeypatch.undo()
+            QRCodeGenerator.use_encoder(QRCodeGenerator.encoder())
+            QRCodeGenerator.use_artifact_store(previous_store)
+            QRCodeGenerator.clear_cache()
+
+    def test_process_pool_uses_injected_encoder(self):
+        """Test: Kindprozesse des Pools (spawn) erzeugen mit dem gesetzten Encoder"""
+        previous = QRCodeGenerator.encoder()
+        QRCodeGenerator.clear_cache()
+        try:
+            QRCodeGenerator.use_encoder(SVGRectRunQRGenerator(error_correction='M'))
+            codes = QRCodeGenerator.generate_many([("Parloa-00001", "Parloa"), ("Parloa-00002", "Parloa")],
+                                                  workers=2, threshold=1)
+
+            assert base64.b64decode(codes[0]) == SVGRectRunQRGenerator(error_correction='M').encode(PAYLOAD)
+        finally:
+            QRCodeGenerator.use_encoder(previous)
+            QRCodeGenerator.clear_cache()
+
+    def test_use_encoder_rejects_raster(self):
+        """Test: Gespeicherte QR-Codes bleiben SVG"""
+        with pytest.raises(ValueError):
+            QRCodeGenerator.use_encoder(PNGQRGenerator())
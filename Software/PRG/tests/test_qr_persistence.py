@@ -0,0 +1,176 @@
+"""Tests für gespeicherte QR-Codes (Anlegen, Backfill, Anzeige ohne Encoder)"""
+import json
+import pytest
+from unittest.mock import Mock, patch
+from src.main import create_app
+from src.core.domain.device import Device
+from src.core.usecases.device_usecases import BackfillQRCodesUseCase, UpdateDeviceUseCase
+from src.adapters.persistence.mysql_device_repository import MySQLDeviceRepository
+from src.adapters.services import QRCodeGenerator
+from src.adapters.web.presenters import qr_data_uri
+
+
+class TestQrDataUri:
+    """Tests für den Template-Filter qr_data_uri"""
+
+    def test_builds_svg_data_uri_from_stored_bytes(self):
+        """Test: Base64-SVG aus der DB wird zur Data-URI"""
+        assert qr_data_uri(b"PHN2Zz4=") == "data:image/svg+xml;base64,PHN2Zz4="
+
+    def test_missing_qr_code_returns_none(self):
+        """Test: Ohne gespeicherten QR-Code kein Bild"""
+        assert qr_data_uri(None) is None
+        assert qr_data_uri(b"") is None
+
+
+class TestRepositoryStoresQrCode:
+    """Tests für das Speichern des QR-Codes im Repository"""
+
+    @patch('src.adapters.persistence.mysql_device_repository.mysql.connector.connect')
+    def test_create_writes_qr_code_column(self, mock_connect):
+        """Test: INSERT schreibt devices.qr_code"""
+        cursor = Mock(lastrowid=3)
+        mock_connect.return_value.cursor.return_value = cursor
+        repository = MySQLDeviceRepository('localhost', 3306, 'test', 'test', 'test_db')
+
+        repository.create(Device(name="Bohrer", customer="Parloa", customer_device_id="Parloa-00003",
+                                 qr_code=b"PHN2Zz4="))
+
+        query, values = cursor.execute.call_args[0]
+        assert "qr_code" in query
+        assert values[-1] == b"PHN2Zz4="
+
+
+class TestBackfillQRCodesUseCase:
+    """Tests für BackfillQRCodesUseCase"""
+
+    def test_generates_codes_batchwise_by_id(self):
+        """Test: Batches über den Primärschlüssel, bis keine Geräte mehr fehlen"""
+        repository = Mock()
+        repository.get_without_qr_code.side_effect = [
+            [Device(id=1, name="A", customer="Parloa", customer_device_id="Parloa-00001"),
+             Device(id=4, name="B", customer="Parloa", customer_device_id="Parloa-00004")],
+            [],
+        ]
+        repository.update_qr_codes.side_effect = lambda codes: len(codes)
+
+        updated = BackfillQRCodesUseCase(repository, batch_size=2).execute()
+
+        assert updated == 2
+        assert repository.get_without_qr_code.call_args_list[1].kwargs == {'limit': 2, 'after_id': 4}
+        assert set(repository.update_qr_codes.call_args[0][0]) == {1, 4}
+
+    def test_respects_max_devices(self):
+        """Test: max_devices begrenzt die Anzahl pro Aufruf"""
+        repository = Mock()
+        repository.get_without_qr_code.return_value = [Device(id=1, name="A", customer="A", customer_device_id="A-00001")]
+        repository.update_qr_codes.side_effect = lambda codes: len(codes)
+
+        assert BackfillQRCodesUseCase(repository, batch_size=50).execute(max_devices=1) == 1
+        assert repository.get_without_qr_code.call_args.kwargs['limit'] == 1
+
+    def test_refresh_stale_rewrites_only_outdated_codes(self):
+        """Test: Mit refresh_stale werden nur fehlende und veraltete QR-Codes gespeichert"""
+        current = QRCodeGenerator.generate_qr_code("Parloa-00001", "Parloa")
+        repository = Mock()
+        repository.get_qr_code_batch.side_effect = [
+            [Device(id=1, name="A", customer="Parloa", customer_device_id="Parloa-00001", qr_code=current),
+             Device(id=2, name="B", customer="Parloa", customer_device_id="Parloa-00002", qr_code=b"alt"),
+             Device(id=3, name="C", customer="Parloa", customer_device_id="Parloa-00003")],
+            [],
+        ]
+        repository.update_qr_codes.side_effect = lambda codes: len(codes)
+        reports = []
+
+        updated = BackfillQRCodesUseCase(repository, batch_size=3).execute(
+            refresh_stale=True, after_id=0, on_batch=lambda progress: reports.append(progress.to_dict()))
+
+        assert updated == 2
+        assert set(repository.update_qr_codes.call_args[0][0]) == {2, 3}
+        assert reports[0]['scanned'] == 3 and reports[0]['stale'] == 1 and reports[0]['last_id'] == 3
+        repository.get_without_qr_code.assert_not_called()
+
+    def test_resumes_after_id(self):
+        """Test: after_id setzt einen abgebrochenen Lauf fort"""
+        repository = Mock()
+        repository.get_without_qr_code.return_value = []
+
+        assert BackfillQRCodesUseCase(repository).execute(after_id=41) == 0
+        assert repository.get_without_qr_code.call_args.kwargs['after_id'] == 41
+
+
+class TestBackfillCommand:
+    """Tests für flask backfill-qr"""
+
+    @pytest.fixture
+    def app(self):
+        app = create_app()
+        app.config['TESTING'] = True
+        return app
+
+    def _repository(self):
+        repository = Mock()
+        repository.get_without_qr_code.side_effect = lambda limit, after_id: [
+            Device(id=i, name="A", customer="Parloa", customer_device_id=f"Parloa-{i:05d}")
+            for i in range(after_id + 1, min(after_id + limit, 5) + 1)
+        ]
+        repository.update_qr_codes.side_effect = lambda codes: len(codes)
+        return repository
+
+    def test_writes_checkpoint_and_resumes(self, app, tmp_path):
+        """Test: Zustandsdatei nach jedem Batch, Fortsetzen ab der letzten id"""
+        state = tmp_path / 'backfill.json'
+        repository = self._repository()
+        with patch('src.config.dependencies.container.device_repository', repository):
+            result = app.test_cli_runner().invoke(
+                args=['backfill-qr', '--batch-size', '2', '--limit', '2', '--state-file', str(state)])
+
+            assert result.exit_code == 0, result.output
+            assert json.loads(state.read_text()) == {'after_id': 2, 'refresh_stale': False}
+
+            result = app.test_cli_runner().invoke(
+                args=['backfill-qr', '--batch-size', '2', '--state-file', str(state)])
+
+        assert result.exit_code == 0, result.output
+        assert "3 QR-Codes gespeichert" in result.output
+        assert repository.get_without_qr_code.call_args_list[1].kwargs['after_id'] == 2
+        # Vollständiger Lauf: Zustandsdatei entfernt
+        assert not state.exists()
+
+
+class TestUpdateDeviceUseCase:
+    """Tests für das Neuerzeugen des QR-Codes beim Ändern"""
+
+    def test_update_regenerates_qr_code(self):
+        """Test: Update erzeugt den QR-Code neu (Kunde ist Teil des Inhalts)"""
+        repository = Mock()
+        repository.update.side_effect = lambda device: device
+
+        updated = UpdateDeviceUseCase(repository).execute(
+            Device(id=1, name="A", customer="Miro", customer_device_id="Parloa-00001"))
+
+        assert updated.qr_code
+
+
+class TestPagesDoNotEncode:
+    """Tests: Seitenaufbau ruft den QR-Encoder nicht auf"""
+
+    @pytest.fixture
+    def client(self):
+        app = create_app()
+        app.config['TESTING'] = True
+        return app.test_client()
+
+    def test_device_detail_references_qr_image(self, client):
+        """Test: /device/<id> verweist auf das cachebare QR-Bild statt einer Data-URI"""
+        device = Device(id=1, name="Bohrer", customer="Parloa", customer_device_id="Parloa-00001",
+                        qr_code=b"PHN2Zz4=")
+        with patch('src.config.dependencies.container.device_repository.get_by_id', return_value=device), \
+                patch('src.config.dependencies.container.list_inspections_usecase.execute', return_value=[]), \
+                patch('src.adapters.services.qr_code_generator.QRCodeGenerator.generate_qr_code') as encoder:
+            response = client.get('/device/1')
+
+        assert response.status_code == 200
+        assert b'src="/qr/Parloa-00001.svg?v=' in response.data
+        assert b"data:image/svg+xml" not in response.data
+        encoder.assert_not_called()
@@ -0,0 +1,119 @@
+"""Tests für den QR-Bild-Endpunkt /qr/<customer_device_id>.svg|png"""
+import gzip
+import pytest
+from unittest.mock import patch
+from src.main import create_app
+from src.core.domain.device import Device
+from src.adapters.persistence.mysql_device_repository import MySQLDeviceRepository
+from src.adapters.services import QRCodeGenerator
+from src.adapters.services.qr_code_generator import qr_version
+
+
+DEVICE = Device(id=1, name="Bohrer", customer="Parloa", customer_device_id="Parloa-00001")
+
+
+@pytest.fixture
+def client():
+    app = create_app()
+    app.config['TESTING'] = True
+    return app.test_client()
+
+
+@pytest.fixture(autouse=True)
+def device_lookup():
+    QRCodeGenerator.clear_cache()
+    with patch('src.config.dependencies.container.get_device_customer_usecase.execute',
+               return_value=DEVICE.customer) as lookup:
+        yield lookup
+    QRCodeGenerator.clear_cache()
+
+
+class TestQRImageRoute:
+    """Tests für GET /qr/<customer_device_id>.<format>"""
+
+    def test_svg_with_strong_etag(self, client):
+        """Test: SVG mit starkem ETag, ohne Version nur revalidierbar"""
+        response = client.get('/qr/Parloa-00001.svg')
+
+        assert response.status_code == 200
+        assert response.mimetype == 'image/svg+xml'
+        assert response.data.startswith(b'<?xml')
+        etag, weak = response.get_etag()
+        assert etag and not weak
+        assert response.headers['Cache-Control'] == 'no-cache'
+
+    def test_versioned_url_is_immutable(self, client):
+        """Test: Mit passender Version ist die Antwort unveränderlich cachebar"""
+        response = client.get(f'/qr/Parloa-00001.svg?v={qr_version("Parloa-00001", "Parloa")}')
+
+        assert 'immutable' in response.headers['Cache-Control']
+
+    def test_if_none_match_returns_304(self, client):
+        """Test: Bekannter ETag ergibt 304 ohne Body"""
+        etag = client.get('/qr/Parloa-00001.png').get_etag()[0]
+
+        response = client.get('/qr/Parloa-00001.png', headers={'If-None-Match': f'"{etag}"'})
+
+        assert response.status_code == 304
+        assert response.data == b''
+
+    def test_gzip_variant(self, client):
+        """Test: Bei Accept-Encoding gzip wird das vorkomprimierte SVG geliefert"""
+        plain = client.get('/qr/Parloa-00001.svg')
+        response = client.get('/qr/Parloa-00001.svg', headers={'Accept-Encoding': 'gzip, br'})
+
+        assert response.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in response.headers['Vary']
+        assert gzip.decompress(response.data) == plain.data
+        assert response.get_etag()[0] != plain.get_etag()[0]
+
+    def test_png(self, client):
+        """Test: PNG-Variante"""
+        response = client.get('/qr/Parloa-00001.png')
+
+        assert response.mimetype == 'image/png'
+        assert response.data.startswith(b'\x89PNG')
+
+    def test_unknown_device_and_format(self, client, device_lookup):
+        """Test: Unbekanntes Format oder Gerät ergibt 404"""
+        assert client.get('/qr/Parloa-00001.gif').status_code == 404
+        device_lookup.return_value = None
+        assert client.get('/qr/Parloa-99999.svg').status_code == 404
+
+    @patch('src.adapters.persistence.mysql_device_repository.mysql.connector.connect')
+    def test_lookup_reads_only_customer(self, mock_connect):
+        """Test: Bild-Endpunkt liest nur die Spalte customer (kein qr_code BLOB)"""
+        cursor = mock_connect.return_value.cursor.return_value
+        cursor.fetchone.return_value = ("Parloa",)
+        repository = MySQLDeviceRepository('localhost', 3306, 'test', 'test', 'test_db')
+
+        assert repository.get_customer_of("Parloa-00001") == "Parloa"
+        assert cursor.execute.call_args[0][0] == "SELECT customer FROM devices WHERE customer_device_id = %s"
+        cursor.fetchone.return_value = None
+        assert repository.get_customer_of("Parloa-99999") is None
+
+
+class TestDeviceListReferencesImages:
+    """Tests: Geräteliste lädt QR-Codes als Bilder"""
+
+    def test_devices_page_uses_lazy_image_urls(self, client):
+        """Test: /devices enthält nur Bild-URLs mit loading=lazy"""
+        with patch('src.config.dependencies.container.list_devices_usecase.execute', return_value=[DEVICE]):
+            response = client.get('/devices')
+
+        assert response.status_code == 200
+        assert b'src="/qr/Parloa-00001.svg?v=' in response.data
+        assert b'loading="lazy"' in response.data
+        assert b'data:image/svg+xml' not in response.data
+
+    def test_print_view_uses_image_urls(self, client):
+        """Test: Druckansicht rendert ohne Encoder und verweist auf /qr-URLs"""
+        with patch('src.config.dependencies.container.list_devices_usecase.execute',
+                   return_value=[DEVICE]) as mock_list, \
+                patch.object(QRCodeGenerator, 'generate_many') as mock_generate:
+            response = client.get('/api/devices/print')
+
+        assert response.status_code == 200
+        assert b'src="/qr/Parloa-00001.svg?v=' in response.data
+        assert mock_list.call_args[0][0].sort == ('-id',)
+        mock_generate.assert_not_called()
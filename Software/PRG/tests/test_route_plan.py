@@ -0,0 +1,133 @@
+"""Tests für die Prüfroute (Gruppierung nach Standort-Hierarchie)"""
+import json
+import pytest
+from datetime import date, timedelta
+from unittest.mock import Mock, patch
+from src.main import create_app
+from src.core.domain import dates
+from src.core.domain.device import Device
+from src.core.domain.route_plan import build_route_plan, parse_location, UNASSIGNED_LOCATION
+from src.core.usecases.device_usecases import PlanInspectionRouteUseCase
+
+
+def _device(device_id, location, customer_device_id=None, next_inspection=None):
+    return Device(id=device_id, name=f"Gerät {device_id}", customer="Parloa", location=location,
+                  customer_device_id=customer_device_id or f"Parloa-{device_id:05d}",
+                  next_inspection=next_inspection or date(2025, 6, 1))
+
+
+class TestParseLocation:
+    """Tests für parse_location"""
+
+    def test_splits_hierarchy_levels(self):
+        """Test: "Berlin - Büro - MB1" wird in Ebenen zerlegt"""
+        assert parse_location("Berlin - Büro - MB1") == ("Berlin", "Büro", "MB1")
+        assert parse_location(" Hamburg / Lager ") == ("Hamburg", "Lager")
+
+    def test_keeps_hyphenated_names(self):
+        """Test: Bindestrich ohne Leerzeichen trennt nicht"""
+        assert parse_location("Berlin - Ost-Flügel - R-12") == ("Berlin", "Ost-Flügel", "R-12")
+
+    def test_empty_location(self):
+        """Test: Ohne Standort eigene Gruppe"""
+        assert parse_location(None) == (UNASSIGNED_LOCATION,)
+        assert parse_location("   ") == (UNASSIGNED_LOCATION,)
+
+
+class TestBuildRoutePlan:
+    """Tests für build_route_plan"""
+
+    def test_groups_by_room_in_natural_order(self):
+        """Test: Räume natürlich sortiert, Geräte ohne Standort zuletzt"""
+        devices = [
+            _device(1, "Berlin - Büro - MB10"),
+            _device(2, None),
+            _device(3, "Berlin - Büro - MB2", "Parloa-00010"),
+            _device(4, "Berlin - Büro - MB2", "Parloa-00009"),
+            _device(5, "Aachen - Halle"),
+            _device(6, "Berlin - Büro - MB10"),
+        ]
+
+        plan = build_route_plan(devices, "Parloa", until=date(2025, 6, 30))
+
+        assert [room.location for room in plan.rooms] == [
+            "Aachen - Halle", "Berlin - Büro - MB2", "Berlin - Büro - MB10", UNASSIGNED_LOCATION
+        ]
+        assert [d.id for d in plan.rooms[1].devices] == [4, 3]
+        assert plan.total_devices == 6
+        assert [site for site, _ in plan.sites()] == ["Aachen", "Berlin", UNASSIGNED_LOCATION]
+        assert len(plan.sites()[1][1]) == 2
+
+    def test_overdue_count(self):
+        """Test: Überfällige Geräte pro Raum"""
+        plan = build_route_plan([
+            _device(1, "Berlin - MB1", next_inspection=date(2025, 1, 1)),
+            _device(2, "Berlin - MB1", next_inspection=date(2025, 3, 1)),
+        ], "Parloa", until=date(2025, 3, 31))
+
+        assert plan.rooms[0].overdue_count(date(2025, 2, 1)) == 1
+
+
+class TestPlanInspectionRouteUseCase:
+    """Tests für PlanInspectionRouteUseCase"""
+
+    def test_single_query_for_due_devices(self):
+        """Test: Eine Abfrage mit Kunde, Fälligkeitsstatus und Zeitfenster"""
+        repository = Mock()
+        repository.find.return_value = [_device(1, "Berlin - MB1")]
+
+        plan = PlanInspectionRouteUseCase(repository).execute("Parloa", within_days=14)
+
+        repository.find.assert_called_once()
+        query = repository.find.call_args[0][0]
+        assert query.customer == "Parloa"
+        assert query.statuses == ('active', 'maintenance')
+        assert query.next_inspection_from is None
+        assert query.next_inspection_to == dates.today() + timedelta(days=14)
+        assert plan.rooms[0].path == ("Berlin", "MB1")
+
+    def test_customer_is_required(self):
+        """Test: Ohne Kunde ValueError"""
+        with pytest.raises(ValueError):
+            PlanInspectionRouteUseCase(Mock()).execute("")
+
+
+class TestRoutePlanRoutes:
+    """Tests für /api/devices/route-plan und /route-plan"""
+
+    @pytest.fixture
+    def client(self):
+        app = create_app()
+        app.config['TESTING'] = True
+        return app.test_client()
+
+    def test_json_worklist_per_room(self, client):
+        """Test: JSON mit Räumen und Geräten"""
+        plan = build_route_plan([_device(1, "Berlin - Büro - MB1"), _device(2, "Berlin - Büro - MB1")],
+                                "Parloa", until=date(2025, 6, 30))
+        with patch('src.config.dependencies.container.plan_inspection_route_usecase.execute',
+                   return_value=plan) as mock_execute:
+            response = client.get('/api/devices/route-plan?customer=Parloa&within=2w')
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data['total_devices'] == 2
+        assert data['rooms'][0]['path'] == ["Berlin", "Büro", "MB1"]
+        assert [d['customer_device_id'] for d in data['rooms'][0]['devices']] == ['Parloa-00001', 'Parloa-00002']
+        assert mock_execute.call_args[0][:2] == ('Parloa', 14)
+
+    def test_json_requires_customer(self, client):
+        """Test: Ohne Kunde 400"""
+        assert client.get('/api/devices/route-plan').status_code == 400
+
+    def test_printable_view(self, client):
+        """Test: Druckansicht mit Raumüberschriften"""
+        plan = build_route_plan([_device(1, "Berlin - Büro - MB1")], "Parloa", until=date(2025, 6, 30))
+        with patch('src.config.dependencies.container.plan_inspection_route_usecase.execute',
+                   return_value=plan):
+            response = client.get('/route-plan?customer=Parloa')
+
+        assert response.status_code == 200
+        html = response.data.decode('utf-8')
+        assert 'Berlin - Büro - MB1' in html
+        assert 'Parloa-00001' in html
@@ -0,0 +1,64 @@
+"""Tests für den positionalen Row-Mapper"""
+from datetime import date
+from unittest.mock import Mock, patch
+from src.adapters.persistence.row_mapper import RowMapperCache, build_row_mapper
+from src.adapters.persistence.mysql_device_repository import MySQLDeviceRepository
+
+COLUMNS = ('id', 'customer', 'customer_device_id', 'name', 'qr_code', 'next_inspection', 'r_pe', 'created_at')
+ROW = (7, 'Parloa', 'Parloa-00007', 'Bohrmaschine', b'<svg/>', date(2025, 1, 15), 0.15, None)
+
+
+class TestBuildRowMapper:
+    """Tests für build_row_mapper"""
+
+    def test_maps_columns_by_position(self):
+        """Test: Werte werden über vorberechnete Indizes zugeordnet"""
+        device = build_row_mapper(COLUMNS)(ROW)
+
+        assert device.id == 7
+        assert device.customer_device_id == 'Parloa-00007'
+        assert device.next_inspection == date(2025, 1, 15)
+        assert device.r_pe == 0.15
+
+    def test_ignores_non_device_columns_and_keeps_defaults(self):
+        """Test: created_at wird ignoriert, fehlende Felder behalten Defaults"""
+        device = build_row_mapper(COLUMNS)(ROW)
+
+        assert not hasattr(device, 'created_at')
+        assert device.status == 'active'
+        assert device.location is None
+
+    def test_maps_stored_qr_code_when_selected(self):
+        """Test: Gespeicherter QR-Code wird übernommen, wenn die Abfrage ihn liefert"""
+        assert build_row_mapper(COLUMNS)(ROW).qr_code == b'<svg/>'
+        assert build_row_mapper(('id', 'name', 'customer'))((1, 'X', 'Y')).qr_code is None
+
+    def test_column_order_is_irrelevant(self):
+        """Test: Andere Spaltenreihenfolge ergibt dasselbe Device"""
+        reversed_mapper = build_row_mapper(tuple(reversed(COLUMNS)))
+
+        assert reversed_mapper(tuple(reversed(ROW))) == build_row_mapper(COLUMNS)(ROW)
+
+    def test_cache_reuses_mapper(self):
+        """Test: Mapper wird pro Spaltenliste nur einmal erzeugt"""
+        cache = RowMapperCache()
+
+        assert cache.get(list(COLUMNS)) is cache.get(COLUMNS)
+
+
+class TestRepositoryTupleCursor:
+    """Tests für Repository-Lesezugriffe mit Tupel-Cursor"""
+
+    @patch('src.adapters.persistence.mysql_device_repository.mysql.connector.connect')
+    def test_get_all_uses_tuple_cursor(self, mock_connect):
+        """Test: get_all liest Tupel und mappt über cursor.column_names"""
+        cursor = Mock()
+        cursor.column_names = COLUMNS
+        cursor.fetchall.return_value = [ROW]
+        mock_connect.return_value.cursor.return_value = cursor
+        repository = MySQLDeviceRepository('localhost', 3306, 'test', 'test', 'test_db')
+
+        devices = repository.get_all()
+
+        mock_connect.return_value.cursor.assert_called_once_with()
+        assert devices[0].customer_device_id == 'Parloa-00007'
@@ -0,0 +1,209 @@
+"""Tests für die Scan-Auflösung (QR-Inhalt, Gerätekarte, In-Memory-Index, Route)"""
+from datetime import date, datetime, timedelta
+from threading import Event, Thread
+import pytest
+from unittest.mock import Mock, patch
+from src.main import create_app
+from src.core.domain.device import Device
+from src.core.domain.device_query import ChangeMarker
+from src.core.domain.scan import DeviceCard, parse_qr_payload
+from src.core.usecases.scan_usecases import ResolveScanUseCase
+
+
+def _marker(count, changed_at, observed_after=timedelta(seconds=5)):
+    return ChangeMarker(count, changed_at, changed_at + observed_after if changed_at else None)
+
+
+def _device(number: int, **fields) -> Device:
+    return Device(id=number, name="Bohrer", customer="Parloa", customer_device_id=f"Parloa-{number:05d}", **fields)
+
+
+class TestParsePayload:
+    """Tests für parse_qr_payload"""
+
+    def test_customer_and_id(self):
+        """Test: "Kunde|ID" wird zerlegt, Scanner-Zeilenende entfernt"""
+        assert parse_qr_payload("Parloa|Parloa-00001\r\n") == ("Parloa", "Parloa-00001")
+
+    def test_id_only(self):
+        """Test: Alte QR-Codes ohne Kunde"""
+        assert parse_qr_payload("Parloa-00001") == (None, "Parloa-00001")
+
+    @pytest.mark.parametrize("payload", ["", "   ", "Parloa|", "x" * 600])
+    def test_invalid(self, payload):
+        """Test: Leere, unvollständige oder zu lange Inhalte"""
+        with pytest.raises(ValueError):
+            parse_qr_payload(payload)
+
+
+class TestDeviceCard:
+    """Tests für den Prüfstatus der Gerätekarte"""
+
+    @pytest.mark.parametrize("next_inspection,status,expected", [
+        (date(2025, 5, 31), 'active', 'overdue'),
+        (date(2025, 6, 20), 'active', 'due_soon'),
+        (date(2025, 9, 1), 'active', 'ok'),
+        (None, 'maintenance', 'unplanned'),
+        (date(2025, 5, 31), 'retired', 'inactive'),
+    ])
+    def test_due_status(self, next_inspection, status, expected):
+        """Test: Status relativ zum Stichtag"""
+        card = DeviceCard.from_device(_device(1, next_inspection=next_inspection, status=status))
+
+        assert card.due_status(date(2025, 6, 1)) == expected
+
+    def test_to_dict_is_slim(self):
+        """Test: Karte ohne Messwerte und QR-Code"""
+        data = DeviceCard.from_device(_device(1, next_inspection=date(2025, 6, 11))).to_dict(date(2025, 6, 1))
+
+        assert data['days_until_inspection'] == 10
+        assert 'qr_code' not in data and 'r_pe' not in data
+
+
+class TestResolveScanUseCase:
+    """Tests für den In-Memory-Index pro Kunde"""
+
+    def _usecase(self, devices):
+        self.now = 0.0
+        repository = Mock()
+        repository.get_change_marker.return_value = _marker(len(devices), datetime(2025, 6, 1, 8, 0))
+        repository.get_changed_since.return_value = devices
+        return repository, ResolveScanUseCase(repository, ttl=2.0, clock=lambda: self.now)
+
+    def test_scans_within_ttl_skip_database(self):
+        """Test: Nach dem Aufbau kosten Scans innerhalb der TTL keine Abfrage"""
+        repository, usecase = self._usecase([_device(1), _device(2)])
+
+        assert usecase.execute("Parloa|Parloa-00001").name == "Bohrer"
+        self.now = 1.0
+        assert usecase.execute("Parloa|Parloa-00002").customer_device_id == "Parloa-00002"
+
+        assert repository.get_change_marker.call_count == 1
+        assert repository.get_changed_since.call_count == 1
+
+    def test_unchanged_marker_keeps_index(self):
+        """Test: Nach Ablauf der TTL nur die Änderungsprüfung"""
+        repository, usecase = self._usecase([_device(1)])
+        usecase.execute("Parloa|Parloa-00001")
+        self.now = 5.0
+        usecase.execute("Parloa|Parloa-00001")
+
+        assert repository.get_change_marker.call_count == 2
+        assert repository.get_changed_since.call_count == 1
+
+    def test_incremental_update_and_unknown_device(self):
+        """Test: Unbekanntes Gerät löst Prüfung aus, Änderungen werden inkrementell übernommen"""
+        repository, usecase = self._usecase([_device(1)])
+        usecase.execute("Parloa|Parloa-00001")
+
+        repository.get_change_marker.return_value = _marker(2, datetime(2025, 6, 1, 9, 0))
+        repository.get_changed_since.return_value = [_device(2)]
+        card = usecase.execute("Parloa|Parloa-00002")
+
+        assert card.customer_device_id == "Parloa-00002"
+        assert repository.get_changed_since.call_args[0] == ("Parloa", datetime(2025, 6, 1, 8, 0))
+        assert usecase.execute("Parloa|Parloa-00001") is not None
+
+    def test_change_in_same_second_is_picked_up(self):
+        """Test: Prüfung in derselben Sekunde wie die letzte Änderung -> letzte Sekunde erneut lesen"""
+        changed_at = datetime(2025, 6, 1, 8, 0, 0)
+        repository, usecase = self._usecase([_device(1)])
+        repository.get_change_marker.return_value = _marker(1, changed_at, timedelta(milliseconds=400))
+        usecase.execute("Parloa|Parloa-00001")
+
+        # Änderung in derselben Sekunde: gleicher Marker, Gerät jetzt überfällig
+        self.now = 5.0
+        repository.get_change_marker.return_value = _marker(1, changed_at, timedelta(seconds=2))
+        repository.get_changed_since.return_value = [_device(1, next_inspection=date(2020, 1, 1))]
+        card = usecase.execute("Parloa|Parloa-00001")
+        self.now = 10.0
+        usecase.execute("Parloa|Parloa-00001")
+
+        assert card.next_inspection == date(2020, 1, 1)
+        assert repository.get_changed_since.call_args[0] == ("Parloa", changed_at)
+        assert repository.get_changed_since.call_count == 2
+
+    def test_deleted_device_triggers_rebuild(self):
+        """Test: Weniger Geräte als im Index -> vollständiger Neuaufbau"""
+        repository, usecase = self._usecase([_device(1), _device(2)])
+        usecase.execute("Parloa|Parloa-00001")
+
+        self.now = 5.0
+        repository.get_change_marker.return_value = _marker(1, datetime(2025, 6, 1, 8, 0))
+        repository.get_changed_since.side_effect = [[], [_device(1)]]
+
+        assert usecase.execute("Parloa|Parloa-00002") is None
+        assert repository.get_changed_since.call_args[0] == ("Parloa",)
+
+    def test_unknown_customer(self):
+        """Test: Kunde ohne Geräte"""
+        repository, usecase = self._usecase([])
+        repository.get_change_marker.return_value = _marker(0, None)
+
+        assert usecase.execute("Unbekannt|Unbekannt-00001") is None
+
+    def test_cold_index_blocks_only_its_customer(self):
+        """Test: Aufbau des Index eines Kunden blockiert Scans anderer Kunden nicht"""
+        repository, usecase = self._usecase([])
+        loading, release = Event(), Event()
+
+        def changed_since(customer, since=None):
+            if customer == "Langsam":
+                loading.set()
+                release.wait(5)
+                return [Device(id=99, name="Leiter", customer="Langsam", customer_device_id="Langsam-00001")]
+            return [_device(1)]
+        repository.get_change_marker.return_value = _marker(1, datetime(2025, 6, 1, 8, 0))
+        repository.get_changed_since.side_effect = changed_since
+
+        cards = []
+        slow = Thread(target=usecase.execute, args=("Langsam|Langsam-00001",))
+        fast = Thread(target=lambda: cards.append(usecase.execute("Parloa|Parloa-00001")))
+        slow.start()
+        try:
+            assert loading.wait(5)
+            fast.start()
+            fast.join(2)
+            # Noch während der Index von "Langsam" lädt
+            assert not release.is_set() and [card.name for card in cards] == ["Bohrer"]
+        finally:
+            release.set()
+            slow.join(5)
+            fast.join(5)
+        assert usecase.execute("Langsam|Langsam-00001").name == "Leiter"
+
+    def test_payload_without_customer_uses_unique_key(self):
+        """Test: Reine ID wird über den eindeutigen Schlüssel aufgelöst"""
+        repository, usecase = self._usecase([])
+        repository.get_by_customer_device_id.return_value = _device(7)
+
+        assert usecase.execute("Parloa-00007").id == 7
+        repository.get_change_marker.assert_not_called()
+
+
+class TestScanRoute:
+    """Tests für GET /scan"""
+
+    @pytest.fixture
+    def client(self):
+        app = create_app()
+        app.config['TESTING'] = True
+        return app.test_client()
+
+    def test_resolves_payload(self, client):
+        """Test: Gerätekarte mit Prüfstatus"""
+        card = DeviceCard.from_device(_device(1, next_inspection=date(2020, 1, 1)))
+        with patch('src.config.dependencies.container.resolve_scan_usecase.execute', return_value=card) as execute:
+            response = client.get('/scan?payload=Parloa%7CParloa-00001')
+
+        assert response.status_code == 200
+        assert response.json['device']['customer_device_id'] == "Parloa-00001"
+        assert response.json['device']['due_status'] == 'overdue'
+        assert response.headers['Cache-Control'] == 'no-store'
+        execute.assert_called_once_with("Parloa|Parloa-00001")
+
+    def test_errors(self, client):
+        """Test: Fehlender Inhalt 400, unbekanntes Gerät 404"""
+        assert client.get('/scan').status_code == 400
+        with patch('src.config.dependencies.container.resolve_scan_usecase.execute', return_value=None):
+            assert client.get('/scan?payload=Parloa%7CParloa-09999').status_code == 404
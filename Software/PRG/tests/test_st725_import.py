@@ -0,0 +1,196 @@
+"""Tests für den BENNING ST 725 Protokoll-Import"""
+import io
+import json
+import pytest
+from datetime import date, datetime
+from pathlib import Path
+from unittest.mock import Mock, patch
+from src.main import create_app
+from src.core.domain.bulk_result import BulkCreateResult, BulkItemError
+from src.core.domain.device import Device
+from src.core.usecases.import_usecases import ImportInspectionProtocolUseCase, device_type_for
+from src.adapters.importers import ProtocolRecord, ST725ProtocolReader
+from src.adapters.persistence.mysql_device_repository import MySQLDeviceRepository
+
+ARCHIVE_PROTOCOL = Path(__file__).resolve().parents[3] / 'archiv' / 'ST 725_Pruefprotokoll_ 2021-12-01 DE.xls'
+
+CSV_EXPORT = (
+    "Nr.;Prüfobjekt;ID-Nr.;Prüfablauf;Prüfdatum;Sichtprüfung;RPE [Ohm];RISO [MOhm];"
+    "IPE [mA];IBer [mA];Gesamtprüfung bestanden;Nächster Prüftermin\n"
+    "1;Bohrmaschine;SN-1;SK I;01.12.2021 10:15;Ja;0,12;>299;0,5;0,1;Ja;01.12.2022\n"
+    "2;;;;;;;;;;;\n"
+    "3;Wasserkocher;Parloa-00003;SK I;01.12.2021 10:20;Ja;0,45;12,5;0,3;;Nein;\n"
+)
+
+
+def _read_csv(content=CSV_EXPORT):
+    return list(ST725ProtocolReader().read('protokoll.csv', io.BytesIO(content.encode('cp1252'))))
+
+
+def _record(row, id_number, **fields):
+    return ProtocolRecord(row_number=row, id_number=id_number, name="Gerät",
+                          inspection_date=datetime(2021, 12, 1, 10, 0), passed=True, **fields)
+
+
+class TestST725ProtocolReader:
+    """Tests für ST725ProtocolReader"""
+
+    def test_parses_csv_export_with_decimal_comma(self):
+        """Test: Spalten über Kopfzeile erkannt, Dezimalkomma und Grenzwertzeichen geparst"""
+        records = _read_csv()
+
+        assert [r.id_number for r in records] == ['SN-1', 'Parloa-00003']
+        first = records[0]
+        assert first.inspection_date == datetime(2021, 12, 1, 10, 15)
+        assert (first.r_pe, first.r_iso, first.i_pe, first.i_b) == (0.12, 299.0, 0.5, 0.1)
+        assert first.next_inspection == date(2022, 12, 1)
+        assert (first.result, records[1].result) == ('pass', 'fail')
+
+    def test_skips_empty_template_rows(self):
+        """Test: Vorlagenzeilen mit nur laufender Nummer werden übersprungen"""
+        assert all(not r.is_empty for r in _read_csv())
+
+    @pytest.mark.skipif(not ARCHIVE_PROTOCOL.exists(), reason="Archiv-Protokoll nicht vorhanden")
+    def test_reads_header_block_of_excel_protocol(self):
+        """Test: Kunde und Prüfer aus dem Kopfbereich des Excel-Protokolls"""
+        pytest.importorskip('xlrd')
+        reader = ST725ProtocolReader()
+        with open(ARCHIVE_PROTOCOL, 'rb') as protocol:
+            records = list(reader.read(ARCHIVE_PROTOCOL.name, protocol))
+
+        assert records == []
+        assert reader.metadata == {'customer': 'Stadt Musterhausen', 'inspector': 'Peter Prüfer'}
+
+    def test_device_type_from_test_sequence(self):
+        """Test: Prüfablauf bestimmt die Schutzklasse"""
+        assert device_type_for('SK II') == 'Elektrogerät Schutzklasse 2'
+        assert device_type_for('SK I') == 'Elektrogerät Schutzklasse 1'
+        assert device_type_for(None) == 'Elektrogerät'
+
+
+class TestImportInspectionProtocolUseCase:
+    """Tests für ImportInspectionProtocolUseCase"""
+
+    @pytest.fixture
+    def repositories(self):
+        device_repository = Mock()
+        device_repository.get_by_identifiers.return_value = [
+            Device(id=3, name="Wasserkocher", customer="Parloa", customer_device_id="Parloa-00003")
+        ]
+        inspection_repository = Mock()
+        create_devices = Mock()
+
+        def create(devices):
+            for offset, device in enumerate(devices):
+                device.id = 100 + offset
+            return BulkCreateResult(created=devices)
+        create_devices.execute.side_effect = create
+        return device_repository, inspection_repository, create_devices
+
+    def test_matches_existing_and_creates_new_devices_once(self, repositories):
+        """Test: Abgleich über ID-Nr., neue Geräte einmal anlegen, Prüfungen gebündelt"""
+        device_repository, inspection_repository, create_devices = repositories
+        records = [_record(1, 'Parloa-00003'), _record(2, 'SN-1'), _record(3, 'SN-1')]
+
+        report = ImportInspectionProtocolUseCase(device_repository, inspection_repository, create_devices) \
+            .execute(iter(records), customer="Parloa")
+
+        assert (report.rows, report.matched, report.created, report.inspections) == (3, 1, 1, 3)
+        created = create_devices.execute.call_args[0][0]
+        assert [d.serial_number for d in created] == ['SN-1']
+        entries = inspection_repository.record_many.call_args[0][0]
+        assert [inspection.device_id for inspection, _, _ in entries] == [3, 100, 100]
+        assert entries[0][2] == 'active'
+        assert device_repository.get_by_identifiers.call_args.kwargs == {'customer': 'Parloa'}
+
+    @patch('src.adapters.persistence.mysql_device_repository.mysql.connector.connect')
+    def test_identifier_lookup_is_scoped_to_customer(self, mock_connect):
+        """Test: Abgleich findet nur Geräte des importierenden Kunden"""
+        cursor = mock_connect.return_value.cursor.return_value
+        cursor.fetchall.return_value = []
+        cursor.column_names = ('id', 'customer', 'name')
+
+        MySQLDeviceRepository('localhost', 3306, 'test', 'test', 'test_db') \
+            .get_by_identifiers(['SN-1'], ['SN-1'], customer='Parloa')
+
+        query, params = cursor.execute.call_args[0]
+        assert query.endswith("WHERE (customer_device_id IN (%s) OR serial_number IN (%s)) AND customer = %s")
+        assert params == ('SN-1', 'SN-1', 'Parloa')
+
+    def test_dry_run_writes_nothing(self, repositories):
+        """Test: dry_run liefert Bericht ohne Schreibzugriffe"""
+        device_repository, inspection_repository, create_devices = repositories
+
+        report = ImportInspectionProtocolUseCase(device_repository, inspection_repository, create_devices) \
+            .execute([_record(1, 'Parloa-00003'), _record(2, 'SN-1')], customer="Parloa", dry_run=True)
+
+        assert (report.matched, report.created, report.inspections) == (1, 1, 2)
+        create_devices.execute.assert_not_called()
+        inspection_repository.record_many.assert_not_called()
+
+    def test_rows_without_id_or_failed_devices_are_reported(self, repositories):
+        """Test: Fehlende ID-Nr. und fehlgeschlagene Anlage werden pro Zeile gemeldet"""
+        device_repository, inspection_repository, create_devices = repositories
+        create_devices.execute.side_effect = None
+        create_devices.execute.return_value = BulkCreateResult(errors=[BulkItemError(0, "Duplicate entry")])
+
+        report = ImportInspectionProtocolUseCase(device_repository, inspection_repository, create_devices) \
+            .execute([_record(4, None), _record(5, 'SN-9')], customer="Parloa")
+
+        assert [(e.index, e.error) for e in report.errors] == [
+            (4, "ID-Nr. fehlt - Gerät kann nicht zugeordnet werden"), (5, "Duplicate entry")
+        ]
+        inspection_repository.record_many.assert_not_called()
+
+    def test_processes_stream_in_batches(self, repositories):
+        """Test: Ein Abgleich pro Batch statt pro Zeile"""
+        device_repository, inspection_repository, create_devices = repositories
+        records = (_record(i, 'Parloa-00003') for i in range(5))
+
+        ImportInspectionProtocolUseCase(device_repository, inspection_repository, create_devices, batch_size=2) \
+            .execute(records, customer="Parloa")
+
+        assert device_repository.get_by_identifiers.call_count == 1
+        assert inspection_repository.record_many.call_count == 3
+
+
+class TestImportRoute:
+    """Tests für POST /api/devices/import/st725"""
+
+    @pytest.fixture
+    def client(self):
+        app = create_app()
+        app.config['TESTING'] = True
+        return app.test_client()
+
+    def test_dry_run_returns_report_per_file(self, client):
+        """Test: Upload im Dry-Run liefert Bericht"""
+        with patch('src.config.dependencies.container.device_repository.get_by_identifiers', return_value=[]):
+            response = client.post('/api/devices/import/st725', data={
+                'file': (io.BytesIO(CSV_EXPORT.encode('cp1252')), 'protokoll.csv'),
+                'customer': 'Parloa',
+                'dry_run': 'true'
+            }, content_type='multipart/form-data')
+
+        assert response.status_code == 200
+        report = json.loads(response.data)['reports'][0]
+        assert (report['rows'], report['created'], report['dry_run']) == (2, 2, True)
+
+    def test_file_without_customer_rejects_whole_upload(self, client):
+        """Test: Fehlt der Kunde in der zweiten Datei, wird auch die erste nicht importiert"""
+        with_customer = "Auftraggeber:;\nParloa GmbH;\n" + CSV_EXPORT
+        with patch('src.config.dependencies.container.import_protocol_usecase.execute') as execute:
+            response = client.post('/api/devices/import/st725', data={
+                'file': [
+                    (io.BytesIO(with_customer.encode('cp1252')), 'parloa.csv'),
+                    (io.BytesIO(CSV_EXPORT.encode('cp1252')), 'ohne-kunde.csv'),
+                ]
+            }, content_type='multipart/form-data')
+
+        assert response.status_code == 400
+        assert 'ohne-kunde.csv' in json.loads(response.data)['error']
+        execute.assert_not_called()
+
+    def test_missing_file_returns_400(self, client):
+        """Test: Ohne Datei 400"""
+        assert client.post('/api/devices/import/st725', data={}).status_code == 400
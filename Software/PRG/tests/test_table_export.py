@@ -0,0 +1,159 @@
+"""Tests für die Streaming-Exporte (CSV/XLSX)"""
+import csv
+import io
+import zipfile
+import pytest
+import xml.etree.ElementTree as ET
+from datetime import date
+from unittest.mock import Mock, patch
+from src.main import create_app
+from src.core.domain.device import Device
+from src.core.domain.device_query import DeviceQuery
+from src.adapters.persistence.mysql_device_repository import MySQLDeviceRepository
+from src.adapters.web.presenters import get_serializer, iter_csv, iter_xlsx
+
+SHEET_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+
+
+def _devices(count):
+    return (Device(id=i, name=f"Gerät <{i}> & Co", customer="Parloa",
+                   customer_device_id=f"Parloa-{i:05d}", r_pe=0.12,
+                   next_inspection=date(2025, 1, 31)) for i in range(1, count + 1))
+
+
+def _sheet_rows(content: bytes):
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        assert archive.testzip() is None
+        root = ET.fromstring(archive.read('xl/worksheets/sheet1.xml'))
+    rows = []
+    for row in root.iter(f'{SHEET_NS}row'):
+        cells = {}
+        for cell in row:
+            text = cell.find(f'{SHEET_NS}is/{SHEET_NS}t')
+            cells[cell.get('r')] = text.text if text is not None else cell.find(f'{SHEET_NS}v').text
+        rows.append(cells)
+    return rows
+
+
+class TestTableExport:
+    """Tests für iter_csv / iter_xlsx"""
+
+    @pytest.fixture
+    def serializer(self):
+        return get_serializer('export')
+
+    def test_csv_streams_header_first_and_chunks_rows(self, serializer):
+        """Test: Kopfzeile als erster Chunk, danach Blöcke fester Größe"""
+        chunks = list(iter_csv(_devices(5), serializer, chunk_size=2))
+
+        assert chunks[0].startswith(b'\xef\xbb\xbf' + b'customer_device_id,customer,')
+        assert len(chunks) == 4
+        rows = list(csv.reader(io.StringIO(b''.join(chunks).decode('utf-8-sig'))))
+        assert len(rows) == 6
+        record = dict(zip(rows[0], rows[1]))
+        assert (record['name'], record['r_pe'], record['next_inspection']) == ("Gerät <1> & Co", '0.12', '2025-01-31')
+        assert record['model'] == ''
+
+    def test_header_is_sent_before_devices_are_read(self, serializer):
+        """Test: Erstes Byte ohne Datenbankzugriff"""
+        devices = Mock()
+        devices.__iter__ = Mock(side_effect=AssertionError("DB gelesen"))
+
+        assert next(iter_csv(devices, serializer))
+        assert next(iter_xlsx(devices, serializer))
+
+    def test_xlsx_is_valid_workbook(self, serializer):
+        """Test: Streaming-Zip ist eine gültige Arbeitsmappe mit allen Zeilen"""
+        content = b''.join(iter_xlsx(_devices(3), serializer, chunk_size=2))
+
+        rows = _sheet_rows(content)
+        assert len(rows) == 4
+        assert rows[0]['A1'] == 'customer_device_id'
+        assert rows[1]['A2'] == 'Parloa-00001'
+        assert rows[1]['C2'] == 'Gerät <1> & Co'
+        assert float(rows[3]['M4']) == 0.12
+
+
+class TestIterFind:
+    """Tests für MySQLDeviceRepository.iter_find"""
+
+    def test_fetches_in_blocks_and_closes_connection(self):
+        """Test: fetchmany-Schleife über ungepufferten Cursor, Verbindung wird geschlossen"""
+        repository = MySQLDeviceRepository('localhost', 3306, 'test', 'test', 'test_db')
+        cursor = Mock()
+        cursor.column_names = ('id', 'name', 'customer')
+        cursor.fetchmany.side_effect = [[(1, 'A', 'Parloa'), (2, 'B', 'Parloa')], [(3, 'C', 'Parloa')], []]
+        conn = Mock()
+        conn.cursor.return_value = cursor
+
+        with patch.object(repository, '_get_connection', return_value=conn):
+            devices = repository.iter_find(DeviceQuery(), fetch_size=2)
+            conn.cursor.assert_not_called()
+            names = [device.name for device in devices]
+
+        assert names == ['A', 'B', 'C']
+        conn.cursor.assert_called_once_with(buffered=False)
+        cursor.fetchmany.assert_called_with(2)
+        conn.close.assert_called_once()
+
+    def test_aborted_stream_closes_connection(self):
+        """Test: Abgebrochener Download schließt die Verbindung trotz ungelesener Zeilen"""
+        from mysql.connector import InternalError
+        repository = MySQLDeviceRepository('localhost', 3306, 'test', 'test', 'test_db')
+        cursor = Mock()
+        cursor.column_names = ('id', 'name', 'customer')
+        cursor.fetchmany.return_value = [(1, 'A', 'Parloa'), (2, 'B', 'Parloa')]
+        cursor.close.side_effect = InternalError("Unread result found")
+        conn = Mock()
+        conn.cursor.return_value = cursor
+
+        with patch.object(repository, '_get_connection', return_value=conn):
+            devices = repository.iter_find(DeviceQuery())
+            next(devices)
+            devices.close()
+
+        conn.close.assert_called_once()
+
+
+class TestExportRoutes:
+    """Tests für GET /export/devices.<format>"""
+
+    @pytest.fixture
+    def client(self):
+        app = create_app()
+        app.config['TESTING'] = True
+        return app.test_client()
+
+    def test_csv_export_with_filters(self, client):
+        """Test: Filter werden zu DeviceQuery, Antwort als CSV-Download"""
+        with patch('src.config.dependencies.container.export_devices_usecase.execute') as mock_execute:
+            mock_execute.return_value = _devices(2)
+
+            response = client.get('/export/devices.csv?customer=Parloa&status=active'
+                                  '&next_inspection_to=2025-12-31')
+
+            assert response.status_code == 200
+            assert response.mimetype == 'text/csv'
+            assert 'attachment' in response.headers['Content-Disposition']
+            assert len(response.data.decode('utf-8-sig').strip().splitlines()) == 3
+        query = mock_execute.call_args[0][0]
+        assert (query.customer, query.statuses, query.next_inspection_to) == ('Parloa', ('active',), date(2025, 12, 31))
+
+    def test_xlsx_export(self, client):
+        """Test: XLSX-Download ist eine gültige Arbeitsmappe"""
+        with patch('src.config.dependencies.container.export_devices_usecase.execute',
+                   return_value=_devices(2)):
+            response = client.get('/export/devices.xlsx')
+
+        assert response.status_code == 200
+        assert len(_sheet_rows(response.data)) == 3
+
+    def test_invalid_filter_returns_400(self, client):
+        """Test: Ungültiger Status ergibt 400"""
+        response = client.get('/export/devices.csv?status=kaputt')
+
+        assert response.status_code == 400
+
+    def test_unknown_format_returns_404(self, client):
+        """Test: Unbekanntes Format ergibt 404"""
+        assert client.get('/export/devices.ods').status_code == 404
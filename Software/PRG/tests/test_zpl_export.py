@@ -0,0 +1,128 @@
+"""Tests für den ZPL-Export (Thermodrucker-Etiketten)"""
+import re
+import pytest
+from datetime import timedelta
+from unittest.mock import Mock, patch
+from src.main import create_app
+from src.core.domain import dates
+from src.core.domain.device import Device
+from src.core.usecases.device_usecases import ListLabelDevicesUseCase
+from src.adapters.web.presenters import get_zpl_layout, iter_zpl
+from src.adapters.web.presenters.zpl_export import render_zpl_label
+
+
+def _device(number: int, name: str = "Bohrer") -> Device:
+    return Device(id=number, name=name, customer="Parloa", customer_device_id=f"Parloa-{number:05d}")
+
+
+class TestRenderZPL:
+    """Tests für render_zpl_label und iter_zpl"""
+
+    def test_label_uses_native_qr_command(self):
+        """Test: QR-Code über ^BQ mit Kunde|ID, keine Rastergrafik"""
+        zpl = render_zpl_label(_device(1), get_zpl_layout('50x25'))
+
+        assert zpl.startswith("^XA\n") and zpl.endswith("^XZ\n")
+        assert "^BQN,2," in zpl
+        assert "^FDLA,Parloa|Parloa-00001^FS" in zpl
+        assert "^FDParloa-00001^FS" in zpl
+        assert "^GF" not in zpl
+        assert "^PW400" in zpl and "^LL200" in zpl
+
+    def test_qr_fits_label_height(self):
+        """Test: Vergrößerung wird an die Etikettenhöhe angepasst"""
+        small = render_zpl_label(_device(1), get_zpl_layout('50x25'))
+        large = render_zpl_label(_device(1), get_zpl_layout('100x50'))
+
+        def magnification(zpl):
+            return int(re.search(r"\^BQN,2,(\d+)", zpl).group(1))
+
+        assert magnification(small) * 25 <= 200 - 2 * 16
+        assert magnification(large) > magnification(small)
+
+    def test_control_characters_are_escaped(self):
+        """Test: ^, ~ und _ im Feldinhalt werden hex-maskiert"""
+        zpl = render_zpl_label(_device(1, name="Kabel ^XZ ~JA_2"), get_zpl_layout('50x25'))
+
+        assert "^FDKabel _5EXZ _7EJA_5F2^FS" in zpl
+        assert zpl.count("^XZ") == 1
+
+    def test_copies_and_batching(self):
+        """Test: Kopien über ^PQ, eine Datei in Blöcken"""
+        chunks = list(iter_zpl((_device(i) for i in range(5)), get_zpl_layout('57x32'), copies=3, chunk_size=2))
+
+        data = b''.join(chunks)
+        assert len(chunks) == 3
+        assert data.count(b"^XA") == 5
+        assert data.count(b"^PQ3") == 5
+
+    def test_unknown_layout(self):
+        """Test: Unbekanntes Format"""
+        with pytest.raises(ValueError, match="layout must be one of"):
+            get_zpl_layout('10x10')
+
+
+class TestDueLabels:
+    """Tests für Etiketten der Fälligkeitsliste"""
+
+    def test_due_list_query(self):
+        """Test: due_within_days fragt fällige Geräte in Prüfreihenfolge ab"""
+        repository = Mock()
+        repository.iter_find.return_value = iter([_device(1)])
+
+        devices = list(ListLabelDevicesUseCase(repository).execute(due_within_days=14))
+
+        query = repository.iter_find.call_args[0][0]
+        assert len(devices) == 1
+        assert query.next_inspection_to == dates.today() + timedelta(days=14)
+        assert query.statuses == ('active', 'maintenance')
+        assert query.sort == ('next_inspection', 'id')
+
+
+class TestZPLRoute:
+    """Tests für GET /export/labels.zpl"""
+
+    @pytest.fixture
+    def app(self):
+        app = create_app()
+        app.config['TESTING'] = True
+        return app
+
+    def test_download(self, app):
+        """Test: ZPL-Datei als Download"""
+        with patch('src.config.dependencies.container.list_label_devices_usecase.execute',
+                   return_value=iter([_device(1), _device(2)])) as execute:
+            response = app.test_client().get('/export/labels.zpl?due_within=30&customer=Parloa')
+
+        assert response.status_code == 200
+        assert response.mimetype == 'application/x-zpl'
+        assert 'attachment' in response.headers['Content-Disposition']
+        assert response.data.count(b"^XA") == 2
+        assert execute.call_args.kwargs['due_within_days'] == 30
+
+    def test_preview(self, app):
+        """Test: Probelauf zeigt die ersten Etiketten und die Gesamtzahl"""
+        with patch('src.config.dependencies.container.list_label_devices_usecase.execute',
+                   return_value=iter([_device(i) for i in range(12)])):
+            response = app.test_client().get('/export/labels.zpl?customer=Parloa&copies=2&preview=1')
+
+        assert response.mimetype == 'text/plain'
+        assert response.headers['X-Label-Count'] == '24'
+        assert response.data.count(b"^XA") == 5
+
+    def test_invalid_parameters(self, app):
+        """Test: Ungültige Parameter ergeben 400"""
+        client = app.test_client()
+        assert client.get('/export/labels.zpl?customer=Parloa&layout=A4').status_code == 400
+        assert client.get('/export/labels.zpl?customer=Parloa&copies=0').status_code == 400
+        assert client.get('/export/labels.zpl').status_code == 400
+
+    def test_cli_writes_file(self, app, tmp_path):
+        """Test: flask export-zpl schreibt die Datei"""
+        target = tmp_path / 'labels.zpl'
+        with patch('src.config.dependencies.container.list_label_devices_usecase.execute',
+                   return_value=iter([_device(1)])):
+            result = app.test_cli_runner().invoke(args=['export-zpl', '--ids', 'Parloa-00001', '-o', str(target)])
+
+        assert result.exit_code == 0, result.output
+        assert target.read_bytes().startswith(b"^XA")
@@ -0,0 +1,18 @@
+-- ============================================================================
+-- Migration: Index für den Kalender-Feed (GET /calendar/<kunde>.ics)
+-- Datum: 2026-10-19
+-- Beschreibung: Der Feed prüft pro Abruf nur COUNT(*) und MAX(updated_at)
+--               eines Kunden und lädt danach ausschließlich geänderte Geräte
+--               (updated_at >= letzter Stand). Beides ist mit
+--               (customer, updated_at) ein reiner Index-Zugriff.
+-- ============================================================================
+
+CREATE INDEX idx_customer_updated ON devices (customer, updated_at);
+
+-- Prüfen, ob der Index verwendet wird ("Using index" / Range-Scan)
+EXPLAIN SELECT COUNT(*), MAX(updated_at) FROM devices WHERE customer = 'Parloa';
+EXPLAIN SELECT id FROM devices WHERE customer = 'Parloa' AND updated_at >= NOW() - INTERVAL 1 HOUR;
+
+-- ============================================================================
+-- Migration erfolgreich abgeschlossen!
+-- ============================================================================
@@ -0,0 +1,22 @@
+-- ============================================================================
+-- Migration: Zähler pro Kunde für die Vergabe von customer_device_id
+-- Datum: 2026-10-19
+-- Beschreibung: MySQLDeviceRepository.reserve_customer_device_ids sperrt die
+--               Zählerzeile des Kunden (SELECT ... FOR UPDATE), damit
+--               gleichzeitige Einzel- und Massenanlagen keine doppelten
+--               IDs erhalten. Die Zähler werden aus den vorhandenen Geräten
+--               übernommen.
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS customer_device_counters (
+    customer VARCHAR(255) NOT NULL PRIMARY KEY,
+    last_number INT UNSIGNED NOT NULL DEFAULT 0
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- Höchste vergebene Nummer pro Kunde übernehmen (idempotent)
+INSERT INTO customer_device_counters (customer, last_number)
+SELECT customer, MAX(CAST(SUBSTRING_INDEX(customer_device_id, '-', -1) AS UNSIGNED))
+FROM devices
+WHERE customer IS NOT NULL AND customer_device_id IS NOT NULL
+GROUP BY customer
+ON DUPLICATE KEY UPDATE last_number = GREATEST(last_number, VALUES(last_number));
@@ -0,0 +1,16 @@
+-- ============================================================================
+-- Migration: Indizes für DeviceQuery-Filter
+-- Datum: 2026-10-19
+-- Beschreibung: Typ- und Standortfilter (Präfixsuche LIKE 'Berlin%') der
+--               ListDevicesUseCase-Abfragen laufen über einen Index
+-- ============================================================================
+
+CREATE INDEX idx_type ON devices (type);
+CREATE INDEX idx_location ON devices (location);
+
+-- Bestätigung der Änderungen
+SHOW INDEX FROM devices;
+
+-- ============================================================================
+-- Migration erfolgreich abgeschlossen!
+-- ============================================================================
@@ -0,0 +1,28 @@
+-- ============================================================================
+-- Migration: Index für Prüfplanung (fällige Geräte)
+-- Datum: 2026-10-19
+-- Beschreibung: Composite-Index für GET /api/devices/due
+--               (customer, next_inspection, status) + next_inspection allein
+--               für Abfragen ohne Kundenfilter
+-- ============================================================================
+
+-- Composite-Index: Kundenfilter + Datumsbereich + Statusfilter aus dem Index
+CREATE INDEX idx_customer_next_inspection_status
+    ON devices (customer, next_inspection, status);
+
+-- Datumsbereich ohne Kundenfilter
+CREATE INDEX idx_next_inspection ON devices (next_inspection);
+
+-- Prüfen, ob der Index verwendet wird
+EXPLAIN SELECT id, customer_device_id, next_inspection
+FROM devices
+WHERE customer = 'Parloa'
+  AND next_inspection IS NOT NULL
+  AND next_inspection <= CURDATE() + INTERVAL 30 DAY
+  AND status IN ('active', 'maintenance')
+ORDER BY next_inspection, id
+LIMIT 101;
+
+-- ============================================================================
+-- Migration erfolgreich abgeschlossen!
+-- ============================================================================
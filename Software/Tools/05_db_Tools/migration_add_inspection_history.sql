@@ -0,0 +1,33 @@
+-- ============================================================================
+-- Migration: Prüfhistorie in der inspections-Tabelle
+-- Datum: 2026-10-19
+-- Beschreibung: Jede Prüfung wird mit ihren Messwerten als eigene Zeile
+--               gespeichert (RecordInspectionUseCase). Das Gerät hält nur den
+--               aktuellen Stand; die Historie überschreibt keine Gerätezeilen.
+--               idx_device_date liefert "letzte Prüfung pro Gerät" über einen
+--               einzelnen Index-Lookup (ersetzt idx_device).
+-- ============================================================================
+
+ALTER TABLE inspections
+    MODIFY COLUMN inspection_date DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    ADD COLUMN r_pe DECIMAL(6,3) NULL COMMENT 'Schutzleiterwiderstand in Ohm' AFTER inspector,
+    ADD COLUMN r_iso DECIMAL(8,3) NULL COMMENT 'Isolationswiderstand in MegaOhm' AFTER r_pe,
+    ADD COLUMN i_pe DECIMAL(6,3) NULL COMMENT 'Schutzleiterstrom in mA' AFTER r_iso,
+    ADD COLUMN i_b DECIMAL(6,3) NULL COMMENT 'Berührungsstrom in mA' AFTER i_pe,
+    ADD COLUMN cable_type VARCHAR(100) NULL COMMENT 'USB-Kabeltyp (USB-C, Lightning, etc.)' AFTER i_b,
+    ADD COLUMN test_result VARCHAR(50) NULL COMMENT 'Testergebnis (bestanden, nicht_bestanden, etc.)' AFTER cable_type,
+    ADD COLUMN internal_resistance DECIMAL(10,3) NULL COMMENT 'Innenwiderstand in Ohm' AFTER test_result,
+    ADD COLUMN emarker_active BOOLEAN NULL COMMENT 'eMarker Status (nur USB-C)' AFTER internal_resistance;
+
+-- Zuerst den neuen Index anlegen: der Fremdschlüssel device_id benötigt
+-- jederzeit einen Index mit device_id als erster Spalte
+CREATE INDEX idx_device_date ON inspections (device_id, inspection_date, id);
+DROP INDEX idx_device ON inspections;
+
+-- Bestätigung der Änderungen
+DESC inspections;
+EXPLAIN SELECT id FROM inspections WHERE device_id = 1 ORDER BY inspection_date DESC, id DESC LIMIT 1;
+
+-- ============================================================================
+-- Migration erfolgreich abgeschlossen!
+-- ============================================================================
@@ -0,0 +1,66 @@
+-- ============================================================================
+-- Migration: Messwert-Zeitreihe (measurements) für die Drift-Analyse
+-- Datum: 2026-10-19
+-- Beschreibung: Kompakte Einzelmesswerte (device_id, measured_at, metric,
+--               value), jahresweise partitioniert. RecordInspectionUseCase und
+--               der ST 725 Import schreiben neue Prüfungen automatisch mit;
+--               diese Migration übernimmt die vorhandene Prüfhistorie.
+--               metric: 1=r_pe, 2=r_iso, 3=i_pe, 4=i_b, 5=internal_resistance
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS measurements (
+    device_id INT NOT NULL,
+    measured_at DATETIME NOT NULL,
+    metric TINYINT UNSIGNED NOT NULL,
+    value FLOAT NOT NULL,
+    PRIMARY KEY (device_id, metric, measured_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+PARTITION BY RANGE (YEAR(measured_at)) (
+    PARTITION p2020 VALUES LESS THAN (2021),
+    PARTITION p2021 VALUES LESS THAN (2022),
+    PARTITION p2022 VALUES LESS THAN (2023),
+    PARTITION p2023 VALUES LESS THAN (2024),
+    PARTITION p2024 VALUES LESS THAN (2025),
+    PARTITION p2025 VALUES LESS THAN (2026),
+    PARTITION p2026 VALUES LESS THAN (2027),
+    PARTITION pmax VALUES LESS THAN MAXVALUE
+);
+
+-- Vorhandene Prüfhistorie übernehmen (idempotent über den Primärschlüssel)
+INSERT IGNORE INTO measurements (device_id, measured_at, metric, value)
+SELECT device_id, inspection_date, 1, r_pe FROM inspections WHERE r_pe IS NOT NULL
+UNION ALL
+SELECT device_id, inspection_date, 2, r_iso FROM inspections WHERE r_iso IS NOT NULL
+UNION ALL
+SELECT device_id, inspection_date, 3, i_pe FROM inspections WHERE i_pe IS NOT NULL
+UNION ALL
+SELECT device_id, inspection_date, 4, i_b FROM inspections WHERE i_b IS NOT NULL
+UNION ALL
+SELECT device_id, inspection_date, 5, internal_resistance FROM inspections WHERE internal_resistance IS NOT NULL;
+
+-- Aktueller Gerätestand (bei Geräten mit Historie meist schon enthalten)
+INSERT IGNORE INTO measurements (device_id, measured_at, metric, value)
+SELECT id, last_inspection, 1, r_pe FROM devices WHERE last_inspection IS NOT NULL AND r_pe IS NOT NULL
+UNION ALL
+SELECT id, last_inspection, 2, r_iso FROM devices WHERE last_inspection IS NOT NULL AND r_iso IS NOT NULL
+UNION ALL
+SELECT id, last_inspection, 3, i_pe FROM devices WHERE last_inspection IS NOT NULL AND i_pe IS NOT NULL
+UNION ALL
+SELECT id, last_inspection, 4, i_b FROM devices WHERE last_inspection IS NOT NULL AND i_b IS NOT NULL
+UNION ALL
+SELECT id, last_inspection, 5, internal_resistance FROM devices
+WHERE last_inspection IS NOT NULL AND internal_resistance IS NOT NULL;
+
+-- Neue Jahrespartition jeweils vor Jahresbeginn abspalten, z.B.:
+-- ALTER TABLE measurements REORGANIZE PARTITION pmax INTO (
+--     PARTITION p2027 VALUES LESS THAN (2028),
+--     PARTITION pmax VALUES LESS THAN MAXVALUE
+-- );
+
+-- Bestätigung
+SELECT metric, COUNT(*) FROM measurements GROUP BY metric;
+EXPLAIN SELECT metric, measured_at, value FROM measurements WHERE device_id = 1 ORDER BY metric, measured_at;
+
+-- ============================================================================
+-- Migration erfolgreich abgeschlossen!
+-- ============================================================================